@@ -0,0 +1,103 @@
+"""Suggest the argon2 parameters meeting a target verification latency on this host.
+
+Following the recommendation of RFC 9106, takes as much memory as the target allows
+with a single iteration, halving it from `--max-memory` until a verification fits, then
+adds iterations while the 90th percentile of the verification latency stays under the
+target. Run it on the target hardware, with the other processes of the host as busy as
+they are in production, and set the suggested environment variables:
+
+    python -m benchmarks.argon2_tune [--target-ms 100] [--parallelism 4]
+        [--max-memory 262144] [--samples 10]
+
+The stored hashes are rehashed with the new parameters at the next login of each user.
+
+"""
+
+import argparse
+import statistics
+import time
+
+from passlib.hash import argon2
+
+MIN_MEMORY = 8192
+
+
+def verify_latency(
+    time_cost: int, memory_cost: int, parallelism: int, samples: int
+) -> float:
+    """Measure the 90th percentile of the verification latency, in milliseconds."""
+    hasher = argon2.using(
+        rounds=time_cost, memory_cost=memory_cost, parallelism=parallelism
+    )
+    hashed_password = hasher.hash("password")
+    hasher.verify("password", hashed_password)  # NOTE: Warm up before measuring.
+
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.verify("password", hashed_password)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latency = statistics.quantiles(latencies, n=10, method="inclusive")[8]
+    print(
+        f"t={time_cost:<3} m={memory_cost:<8} p={parallelism:<3} "
+        f"p90: {latency:>8.1f} ms  (n={samples})"
+    )
+
+    return latency
+
+
+def tune(
+    target_ms: float, parallelism: int, max_memory: int, samples: int
+) -> tuple[int, int] | None:
+    """Find the memory, then the iterations, meeting the target latency."""
+    memory_cost = max_memory
+    while verify_latency(1, memory_cost, parallelism, samples) > target_ms:
+        memory_cost //= 2
+
+        if memory_cost < max(MIN_MEMORY, 8 * parallelism):
+            return None
+
+    time_cost = 1
+    while verify_latency(time_cost + 1, memory_cost, parallelism, samples) <= target_ms:
+        time_cost += 1
+
+    return time_cost, memory_cost
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=100.0,
+        help="the target 90th percentile of a verification, in milliseconds",
+    )
+    parser.add_argument(
+        "--parallelism", type=int, default=4, help="the number of argon2 lanes"
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        default=262144,
+        help="the most memory a hash may take, in KiB",
+    )
+    parser.add_argument(
+        "--samples", type=int, default=10, help="the verifications per parameters"
+    )
+    args = parser.parse_args()
+
+    result = tune(args.target_ms, args.parallelism, args.max_memory, args.samples)
+
+    if result is None:
+        parser.exit(1, f"No parameters verify a password in {args.target_ms} ms.\n")
+
+    time_cost, memory_cost = result
+    print()
+    print(f"PASSWORD_TIME_COST={time_cost}")
+    print(f"PASSWORD_MEMORY_COST={memory_cost}")
+    print(f"PASSWORD_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
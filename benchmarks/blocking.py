@@ -0,0 +1,133 @@
+"""Benchmark of the `/health` latency while login traffic saturates the application.
+
+Logins verify an argon2 hash, which takes tens of milliseconds of CPU. Compares running
+the `auth` resolver on the event loop with running it on the blocking executor. The
+database is not needed: the authentication service is replaced with one that only
+verifies a password. The hashing threads still compete with the event loop for the CPU,
+so `/health` only stays flat when `BLOCKING_POOL_SIZE` leaves a core to the event loop.
+Run it with the application environment variables set:
+
+    python -m benchmarks.blocking
+
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+from strawberry.extensions.field_extension import SyncExtensionResolver
+from strawberry.types import Info
+
+from pokeapi.application.services.authentication import AuthenticationService
+from pokeapi.dependencies.context import get_root_container
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.entities.token import Token
+from pokeapi.domain.services.password import PasswordService
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.main import app
+from pokeapi.presentation.extensions.blocking import BlockingResolverExtension
+
+from .utils import measure
+
+CONCURRENT_LOGINS = 8
+AUTH_MUTATION = """
+    mutation {
+        auth(input: {username: "Red", password: "password"}) {
+            ... on AuthResult { accessToken }
+        }
+    }
+"""
+
+
+class PasswordOnlyAuthenticationService(AuthenticationService):
+    """An authentication service that only verifies the password of the user."""
+
+    def __init__(self) -> None:
+        self._password_service = PasswordService(AppConfig())
+        self._hashed_password = self._password_service.hash("password")
+
+    def auth(self, username: str, password: str) -> Token:
+        self._password_service.verify(password, self._hashed_password)
+
+        return Token(access_token="", refresh_token="", token_type="Bearer")
+
+
+def resolve_inline(
+    self: BlockingResolverExtension,
+    next_: SyncExtensionResolver,
+    source: Any,
+    info: Info,
+    **kwargs: Any,
+) -> Any:
+    """Resolve on the event loop, as the resolvers did before the blocking executor."""
+    return next_(source, info, **kwargs)
+
+
+async def login_forever(client: httpx.AsyncClient, stop: asyncio.Event) -> None:
+    """Send logins one after another until stopped."""
+    while not stop.is_set():
+        await client.post("/graphql", json={"query": AUTH_MUTATION})
+
+
+def under_load(
+    name: str,
+    loop: asyncio.AbstractEventLoop,
+    client: httpx.AsyncClient,
+    health: Callable[[], object],
+) -> float:
+    """Measure `/health` while logins keep the application busy."""
+
+    async def start() -> tuple[asyncio.Event, Awaitable[Any]]:
+        stop = asyncio.Event()
+        logins = asyncio.gather(
+            *(login_forever(client, stop) for _ in range(CONCURRENT_LOGINS))
+        )
+
+        return stop, logins
+
+    stop, logins = asyncio.run_coroutine_threadsafe(start(), loop).result()
+    result = measure(name, health, 50)
+
+    async def finish() -> None:
+        stop.set()
+        await logins
+
+    asyncio.run_coroutine_threadsafe(finish(), loop).result()
+
+    return result
+
+
+def main() -> None:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    get_root_container().binder.bind(
+        AuthenticationService, to=PasswordOnlyAuthenticationService()
+    )
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),  # type: ignore[arg-type]
+        base_url="http://testserver",
+    )
+
+    def health() -> None:
+        asyncio.run_coroutine_threadsafe(client.get("/health"), loop).result()
+
+    measure("idle", health, 200)
+
+    with patch.object(BlockingResolverExtension, "resolve", resolve_inline):
+        before = under_load("before: logins on the event loop", loop, client, health)
+
+    after = under_load("after: logins on the blocking executor", loop, client, health)
+    print(f"speedup: {before / after:.1f}x")
+    print(f"blocking executor: {get_root_container().get(BlockingExecutor).snapshot()}")
+
+    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+if __name__ == "__main__":
+    main()
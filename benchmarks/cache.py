@@ -0,0 +1,109 @@
+"""Benchmark of the entries of the shared cache of master data.
+
+Measures the encoding of a Pokémon and of the list of every Pokémon, with msgpack and
+the validation of the entities, as the shared cache stores them, and with pickle, and
+prints the size of each encoding. Then measures a lookup hitting the entries in memory
+against a lookup hitting the shared store only, through an in-process store, so that
+the figures exclude the network round trip to Redis. Run it on the target hardware:
+
+    python -m benchmarks.cache
+
+"""
+
+import pickle
+
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.entities.pokemon_stats import PokemonStats
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.domain.entities.pokemons_ability import PokemonsAbility
+from pokeapi.domain.entities.pokemons_type import PokemonsType
+from pokeapi.infrastructure.cache.codec import EntityCodec
+from pokeapi.infrastructure.cache.memory import MemoryCache
+from pokeapi.infrastructure.cache.memory_backend import MemoryCacheBackend
+from pokeapi.infrastructure.cache.memory_backend_async import AsyncMemoryCacheBackend
+from pokeapi.infrastructure.cache.tiered import TieredCache
+
+from .utils import measure
+
+NUMBER = 1000
+POKEMON_COUNT = 1025
+
+POKEMON = Pokemon(
+    id_=1,
+    national_pokedex_number=1,
+    name="フシギダネ",
+    stats=PokemonStats(
+        hp=45,
+        attack=49,
+        defense=49,
+        special_attack=65,
+        special_defense=65,
+        speed=45,
+        base_total=318,
+    ),
+    pokemons_type=(
+        PokemonsType(pokemon_type=PokemonType(id_=5, name="くさ"), slot=1),
+        PokemonsType(pokemon_type=PokemonType(id_=8, name="どく"), slot=2),
+    ),
+    pokemons_ability=(
+        PokemonsAbility(
+            pokemon_ability=PokemonAbility(id_=34, name="ようりょくそ"),
+            slot=3,
+            is_hidden=True,
+        ),
+        PokemonsAbility(
+            pokemon_ability=PokemonAbility(id_=65, name="しんりょく"),
+            slot=1,
+            is_hidden=False,
+        ),
+    ),
+)
+POKEMONS = [
+    POKEMON.model_copy(update={"id_": id_, "national_pokedex_number": id_})
+    for id_ in range(1, POKEMON_COUNT + 1)
+]
+
+
+def measure_encoding(name: str, value: Pokemon | list[Pokemon], number: int) -> None:
+    """Measure the encoding and decoding of a value, with msgpack and with pickle."""
+    codec = EntityCodec(Pokemon)
+    packed = codec.encode(value)
+    pickled = pickle.dumps(value)
+
+    measure(f"{name}: msgpack encode", lambda: codec.encode(value), number)
+    measure(f"{name}: msgpack decode", lambda: codec.decode(packed), number)
+    measure(f"{name}: pickle dumps", lambda: pickle.dumps(value), number)
+    measure(f"{name}: pickle loads", lambda: pickle.loads(pickled), number)
+    print(f"{name}: {len(packed)} bytes (msgpack), {len(pickled)} bytes (pickle)")
+
+
+def measure_tiers() -> None:
+    """Measure a lookup hitting the memory against one hitting the shared store."""
+    backend = MemoryCacheBackend()
+    async_backend = AsyncMemoryCacheBackend(backend)
+    codec = EntityCodec(Pokemon)
+    writer = TieredCache(
+        "pokemon", MemoryCache(10, 0), backend, async_backend, codec, 0, 60, 5
+    )
+    local = MemoryCache(10, 0)
+    reader = TieredCache("pokemon", local, backend, async_backend, codec, 0, 60, 5)
+    writer.set("pokemon:id:1", POKEMON)
+    reader.get("pokemon:id:1")
+
+    def shared_hit() -> None:
+        local.clear()
+        reader.get("pokemon:id:1")
+
+    measure("lookup: memory hit", lambda: reader.get("pokemon:id:1"), NUMBER)
+    measure("lookup: shared store hit", shared_hit, NUMBER)
+
+
+def main() -> None:
+    measure_encoding("Pokémon", POKEMON, NUMBER)
+    measure_encoding(f"{POKEMON_COUNT} Pokémon", POKEMONS, NUMBER // 100)
+    measure_tiers()
+
+
+if __name__ == "__main__":
+    main()
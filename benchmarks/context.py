@@ -0,0 +1,49 @@
+"""Benchmark of the per-request GraphQL context cost.
+
+Compares building a whole container per request with creating a child of the root
+container. Run it with the application environment variables set:
+
+    python -m benchmarks.context
+
+"""
+
+from injector import Injector
+
+from pokeapi.application.services.pokemon import PokemonService
+from pokeapi.dependencies.context import get_context
+from pokeapi.dependencies.di.application import ApplicationServiceModule
+from pokeapi.dependencies.di.config import ConfigModule
+from pokeapi.dependencies.di.database import DatabaseModule
+from pokeapi.dependencies.di.domain import DomainServiceModule
+from pokeapi.dependencies.di.repository import RepositoryModule
+
+from .utils import measure
+
+
+def container_per_request() -> None:
+    """Build a whole container per request, as `get_context` used to do."""
+    container = Injector(
+        [
+            ConfigModule(),
+            DatabaseModule(),
+            DomainServiceModule(),
+            RepositoryModule(),
+            ApplicationServiceModule(),
+        ]
+    )
+    container.get(PokemonService)
+
+
+def child_container_per_request() -> None:
+    """Create a child of the root container per request."""
+    get_context()["container"].get(PokemonService)
+
+
+def main() -> None:
+    before = measure("before: container per request", container_per_request, 200)
+    after = measure("after: child container per request", child_container_per_request)
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
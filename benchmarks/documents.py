@@ -0,0 +1,88 @@
+"""Benchmark of the CPU time saved per request by the cache of GraphQL documents.
+
+For our typical `pokemons` and `pokemonByName` queries, measures the parsing and the
+validation of the document against the schema, as strawberry runs them for every
+request, and the lookup of the document in `DocumentCache`, which replaces both on a
+hit. The difference is the time saved per request. Run it on the target hardware:
+
+    python -m benchmarks.documents
+
+"""
+
+from unittest.mock import MagicMock
+
+from graphql import GraphQLSchema, build_schema, parse, validate
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.main import schema
+from pokeapi.presentation.document_cache import DocumentCache
+
+from .utils import measure
+
+NUMBER = 1000
+
+QUERIES = {
+    "pokemons": """
+        query Pokemons($first: Int, $after: String) {
+          pokemons(first: $first, after: $after) {
+            pageInfo { hasNextPage endCursor }
+            edges {
+              cursor
+              node {
+                id
+                nationalPokedexNumber
+                name
+                types { slot pokemonType { id typeName } }
+                abilities { slot isHidden pokemonAbility { id abilityName } }
+              }
+            }
+          }
+        }
+    """,
+    "pokemonByName": """
+        query PokemonByName($name: String!) {
+          pokemonByName(name: $name) {
+            id
+            nationalPokedexNumber
+            name
+            hp
+            attack
+            defense
+            specialAttack
+            specialDefense
+            speed
+            baseTotal
+            types { slot pokemonType { id typeName } }
+            abilities { slot isHidden pokemonAbility { id abilityName } }
+          }
+        }
+    """,
+}
+
+
+def measure_query(
+    name: str, query: str, graphql_schema: GraphQLSchema, cache: DocumentCache
+) -> None:
+    """Measure the parsing and validation of a query, and its lookup in the cache."""
+    document = parse(query)
+    cache.set(query, document, validate(graphql_schema, document))
+
+    uncached = measure(
+        f"{name}: parse + validate",
+        lambda: validate(graphql_schema, parse(query)),
+        NUMBER,
+    )
+    cached = measure(f"{name}: cached", lambda: cache.get(query), NUMBER)
+    print(f"{name}: {uncached - cached:.2f} us saved per request")
+
+
+def main() -> None:
+    graphql_schema = build_schema(schema.as_str())
+    cache = DocumentCache(MagicMock(spec=AppConfig, document_cache_max_size=100))
+
+    for name, query in QUERIES.items():
+        measure_query(name, query, graphql_schema, cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of JWT signing and verification throughput per algorithm.
+
+For RS256, ES256 and EdDSA, signs and verifies a token shaped like our access tokens,
+once with the PEM keys handed to `jose.jwt` on every call, as the service used to, and
+once with the keys the service parses at startup. The cache of verified payloads is
+disabled, so that every verification checks the signature. Run it on the target
+hardware:
+
+    python -m benchmarks.jwt
+
+"""
+
+import datetime
+import uuid
+from unittest.mock import MagicMock
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+from jose import jwt
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.entities.user import User
+from pokeapi.domain.services.jwt import JWTService
+
+from .utils import measure
+
+NUMBER = 1000
+ISSUER = "http://localhost"
+
+KEYS: dict[str, PrivateKeyTypes] = {
+    "RS256": rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate(),
+}
+
+
+def pem_config(algorithm: str) -> MagicMock:
+    """Build a configuration holding the PEM keys of an algorithm."""
+    key = KEYS[algorithm]
+
+    return MagicMock(
+        spec=AppConfig,
+        app_domain=ISSUER,
+        jwt_algorithm=algorithm,
+        jwt_cache_size=0,
+        private_key=key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode("utf-8"),
+        public_key=key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode("utf-8"),
+    )
+
+
+def measure_algorithm(algorithm: str) -> dict[str, float]:
+    """Measure signing and verification, with PEM keys and with parsed keys."""
+    config = pem_config(algorithm)
+    service = JWTService(config)
+    user = User(id_=1, username="Red", password="password")
+    exp = datetime.datetime.now() + datetime.timedelta(hours=1)
+    jti = str(uuid.uuid4())
+    token = service.create_token(user, exp, jti)
+    claims = jwt.get_unverified_claims(token)
+
+    def sign_pem() -> None:
+        jwt.encode(claims, config.private_key, algorithm=algorithm)
+
+    def verify_pem() -> None:
+        jwt.decode(token, config.public_key, algorithms=algorithm, issuer=ISSUER)
+
+    return {
+        "sign (PEM)": measure(f"{algorithm}: sign (PEM)", sign_pem, NUMBER),
+        "sign (parsed)": measure(
+            f"{algorithm}: sign (parsed)",
+            lambda: service.create_token(user, exp, jti),
+            NUMBER,
+        ),
+        "verify (PEM)": measure(f"{algorithm}: verify (PEM)", verify_pem, NUMBER),
+        "verify (parsed)": measure(
+            f"{algorithm}: verify (parsed)",
+            lambda: service.decode_token(token),
+            NUMBER,
+        ),
+    }
+
+
+def main() -> None:
+    for algorithm in KEYS:
+        for name, latency in measure_algorithm(algorithm).items():
+            print(f"{algorithm}: {name:<16} {1_000_000 / latency:>10.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
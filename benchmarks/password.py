@@ -0,0 +1,83 @@
+"""Benchmark of read latency while a burst of logins verifies passwords.
+
+Threads standing in for the blocking executor verify argon2 hashes without pause, while
+a cheap CPU-bound read is measured. Compares verifying in-process with verifying in a
+pool of processes, which admits a bounded number of passwords and rejects the rest
+after a timeout. The pool only helps when it leaves a core to the serving process. Run
+it with the application environment variables set:
+
+    python -m benchmarks.password
+
+"""
+
+import json
+import os
+import threading
+from unittest.mock import patch
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.services.password import PasswordService
+from pokeapi.domain.services.password_abc import PasswordServiceABC
+from pokeapi.domain.services.password_pool import ProcessPoolPasswordService
+from pokeapi.exceptions.password import PasswordHashingBusyError
+
+from .utils import measure
+
+CONCURRENT_LOGINS = 8
+READ_PAYLOAD = {"pokemons": [{"id": i, "name": f"pokemon-{i}"} for i in range(200)]}
+
+
+def read() -> None:
+    """A cheap CPU-bound read, such as serializing a small response."""
+    json.dumps(READ_PAYLOAD)
+
+
+def under_login_burst(name: str, service: PasswordServiceABC) -> float:
+    """Measure the read while threads verify passwords without pause."""
+    hashed_password = PasswordService(AppConfig()).hash("password")
+    service.verify("password", hashed_password)  # NOTE: Start the processes.
+    stop = threading.Event()
+    counts = {"verified": 0, "rejected": 0}
+
+    def login() -> None:
+        while not stop.is_set():
+            try:
+                service.verify("password", hashed_password)
+                counts["verified"] += 1
+            except PasswordHashingBusyError:
+                counts["rejected"] += 1
+
+    threads = [threading.Thread(target=login) for _ in range(CONCURRENT_LOGINS)]
+
+    for thread in threads:
+        thread.start()
+
+    result = measure(name, read, 2000)
+    stop.set()
+
+    for thread in threads:
+        thread.join()
+
+    print(f"{'':<48} verified: {counts['verified']}  rejected: {counts['rejected']}")
+
+    return result
+
+
+def main() -> None:
+    measure("idle", read, 2000)
+    before = under_login_burst(
+        "before: verify in-process", PasswordService(AppConfig())
+    )
+
+    pool_size = str(max((os.cpu_count() or 1) - 1, 1))
+
+    with patch.dict(os.environ, {"PASSWORD_POOL_SIZE": pool_size}):
+        service = ProcessPoolPasswordService(AppConfig())
+
+    after = under_login_burst(f"after: verify in a pool of {pool_size}", service)
+    service.dispose()
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark of token lookups and index size, with tokens stored as text or as bytes.
+
+Fills two scratch tables shaped like `token_whitelist`, one holding the tokens as UUID
+text and one as BINARY(16), with the same tokens, then compares the size of their token
+indexes and the latency of a lookup by access token. The rows are generated by the
+server. Run it against a disposable MySQL database with the application environment
+variables set; the number of rows defaults to 10M:
+
+    python -m benchmarks.tokens [rows]
+
+"""
+
+import datetime
+import random
+import sys
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    select,
+    text,
+)
+from sqlalchemy.types import TypeEngine
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.database.models.types import BinaryUUID
+from pokeapi.infrastructure.database.utils import adjust_connection_url
+
+from .utils import measure
+
+ROWS = 10_000_000
+SAMPLES = 1000
+
+metadata = MetaData()
+
+
+def token_table(kind: str, column_type: TypeEngine[str]) -> Table:
+    """Define a scratch table shaped like `token_whitelist`."""
+    return Table(
+        f"bench_token_{kind}",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("user_id", Integer, nullable=False),
+        Column("access_token", column_type, nullable=False),
+        Column("updated_at", DateTime, nullable=False),
+        Column("deleted_at", DateTime),
+        Index(
+            f"ix_bench_token_{kind}_access_token",
+            "access_token",
+            "deleted_at",
+            "updated_at",
+            "user_id",
+        ),
+    )
+
+
+tables = {
+    "text": token_table("text", String(36)),
+    "binary": token_table("binary", BinaryUUID()),
+}
+
+
+def fill(connection: Connection, rows: int) -> None:
+    """Generate the text rows by doubling the table, then copy them as bytes."""
+    connection.execute(
+        text(
+            "INSERT INTO bench_token_text (user_id, access_token, updated_at) "
+            "VALUES (1, UUID(), NOW())"
+        )
+    )
+
+    count = 1
+    while count < rows:
+        connection.execute(
+            text(
+                "INSERT INTO bench_token_text (user_id, access_token, updated_at) "
+                "SELECT id % 100000, UUID(), NOW() FROM bench_token_text LIMIT :limit"
+            ),
+            {"limit": rows - count},
+        )
+        connection.commit()
+        count = min(count * 2, rows)
+
+    connection.execute(
+        text(
+            "INSERT INTO bench_token_binary (id, user_id, access_token, updated_at) "
+            "SELECT id, user_id, UUID_TO_BIN(access_token), updated_at "
+            "FROM bench_token_text"
+        )
+    )
+    connection.commit()
+
+    for table in tables.values():
+        connection.execute(text(f"ANALYZE TABLE {table.name}"))
+
+
+def index_size(connection: Connection, table: Table) -> int:
+    """Read the size in bytes of the token index from the persistent statistics."""
+    size = connection.execute(
+        text(
+            "SELECT stat_value * @@innodb_page_size FROM mysql.innodb_index_stats "
+            "WHERE database_name = DATABASE() AND table_name = :table "
+            "AND index_name = :index AND stat_name = 'size'"
+        ),
+        {"table": table.name, "index": f"ix_{table.name}_access_token"},
+    ).scalar_one()
+
+    return int(size)
+
+
+def measure_lookup(connection: Connection, table: Table, tokens: list[str]) -> float:
+    """Measure the lookup of a valid token, as done on every authenticated request."""
+    expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
+    statement = select(table.c.user_id).where(
+        table.c.deleted_at.is_(None), table.c.updated_at > expiration
+    )
+    lookups = iter(tokens * 2)
+
+    def lookup() -> None:
+        connection.execute(statement.where(table.c.access_token == next(lookups))).all()
+
+    return measure(f"{table.name}: lookup by access token", lookup, len(tokens))
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    engine = create_engine(adjust_connection_url(AppConfig().database_url))
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    latencies = {}
+
+    try:
+        with engine.connect() as connection:
+            fill(connection, rows)
+            sampled = connection.execute(
+                select(tables["text"].c.access_token).limit(SAMPLES * 10)
+            )
+            tokens = random.sample(sampled.scalars().all(), SAMPLES)
+
+            for kind, table in tables.items():
+                size = index_size(connection, table) / 1024 / 1024
+                print(f"{table.name}: index size {size:.1f} MiB (rows={rows})")
+                latencies[kind] = measure_lookup(connection, table, tokens)
+    finally:
+        metadata.drop_all(engine)
+
+    print(f"speedup: {latencies['text'] / latencies['binary']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import statistics
+import time
+from collections.abc import Callable
+
+
+def measure(name: str, func: Callable[[], object], number: int = 1000) -> float:
+    """Measure the average latency of a function and print the result.
+
+    Args:
+        name (str): The label printed with the result.
+        func (Callable[[], object]): The function to measure.
+        number (int): The number of calls to measure.
+
+    Returns:
+        float: The average latency in microseconds.
+
+    """
+    func()  # NOTE: Warm up caches before measuring.
+
+    samples = []
+    for _ in range(number):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+
+    mean = statistics.fmean(samples)
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(f"{name:<48} mean: {mean:>10.2f} us  p99: {p99:>10.2f} us  (n={number})")
+
+    return mean
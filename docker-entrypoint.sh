@@ -3,8 +3,12 @@ set -e
 
 echo "Creating keys..."
 mkdir -p /keys
-openssl genpkey -algorithm RSA -out /keys/private_key.pem
-openssl rsa -pubout -in /keys/private_key.pem -out /keys/public_key.pem
+case "$JWT_ALGORITHM" in
+  ES256) openssl genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 -out /keys/private_key.pem ;;
+  EdDSA) openssl genpkey -algorithm ED25519 -out /keys/private_key.pem ;;
+  *) openssl genpkey -algorithm RSA -out /keys/private_key.pem ;;
+esac
+openssl pkey -pubout -in /keys/private_key.pem -out /keys/public_key.pem
 
 echo "Waiting for Database..." && sleep 20
 task migrate
@@ -0,0 +1,43 @@
+"""add lookup indexes
+
+Revision ID: 1f0ddab3de0e
+Revises: dbd17ec698c8
+Create Date: 2026-10-18 09:30:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1f0ddab3de0e"
+down_revision: Union[str, None] = "dbd17ec698c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # `users.username` is already covered by its unique index.
+    op.create_index("ix_pokemon_mst_national_pokedex_number", "pokemon_mst", ["national_pokedex_number", "deleted_at"])
+    op.create_index("ix_pokemon_mst_name", "pokemon_mst", ["name", "deleted_at"])
+    # The token lookups also cover `user_id`, so that the join to `users` reads no row of the whitelist.
+    op.create_index("ix_token_whitelist_access_token", "token_whitelist", ["access_token", "deleted_at", "updated_at", "user_id"])
+    op.create_index("ix_token_whitelist_refresh_token", "token_whitelist", ["refresh_token", "deleted_at", "updated_at", "user_id"])
+    # Takes over the implicit index of the foreign key on `user_id`.
+    op.create_index("ix_token_whitelist_user_id", "token_whitelist", ["user_id", "deleted_at", "updated_at"])
+    # Both sides of the OR of the purge, merged by the optimizer.
+    op.create_index("ix_token_whitelist_updated_at", "token_whitelist", ["updated_at"])
+    op.create_index("ix_token_whitelist_deleted_at", "token_whitelist", ["deleted_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_token_whitelist_deleted_at", table_name="token_whitelist")
+    op.drop_index("ix_token_whitelist_updated_at", table_name="token_whitelist")
+    # The foreign key needs an index on `user_id` at all times.
+    op.create_index("user_id", "token_whitelist", ["user_id"])
+    op.drop_index("ix_token_whitelist_user_id", table_name="token_whitelist")
+    op.drop_index("ix_token_whitelist_refresh_token", table_name="token_whitelist")
+    op.drop_index("ix_token_whitelist_access_token", table_name="token_whitelist")
+    op.drop_index("ix_pokemon_mst_name", table_name="pokemon_mst")
+    op.drop_index("ix_pokemon_mst_national_pokedex_number", table_name="pokemon_mst")
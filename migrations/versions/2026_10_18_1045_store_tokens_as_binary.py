@@ -0,0 +1,139 @@
+"""store tokens as binary
+
+Revision ID: 7c2e9b41d5a3
+Revises: 1f0ddab3de0e
+Create Date: 2026-10-18 10:45:27.903114
+
+The tokens are copied into new BINARY(16) columns while the application keeps serving:
+the columns are added instantly, and triggers convert the tokens of every row inserted
+or updated from then on. The rows written before are filled batch after batch, each
+batch committed on its own so that no lock is held for long. A row whose tokens are not
+UUIDs cannot match any lookup, so it is deleted rather than converted.
+
+The columns are swapped at the end by a single ALTER TABLE, once the triggers are
+dropped and the rows written meanwhile have caught up. The ALTER TABLE is atomic: should
+a row be written between the catch-up and the ALTER TABLE, it fails without any change,
+and the catch-up and the ALTER TABLE are run again.
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9b41d5a3"
+down_revision: Union[str, None] = "1f0ddab3de0e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10000
+SWAP_ATTEMPTS = 5
+# The error of MySQL raised when a NOT NULL column is given a row with NULL.
+INVALID_USE_OF_NULL = 1138
+TRIGGERS = (
+    ("token_whitelist_convert_insert", "INSERT"),
+    ("token_whitelist_convert_update", "UPDATE"),
+)
+# The conversions of a token, where `{0}` is the column of the token.
+UUID_TO_BIN = "IF(IS_UUID({0}), UUID_TO_BIN({0}), NULL)"
+BIN_TO_UUID = "BIN_TO_UUID({0})"
+
+
+def backfill(statement: str) -> None:
+    """Run an UPDATE of the new columns over every row, one batch of IDs at a time."""
+    if context.is_offline_mode():
+        op.execute(statement)
+        return
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        low, high = bind.execute(sa.text("SELECT MIN(id), MAX(id) FROM token_whitelist")).one()
+
+        if low is None:
+            return
+
+        for start in range(low, high + 1, BATCH_SIZE):
+            bind.execute(
+                sa.text(f"{statement} AND id BETWEEN :start AND :end"),
+                {"start": start, "end": start + BATCH_SIZE - 1},
+            )
+
+
+def create_triggers(convert: str) -> None:
+    """Convert the tokens of every row inserted or updated, until the swap."""
+    for trigger, event in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {trigger} BEFORE {event} ON token_whitelist FOR EACH ROW "
+            f"SET NEW.new_access_token = {convert.format('NEW.access_token')}, "
+            f"NEW.new_refresh_token = {convert.format('NEW.refresh_token')}"
+        )
+
+
+def convert_tokens(convert: str) -> str:
+    """Build the UPDATE of the new columns of the rows not converted yet."""
+    return (
+        "UPDATE token_whitelist "
+        f"SET new_access_token = {convert.format('access_token')}, "
+        f"new_refresh_token = {convert.format('refresh_token')} "
+        "WHERE new_access_token IS NULL"
+    )
+
+
+def catch_up(convert: str) -> None:
+    """Convert the rows written since the triggers were dropped, and delete the rest."""
+    op.execute(convert_tokens(convert))
+    op.execute("DELETE FROM token_whitelist WHERE new_access_token IS NULL OR new_refresh_token IS NULL")
+
+
+def swap(convert: str, column_type: str) -> None:
+    """Replace the token columns with the new ones, and index them again."""
+    for trigger, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    statement = (
+        "ALTER TABLE token_whitelist "
+        "DROP INDEX ix_token_whitelist_access_token, "
+        "DROP INDEX ix_token_whitelist_refresh_token, "
+        "DROP COLUMN access_token, "
+        "DROP COLUMN refresh_token, "
+        f"CHANGE COLUMN new_access_token access_token {column_type} NOT NULL COMMENT 'Access Token', "
+        f"CHANGE COLUMN new_refresh_token refresh_token {column_type} NOT NULL COMMENT 'Refresh Token', "
+        "ADD INDEX ix_token_whitelist_access_token (access_token, deleted_at, updated_at, user_id), "
+        "ADD INDEX ix_token_whitelist_refresh_token (refresh_token, deleted_at, updated_at, user_id)"
+    )
+
+    if context.is_offline_mode():
+        catch_up(convert)
+        op.execute(statement)
+        return
+
+    for attempt in range(SWAP_ATTEMPTS):
+        catch_up(convert)
+
+        try:
+            op.execute(statement)
+            return
+        except sa.exc.OperationalError as e:
+            # NOTE: A row written since the catch-up has no new tokens.
+            if e.orig is None or e.orig.args[0] != INVALID_USE_OF_NULL or attempt == SWAP_ATTEMPTS - 1:
+                raise
+
+
+def upgrade() -> None:
+    op.add_column("token_whitelist", sa.Column("new_access_token", sa.BINARY(length=16), nullable=True, comment="Access Token"))
+    op.add_column("token_whitelist", sa.Column("new_refresh_token", sa.BINARY(length=16), nullable=True, comment="Refresh Token"))
+
+    create_triggers(UUID_TO_BIN)
+    backfill(convert_tokens(UUID_TO_BIN))
+    swap(UUID_TO_BIN, "BINARY(16)")
+
+
+def downgrade() -> None:
+    op.add_column("token_whitelist", sa.Column("new_access_token", sa.String(length=36), nullable=True, comment="Access Token"))
+    op.add_column("token_whitelist", sa.Column("new_refresh_token", sa.String(length=36), nullable=True, comment="Refresh Token"))
+
+    create_triggers(BIN_TO_UUID)
+    backfill(convert_tokens(BIN_TO_UUID))
+    swap(BIN_TO_UUID, "VARCHAR(36)")
@@ -0,0 +1,36 @@
+"""create token revocation
+
+Revision ID: 4b8d1e6f0a27
+Revises: 7c2e9b41d5a3
+Create Date: 2026-10-18 12:00:41.562093
+
+The access tokens replaced by a rotation are recorded here, so that the workers trusting
+access tokens on their signature alone can learn of the revocations.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8d1e6f0a27"
+down_revision: Union[str, None] = "7c2e9b41d5a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table("token_revocation",
+    sa.Column("id", sa.Integer(), autoincrement=True, nullable=False, comment="ID"),
+    sa.Column("access_token", sa.BINARY(length=16), nullable=False, comment="Access Token"),
+    sa.Column("revoked_at", sa.DateTime(), nullable=False, comment="Revocation DateTime"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_token_revocation_revoked_at", "token_revocation", ["revoked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_token_revocation_revoked_at", table_name="token_revocation")
+    op.drop_table("token_revocation")
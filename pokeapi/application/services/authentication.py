@@ -5,12 +5,13 @@ from injector import inject, singleton
 
 from pokeapi.dependencies.settings.config import AppConfigABC
 from pokeapi.domain.entities.token import Token
-from pokeapi.domain.repositories.token_whitelist import TokenWhitelistRepositoryABC
+from pokeapi.domain.entities.user import User
 from pokeapi.domain.repositories.user import UserRepositoryABC
 from pokeapi.domain.services.password_abc import PasswordServiceABC
 from pokeapi.domain.services.token_abc import TokenServiceABC
 from pokeapi.exceptions.authentication import AuthenticationError
-from pokeapi.exceptions.user import UserNotFoundError
+from pokeapi.exceptions.password import PasswordHashingBusyError
+from pokeapi.exceptions.user import UserUpdateError
 
 from .authentication_abc import AuthenticationServiceABC
 
@@ -27,8 +28,6 @@ class AuthenticationService(AuthenticationServiceABC):
         _config (AppConfigABC): The application configuration.
         _password_service (PasswordServiceABC): The service used to hash and verify passwords.
         _token_service (TokenServiceABC): The service used to generate and verify tokens.
-        _token_whitelist_repo (TokenWhitelistRepositoryABC):
-            The repository used to manage token whitelists.
         _user_repo (UserRepositoryABC): The repository used to retrieve user data.
 
     """
@@ -39,7 +38,6 @@ class AuthenticationService(AuthenticationServiceABC):
         config: AppConfigABC,
         password_service: PasswordServiceABC,
         token_service: TokenServiceABC,
-        token_whitelist_repo: TokenWhitelistRepositoryABC,
         user_repo: UserRepositoryABC,
     ) -> None:
         """Initialize the AuthenticationService with services and repositories.
@@ -48,8 +46,6 @@ class AuthenticationService(AuthenticationServiceABC):
             config (AppConfigABC): The application configuration.
             password_service (PasswordServiceABC): The service used to hash and verify passwords.
             token_service (TokenServiceABC): The service used to generate and verify tokens.
-            token_whitelist_repo (TokenWhitelistRepositoryABC):
-                The repository used to manage token whitelists.
             user_repo (UserRepositoryABC): The repository used to retrieve user data.
 
         """
@@ -57,7 +53,6 @@ class AuthenticationService(AuthenticationServiceABC):
         self._config = config
         self._password_service = password_service
         self._token_service = token_service
-        self._token_whitelist_repo = token_whitelist_repo
         self._user_repo = user_repo
 
     def auth(self, username: str, password: str) -> Token:
@@ -65,7 +60,8 @@ class AuthenticationService(AuthenticationServiceABC):
 
         This method authenticates a user with the given credentials and returns a token if the
         credentials are valid. If the user is not found or the password is incorrect, an
-        AuthenticationError is raised.
+        AuthenticationError is raised. If the password was hashed with outdated argon2
+        parameters, it is hashed again and stored, without failing the login.
 
         Args:
             username (str): The username of the user to authenticate.
@@ -92,20 +88,41 @@ class AuthenticationService(AuthenticationServiceABC):
             )
             raise AuthenticationError("Password is incorrect.")
 
-        # NOTE: Delete expired tokens.
-        exp = datetime.datetime.now() - datetime.timedelta(
-            hours=self._config.refresh_token_lifetime
-        )
-        self._token_whitelist_repo.delete(user.id_, exp)
+        if self._password_service.needs_rehash(user.password):
+            user = self._rehash(user, password)
 
         return self._token_service.create(user)
 
+    def _rehash(self, user: User, password: str) -> User:
+        """Hash a verified password again with the current parameters and store it.
+
+        Args:
+            user (User): The authenticated user.
+            password (str): The verified password of the user.
+
+        Returns:
+            User: The updated user, or the user as is if the password was not updated.
+
+        """
+        try:
+            return self._user_repo.update(
+                user.model_copy(
+                    update={"password": self._password_service.hash(password)}
+                )
+            )
+        except (PasswordHashingBusyError, UserUpdateError) as e:
+            self._logger.warning(
+                f"Failed to rehash the password. user_id: {user.id_}, error: {e}"
+            )
+
+            return user
+
     def refresh(self, token: str) -> Token:
         """Refresh a user's token.
 
-        This method refreshes a user's token using the refresh token provided. If the refresh token
-        is not found or has expired, an AuthenticationError is raised. If the user associated with
-        the refresh token is not found, a UserNotFoundError is raised.
+        This method replaces the refresh token provided with a new token. If the refresh
+        token is not found, has expired, or has been replaced concurrently, an
+        AuthenticationError is raised.
 
         Args:
             token (str): The refresh token to use to refresh the user's token.
@@ -115,32 +132,26 @@ class AuthenticationService(AuthenticationServiceABC):
 
         Raises:
             AuthenticationError: If the refresh token is not found or has expired.
-            UserNotFoundError: If the user associated with the refresh token is not found.
 
         """
         exp = datetime.datetime.now() - datetime.timedelta(
             hours=self._config.refresh_token_lifetime
         )
-        valid_token = self._token_whitelist_repo.get_by_refresh_token(token, exp)
+        user = self._user_repo.get_by_refresh_token(token, exp)
 
-        if valid_token is None:
+        if user is None:
             self._logger.info(
                 "The token was not found in the whitelist with the specified refresh token."
             )
             raise AuthenticationError("User is not authenticated.")
 
-        user = self._user_repo.get_by_id(valid_token.user_id)
+        refreshed_token = self._token_service.rotate(user, token, exp)
 
-        if user is None:
+        if refreshed_token is None:
             self._logger.info(
-                ValueError(
-                    "The user associated with the specified refresh token was not found."
-                    f"user_id: {valid_token.user_id}"
-                )
+                "The specified refresh token was replaced by a concurrent refresh."
+                f" user_id: {user.id_}"
             )
-            raise UserNotFoundError("User not found.")
-
-        # NOTE: Delete expired tokens.
-        self._token_whitelist_repo.delete(user.id_, exp)
+            raise AuthenticationError("User is not authenticated.")
 
-        return self._token_service.update(user, valid_token.id_)
+        return refreshed_token
@@ -0,0 +1,96 @@
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import Any, Protocol, TypeVar
+
+from pokeapi.domain.services.cache_abc import CacheABC
+
+
+class _Identifiable(Protocol):
+    @property
+    def id_(self) -> int:
+        ...  # pragma: no cover
+
+
+T = TypeVar("T")
+
+
+def cache_key(kind: str, field: str, value: object) -> str:
+    """Build the key of a cached lookup.
+
+    Args:
+        kind (str): The kind of master data (e.g. 'pokemon').
+        field (str): The field looked up (e.g. 'id').
+        value (object): The value looked up.
+
+    Returns:
+        str: The key of the lookup.
+
+    """
+    return f"{kind}:{field}:{value}"
+
+
+async def read_through_async(
+    cache: CacheABC, key: str, load: Callable[[], Awaitable[T | None]]
+) -> T | None:
+    """Retrieve a value from the cache, or load and cache it when missing.
+
+    Args:
+        cache (CacheABC): The cache of the lookup.
+        key (str): The key of the lookup.
+        load (Callable[[], Awaitable[T | None]]): The coroutine function loading the
+            value.
+
+    Returns:
+        T | None: The value, or None if it does not exist.
+
+    """
+    [value] = await cache.get_many_async([key])
+
+    if value is None:
+        value = await load()
+        await cache.set_many_async({key: value})
+
+    return value
+
+
+async def split_cached_async(
+    cache: CacheABC, kind: str, ids: Sequence[int]
+) -> tuple[list[Any], list[int]]:
+    """Take the entities cached by identifier, and the identifiers left to load.
+
+    Args:
+        cache (CacheABC): The cache of the entities.
+        kind (str): The kind of master data.
+        ids (Sequence[int]): The identifiers of the entities.
+
+    Returns:
+        tuple[list[Any], list[int]]: The cached entities, and the identifiers of
+            the entities missing from the cache.
+
+    """
+    entities = await cache.get_many_async([cache_key(kind, "id", id_) for id_ in ids])
+    cached: list[Any] = []
+    missing: list[int] = []
+
+    for id_, entity in zip(ids, entities, strict=True):
+        if entity is None:
+            missing.append(id_)
+        else:
+            cached.append(entity)
+
+    return cached, missing
+
+
+async def store_by_id_async(
+    cache: CacheABC, kind: str, entities: Iterable[_Identifiable]
+) -> None:
+    """Cache entities by identifier, as their lookup by identifier would.
+
+    Args:
+        cache (CacheABC): The cache of the entities.
+        kind (str): The kind of master data.
+        entities (Iterable[_Identifiable]): The entities to be cached.
+
+    """
+    await cache.set_many_async(
+        {cache_key(kind, "id", entity.id_): entity for entity in entities}
+    )
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from injector import inject, singleton
 
 from pokeapi.domain.entities.pokemon import Pokemon
@@ -72,3 +74,40 @@ class PokemonService(PokemonServiceABC):
 
         """
         return self._repo.get_all()
+
+    def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+    ) -> list[Pokemon]:
+        """Retrieve a page of Pokémon ordered by their identifiers.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+
+        Returns:
+            list[Pokemon]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        return self._repo.get_page(limit, after=after, before=before, backward=backward)
+
+    def get_by_ids(self, ids: Sequence[int]) -> list[Pokemon]:
+        """Retrieve Pokémon by their identifiers.
+
+        Identifiers without a matching Pokémon are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+
+        Returns:
+            list[Pokemon]: The Pokémon with the specified identifiers, in no particular
+                order.
+
+        """
+        return self._repo.get_by_ids(ids)
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from injector import inject, singleton
 
 from pokeapi.domain.entities.pokemon_ability import PokemonAbility
@@ -48,3 +50,18 @@ class AbilityService(AbilityServiceABC):
 
         """
         return self._repo.get_all()
+
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers.
+
+        Identifiers without a matching ability are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        return self._repo.get_by_ids(ids)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from pokeapi.domain.entities.pokemon_ability import PokemonAbility
 
@@ -33,3 +34,19 @@ class AbilityServiceABC(ABC):
 
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers.
+
+        Identifiers without a matching ability are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
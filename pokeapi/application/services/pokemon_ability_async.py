@@ -0,0 +1,67 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.repositories.pokemon_ability_async import AsyncAbilityRepositoryABC
+
+from .pokemon_ability_async_abc import AsyncAbilityServiceABC
+
+
+@singleton
+class AsyncAbilityService(AsyncAbilityServiceABC):
+    """Concrete implementation of an async ability service.
+
+    This class provides concrete implementations of the abstract methods defined in the
+    AsyncAbilityServiceABC class. It is responsible for retrieving abilities from the repository.
+
+    Attributes:
+        _repo (AsyncAbilityRepositoryABC): The repository used by the service.
+
+    """
+
+    @inject
+    def __init__(self, repo: AsyncAbilityRepositoryABC):
+        """Initialize the AsyncAbilityService with a repository.
+
+        Args:
+            repo (AsyncAbilityRepositoryABC): The repository used by the service.
+
+        """
+        self._repo = repo
+
+    async def get_by_id(self, id_: int) -> PokemonAbility | None:
+        """Retrieve a ability by its identifier.
+
+        Args:
+            id_ (int): The identifier of the ability to retrieve.
+
+        Returns:
+            PokemonAbility | None: The ability with the specified identifier, or None if not found.
+
+        """
+        return await self._repo.get_by_id(id_)
+
+    async def get_all(self) -> list[PokemonAbility]:
+        """Retrieve all ability from the repository.
+
+        Returns:
+            list[PokemonAbility]: A list of all ability in the repository.
+
+        """
+        return await self._repo.get_all()
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers.
+
+        Identifiers without a matching ability are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        return await self._repo.get_by_ids(ids)
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+
+
+class AsyncAbilityServiceABC(ABC):
+    """Abstract base class for async ability services.
+
+    This class defines the async counterpart of AbilityServiceABC. Concrete implementations
+    should inherit from this class and provide implementations for the abstract methods.
+
+    """
+
+    @abstractmethod
+    async def get_by_id(self, id_: int) -> PokemonAbility | None:
+        """Retrieve a type by its identifier.
+
+        Args:
+            id_ (int): The identifier of the ability to retrieve.
+
+        Returns:
+            PokemonAbility | None: The ability with the specified identifier, or None if not found.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_all(self) -> list[PokemonAbility]:
+        """Retrieve all ability from the repository.
+
+        Returns:
+            list[PokemonAbility]: A list of all ability in the repository.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers.
+
+        Identifiers without a matching ability are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
@@ -0,0 +1,115 @@
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.services.cache_abc import CacheABC
+
+from .cache_utils import (
+    cache_key,
+    read_through_async,
+    split_cached_async,
+    store_by_id_async,
+)
+from .pokemon_ability_async_abc import AsyncAbilityServiceABC
+
+KIND = "ability"
+
+
+def ability_keys(ability: PokemonAbility) -> list[str]:
+    """List the keys an ability is cached under.
+
+    Args:
+        ability (PokemonAbility): The ability.
+
+    Returns:
+        list[str]: The key of the lookup returning the ability, and of the lookup of all
+            abilities.
+
+    """
+    return [cache_key(KIND, "id", ability.id_), cache_key(KIND, "all", None)]
+
+
+class AsyncCachedAbilityService(AsyncAbilityServiceABC):
+    """An async ability service caching the lookups of another.
+
+    The lookups by identifier, and of all abilities, are read through the cache.
+
+    Attributes:
+        _service (AsyncAbilityServiceABC): The service retrieving the abilities.
+        _cache (CacheABC): The cache of abilities.
+
+    """
+
+    def __init__(self, service: AsyncAbilityServiceABC, cache: CacheABC) -> None:
+        """Initialize the AsyncCachedAbilityService with a service and its cache.
+
+        Args:
+            service (AsyncAbilityServiceABC): The service retrieving the abilities.
+            cache (CacheABC): The cache of abilities.
+
+        """
+        self._service = service
+        self._cache = cache
+
+    async def invalidate(self, ability: PokemonAbility | None = None) -> None:
+        """Invalidate the cached lookups of an ability, or of every ability.
+
+        Args:
+            ability (PokemonAbility | None): The ability to be invalidated, or None to
+                invalidate every ability.
+
+        """
+        if ability is None:
+            await self._cache.clear_async()
+        else:
+            await self._cache.delete_async(*ability_keys(ability))
+
+    async def get_by_id(self, id_: int) -> PokemonAbility | None:
+        """Retrieve an ability by its identifier.
+
+        Args:
+            id_ (int): The identifier of the ability to retrieve.
+
+        Returns:
+            PokemonAbility | None: The ability with the specified identifier, or None if not found.
+
+        """
+        return await read_through_async(
+            self._cache,
+            cache_key(KIND, "id", id_),
+            lambda: self._service.get_by_id(id_),
+        )
+
+    async def get_all(self) -> list[PokemonAbility]:
+        """Retrieve all abilities from the repository.
+
+        Returns:
+            list[PokemonAbility]: A list of all abilities in the repository.
+
+        """
+        abilities = await read_through_async(
+            self._cache, cache_key(KIND, "all", None), self._service.get_all
+        )
+
+        return list(abilities or [])
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers, loading only those not cached.
+
+        Identifiers without a matching ability are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        abilities, missing = await split_cached_async(self._cache, KIND, ids)
+
+        if missing:
+            loaded = await self._service.get_by_ids(missing)
+            await store_by_id_async(self._cache, KIND, loaded)
+            abilities.extend(loaded)
+
+        return abilities
@@ -0,0 +1,115 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.domain.repositories.pokemon_async import AsyncPokemonRepositoryABC
+
+from .pokemon_async_abc import AsyncPokemonServiceABC
+
+
+@singleton
+class AsyncPokemonService(AsyncPokemonServiceABC):
+    """Concrete implementation of an async Pokémon service.
+
+    This class provides concrete implementations of the abstract methods defined in the
+    AsyncPokemonServiceABC class. It is responsible for retrieving Pokémon from the repository.
+
+    Attributes:
+        _repo (AsyncPokemonRepositoryABC): The repository used by the service.
+
+    """
+
+    @inject
+    def __init__(self, repo: AsyncPokemonRepositoryABC):
+        """Initialize the AsyncPokemonService with a repository.
+
+        Args:
+            repo (AsyncPokemonRepositoryABC): The repository used by the service.
+
+        """
+        self._repo = repo
+
+    async def get_by_id(self, id_: int) -> Pokemon | None:
+        """Retrieve a pokemon by its identifier.
+
+        Args:
+            id_ (int): The identifier of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the given identifier, or None if it does not exist.
+
+        """
+        return await self._repo.get_by_id(id_)
+
+    async def get_by_pokedex_number(self, pokedex_number: int) -> Pokemon | None:
+        """Retrieve a Pokémon by its Pokédex number.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the specified Pokédex number, or None if not found.
+
+        """
+        return await self._repo.get_by_pokedex_number(pokedex_number)
+
+    async def get_by_name(self, name: str) -> Pokemon | None:
+        """Retrieve a Pokémon by its name.
+
+        Args:
+            name (str): The name of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the specified name, or None if not found.
+
+        """
+        return await self._repo.get_by_name(name)
+
+    async def get_all(self) -> list[Pokemon]:
+        """Retrieve all Pokémon from the repository.
+
+        Returns:
+            list[Pokemon]: A list of all Pokémon in the repository.
+
+        """
+        return await self._repo.get_all()
+
+    async def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+    ) -> list[Pokemon]:
+        """Retrieve a page of Pokémon ordered by their identifiers.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+
+        Returns:
+            list[Pokemon]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        return await self._repo.get_page(
+            limit, after=after, before=before, backward=backward
+        )
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[Pokemon]:
+        """Retrieve Pokémon by their identifiers.
+
+        Identifiers without a matching Pokémon are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+
+        Returns:
+            list[Pokemon]: The Pokémon with the specified identifiers, in no particular
+                order.
+
+        """
+        return await self._repo.get_by_ids(ids)
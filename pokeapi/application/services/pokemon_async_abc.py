@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon import Pokemon
+
+
+class AsyncPokemonServiceABC(ABC):
+    """Abstract base class for async Pokémon services.
+
+    This class defines the async counterpart of PokemonServiceABC. Concrete implementations
+    should inherit from this class and provide implementations for the abstract methods.
+
+    """
+
+    @abstractmethod
+    async def get_by_id(self, id_: int) -> Pokemon | None:
+        """Retrieve a Pokémon by its identifier.
+
+        Args:
+            id_ (int): The identifier of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the specified identifier, or None if not found.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_pokedex_number(self, pokedex_number: int) -> Pokemon | None:
+        """Retrieve a Pokémon by its Pokédex number.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the specified Pokédex number, or None if not found.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_name(self, name: str) -> Pokemon | None:
+        """Retrieve a Pokémon by its name.
+
+        Args:
+            name (str): The name of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the specified name, or None if not found.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_all(self) -> list[Pokemon]:
+        """Retrieve all Pokémon from the repository.
+
+        Returns:
+            list[Pokemon]: A list of all Pokémon in the repository.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+    ) -> list[Pokemon]:
+        """Retrieve a page of Pokémon ordered by their identifiers.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+
+        Returns:
+            list[Pokemon]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_ids(self, ids: Sequence[int]) -> list[Pokemon]:
+        """Retrieve Pokémon by their identifiers.
+
+        Identifiers without a matching Pokémon are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+
+        Returns:
+            list[Pokemon]: The Pokémon with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
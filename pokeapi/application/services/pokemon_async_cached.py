@@ -0,0 +1,177 @@
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.domain.services.cache_abc import CacheABC
+
+from .cache_utils import (
+    cache_key,
+    read_through_async,
+    split_cached_async,
+    store_by_id_async,
+)
+from .pokemon_async_abc import AsyncPokemonServiceABC
+
+KIND = "pokemon"
+
+
+def pokemon_keys(pokemon: Pokemon) -> list[str]:
+    """List the keys a Pokémon is cached under.
+
+    Args:
+        pokemon (Pokemon): The Pokémon.
+
+    Returns:
+        list[str]: The keys of the lookups returning the Pokémon, and of the lookup of
+            all Pokémon.
+
+    """
+    return [
+        cache_key(KIND, "id", pokemon.id_),
+        cache_key(KIND, "pokedex_number", pokemon.national_pokedex_number),
+        cache_key(KIND, "name", pokemon.name),
+        cache_key(KIND, "all", None),
+    ]
+
+
+class AsyncCachedPokemonService(AsyncPokemonServiceABC):
+    """An async Pokémon service caching the lookups of another.
+
+    The lookups by identifier, Pokédex number and name, and of all Pokémon, are read
+    through the cache. Pages are not cached, since they depend on their cursors.
+
+    Attributes:
+        _service (AsyncPokemonServiceABC): The service retrieving the Pokémon.
+        _cache (CacheABC): The cache of Pokémon.
+
+    """
+
+    def __init__(self, service: AsyncPokemonServiceABC, cache: CacheABC) -> None:
+        """Initialize the AsyncCachedPokemonService with a service and its cache.
+
+        Args:
+            service (AsyncPokemonServiceABC): The service retrieving the Pokémon.
+            cache (CacheABC): The cache of Pokémon.
+
+        """
+        self._service = service
+        self._cache = cache
+
+    async def invalidate(self, pokemon: Pokemon | None = None) -> None:
+        """Invalidate the cached lookups of a Pokémon, or of every Pokémon.
+
+        Args:
+            pokemon (Pokemon | None): The Pokémon to be invalidated, or None to
+                invalidate every Pokémon.
+
+        """
+        if pokemon is None:
+            await self._cache.clear_async()
+        else:
+            await self._cache.delete_async(*pokemon_keys(pokemon))
+
+    async def get_by_id(self, id_: int) -> Pokemon | None:
+        """Retrieve a pokemon by its identifier.
+
+        Args:
+            id_ (int): The identifier of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the given identifier, or None if it does not exist.
+
+        """
+        return await read_through_async(
+            self._cache,
+            cache_key(KIND, "id", id_),
+            lambda: self._service.get_by_id(id_),
+        )
+
+    async def get_by_pokedex_number(self, pokedex_number: int) -> Pokemon | None:
+        """Retrieve a Pokémon by its Pokédex number.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the specified Pokédex number, or None if not found.
+
+        """
+        return await read_through_async(
+            self._cache,
+            cache_key(KIND, "pokedex_number", pokedex_number),
+            lambda: self._service.get_by_pokedex_number(pokedex_number),
+        )
+
+    async def get_by_name(self, name: str) -> Pokemon | None:
+        """Retrieve a Pokémon by its name.
+
+        Args:
+            name (str): The name of the Pokémon to retrieve.
+
+        Returns:
+            Pokemon | None: The Pokémon with the specified name, or None if not found.
+
+        """
+        return await read_through_async(
+            self._cache,
+            cache_key(KIND, "name", name),
+            lambda: self._service.get_by_name(name),
+        )
+
+    async def get_all(self) -> list[Pokemon]:
+        """Retrieve all Pokémon from the repository.
+
+        Returns:
+            list[Pokemon]: A list of all Pokémon in the repository.
+
+        """
+        pokemons = await read_through_async(
+            self._cache, cache_key(KIND, "all", None), self._service.get_all
+        )
+
+        return list(pokemons or [])
+
+    async def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+    ) -> list[Pokemon]:
+        """Retrieve a page of Pokémon ordered by their identifiers, without caching.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+
+        Returns:
+            list[Pokemon]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        return await self._service.get_page(
+            limit, after=after, before=before, backward=backward
+        )
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[Pokemon]:
+        """Retrieve Pokémon by their identifiers, loading only those not cached.
+
+        Identifiers without a matching Pokémon are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+
+        Returns:
+            list[Pokemon]: The Pokémon with the specified identifiers, in no particular
+                order.
+
+        """
+        pokemons, missing = await split_cached_async(self._cache, KIND, ids)
+
+        if missing:
+            loaded = await self._service.get_by_ids(missing)
+            await store_by_id_async(self._cache, KIND, loaded)
+            pokemons.extend(loaded)
+
+        return pokemons
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from injector import inject, singleton
 
 from pokeapi.domain.entities.pokemon_type import PokemonType
@@ -48,3 +50,18 @@ class TypeService(TypeServiceABC):
 
         """
         return self._repo.get_all()
+
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers.
+
+        Identifiers without a matching type are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        return self._repo.get_by_ids(ids)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from pokeapi.domain.entities.pokemon_type import PokemonType
 
@@ -33,3 +34,19 @@ class TypeServiceABC(ABC):
 
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers.
+
+        Identifiers without a matching type are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
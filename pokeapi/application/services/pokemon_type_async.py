@@ -0,0 +1,67 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.domain.repositories.pokemon_type_async import AsyncTypeRepositoryABC
+
+from .pokemon_type_async_abc import AsyncTypeServiceABC
+
+
+@singleton
+class AsyncTypeService(AsyncTypeServiceABC):
+    """Concrete implementation of an async type service.
+
+    This class provides concrete implementations of the abstract methods defined in the
+    AsyncTypeServiceABC class. It is responsible for retrieving types from the repository.
+
+    Attributes:
+        _repo (AsyncTypeRepositoryABC): The repository used by the service.
+
+    """
+
+    @inject
+    def __init__(self, repo: AsyncTypeRepositoryABC):
+        """Initialize the AsyncTypeService with a repository.
+
+        Args:
+            repo (AsyncTypeRepositoryABC): The repository used by the service.
+
+        """
+        self._repo = repo
+
+    async def get_by_id(self, id_: int) -> PokemonType | None:
+        """Retrieve a type by its identifier.
+
+        Args:
+            id_ (int): The identifier of the type to retrieve.
+
+        Returns:
+            PokemonType | None: The type with the specified identifier, or None if not found.
+
+        """
+        return await self._repo.get_by_id(id_)
+
+    async def get_all(self) -> list[PokemonType]:
+        """Retrieve all type from the repository.
+
+        Returns:
+            list[PokemonType]: A list of all type in the repository.
+
+        """
+        return await self._repo.get_all()
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers.
+
+        Identifiers without a matching type are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        return await self._repo.get_by_ids(ids)
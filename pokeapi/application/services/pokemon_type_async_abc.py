@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+
+
+class AsyncTypeServiceABC(ABC):
+    """Abstract base class for async type services.
+
+    This class defines the async counterpart of TypeServiceABC. Concrete implementations
+    should inherit from this class and provide implementations for the abstract methods.
+
+    """
+
+    @abstractmethod
+    async def get_by_id(self, id_: int) -> PokemonType | None:
+        """Retrieve a type by its identifier.
+
+        Args:
+            id_ (int): The identifier of the type to retrieve.
+
+        Returns:
+            PokemonType | None: The type with the specified identifier, or None if not found.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_all(self) -> list[PokemonType]:
+        """Retrieve all type from the repository.
+
+        Returns:
+            list[PokemonType]: A list of all type in the repository.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers.
+
+        Identifiers without a matching type are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
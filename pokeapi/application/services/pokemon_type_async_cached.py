@@ -0,0 +1,115 @@
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.domain.services.cache_abc import CacheABC
+
+from .cache_utils import (
+    cache_key,
+    read_through_async,
+    split_cached_async,
+    store_by_id_async,
+)
+from .pokemon_type_async_abc import AsyncTypeServiceABC
+
+KIND = "type"
+
+
+def type_keys(type_: PokemonType) -> list[str]:
+    """List the keys a type is cached under.
+
+    Args:
+        type_ (PokemonType): The type.
+
+    Returns:
+        list[str]: The key of the lookup returning the type, and of the lookup of all
+            types.
+
+    """
+    return [cache_key(KIND, "id", type_.id_), cache_key(KIND, "all", None)]
+
+
+class AsyncCachedTypeService(AsyncTypeServiceABC):
+    """An async type service caching the lookups of another.
+
+    The lookups by identifier, and of all types, are read through the cache.
+
+    Attributes:
+        _service (AsyncTypeServiceABC): The service retrieving the types.
+        _cache (CacheABC): The cache of types.
+
+    """
+
+    def __init__(self, service: AsyncTypeServiceABC, cache: CacheABC) -> None:
+        """Initialize the AsyncCachedTypeService with a service and its cache.
+
+        Args:
+            service (AsyncTypeServiceABC): The service retrieving the types.
+            cache (CacheABC): The cache of types.
+
+        """
+        self._service = service
+        self._cache = cache
+
+    async def invalidate(self, type_: PokemonType | None = None) -> None:
+        """Invalidate the cached lookups of a type, or of every type.
+
+        Args:
+            type_ (PokemonType | None): The type to be invalidated, or None to
+                invalidate every type.
+
+        """
+        if type_ is None:
+            await self._cache.clear_async()
+        else:
+            await self._cache.delete_async(*type_keys(type_))
+
+    async def get_by_id(self, id_: int) -> PokemonType | None:
+        """Retrieve a type by its identifier.
+
+        Args:
+            id_ (int): The identifier of the type to retrieve.
+
+        Returns:
+            PokemonType | None: The type with the specified identifier, or None if not found.
+
+        """
+        return await read_through_async(
+            self._cache,
+            cache_key(KIND, "id", id_),
+            lambda: self._service.get_by_id(id_),
+        )
+
+    async def get_all(self) -> list[PokemonType]:
+        """Retrieve all types from the repository.
+
+        Returns:
+            list[PokemonType]: A list of all types in the repository.
+
+        """
+        types = await read_through_async(
+            self._cache, cache_key(KIND, "all", None), self._service.get_all
+        )
+
+        return list(types or [])
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers, loading only those not cached.
+
+        Identifiers without a matching type are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        types, missing = await split_cached_async(self._cache, KIND, ids)
+
+        if missing:
+            loaded = await self._service.get_by_ids(missing)
+            await store_by_id_async(self._cache, KIND, loaded)
+            types.extend(loaded)
+
+        return types
@@ -6,12 +6,11 @@ from injector import inject, singleton
 from pokeapi.dependencies.settings.config import AppConfigABC
 from pokeapi.domain.entities.token import Token
 from pokeapi.domain.entities.user import User
-from pokeapi.domain.repositories.token_whitelist import TokenWhitelistRepositoryABC
 from pokeapi.domain.repositories.user import UserRepositoryABC
 from pokeapi.domain.services.password_abc import PasswordServiceABC
+from pokeapi.domain.services.revocation_abc import TokenRevocationFilterABC
 from pokeapi.domain.services.token_abc import TokenServiceABC
 from pokeapi.exceptions.authorization import AuthorizationError
-from pokeapi.exceptions.user import UserNotFoundError
 
 from .user_abc import UserServiceABC
 
@@ -28,9 +27,9 @@ class UserService(UserServiceABC):
         _config (AppConfigABC): The application configuration.
         _password_service (PasswordServiceABC): The service used to hash and verify passwords.
         _token_service (TokenServiceABC): The service used to generate and verify tokens.
-        _token_whitelist_repo (TokenWhitelistRepositoryABC):
-            The repository used to manage token whitelists.
         _user_repo (UserRepositoryABC): The repository used to retrieve user data.
+        _revocation_filter (TokenRevocationFilterABC): The filter of the revoked access
+            tokens, used instead of the whitelist when `ACCESS_TOKEN_STATELESS` is enabled.
 
     """
 
@@ -40,8 +39,8 @@ class UserService(UserServiceABC):
         config: AppConfigABC,
         password_service: PasswordServiceABC,
         token_service: TokenServiceABC,
-        token_whitelist_repo: TokenWhitelistRepositoryABC,
         user_repo: UserRepositoryABC,
+        revocation_filter: TokenRevocationFilterABC,
     ) -> None:
         """Initialize the UserService with services and repositories.
 
@@ -49,47 +48,60 @@ class UserService(UserServiceABC):
             config (AppConfigABC): The application configuration.
             password_service (PasswordServiceABC): The service used to hash and verify passwords.
             token_service (TokenServiceABC): The service used to generate and verify tokens.
-            token_whitelist_repo (TokenWhitelistRepositoryABC):
-                The repository used to manage token whitelists.
             user_repo (UserRepositoryABC): The repository used to retrieve user data.
+            revocation_filter (TokenRevocationFilterABC): The filter of the revoked
+                access tokens.
 
         """
         self._logger = logging.getLogger(__name__)
         self._config = config
         self._password_service = password_service
         self._token_service = token_service
-        self._token_whitelist_repo = token_whitelist_repo
         self._user_repo = user_repo
+        self._revocation_filter = revocation_filter
 
     def get_by_token(self, token: str) -> User:
         payload = self._token_service.extract_payload(token)
+
+        if self._config.access_token_stateless and self._revocation_filter.is_fresh():
+            return self._get_by_payload(payload)
+
         exp = datetime.datetime.now() - datetime.timedelta(
             hours=self._config.access_token_lifetime
         )
-        valid_token = self._token_whitelist_repo.get_by_access_token(
-            payload["jti"], exp
-        )
+        user = self._user_repo.get_by_access_token(payload["sub"], payload["jti"], exp)
 
-        if not valid_token:
+        if user is None:
             self._logger.info(
-                "The token was not found in the whitelist with the specified access token."
+                "The token was not found in the whitelist with the specified access token. "
+                f"user_id: {payload['sub']}"
             )
             raise AuthorizationError("User is unauthorized")
 
-        user = self._user_repo.get_by_id(payload["sub"])
+        return user
 
-        if user is None:
-            self._logger.info(
-                "The user associated with the specified access token was not found."
-                f"user_id: {payload['sub']}"
-            )
-            raise UserNotFoundError("User not found")
+    def _get_by_payload(self, payload: dict) -> User:
+        """Get the user of a verified access token, without the whitelist.
 
-        # NOTE: Delete expired tokens.
-        refresh_exp = datetime.datetime.now() - datetime.timedelta(
-            hours=self._config.refresh_token_lifetime
-        )
-        self._token_whitelist_repo.delete(user.id_, refresh_exp)
+        Args:
+            payload (dict): The payload of the access token.
+
+        Returns:
+            User: The user the access token was issued to.
+
+        Raises:
+            AuthorizationError: If the access token was revoked or the user was not found.
+
+        """
+        if self._revocation_filter.is_revoked(payload["jti"]):
+            self._logger.info(f"The token was revoked. user_id: {payload['sub']}")
+            raise AuthorizationError("User is unauthorized")
+
+        user = self._user_repo.get_by_id(int(payload["sub"]))
+
+        if user is None:
+            self._logger.info(f"The user was not found. user_id: {payload['sub']}")
+            raise AuthorizationError("User is unauthorized")
 
         return user
 
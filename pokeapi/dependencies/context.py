@@ -1,27 +1,75 @@
+from collections.abc import AsyncIterator
+from functools import cache
+
 from injector import Injector
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.orm import Session, scoped_session
 
 from pokeapi.dependencies.di.application import ApplicationServiceModule
 from pokeapi.dependencies.di.config import ConfigModule
 from pokeapi.dependencies.di.database import DatabaseModule
 from pokeapi.dependencies.di.domain import DomainServiceModule
 from pokeapi.dependencies.di.repository import RepositoryModule
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.database.db import async_unit_of_work, unit_of_work
+from pokeapi.presentation.dataloaders import create_dataloaders
+
+
+@cache
+def get_root_container() -> Injector:
+    """Provide the process-wide root container.
+
+    The root container owns every singleton of the application (configuration,
+    database engine, repositories and services), so it is built only once per process.
+
+    Returns:
+        Injector: The root container.
+
+    """
+    return Injector(
+        [
+            ConfigModule(),
+            DatabaseModule(),
+            DomainServiceModule(),
+            RepositoryModule(),
+            ApplicationServiceModule(),
+        ]
+    )
 
 
 def get_context() -> dict:
     """Provide a custom context object
 
+    Each request receives a child of the root container. Singletons are resolved from
+    the root container, so creating the child is cheap. Each request also receives its
+    own DataLoaders, so that node lookups are batched within the request only.
+
     Returns:
         dict: A dictionary with the context object
 
     """
-    return {
-        "container": Injector(
-            [
-                ConfigModule(),
-                DatabaseModule(),
-                DomainServiceModule(),
-                RepositoryModule(),
-                ApplicationServiceModule(),
-            ]
-        )
-    }
+    container = get_root_container().create_child_injector()
+
+    return {"container": container, "dataloaders": create_dataloaders(container)}
+
+
+async def get_unit_of_work() -> AsyncIterator[None]:
+    """Scope the database session to the current request.
+
+    The session is closed once the response is finished, whether the request succeeded
+    or not. When `DB_ASYNC` is enabled, the async session is scoped to the request too.
+
+    """
+    container = get_root_container()
+    session_local = container.get(scoped_session[Session])
+
+    if not container.get(AppConfig).db_async:
+        with unit_of_work(session_local):
+            yield
+
+        return
+
+    async with async_unit_of_work(
+        session_local, container.get(async_scoped_session[AsyncSession])
+    ):
+        yield
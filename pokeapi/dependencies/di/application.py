@@ -1,4 +1,4 @@
-from injector import Binder, Module, singleton
+from injector import Binder, Injector, Module, provider, singleton
 
 from pokeapi.application.services.authentication import AuthenticationService
 from pokeapi.application.services.authentication_abc import AuthenticationServiceABC
@@ -6,10 +6,29 @@ from pokeapi.application.services.pokemon import PokemonService
 from pokeapi.application.services.pokemon_abc import PokemonServiceABC
 from pokeapi.application.services.pokemon_ability import AbilityService
 from pokeapi.application.services.pokemon_ability_abc import AbilityServiceABC
+from pokeapi.application.services.pokemon_ability_async import AsyncAbilityService
+from pokeapi.application.services.pokemon_ability_async_abc import (
+    AsyncAbilityServiceABC,
+)
+from pokeapi.application.services.pokemon_ability_async_cached import (
+    AsyncCachedAbilityService,
+)
+from pokeapi.application.services.pokemon_async import AsyncPokemonService
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
+from pokeapi.application.services.pokemon_async_cached import (
+    AsyncCachedPokemonService,
+)
 from pokeapi.application.services.pokemon_type import TypeService
 from pokeapi.application.services.pokemon_type_abc import TypeServiceABC
+from pokeapi.application.services.pokemon_type_async import AsyncTypeService
+from pokeapi.application.services.pokemon_type_async_abc import AsyncTypeServiceABC
+from pokeapi.application.services.pokemon_type_async_cached import (
+    AsyncCachedTypeService,
+)
 from pokeapi.application.services.user import UserService
 from pokeapi.application.services.user_abc import UserServiceABC
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.cache.caches import ServiceCaches
 
 
 class ApplicationServiceModule(Module):
@@ -17,6 +36,8 @@ class ApplicationServiceModule(Module):
 
     This module provides the application service as a dependency
     to be used by other classes in the application.
+    The async services of master data read through a cache when enabled for them with
+    `CACHE_POKEMON`, `CACHE_TYPE` and `CACHE_ABILITY`.
 
     """
 
@@ -32,3 +53,73 @@ class ApplicationServiceModule(Module):
         binder.bind(PokemonServiceABC, to=PokemonService, scope=singleton)  # type: ignore[type-abstract]
         binder.bind(TypeServiceABC, to=TypeService, scope=singleton)  # type: ignore[type-abstract]
         binder.bind(UserServiceABC, to=UserService, scope=singleton)  # type: ignore[type-abstract]
+
+    @singleton
+    @provider
+    def provide_async_pokemon_service(
+        self, config: AppConfig, injector: Injector
+    ) -> AsyncPokemonServiceABC:
+        """Provide the async service of Pokémon.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            AsyncPokemonServiceABC: The async service of Pokémon.
+
+        """
+        service = injector.get(AsyncPokemonService)
+
+        if config.cache_pokemon:
+            return AsyncCachedPokemonService(
+                service, injector.get(ServiceCaches).pokemon
+            )
+
+        return service
+
+    @singleton
+    @provider
+    def provide_async_type_service(
+        self, config: AppConfig, injector: Injector
+    ) -> AsyncTypeServiceABC:
+        """Provide the async service of Types.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            AsyncTypeServiceABC: The async service of Types.
+
+        """
+        service = injector.get(AsyncTypeService)
+
+        if config.cache_type:
+            return AsyncCachedTypeService(service, injector.get(ServiceCaches).type_)
+
+        return service
+
+    @singleton
+    @provider
+    def provide_async_ability_service(
+        self, config: AppConfig, injector: Injector
+    ) -> AsyncAbilityServiceABC:
+        """Provide the async service of Abilities.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            AsyncAbilityServiceABC: The async service of Abilities.
+
+        """
+        service = injector.get(AsyncAbilityService)
+
+        if config.cache_ability:
+            return AsyncCachedAbilityService(
+                service, injector.get(ServiceCaches).ability
+            )
+
+        return service
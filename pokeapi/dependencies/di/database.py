@@ -1,14 +1,24 @@
 from injector import Binder, Module, singleton
-from sqlalchemy.orm import Session
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_scoped_session
+from sqlalchemy.orm import Session, scoped_session
 
-from pokeapi.infrastructure.database.db import session_factory
+from pokeapi.infrastructure.database.db import (
+    async_engine_factory,
+    async_scoped_session_factory,
+    async_session_factory,
+    engine_factory,
+    scoped_session_factory,
+    session_factory,
+)
 
 
 class DatabaseModule(Module):
     """A module for providing database-related dependencies.
 
-    This module provides the database session and connection URL as dependencies
-    to be used by other classes in the application.
+    This module provides the database engine, the registry of sessions and the session
+    of the current unit of work as dependencies to be used by other classes in the
+    application, along with their async counterparts.
 
     """
 
@@ -19,4 +29,13 @@ class DatabaseModule(Module):
             binder (Binder): The binder to configure.
 
         """
-        binder.bind(Session, to=session_factory, scope=singleton)
+        binder.bind(Engine, to=engine_factory, scope=singleton)
+        binder.bind(scoped_session[Session], to=scoped_session_factory, scope=singleton)
+        binder.bind(Session, to=session_factory)
+        binder.bind(AsyncEngine, to=async_engine_factory, scope=singleton)
+        binder.bind(
+            async_scoped_session[AsyncSession],
+            to=async_scoped_session_factory,
+            scope=singleton,
+        )
+        binder.bind(AsyncSession, to=async_session_factory)
@@ -1,17 +1,25 @@
-from injector import Binder, Module, singleton
+from injector import Binder, Injector, Module, provider, singleton
 
+from pokeapi.dependencies.settings.config import AppConfig
 from pokeapi.domain.services.jwt import JWTService
 from pokeapi.domain.services.jwt_abc import JWTServiceABC
 from pokeapi.domain.services.password import PasswordService
 from pokeapi.domain.services.password_abc import PasswordServiceABC
+from pokeapi.domain.services.password_pool import ProcessPoolPasswordService
+from pokeapi.domain.services.revocation_abc import TokenRevocationFilterABC
 from pokeapi.domain.services.token import TokenService
 from pokeapi.domain.services.token_abc import TokenServiceABC
+from pokeapi.infrastructure.database.revocation import TokenRevocationFilter
 
 
 class DomainServiceModule(Module):
     """A module for providing domain service-related dependencies.
 
     This module provides the domain service as a dependency to be used by other classes in the domain.
+    The JWT service and the filter of revoked tokens are shared with their concrete bindings,
+    so that the metrics and the lifespan of the application see the instances in use.
+    Passwords are hashed in a pool of processes when `PASSWORD_POOL_SIZE` is positive,
+    and in-process otherwise.
 
     """
 
@@ -22,6 +30,54 @@ class DomainServiceModule(Module):
             binder (Binder): The binder to configure.
 
         """
-        binder.bind(JWTServiceABC, to=JWTService, scope=singleton)  # type: ignore[type-abstract]
-        binder.bind(PasswordServiceABC, to=PasswordService, scope=singleton)  # type: ignore[type-abstract]
         binder.bind(TokenServiceABC, to=TokenService, scope=singleton)  # type: ignore[type-abstract]
+
+    @singleton
+    @provider
+    def provide_password_service(
+        self, config: AppConfig, injector: Injector
+    ) -> PasswordServiceABC:
+        """Provide the service hashing and verifying passwords.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            PasswordServiceABC: The service hashing and verifying passwords.
+
+        """
+        if config.password_pool_size > 0:
+            return injector.get(ProcessPoolPasswordService)
+
+        return injector.get(PasswordService)
+
+    @singleton
+    @provider
+    def provide_jwt_service(self, injector: Injector) -> JWTServiceABC:
+        """Provide the service creating and decoding JWT tokens.
+
+        Args:
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            JWTServiceABC: The service creating and decoding JWT tokens.
+
+        """
+        return injector.get(JWTService)
+
+    @singleton
+    @provider
+    def provide_token_revocation_filter(
+        self, injector: Injector
+    ) -> TokenRevocationFilterABC:
+        """Provide the filter of the revoked access tokens.
+
+        Args:
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            TokenRevocationFilterABC: The filter of the revoked access tokens.
+
+        """
+        return injector.get(TokenRevocationFilter)
@@ -1,25 +1,68 @@
-from injector import Binder, Module, singleton
+from injector import Binder, Injector, Module, provider, singleton
 
+from pokeapi.dependencies.settings.config import AppConfig
 from pokeapi.domain.repositories.pokemon import PokemonRepositoryABC
 from pokeapi.domain.repositories.pokemon_ability import AbilityRepositoryABC
+from pokeapi.domain.repositories.pokemon_ability_async import (
+    AsyncAbilityRepositoryABC,
+)
+from pokeapi.domain.repositories.pokemon_async import AsyncPokemonRepositoryABC
 from pokeapi.domain.repositories.pokemon_type import TypeRepositoryABC
+from pokeapi.domain.repositories.pokemon_type_async import AsyncTypeRepositoryABC
+from pokeapi.domain.repositories.token_revocation import TokenRevocationRepositoryABC
 from pokeapi.domain.repositories.token_whitelist import TokenWhitelistRepositoryABC
 from pokeapi.domain.repositories.user import UserRepositoryABC
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.infrastructure.blocking.repositories.pokemon import (
+    BlockingPokemonRepository,
+)
+from pokeapi.infrastructure.blocking.repositories.pokemon_ability import (
+    BlockingAbilityRepository,
+)
+from pokeapi.infrastructure.blocking.repositories.pokemon_type import (
+    BlockingTypeRepository,
+)
 from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
 from pokeapi.infrastructure.database.repositories.pokemon_ability import (
     AbilityRepository,
 )
+from pokeapi.infrastructure.database.repositories.pokemon_ability_async import (
+    AsyncAbilityRepository,
+)
+from pokeapi.infrastructure.database.repositories.pokemon_async import (
+    AsyncPokemonRepository,
+)
 from pokeapi.infrastructure.database.repositories.pokemon_type import TypeRepository
+from pokeapi.infrastructure.database.repositories.pokemon_type_async import (
+    AsyncTypeRepository,
+)
+from pokeapi.infrastructure.database.repositories.token_revocation import (
+    TokenRevocationRepository,
+)
 from pokeapi.infrastructure.database.repositories.token_whitelist import (
     TokenWhitelistRepository,
 )
 from pokeapi.infrastructure.database.repositories.user import UserRepository
+from pokeapi.infrastructure.snapshot.repositories.pokemon import (
+    SnapshotPokemonRepository,
+)
+from pokeapi.infrastructure.snapshot.repositories.pokemon_ability import (
+    SnapshotAbilityRepository,
+)
+from pokeapi.infrastructure.snapshot.repositories.pokemon_type import (
+    SnapshotTypeRepository,
+)
 
 
 class RepositoryModule(Module):
     """A module for providing repository-related dependencies.
 
     This module provides the repository as a dependency to be used by other classes in the application.
+    The repositories of master data read from the in-memory snapshot when
+    `POKEDEX_SNAPSHOT` is enabled, and from the database otherwise. Their async
+    counterparts query the database through the async driver when `DB_ASYNC` is enabled,
+    and serve the sync repositories otherwise, on the blocking executor unless they read
+    from the snapshot.
 
     """
 
@@ -30,12 +73,146 @@ class RepositoryModule(Module):
             binder (Binder): The binder to configure.
 
         """
-        binder.bind(PokemonRepositoryABC, to=PokemonRepository, scope=singleton)  # type: ignore[type-abstract]
-        binder.bind(AbilityRepositoryABC, to=AbilityRepository, scope=singleton)  # type: ignore[type-abstract]
         binder.bind(
             TokenWhitelistRepositoryABC,  # type: ignore[type-abstract]
             to=TokenWhitelistRepository,
             scope=singleton,
         )
-        binder.bind(TypeRepositoryABC, to=TypeRepository, scope=singleton)  # type: ignore[type-abstract]
+        binder.bind(
+            TokenRevocationRepositoryABC,  # type: ignore[type-abstract]
+            to=TokenRevocationRepository,
+            scope=singleton,
+        )
         binder.bind(UserRepositoryABC, to=UserRepository, scope=singleton)  # type: ignore[type-abstract]
+
+    @singleton
+    @provider
+    def provide_pokemon_repository(
+        self, config: AppConfig, injector: Injector
+    ) -> PokemonRepositoryABC:
+        """Provide the repository of Pokémon.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            PokemonRepositoryABC: The repository of Pokémon.
+
+        """
+        if config.pokedex_snapshot:
+            return injector.get(SnapshotPokemonRepository)
+
+        return injector.get(PokemonRepository)
+
+    @singleton
+    @provider
+    def provide_type_repository(
+        self, config: AppConfig, injector: Injector
+    ) -> TypeRepositoryABC:
+        """Provide the repository of Types.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            TypeRepositoryABC: The repository of Types.
+
+        """
+        if config.pokedex_snapshot:
+            return injector.get(SnapshotTypeRepository)
+
+        return injector.get(TypeRepository)
+
+    @singleton
+    @provider
+    def provide_ability_repository(
+        self, config: AppConfig, injector: Injector
+    ) -> AbilityRepositoryABC:
+        """Provide the repository of Abilities.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+
+        Returns:
+            AbilityRepositoryABC: The repository of Abilities.
+
+        """
+        if config.pokedex_snapshot:
+            return injector.get(SnapshotAbilityRepository)
+
+        return injector.get(AbilityRepository)
+
+    @singleton
+    @provider
+    def provide_async_pokemon_repository(
+        self, config: AppConfig, injector: Injector, repo: PokemonRepositoryABC
+    ) -> AsyncPokemonRepositoryABC:
+        """Provide the async repository of Pokémon.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+            repo (PokemonRepositoryABC): The sync repository of Pokémon.
+
+        Returns:
+            AsyncPokemonRepositoryABC: The async repository of Pokémon.
+
+        """
+        if config.pokedex_snapshot:
+            return BlockingPokemonRepository(repo)
+
+        if config.db_async:
+            return injector.get(AsyncPokemonRepository)
+
+        return BlockingPokemonRepository(repo, injector.get(BlockingExecutor))
+
+    @singleton
+    @provider
+    def provide_async_type_repository(
+        self, config: AppConfig, injector: Injector, repo: TypeRepositoryABC
+    ) -> AsyncTypeRepositoryABC:
+        """Provide the async repository of Types.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+            repo (TypeRepositoryABC): The sync repository of Types.
+
+        Returns:
+            AsyncTypeRepositoryABC: The async repository of Types.
+
+        """
+        if config.pokedex_snapshot:
+            return BlockingTypeRepository(repo)
+
+        if config.db_async:
+            return injector.get(AsyncTypeRepository)
+
+        return BlockingTypeRepository(repo, injector.get(BlockingExecutor))
+
+    @singleton
+    @provider
+    def provide_async_ability_repository(
+        self, config: AppConfig, injector: Injector, repo: AbilityRepositoryABC
+    ) -> AsyncAbilityRepositoryABC:
+        """Provide the async repository of Abilities.
+
+        Args:
+            config (AppConfig): The application configuration.
+            injector (Injector): The injector resolving the implementation.
+            repo (AbilityRepositoryABC): The sync repository of Abilities.
+
+        Returns:
+            AsyncAbilityRepositoryABC: The async repository of Abilities.
+
+        """
+        if config.pokedex_snapshot:
+            return BlockingAbilityRepository(repo)
+
+        if config.db_async:
+            return injector.get(AsyncAbilityRepository)
+
+        return BlockingAbilityRepository(repo, injector.get(BlockingExecutor))
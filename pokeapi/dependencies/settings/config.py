@@ -135,6 +135,495 @@ class AppConfig(AppConfigABC):
 
         return url
 
+    @property
+    def db_pool_size(self) -> int:
+        """The number of connections kept open in the connection pool.
+
+        Returns:
+            int: The number of connections kept open in the connection pool. Defaults to 5.
+
+        """
+        return int(os.getenv("DB_POOL_SIZE", "5"))
+
+    @property
+    def db_max_overflow(self) -> int:
+        """The number of connections allowed beyond the pool size.
+
+        Returns:
+            int: The number of connections allowed beyond the pool size. Defaults to 10.
+
+        """
+        return int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+    @property
+    def db_pool_timeout(self) -> float:
+        """The number of seconds to wait for a connection from the pool.
+
+        Returns:
+            float: The number of seconds to wait for a connection from the pool.
+                Defaults to 30.
+
+        """
+        return float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+    @property
+    def db_pool_recycle(self) -> int:
+        """The number of seconds after which a pooled connection is recycled.
+
+        This should be lower than the `wait_timeout` of MySQL.
+
+        Returns:
+            int: The number of seconds after which a pooled connection is recycled.
+                Defaults to -1, which disables recycling.
+
+        """
+        return int(os.getenv("DB_POOL_RECYCLE", "-1"))
+
+    @property
+    def db_pool_pre_ping(self) -> bool:
+        """A boolean indicating whether connections are tested on checkout.
+
+        Returns:
+            bool: A boolean indicating whether connections are tested on checkout.
+
+        """
+        env_value = os.getenv("DB_POOL_PRE_PING")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def db_async(self) -> bool:
+        """A boolean indicating whether master data is read with the async driver.
+
+        The Pokémon, Types and Abilities are queried through `aiomysql` without
+        blocking the event loop, instead of through `pymysql`.
+
+        Returns:
+            bool: A boolean indicating whether master data is read with the async driver.
+
+        """
+        env_value = os.getenv("DB_ASYNC")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def pokedex_snapshot(self) -> bool:
+        """A boolean indicating whether master data is served from an in-memory snapshot.
+
+        The Pokémon, Types and Abilities are loaded once and read without querying the
+        database.
+
+        Returns:
+            bool: A boolean indicating whether master data is served from an in-memory
+                snapshot.
+
+        """
+        env_value = os.getenv("POKEDEX_SNAPSHOT")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def cache_pokemon(self) -> bool:
+        """A boolean indicating whether the Pokémon read are cached in memory.
+
+        The lookups of the Pokémon services are served from a bounded cache, until the
+        entries expire or are evicted.
+
+        Returns:
+            bool: A boolean indicating whether the Pokémon read are cached in memory.
+
+        """
+        env_value = os.getenv("CACHE_POKEMON")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def cache_type(self) -> bool:
+        """A boolean indicating whether the Types read are cached in memory.
+
+        The lookups of the Types services are served from a bounded cache, until the
+        entries expire or are evicted.
+
+        Returns:
+            bool: A boolean indicating whether the Types read are cached in memory.
+
+        """
+        env_value = os.getenv("CACHE_TYPE")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def cache_ability(self) -> bool:
+        """A boolean indicating whether the Abilities read are cached in memory.
+
+        The lookups of the Abilities services are served from a bounded cache, until the
+        entries expire or are evicted.
+
+        Returns:
+            bool: A boolean indicating whether the Abilities read are cached in memory.
+
+        """
+        env_value = os.getenv("CACHE_ABILITY")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def cache_max_size(self) -> int:
+        """The number of entries kept by the cache of each service.
+
+        Returns:
+            int: The number of entries kept by the cache of each service. Defaults to
+                10000.
+
+        """
+        return int(os.getenv("CACHE_MAX_SIZE", "10000"))
+
+    @property
+    def cache_ttl(self) -> float:
+        """The number of seconds an entry is kept by the caches of the services.
+
+        Zero keeps the entries until they are evicted.
+
+        Returns:
+            float: The number of seconds an entry is kept by the caches of the
+                services. Defaults to 300.
+
+        """
+        return float(os.getenv("CACHE_TTL", "300"))
+
+    @property
+    def cache_url(self) -> str | None:
+        """The URL of the store shared by the caches of every worker.
+
+        With a URL, the caches of the services keep the entries in memory in front of
+        the shared store: `redis://`, `rediss://` and `unix://` for a Redis server,
+        and `memory://` for a store private to the process. Without one, each worker
+        caches in memory only.
+
+        Returns:
+            str | None: The URL of the shared store, or None if not set.
+
+        Raises:
+            InvalidEnvironmentValueError: If the environment variable has an invalid value.
+
+        """
+        url = os.getenv("CACHE_URL")
+
+        if not url:
+            return None
+
+        if url.split("://", 1)[0] not in ("redis", "rediss", "unix", "memory"):
+            raise InvalidEnvironmentValueError(
+                f"Environment variable has an invalid value. CACHE_URL: {url}"
+            )
+
+        return url
+
+    @property
+    def cache_version_interval(self) -> float:
+        """The number of seconds a worker trusts the versions of the shared caches.
+
+        An invalidation is seen by every worker within this interval.
+
+        Returns:
+            float: The number of seconds a worker trusts the versions of the shared
+                caches. Defaults to 1.
+
+        """
+        return float(os.getenv("CACHE_VERSION_INTERVAL", "1"))
+
+    @property
+    def cache_breaker_interval(self) -> float:
+        """The number of seconds a worker stops using the shared caches after a failure.
+
+        Meanwhile the lookups are served from memory and the database, rather than wait
+        for the shared store to time out on each of them.
+
+        Returns:
+            float: The number of seconds a worker stops using the shared caches after a
+                failure, or zero to keep using them. Defaults to 5.
+
+        """
+        return float(os.getenv("CACHE_BREAKER_INTERVAL", "5"))
+
+    @property
+    def response_cache(self) -> bool:
+        """A boolean indicating whether the responses of GraphQL queries are cached.
+
+        The responses of queries on master data are served from a bounded cache, keyed
+        on the document, the variables and whether the request is authenticated.
+        Operations reading users or tokens are never cached.
+
+        Returns:
+            bool: A boolean indicating whether the responses of GraphQL queries are
+                cached.
+
+        """
+        env_value = os.getenv("RESPONSE_CACHE")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def response_cache_max_size(self) -> int:
+        """The number of responses kept by the response cache.
+
+        Returns:
+            int: The number of responses kept by the response cache. Defaults to 1000.
+
+        """
+        return int(os.getenv("RESPONSE_CACHE_MAX_SIZE", "1000"))
+
+    @property
+    def response_cache_ttl(self) -> float:
+        """The number of seconds a response is kept by the response cache.
+
+        Zero keeps the responses until they are evicted.
+
+        Returns:
+            float: The number of seconds a response is kept by the response cache.
+                Defaults to 60.
+
+        """
+        return float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+
+    @property
+    def response_cache_gzip(self) -> bool:
+        """A boolean indicating whether the cached responses are compressed ahead.
+
+        The compressed responses are served to the clients accepting gzip.
+
+        Returns:
+            bool: A boolean indicating whether the cached responses are compressed
+                ahead.
+
+        """
+        env_value = os.getenv("RESPONSE_CACHE_GZIP")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def persisted_queries(self) -> bool:
+        """A boolean indicating whether the clients may send the hashes of queries.
+
+        The clients send the SHA-256 hash of a query in place of its text, and the
+        text along with the hash to register it when the hash is unknown. The
+        registered queries are kept parsed and validated.
+
+        Returns:
+            bool: A boolean indicating whether the clients may send the hashes of
+                queries.
+
+        """
+        env_value = os.getenv("PERSISTED_QUERIES")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def persisted_query_max_size(self) -> int:
+        """The number of queries kept by the registry of persisted queries.
+
+        Returns:
+            int: The number of queries kept by the registry of persisted queries.
+                Defaults to 1000.
+
+        """
+        return int(os.getenv("PERSISTED_QUERY_MAX_SIZE", "1000"))
+
+    @property
+    def document_cache_max_size(self) -> int:
+        """The number of parsed and validated GraphQL documents kept in memory.
+
+        A request sending a kept document skips its parsing and validation. Zero keeps
+        no document.
+
+        Returns:
+            int: The number of parsed and validated GraphQL documents kept in memory.
+                Defaults to 1000.
+
+        """
+        return int(os.getenv("DOCUMENT_CACHE_MAX_SIZE", "1000"))
+
+    @property
+    def blocking_pool_size(self) -> int:
+        """The number of threads running blocking resolver work.
+
+        Blocking calls wait in a queue when every thread is busy, so this also bounds
+        how many of them hold a database connection at the same time.
+
+        Returns:
+            int: The number of threads running blocking resolver work. Defaults to 10.
+
+        """
+        return int(os.getenv("BLOCKING_POOL_SIZE", "10"))
+
+    @property
+    def password_pool_size(self) -> int:
+        """The number of processes hashing passwords, or 0 to hash them in-process.
+
+        Hashing a password with argon2 takes tens of milliseconds of CPU, so a burst of
+        logins hashed in-process competes with every other request of the worker.
+
+        Returns:
+            int: The number of processes hashing passwords. Defaults to 0.
+
+        """
+        return int(os.getenv("PASSWORD_POOL_SIZE", "0"))
+
+    @property
+    def password_pool_max_pending(self) -> int:
+        """The number of passwords the hashing processes accept at the same time.
+
+        This counts the passwords being hashed and those waiting for a process.
+
+        Returns:
+            int: The number of passwords the hashing processes accept at the same time.
+                Defaults to 16.
+
+        """
+        return int(os.getenv("PASSWORD_POOL_MAX_PENDING", "16"))
+
+    @property
+    def password_pool_timeout(self) -> float:
+        """The number of seconds to wait for the hashing processes to accept a password.
+
+        Returns:
+            float: The number of seconds to wait for the hashing processes to accept a
+                password. Defaults to 0.5.
+
+        """
+        return float(os.getenv("PASSWORD_POOL_TIMEOUT", "0.5"))
+
+    @property
+    def password_time_cost(self) -> int:
+        """The number of argon2 iterations of a password hash.
+
+        The stored hashes made with other parameters are rehashed at the next login.
+        Run `task tune-password` to find the parameters fitting this host.
+
+        Returns:
+            int: The number of argon2 iterations of a password hash. Defaults to 3.
+
+        """
+        return int(os.getenv("PASSWORD_TIME_COST", "3"))
+
+    @property
+    def password_memory_cost(self) -> int:
+        """The memory of a password hash with argon2, in KiB.
+
+        Returns:
+            int: The memory of a password hash with argon2, in KiB. Defaults to 65536.
+
+        """
+        return int(os.getenv("PASSWORD_MEMORY_COST", "65536"))
+
+    @property
+    def password_parallelism(self) -> int:
+        """The number of argon2 lanes of a password hash.
+
+        Returns:
+            int: The number of argon2 lanes of a password hash. Defaults to 4.
+
+        """
+        return int(os.getenv("PASSWORD_PARALLELISM", "4"))
+
+    @property
+    def token_sweep_interval(self) -> float:
+        """The number of seconds between sweeps of the token whitelist.
+
+        Each sweep deletes the expired and the revoked tokens.
+
+        Returns:
+            float: The number of seconds between sweeps of the token whitelist.
+                Defaults to 300. 0 disables sweeping.
+
+        """
+        return float(os.getenv("TOKEN_SWEEP_INTERVAL", "300"))
+
+    @property
+    def token_sweep_batch_size(self) -> int:
+        """The number of rows of the token whitelist deleted per transaction.
+
+        A sweep deletes batch after batch, so that no transaction locks many rows.
+
+        Returns:
+            int: The number of rows of the token whitelist deleted per transaction.
+                Defaults to 1000.
+
+        """
+        return int(os.getenv("TOKEN_SWEEP_BATCH_SIZE", "1000"))
+
+    @property
+    def jwt_cache_size(self) -> int:
+        """The number of verified JWT payloads kept in memory.
+
+        A cached payload skips the verification of the signature, until the token
+        expires. Zero disables the cache.
+
+        Returns:
+            int: The number of verified JWT payloads kept in memory. Defaults to 10000.
+
+        """
+        return int(os.getenv("JWT_CACHE_SIZE", "10000"))
+
+    @property
+    def access_token_stateless(self) -> bool:
+        """A boolean indicating whether access tokens are trusted without the whitelist.
+
+        The access tokens are then trusted on their signature and expiration, unless
+        revoked by a rotation. Each worker keeps the revoked tokens in memory.
+
+        Returns:
+            bool: A boolean indicating whether access tokens are trusted without the whitelist.
+
+        """
+        env_value = os.getenv("ACCESS_TOKEN_STATELESS")
+
+        if env_value is not None:
+            return env_value.lower() == "true"
+
+        return False
+
+    @property
+    def token_revocation_interval(self) -> float:
+        """The number of seconds between refreshes of the revoked access tokens.
+
+        A revocation is seen by every worker within two intervals: past that, the
+        access tokens are checked against the whitelist again.
+
+        Returns:
+            float: The number of seconds between refreshes of the revoked access tokens.
+                Defaults to 5.
+
+        """
+        return float(os.getenv("TOKEN_REVOCATION_INTERVAL", "5"))
+
     @property
     def private_key(self) -> str:
         """The private key for the application.
@@ -157,13 +646,16 @@ class AppConfig(AppConfigABC):
 
     @property
     def jwt_algorithm(self) -> str:
-        """The algorithm to use for JWT signing.
+        """The algorithm to use for JWT signing (e.g. 'RS256', 'ES256', 'EdDSA').
+
+        The keys must be of the matching type: RSA, EC on the P-256 curve, or Ed25519.
 
         Returns:
             str: The algorithm to use for JWT signing.
 
         Raises:
             UnsetEnvironmentVariableError: If the environment variable is not set.
+            InvalidEnvironmentValueError: If the environment variable has an invalid value.
 
         """
         algorithm = os.getenv("JWT_ALGORITHM")
@@ -173,6 +665,11 @@ class AppConfig(AppConfigABC):
                 "JWT_ALGORITHM environment variable is not set"
             )
 
+        if algorithm not in ("RS256", "ES256", "EdDSA"):
+            raise InvalidEnvironmentValueError(
+                f"Environment variable has an invalid value. JWT_ALGORITHM: {algorithm}"
+            )
+
         return algorithm
 
     @property
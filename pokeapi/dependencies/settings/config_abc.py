@@ -67,6 +67,387 @@ class AppConfigABC(ABC):
         """
         pass  # pragma: no cover
 
+    @property
+    @abstractmethod
+    def db_pool_size(self) -> int:
+        """The number of connections kept open in the connection pool.
+
+        Returns:
+            int: The number of connections kept open in the connection pool.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def db_max_overflow(self) -> int:
+        """The number of connections allowed beyond the pool size.
+
+        Returns:
+            int: The number of connections allowed beyond the pool size.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def db_pool_timeout(self) -> float:
+        """The number of seconds to wait for a connection from the pool.
+
+        Returns:
+            float: The number of seconds to wait for a connection from the pool.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def db_pool_recycle(self) -> int:
+        """The number of seconds after which a pooled connection is recycled.
+
+        Returns:
+            int: The number of seconds after which a pooled connection is recycled.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def db_pool_pre_ping(self) -> bool:
+        """A boolean indicating whether connections are tested on checkout.
+
+        Returns:
+            bool: A boolean indicating whether connections are tested on checkout.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def db_async(self) -> bool:
+        """A boolean indicating whether master data is read with the async driver.
+
+        Returns:
+            bool: A boolean indicating whether master data is read with the async driver.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def pokedex_snapshot(self) -> bool:
+        """A boolean indicating whether master data is served from an in-memory snapshot.
+
+        Returns:
+            bool: A boolean indicating whether master data is served from an in-memory
+                snapshot.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_pokemon(self) -> bool:
+        """A boolean indicating whether the Pokémon read are cached in memory.
+
+        Returns:
+            bool: A boolean indicating whether the Pokémon read are cached in memory.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_type(self) -> bool:
+        """A boolean indicating whether the Types read are cached in memory.
+
+        Returns:
+            bool: A boolean indicating whether the Types read are cached in memory.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_ability(self) -> bool:
+        """A boolean indicating whether the Abilities read are cached in memory.
+
+        Returns:
+            bool: A boolean indicating whether the Abilities read are cached in memory.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_max_size(self) -> int:
+        """The number of entries kept by the cache of each service.
+
+        Returns:
+            int: The number of entries kept by the cache of each service.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_ttl(self) -> float:
+        """The number of seconds an entry is kept by the caches of the services.
+
+        Returns:
+            float: The number of seconds an entry is kept by the caches of the services.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_url(self) -> str | None:
+        """The URL of the store shared by the caches of every worker.
+
+        Returns:
+            str | None: The URL of the shared store, or None if not set.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_version_interval(self) -> float:
+        """The number of seconds a worker trusts the versions of the shared caches.
+
+        Returns:
+            float: The number of seconds a worker trusts the versions of the shared
+                caches.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def cache_breaker_interval(self) -> float:
+        """The number of seconds a worker stops using the shared caches after a failure.
+
+        Returns:
+            float: The number of seconds a worker stops using the shared caches after a
+                failure, or zero to keep using them.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def response_cache(self) -> bool:
+        """A boolean indicating whether the responses of GraphQL queries are cached.
+
+        Returns:
+            bool: A boolean indicating whether the responses of GraphQL queries are
+                cached.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def response_cache_max_size(self) -> int:
+        """The number of responses kept by the response cache.
+
+        Returns:
+            int: The number of responses kept by the response cache.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def response_cache_ttl(self) -> float:
+        """The number of seconds a response is kept by the response cache.
+
+        Returns:
+            float: The number of seconds a response is kept by the response cache.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def response_cache_gzip(self) -> bool:
+        """A boolean indicating whether the cached responses are compressed ahead.
+
+        Returns:
+            bool: A boolean indicating whether the cached responses are compressed
+                ahead.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def persisted_queries(self) -> bool:
+        """A boolean indicating whether the clients may send the hashes of queries.
+
+        Returns:
+            bool: A boolean indicating whether the clients may send the hashes of
+                queries.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def persisted_query_max_size(self) -> int:
+        """The number of queries kept by the registry of persisted queries.
+
+        Returns:
+            int: The number of queries kept by the registry of persisted queries.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def document_cache_max_size(self) -> int:
+        """The number of parsed and validated GraphQL documents kept in memory.
+
+        Returns:
+            int: The number of parsed and validated GraphQL documents kept in memory.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def blocking_pool_size(self) -> int:
+        """The number of threads running blocking resolver work.
+
+        Returns:
+            int: The number of threads running blocking resolver work.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def password_pool_size(self) -> int:
+        """The number of processes hashing passwords, or 0 to hash them in-process.
+
+        Returns:
+            int: The number of processes hashing passwords.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def password_pool_max_pending(self) -> int:
+        """The number of passwords the hashing processes accept at the same time.
+
+        Returns:
+            int: The number of passwords the hashing processes accept at the same time.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def password_pool_timeout(self) -> float:
+        """The number of seconds to wait for the hashing processes to accept a password.
+
+        Returns:
+            float: The number of seconds to wait for the hashing processes to accept a
+                password.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def password_time_cost(self) -> int:
+        """The number of argon2 iterations of a password hash.
+
+        Returns:
+            int: The number of argon2 iterations of a password hash.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def password_memory_cost(self) -> int:
+        """The memory of a password hash with argon2, in KiB.
+
+        Returns:
+            int: The memory of a password hash with argon2, in KiB.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def password_parallelism(self) -> int:
+        """The number of argon2 lanes of a password hash.
+
+        Returns:
+            int: The number of argon2 lanes of a password hash.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def token_sweep_interval(self) -> float:
+        """The number of seconds between sweeps of the token whitelist.
+
+        Returns:
+            float: The number of seconds between sweeps of the token whitelist.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def token_sweep_batch_size(self) -> int:
+        """The number of rows of the token whitelist deleted per transaction.
+
+        Returns:
+            int: The number of rows of the token whitelist deleted per transaction.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def jwt_cache_size(self) -> int:
+        """The number of verified JWT payloads kept in memory.
+
+        Returns:
+            int: The number of verified JWT payloads kept in memory.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def access_token_stateless(self) -> bool:
+        """A boolean indicating whether access tokens are trusted without the whitelist.
+
+        Returns:
+            bool: A boolean indicating whether access tokens are trusted without the whitelist.
+
+        """
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def token_revocation_interval(self) -> float:
+        """The number of seconds between refreshes of the revoked access tokens.
+
+        Returns:
+            float: The number of seconds between refreshes of the revoked access tokens.
+
+        """
+        pass  # pragma: no cover
+
     @property
     @abstractmethod
     def private_key(self) -> str:
@@ -0,0 +1,18 @@
+import datetime
+
+from .base import BaseEntity
+
+
+class TokenRevocation(BaseEntity):
+    """Entity class of TokenRevocation.
+
+    Attributes:
+        id_ (int): The id of the TokenRevocation.
+        access_token (str): The ID of the revoked access token.
+        revoked_at (datetime.datetime): The date and time the access token was revoked.
+
+    """
+
+    id_: int = 0
+    access_token: str
+    revoked_at: datetime.datetime
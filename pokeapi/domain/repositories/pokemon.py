@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
+from pokeapi.infrastructure.database.loading import LoadingStrategy
 from pokeapi.infrastructure.database.models import Pokemon as PokemonModel
 
 
@@ -29,11 +31,14 @@ class PokemonRepositoryABC(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def get_by_id(self, id_: int) -> PokemonEntity | None:
+    def get_by_id(
+        self, id_: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
         """Retrieve an entity by its identifier.
 
         Args:
             id_ (int): The identifier of the entity to retrieve.
+            loading (LoadingStrategy): The strategy for loading the relationships.
 
         Returns:
             Pokemon | None: The entity with the specified identifier, or None if not found.
@@ -42,11 +47,14 @@ class PokemonRepositoryABC(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def get_by_pokedex_number(self, pokedex_number: int) -> PokemonEntity | None:
+    def get_by_pokedex_number(
+        self, pokedex_number: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
         """Retrieve an entity by its pokedex number.
 
         Args:
             pokedex_number (int): The pokedex number of the entity to retrieve.
+            loading (LoadingStrategy): The strategy for loading the relationships.
 
         Returns:
             Pokemon | None: The entity with the specified pokedex number, or None if not found.
@@ -55,11 +63,14 @@ class PokemonRepositoryABC(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def get_by_name(self, name: str) -> PokemonEntity | None:
+    def get_by_name(
+        self, name: str, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
         """Retrieve an entity by its name.
 
         Args:
             name (str): The name of the entity to retrieve.
+            loading (LoadingStrategy): The strategy for loading the relationships.
 
         Returns:
             Pokemon | None: The entity with the specified name, or None if not found.
@@ -68,11 +79,65 @@ class PokemonRepositoryABC(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def get_all(self) -> list[PokemonEntity]:
+    def get_all(
+        self, loading: LoadingStrategy = LoadingStrategy.SELECTIN
+    ) -> list[PokemonEntity]:
         """Retrieve all entities from the repository.
 
+        Args:
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
         Returns:
             list[Pokemon]: A list of all entities in the repository.
 
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve a page of entities ordered by their identifiers.
+
+        The page is located with the identifiers of its neighbours (keyset pagination),
+        so the cost does not depend on how deep the page is.
+
+        Args:
+            limit (int): The maximum number of entities to retrieve.
+            after (int | None): Only retrieve entities with a greater identifier.
+            before (int | None): Only retrieve entities with a smaller identifier.
+            backward (bool): Whether to take the entities closest to `before` rather than
+                the ones closest to `after`.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[Pokemon]: The entities of the page in ascending order of identifier.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def get_by_ids(
+        self,
+        ids: Sequence[int],
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve entities by their identifiers.
+
+        Identifiers without a matching entity are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the entities to retrieve.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[Pokemon]: The entities with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.infrastructure.database.models import AbilityMst
+
+
+class AsyncAbilityRepositoryABC(ABC):
+    """Abstract base class for async ability repositories.
+
+    This class defines the async counterpart of AbilityRepositoryABC. Concrete
+    implementations should inherit from this class and provide implementations for the
+    abstract methods.
+
+    """
+
+    @abstractmethod
+    def _convert_to_entity(self, model: AbilityMst) -> PokemonAbility:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        This method converts a SQLAlchemy model instance to a corresponding domain entity
+        instance.
+
+        Args:
+            model (AbilityMst): The SQLAlchemy model instance to be converted.
+
+        Returns:
+            PokemonAbility: The converted instance of the domain entity.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_id(self, id_: int) -> PokemonAbility | None:
+        """Retrieve an entity by its identifier.
+
+        Args:
+            id_ (int): The identifier of the entity to retrieve.
+
+        Returns:
+            PokemonAbility | None: The entity with the specified identifier, or None if not found.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_all(self) -> list[PokemonAbility]:
+        """Retrieve all entities from the repository.
+
+        Returns:
+            list[PokemonAbility]: A list of all entities in the repository.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve entities by their identifiers.
+
+        Identifiers without a matching entity are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the entities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The entities with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from pokeapi.domain.entities.pokemon_type import PokemonType
 from pokeapi.infrastructure.database.models import TypeMst
@@ -50,3 +51,19 @@ class TypeRepositoryABC(ABC):
 
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve entities by their identifiers.
+
+        Identifiers without a matching entity are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the entities to retrieve.
+
+        Returns:
+            list[PokemonType]: The entities with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
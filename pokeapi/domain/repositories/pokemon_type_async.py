@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.infrastructure.database.models import TypeMst
+
+
+class AsyncTypeRepositoryABC(ABC):
+    """Abstract base class for async type repositories.
+
+    This class defines the async counterpart of TypeRepositoryABC. Concrete
+    implementations should inherit from this class and provide implementations for the
+    abstract methods.
+
+    """
+
+    @abstractmethod
+    def _convert_to_entity(self, model: TypeMst) -> PokemonType:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        This method converts a SQLAlchemy model instance to a corresponding domain entity
+        instance.
+
+        Args:
+            model (TypeMst): The SQLAlchemy model instance to be converted.
+
+        Returns:
+            PokemonType: The converted instance of the domain entity.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_id(self, id_: int) -> PokemonType | None:
+        """Retrieve an entity by its identifier.
+
+        Args:
+            id_ (int): The identifier of the entity to retrieve.
+
+        Returns:
+            PokemonType | None: The entity with the specified identifier, or None if not found.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_all(self) -> list[PokemonType]:
+        """Retrieve all entities from the repository.
+
+        Returns:
+            list[PokemonType]: A list of all entities in the repository.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve entities by their identifiers.
+
+        Identifiers without a matching entity are ignored.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the entities to retrieve.
+
+        Returns:
+            list[PokemonType]: The entities with the specified identifiers, in no particular
+                order.
+
+        """
+        pass  # pragma: no cover
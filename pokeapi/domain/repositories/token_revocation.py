@@ -0,0 +1,60 @@
+import datetime
+from abc import ABC, abstractmethod
+
+from pokeapi.domain.entities.token_revocation import (
+    TokenRevocation as TokenRevocationEntity,
+)
+from pokeapi.infrastructure.database.models import (
+    TokenRevocation as TokenRevocationModel,
+)
+
+
+class TokenRevocationRepositoryABC(ABC):
+    """Abstract base class for token revocation repositories.
+
+    This class defines the interface for token revocation repositories. Concrete
+    implementations should inherit from this class and provide implementations for the
+    abstract methods. The revocations are recorded by the token whitelist repository.
+
+    """
+
+    @abstractmethod
+    def _convert_to_entity(self, model: TokenRevocationModel) -> TokenRevocationEntity:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        Args:
+            model (TokenRevocationModel): The SQLAlchemy model instance to be converted.
+
+        Returns:
+            TokenRevocationEntity: The converted instance of the domain entity.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def get_since(self, since: datetime.datetime) -> list[TokenRevocationEntity]:
+        """Retrieve the entities recorded at or after a date.
+
+        Args:
+            since (datetime.datetime): The date of the oldest entities to retrieve.
+
+        Returns:
+            list[TokenRevocationEntity]: The entities, from the oldest to the newest.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def purge(self, expiration: datetime.datetime, limit: int) -> int:
+        """Permanently delete a batch of expired entities.
+
+        Args:
+            expiration (datetime.datetime): The entities recorded at or before this
+                date are expired.
+            limit (int): The maximum number of entities to delete.
+
+        Returns:
+            int: The number of deleted entities.
+
+        """
+        pass  # pragma: no cover
@@ -32,38 +32,6 @@ class TokenWhitelistRepositoryABC(ABC):
         """
         pass  # pragma: no cover
 
-    @abstractmethod
-    def get_by_access_token(
-        self, token: str, expiration: datetime.datetime
-    ) -> TokenWhitelistEntity | None:
-        """Retrieve an entity by its access token.
-
-        Args:
-            access_token (str): The access token of the entity to retrieve.
-
-        Returns:
-            entity (TokenWhitelistEntity): The entity with the specified access token.
-            expiration (datetime.datetime): The expiration date of the access token.
-
-        """
-        pass  # pragma: no cover
-
-    @abstractmethod
-    def get_by_refresh_token(
-        self, token: str, expiration: datetime.datetime
-    ) -> TokenWhitelistEntity | None:
-        """Retrieve an entity by its refresh token.
-
-        Args:
-            refresh_token (str): The refresh token of the entity to retrieve.
-
-        Returns:
-            entity (TokenWhitelistEntity): The entity with the specified refresh token.
-            expiration (datetime.datetime): The expiration date of the refresh token.
-
-        """
-        pass  # pragma: no cover
-
     @abstractmethod
     def create(self, entity: TokenWhitelistEntity) -> TokenWhitelistEntity:
         """Create a new entity.
@@ -78,25 +46,38 @@ class TokenWhitelistRepositoryABC(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def update(self, entity: TokenWhitelistEntity) -> TokenWhitelistEntity:
-        """Update an entity.
+    def rotate(
+        self,
+        token: str,
+        expiration: datetime.datetime,
+        entity: TokenWhitelistEntity,
+        revoke: bool,
+    ) -> bool:
+        """Replace the tokens of the entity holding a valid refresh token.
 
         Args:
-            entity (TokenWhitelistEntity): The entity to be updated.
+            token (str): The refresh token to be replaced.
+            expiration (datetime.datetime): The expiration date of the refresh token.
+            entity (TokenWhitelistEntity): The entity holding the new tokens.
+            revoke (bool): Whether to record the access token replaced as revoked.
 
         Returns:
-            TokenWhitelistEntity: The updated entity.
+            bool: True if the tokens were replaced, False if the refresh token is invalid.
 
         """
         pass  # pragma: no cover
 
     @abstractmethod
-    def delete(self, user_id: int, expiration: datetime.datetime) -> None:
-        """Delete expired entities.
+    def purge(self, expiration: datetime.datetime, limit: int) -> int:
+        """Permanently delete a batch of expired or revoked entities.
 
         Args:
-            user_id (int): The identifier of the entity to be deleted.
-            expiration (datetime.datetime): The expiration date of the entity.
+            expiration (datetime.datetime): The entities last updated at or before this
+                date are expired.
+            limit (int): The maximum number of entities to delete.
+
+        Returns:
+            int: The number of deleted entities.
 
         """
         pass  # pragma: no cover
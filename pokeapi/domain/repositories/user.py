@@ -1,3 +1,4 @@
+import datetime
 from abc import ABC, abstractmethod
 
 from pokeapi.domain.entities.user import User as UserEntity
@@ -43,6 +44,39 @@ class UserRepositoryABC(ABC):
         """
         pass  # pragma: no cover
 
+    @abstractmethod
+    def get_by_access_token(
+        self, id_: int, token: str, expiration: datetime.datetime
+    ) -> UserEntity | None:
+        """Retrieve an entity by a whitelisted access token issued to it.
+
+        Args:
+            id_ (int): The identifier of the entity the token was issued to.
+            token (str): The access token.
+            expiration (datetime.datetime): The expiration date of the access token.
+
+        Returns:
+            UserEntity | None: The entity, or None if the token is not whitelisted.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def get_by_refresh_token(
+        self, token: str, expiration: datetime.datetime
+    ) -> UserEntity | None:
+        """Retrieve an entity by a whitelisted refresh token issued to it.
+
+        Args:
+            token (str): The refresh token.
+            expiration (datetime.datetime): The expiration date of the refresh token.
+
+        Returns:
+            UserEntity | None: The entity, or None if the token is not whitelisted.
+
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     def get_by_username(self, username: str) -> UserEntity | None:
         """Retrieve an entity by its username.
@@ -0,0 +1,125 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+
+class CacheABC(ABC):
+    """Abstract class for the caches of read-through services.
+
+    This class is an abstract class that defines the methods that a cache should
+    implement. None is never cached, so that it always stands for a missing entry.
+    The async methods serve the async services, without blocking the event loop.
+
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Retrieve a cached value.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            Any | None: The cached value, or None if missing or expired.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value.
+
+        Args:
+            key (str): The key of the value.
+            value (Any): The value to be cached.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve cached values.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[Any | None]: The cached values, or None for those missing or expired,
+                in the order of the keys.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        """Cache values.
+
+        Args:
+            values (Mapping[str, Any]): The values to be cached, by key.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_many_async(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve cached values, without blocking the event loop.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[Any | None]: The cached values, or None for those missing or expired,
+                in the order of the keys.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def set_many_async(self, values: Mapping[str, Any]) -> None:
+        """Cache values, without blocking the event loop.
+
+        Args:
+            values (Mapping[str, Any]): The values to be cached, by key.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """Invalidate cached values.
+
+        Args:
+            *keys (str): The keys of the values to be invalidated.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Invalidate every cached value."""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def delete_async(self, *keys: str) -> None:
+        """Invalidate cached values, without blocking the event loop.
+
+        Args:
+            *keys (str): The keys of the values to be invalidated.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def clear_async(self) -> None:
+        """Invalidate every cached value, without blocking the event loop."""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def snapshot(self) -> dict:
+        """Take a snapshot of the counters of the cache.
+
+        Returns:
+            dict: The counters of the cache.
+
+        """
+        pass  # pragma: no cover
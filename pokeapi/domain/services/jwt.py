@@ -1,5 +1,9 @@
 import datetime
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 from injector import inject, singleton
 from jose import JWTError, jwt
@@ -9,6 +13,7 @@ from pokeapi.domain.entities.user import User
 from pokeapi.exceptions.token import TokenVerificationError
 
 from .jwt_abc import JWTServiceABC
+from .jwt_keys import construct_key
 
 
 @singleton
@@ -16,10 +21,21 @@ class JWTService(JWTServiceABC):
     """Service for JWT token creation and decoding.
 
     This class provides the methods for creating and decoding JWT tokens.
+    The verified payloads are kept in a bounded LRU cache, keyed by the digest of the
+    token and dropped once the token expires. A hit only skips the verification of the
+    signature: revoked tokens are still rejected by the lookup in the whitelist.
+    The keys are parsed once, for the algorithm set by `JWT_ALGORITHM`.
 
     Attributes:
         _config (AppConfigABC): The application configuration.
         _logger (logging.Logger): The logger instance.
+        _signing_key (Key): The parsed private key.
+        _verifying_key (Key): The parsed public key.
+        _cache (OrderedDict[bytes, tuple[float, dict]]): The expiration and payload of
+            the verified tokens, from the least to the most recently used.
+        _lock (threading.Lock): The lock guarding the cache and the counters.
+        _hits (int): The number of payloads served from the cache.
+        _misses (int): The number of tokens verified.
 
     """
 
@@ -33,6 +49,12 @@ class JWTService(JWTServiceABC):
         """
         self._config = config
         self._logger = logging.getLogger(__name__)
+        self._signing_key = construct_key(config.private_key, config.jwt_algorithm)
+        self._verifying_key = construct_key(config.public_key, config.jwt_algorithm)
+        self._cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
 
     def create_token(self, entity: User, exp: datetime.datetime, jti: str) -> str:  # type: ignore
         """Create a JWT token.
@@ -57,7 +79,7 @@ class JWTService(JWTServiceABC):
         }
 
         token = jwt.encode(
-            data, self._config.private_key, algorithm=self._config.jwt_algorithm
+            data, self._signing_key, algorithm=self._config.jwt_algorithm
         )
 
         # NOTE: The token is a string, but the type hint is not recognized.
@@ -67,7 +89,7 @@ class JWTService(JWTServiceABC):
         return token
 
     def decode_token(self, token: str) -> dict:
-        """Decode a JWT token.
+        """Decode a JWT token, from the cache if it was verified and has not expired.
 
         Args:
             token (str): The JWT token to be decoded.
@@ -79,11 +101,43 @@ class JWTService(JWTServiceABC):
             TokenVerificationError: If the token is invalid.
             TypeError: If the payload is not a dictionary.
 
+        """
+        key = hashlib.sha256(token.encode()).digest()
+
+        with self._lock:
+            cached = self._cache.pop(key, None)
+
+            if cached is not None and time.time() < cached[0]:
+                self._cache[key] = cached
+                self._hits += 1
+
+                return dict(cached[1])
+
+            self._misses += 1
+
+        payload = self._verify_token(token)
+        self._store(key, payload)
+
+        return dict(payload)
+
+    def _verify_token(self, token: str) -> dict:
+        """Verify the signature and the claims of a JWT token.
+
+        Args:
+            token (str): The JWT token to be verified.
+
+        Returns:
+            dict: The decoded payload.
+
+        Raises:
+            TokenVerificationError: If the token is invalid.
+            TypeError: If the payload is not a dictionary.
+
         """
         try:
             payload = jwt.decode(
                 token,
-                self._config.public_key,
+                self._verifying_key,
                 algorithms=self._config.jwt_algorithm,
                 issuer=self._config.app_domain,
             )
@@ -98,3 +152,39 @@ class JWTService(JWTServiceABC):
             raise TypeError("The payload is not a dictionary.")
 
         return payload
+
+    def _store(self, key: bytes, payload: dict) -> None:
+        """Cache a verified payload until its expiration, evicting the least recently used.
+
+        Args:
+            key (bytes): The digest of the token.
+            payload (dict): The verified payload.
+
+        """
+        size = self._config.jwt_cache_size
+        exp = payload.get("exp")
+
+        if size <= 0 or not isinstance(exp, int | float):
+            return
+
+        with self._lock:
+            self._cache[key] = (float(exp), payload)
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > size:
+                self._cache.popitem(last=False)
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the metrics.
+
+        Returns:
+            dict: The current metrics of the cache.
+
+        """
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self._config.jwt_cache_size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
@@ -0,0 +1,129 @@
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+EDDSA = "EdDSA"
+
+
+class Ed25519Key(Key):
+    """A JWK key signing and verifying JWT tokens with Ed25519 (EdDSA).
+
+    python-jose does not implement EdDSA, so this key is registered for it and used
+    through `jose.jwt` like the RSA and EC keys of its cryptography backend.
+
+    Attributes:
+        prepared_key (Ed25519PrivateKey | Ed25519PublicKey): The parsed key.
+
+    """
+
+    def __init__(
+        self,
+        key: str | bytes | Ed25519PrivateKey | Ed25519PublicKey,
+        algorithm: str,
+    ) -> None:
+        """Initialize the Ed25519Key class.
+
+        Args:
+            key (str | bytes | Ed25519PrivateKey | Ed25519PublicKey): The PEM-encoded
+                or parsed key.
+            algorithm (str): The algorithm of the key.
+
+        Raises:
+            JWKError: If the algorithm is not EdDSA or the key is not an Ed25519 key.
+
+        """
+        if algorithm != EDDSA:
+            raise JWKError(f"{algorithm} is not a valid algorithm for Ed25519 keys")
+
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+
+        if isinstance(key, bytes):
+            try:
+                if b"PRIVATE" in key:
+                    key = serialization.load_pem_private_key(key, password=None)  # type: ignore[assignment]
+                else:
+                    key = serialization.load_pem_public_key(key)  # type: ignore[assignment]
+            except ValueError as e:
+                raise JWKError(e) from None
+
+        if not isinstance(key, Ed25519PrivateKey | Ed25519PublicKey):
+            raise JWKError("The key is not an Ed25519 key")
+
+        self.prepared_key = key
+
+    def sign(self, msg: bytes) -> bytes:
+        """Sign a message.
+
+        Args:
+            msg (bytes): The message to sign.
+
+        Returns:
+            bytes: The signature.
+
+        Raises:
+            JWKError: If the key is a public key.
+
+        """
+        if not isinstance(self.prepared_key, Ed25519PrivateKey):
+            raise JWKError("A public key cannot sign")
+
+        return self.prepared_key.sign(msg)
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        """Verify the signature of a message.
+
+        Args:
+            msg (bytes): The signed message.
+            sig (bytes): The signature.
+
+        Returns:
+            bool: Whether the signature is valid.
+
+        """
+        key = self.prepared_key
+
+        if isinstance(key, Ed25519PrivateKey):
+            key = key.public_key()
+
+        try:
+            key.verify(sig, msg)
+        except InvalidSignature:
+            return False
+
+        return True
+
+    def public_key(self) -> "Ed25519Key":
+        """Get the public key.
+
+        Returns:
+            Ed25519Key: The public key.
+
+        """
+        if isinstance(self.prepared_key, Ed25519PublicKey):
+            return self
+
+        return Ed25519Key(self.prepared_key.public_key(), EDDSA)
+
+
+def construct_key(key: str, algorithm: str) -> Key:
+    """Parse a PEM-encoded key once, into a key reusable for every token.
+
+    Args:
+        key (str): The PEM-encoded key.
+        algorithm (str): The algorithm of the key (e.g. 'RS256', 'ES256', 'EdDSA').
+
+    Returns:
+        Key: The parsed key.
+
+    """
+    return jwk.construct(key, algorithm)
+
+
+jwk.register_key(EDDSA, Ed25519Key)
@@ -1,6 +1,8 @@
-from injector import singleton
+from injector import inject, singleton
 from passlib.hash import argon2
 
+from pokeapi.dependencies.settings.config import AppConfigABC
+
 from .password_abc import PasswordServiceABC
 
 
@@ -8,10 +10,28 @@ from .password_abc import PasswordServiceABC
 class PasswordService(PasswordServiceABC):
     """Service to hash and verify passwords.
 
-    This service uses the argon2 algorithm to hash and verify passwords.
+    This service uses the argon2 algorithm to hash and verify passwords, with the
+    parameters of the configuration.
+
+    Attributes:
+        _hasher (type[argon2]): The argon2 hasher set with the parameters.
 
     """
 
+    @inject
+    def __init__(self, config: AppConfigABC) -> None:
+        """Initialize the PasswordService with the argon2 parameters.
+
+        Args:
+            config (AppConfigABC): The application configuration.
+
+        """
+        self._hasher = argon2.using(
+            rounds=config.password_time_cost,
+            memory_cost=config.password_memory_cost,
+            parallelism=config.password_parallelism,
+        )
+
     def hash(self, password: str) -> str:
         """Hash a password using argon2.
 
@@ -22,7 +42,7 @@ class PasswordService(PasswordServiceABC):
             The hashed password.
 
         """
-        hashed_password = argon2.hash(password)
+        hashed_password = self._hasher.hash(password)
 
         # NOTE: argon2.hash returns a string, but we can't be sure of the type
         assert isinstance(hashed_password, str)
@@ -40,9 +60,21 @@ class PasswordService(PasswordServiceABC):
             True if the password is verified, False otherwise.
 
         """
-        result = argon2.verify(password, hashed_password)
+        result = self._hasher.verify(password, hashed_password)
 
         # NOTE: argon2.verify returns a boolean, but we can't be sure of the type
         assert isinstance(result, bool)
 
         return result
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with other argon2 parameters.
+
+        Args:
+            hashed_password: The hashed password to check.
+
+        Returns:
+            True if the password should be hashed again, False otherwise.
+
+        """
+        return bool(self._hasher.needs_update(hashed_password))
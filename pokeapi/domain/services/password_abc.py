@@ -35,3 +35,16 @@ class PasswordServiceABC(ABC):
 
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hashed password was made with outdated parameters
+
+        Args:
+            hashed_password (str): The hashed password to be checked.
+
+        Returns:
+            bool: True if the password should be hashed again, False otherwise.
+
+        """
+        pass  # pragma: no cover
@@ -0,0 +1,190 @@
+import functools
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TypeVar
+
+from injector import inject, singleton
+
+from pokeapi.dependencies.settings.config import AppConfig, AppConfigABC
+from pokeapi.exceptions.password import PasswordHashingBusyError
+
+from .password import PasswordService
+from .password_abc import PasswordServiceABC
+
+T = TypeVar("T")
+
+
+@functools.cache
+def _service() -> PasswordService:
+    """Build the service of a process of the pool, from the inherited environment."""
+    return PasswordService(AppConfig())
+
+
+def _hash(password: str) -> str:
+    """Hash a password in a process of the pool."""
+    return _service().hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    """Verify a password in a process of the pool."""
+    return _service().verify(password, hashed_password)
+
+
+@singleton
+class ProcessPoolPasswordService(PasswordServiceABC):
+    """Service to hash and verify passwords in a pool of processes.
+
+    Argon2 takes tens of milliseconds of CPU per password, so the work is moved out of
+    the process serving requests. The pool accepts a bounded number of passwords at a
+    time; beyond that, a caller waits for a slot up to a timeout and then fails fast, so
+    a burst of logins cannot queue up behind itself. Checking the parameters of a hash
+    is cheap, so it is done in-process.
+
+    Attributes:
+        _service (PasswordService): The in-process service checking the hashes.
+        _size (int): The number of processes.
+        _timeout (float): The number of seconds to wait for a slot.
+        _slots (threading.BoundedSemaphore): The slots of the accepted passwords.
+        _pool (ProcessPoolExecutor): The pool of processes.
+        _lock (threading.Lock): The lock guarding the counters.
+        _pending (int): The number of accepted passwords not hashed yet.
+        _accepted (int): The number of accepted passwords.
+        _rejected (int): The number of passwords rejected for lack of a slot.
+
+    """
+
+    @inject
+    def __init__(self, config: AppConfigABC) -> None:
+        """Initialize the ProcessPoolPasswordService with an idle pool.
+
+        Args:
+            config (AppConfigABC): The application configuration.
+
+        """
+        self._service = PasswordService(config)
+        self._size = config.password_pool_size
+        self._timeout = config.password_pool_timeout
+        self._slots = threading.BoundedSemaphore(config.password_pool_max_pending)
+        self._pool = self._create_pool()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._accepted = 0
+        self._rejected = 0
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        """Create the pool of processes. Its processes are started on demand.
+
+        The processes are spawned rather than forked, since the application runs threads.
+
+        Returns:
+            ProcessPoolExecutor: The pool of processes.
+
+        """
+        return ProcessPoolExecutor(
+            max_workers=self._size, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _submit(self, func: Callable[..., T], *args: str) -> T:
+        """Run a function in the pool once a slot is free and wait for its result.
+
+        Args:
+            func (Callable[..., T]): The function.
+            *args (str): The arguments of the function.
+
+        Returns:
+            T: The result of the function.
+
+        Raises:
+            PasswordHashingBusyError: If no slot is freed within the timeout.
+
+        """
+        if not self._slots.acquire(timeout=self._timeout):
+            with self._lock:
+                self._rejected += 1
+
+            raise PasswordHashingBusyError(
+                "Too many requests are being authenticated. Please retry later."
+            )
+
+        with self._lock:
+            self._pending += 1
+            self._accepted += 1
+
+        try:
+            future: Future[T] = self._pool.submit(func, *args)
+
+            return future.result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        """Hash a password using argon2 in the pool.
+
+        Args:
+            password (str): The password to be hashed.
+
+        Returns:
+            str: The hashed password.
+
+        Raises:
+            PasswordHashingBusyError: If the pool cannot accept the password in time.
+
+        """
+        return self._submit(_hash, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a password using argon2 in the pool.
+
+        Args:
+            password (str): The password to be verified.
+            hashed_password (str): The hashed password to be compared with.
+
+        Returns:
+            bool: True if the password is verified, False otherwise.
+
+        Raises:
+            PasswordHashingBusyError: If the pool cannot accept the password in time.
+
+        """
+        return self._submit(_verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with other argon2 parameters.
+
+        Args:
+            hashed_password (str): The hashed password to be checked.
+
+        Returns:
+            bool: True if the password should be hashed again, False otherwise.
+
+        """
+        return self._service.needs_rehash(hashed_password)
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the metrics.
+
+        Returns:
+            dict: The current metrics of the pool.
+
+        """
+        with self._lock:
+            return {
+                "max_workers": self._size,
+                "pending": self._pending,
+                "accepted": self._accepted,
+                "rejected": self._rejected,
+            }
+
+    def dispose(self) -> None:
+        """Stop the processes once the accepted passwords are hashed.
+
+        A new pool takes over and starts processes again on demand.
+
+        """
+        pool, self._pool = self._pool, self._create_pool()
+        pool.shutdown(wait=True)
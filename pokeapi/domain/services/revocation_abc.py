@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+
+class TokenRevocationFilterABC(ABC):
+    """Abstract class for the filter of revoked access tokens.
+
+    This class is an abstract class that defines the methods that a filter of revoked
+    access tokens should implement. The filter stands in for the whitelist when access
+    tokens are trusted on their signature alone.
+
+    """
+
+    @abstractmethod
+    def is_fresh(self) -> bool:
+        """Check whether the filter holds the recent revocations.
+
+        Returns:
+            bool: True if the filter was refreshed recently enough to be trusted.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        """Check whether an access token was revoked.
+
+        Args:
+            jti (str): The JWT ID of the access token.
+
+        Returns:
+            bool: True if the access token was revoked.
+
+        """
+        pass  # pragma: no cover
@@ -91,18 +91,23 @@ class TokenService(TokenServiceABC):
             token_type="Bearer",
         )
 
-    def update(self, entity: User, whitelist_id: int) -> Token:
-        """Update a token for a user.
+    def rotate(
+        self, entity: User, token: str, expiration: datetime.datetime
+    ) -> Token | None:
+        """Replace a refresh token of a user with a new token.
 
-        This method updates the token for the given user
-        and stores it in the token whitelist.
+        This method issues a new token for the given user and swaps it into the token
+        whitelist in place of the refresh token, unless the refresh token has expired or
+        has already been replaced. The access token replaced is recorded as revoked only
+        when the access tokens are stateless.
 
         Args:
-            entity (User): The user for whom to update the token.
-            whitelist_id (int): The ID of the token whitelist entry.
+            entity (User): The user for whom to issue the token.
+            token (str): The refresh token to be replaced.
+            expiration (datetime.datetime): The expiration date of the refresh token.
 
         Returns:
-            Token: The updated token.
+            Token | None: The issued token, or None if the refresh token is no longer valid.
 
         """
         jti = str(uuid.uuid4())
@@ -112,9 +117,10 @@ class TokenService(TokenServiceABC):
         access_token = self._jwt_service.create_token(entity, exp, jti)
         refresh_token = str(uuid.uuid4())
 
-        self._whitelist_repo.update(
-            entity=TokenWhitelist(
-                id_=whitelist_id,
+        rotated = self._whitelist_repo.rotate(
+            token,
+            expiration,
+            TokenWhitelist(
                 user_id=entity.id_,
                 access_token=jti,
                 refresh_token=refresh_token,
@@ -123,29 +129,19 @@ class TokenService(TokenServiceABC):
                 updated_by=entity.username,
                 updated_at=datetime.datetime.now(),
             ),
+            # NOTE: Only the stateless access tokens are checked against the revoked.
+            self._config.access_token_stateless,
         )
 
+        if not rotated:
+            return None
+
         return Token(
             access_token=access_token,
             refresh_token=refresh_token,
             token_type="Bearer",
         )
 
-    def delete(self, entity: User) -> None:
-        """Delete a token for a user.
-
-        This method deletes the token for the given user
-        from the token whitelist.
-
-        Args:
-            entity (User): The user for whom to delete the token.
-
-        """
-        token_exp = datetime.datetime.now() - datetime.timedelta(
-            hours=self._config.refresh_token_lifetime
-        )
-        self._whitelist_repo.delete(entity.id_, token_exp)
-
     def extract_payload(self, token: str) -> dict:
         """Extract the payload from a token.
 
@@ -1,3 +1,4 @@
+import datetime
 from abc import ABC, abstractmethod
 
 from pokeapi.domain.entities.token import Token
@@ -25,25 +26,19 @@ class TokenServiceABC(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def update(self, entity: User, whitelist_id: int) -> Token:
-        """Update a token for the given entity.
+    def rotate(
+        self, entity: User, token: str, expiration: datetime.datetime
+    ) -> Token | None:
+        """Replace a refresh token of the given entity with a new token.
 
         Args:
             entity (User): The entity to be used as the payload.
-            whitelist_id (int): The ID of the token to be updated.
+            token (str): The refresh token to be replaced.
+            expiration (datetime.datetime): The expiration date of the refresh token.
 
         Returns:
-            Token: The token issued to the entity.
-
-        """
-        pass  # pragma: no cover
-
-    @abstractmethod
-    def delete(self, entity: User) -> None:
-        """Delete a token for the given entity.
-
-        Args:
-            entity (User): The entity to be used as the payload.
+            Token | None: The token issued to the entity, or None if the refresh token
+                is no longer valid.
 
         """
         pass  # pragma: no cover
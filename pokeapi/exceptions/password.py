@@ -0,0 +1,2 @@
+class PasswordHashingBusyError(Exception):
+    """Raised when the hashing processes cannot accept a password in time."""
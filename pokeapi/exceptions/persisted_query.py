@@ -0,0 +1,6 @@
+class PersistedQueryNotFoundError(Exception):
+    """Raised when the hash of a persisted query is not registered."""
+
+
+class PersistedQueryNotSupportedError(Exception):
+    """Raised when a persisted query is sent while persisted queries are disabled."""
@@ -0,0 +1,193 @@
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
+from injector import inject, singleton
+from sqlalchemy.orm import Session, scoped_session
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.database.db import unit_of_work
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@singleton
+class BlockingExecutor:
+    """A size-bounded thread pool running blocking work off the event loop.
+
+    Calls beyond the size of the pool wait in its queue, so a burst of blocking work,
+    such as hashing passwords on login, cannot starve the event loop nor open more
+    database connections than there are threads.
+
+    Each call runs in its own unit of work, so a session never crosses threads: the
+    session of the calling request stays on the event loop, and the worker opens and
+    closes a session of its own.
+
+    Attributes:
+        _session_local (scoped_session[Session]): The registry of sessions.
+        _max_workers (int): The number of threads.
+        _pool (ThreadPoolExecutor): The thread pool.
+        _lock (threading.Lock): The lock guarding the counters.
+        _queued (int): The number of calls waiting for a thread.
+        _queued_max (int): The highest number of calls waiting for a thread.
+        _running (int): The number of calls running on a thread.
+        _completed (int): The number of finished calls.
+        _wait_total (float): The total time calls waited for a thread in seconds.
+        _wait_max (float): The longest time a call waited for a thread in seconds.
+
+    """
+
+    @inject
+    def __init__(
+        self, config: AppConfig, session_local: scoped_session[Session]
+    ) -> None:
+        """Initialize the BlockingExecutor with an idle thread pool.
+
+        Args:
+            config (AppConfig): The application configuration.
+            session_local (scoped_session[Session]): The registry of sessions.
+
+        """
+        self._session_local = session_local
+        self._max_workers = config.blocking_pool_size
+        self._pool = self._create_pool()
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._queued_max = 0
+        self._running = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _create_pool(self) -> ThreadPoolExecutor:
+        """Create the thread pool. Its threads are started on demand.
+
+        Returns:
+            ThreadPoolExecutor: The thread pool.
+
+        """
+        return ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="blocking"
+        )
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a blocking call on the thread pool and wait for its result.
+
+        The call sees the context variables of the caller. If the caller is cancelled
+        while the call is still queued, the call is dropped.
+
+        Args:
+            func (Callable[P, T]): The blocking callable.
+            *args (P.args): The positional arguments of the call.
+            **kwargs (P.kwargs): The keyword arguments of the call.
+
+        Returns:
+            T: The result of the call.
+
+        """
+        context = contextvars.copy_context()
+
+        with self._lock:
+            self._queued += 1
+            self._queued_max = max(self._queued_max, self._queued)
+
+        call = functools.partial(self._call, time.perf_counter(), func, *args, **kwargs)
+        future = self._pool.submit(context.run, call)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+
+            raise
+
+    def _call(
+        self, submitted: float, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a blocking call on a thread of the pool, recording its wait time.
+
+        Args:
+            submitted (float): When the call was submitted.
+            func (Callable[P, T]): The blocking callable.
+            *args (P.args): The positional arguments of the call.
+            **kwargs (P.kwargs): The keyword arguments of the call.
+
+        Returns:
+            T: The result of the call.
+
+        """
+        wait = time.perf_counter() - submitted
+
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+
+        try:
+            with unit_of_work(self._session_local):
+                return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the metrics.
+
+        Returns:
+            dict: The current metrics of the thread pool.
+
+        """
+        with self._lock:
+            started = self._completed + self._running
+
+            return {
+                "max_workers": self._max_workers,
+                "queued": self._queued,
+                "queued_max": self._queued_max,
+                "running": self._running,
+                "completed": self._completed,
+                "wait_avg": self._wait_total / started if started else 0.0,
+                "wait_max": self._wait_max,
+            }
+
+    def dispose(self) -> None:
+        """Stop the threads once the running calls finish, dropping the queued calls.
+
+        Like disposing an engine, this leaves the executor usable: a new thread pool
+        takes over and starts threads again on demand.
+
+        """
+        pool, self._pool = self._pool, self._create_pool()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class InlineExecutor:
+    """A stand-in for `BlockingExecutor` running calls on the event loop.
+
+    This suits calls that never block, such as reads of the snapshot of the master data.
+
+    """
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a call on the event loop.
+
+        Args:
+            func (Callable[P, T]): The callable.
+            *args (P.args): The positional arguments of the call.
+            **kwargs (P.kwargs): The keyword arguments of the call.
+
+        Returns:
+            T: The result of the call.
+
+        """
+        return func(*args, **kwargs)
@@ -0,0 +1,165 @@
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
+from pokeapi.domain.repositories.pokemon import PokemonRepositoryABC
+from pokeapi.domain.repositories.pokemon_async import AsyncPokemonRepositoryABC
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor, InlineExecutor
+from pokeapi.infrastructure.database.loading import LoadingStrategy
+from pokeapi.infrastructure.database.models.pokemon_mst import Pokemon as PokemonModel
+
+
+class BlockingPokemonRepository(AsyncPokemonRepositoryABC):
+    """An async repository class for Pokémon serving a sync repository.
+
+    Each call runs the sync repository to completion, on the blocking executor when one
+    is given and on the event loop otherwise. This serves the snapshot of the master
+    data, which never blocks, and the database when the async driver is disabled.
+
+    Attributes:
+        _repo (PokemonRepositoryABC): The sync repository.
+        _executor (BlockingExecutor | InlineExecutor): The executor running the calls.
+
+    """
+
+    def __init__(
+        self, repo: PokemonRepositoryABC, executor: BlockingExecutor | None = None
+    ) -> None:
+        """Initializer for BlockingPokemonRepository.
+
+        Args:
+            repo (PokemonRepositoryABC): The sync repository.
+            executor (BlockingExecutor | None): The executor running the calls, or None
+                to run them on the event loop.
+
+        """
+        self._repo = repo
+        self._executor: BlockingExecutor | InlineExecutor = (
+            InlineExecutor() if executor is None else executor
+        )
+
+    def _convert_to_entity(self, model: PokemonModel) -> PokemonEntity:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the sync repository.
+
+        Args:
+            model (PokemonModel): The SQLAlchemy model instance of Pokémon to be converted.
+
+        Returns:
+            PokemonEntity: The converted instance of the domain entity of Pokémon.
+
+        """
+        return self._repo._convert_to_entity(model)
+
+    async def get_by_id(
+        self, id_: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its identifier.
+
+        Args:
+            id_ (int): The identifier of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified identifier, or None if no such Pokémon exists.
+
+        """
+        return await self._executor.run(self._repo.get_by_id, id_, loading)
+
+    async def get_by_pokedex_number(
+        self, pokedex_number: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its pokedex number.
+
+        Args:
+            pokedex_number (int): The pokedex number of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified pokedex number, or None if no such Pokémon exists.
+
+        """
+        return await self._executor.run(
+            self._repo.get_by_pokedex_number, pokedex_number, loading
+        )
+
+    async def get_by_name(
+        self, name: str, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its name.
+
+        Args:
+            name (str): The name of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified name, or None if no such Pokémon exists.
+
+        """
+        return await self._executor.run(self._repo.get_by_name, name, loading)
+
+    async def get_all(
+        self, loading: LoadingStrategy = LoadingStrategy.SELECTIN
+    ) -> list[PokemonEntity]:
+        """Retrieve all Pokémon.
+
+        Args:
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: A list of all Pokémon.
+
+        """
+        return await self._executor.run(self._repo.get_all, loading)
+
+    async def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve a page of Pokémon ordered by their identifiers.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        return await self._executor.run(
+            self._repo.get_page,
+            limit,
+            after=after,
+            before=before,
+            backward=backward,
+            loading=loading,
+        )
+
+    async def get_by_ids(
+        self,
+        ids: Sequence[int],
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve Pokémon by their identifiers.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon with the specified identifiers, in no
+                particular order.
+
+        """
+        return await self._executor.run(self._repo.get_by_ids, ids, loading)
@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.repositories.pokemon_ability import AbilityRepositoryABC
+from pokeapi.domain.repositories.pokemon_ability_async import AsyncAbilityRepositoryABC
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor, InlineExecutor
+from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
+
+
+class BlockingAbilityRepository(AsyncAbilityRepositoryABC):
+    """Async repository for PokemonAbility serving a sync repository
+
+    Each call runs the sync repository to completion, on the blocking executor when one
+    is given and on the event loop otherwise.
+
+    Attributes:
+        _repo (AbilityRepositoryABC): The sync repository
+        _executor (BlockingExecutor | InlineExecutor): The executor running the calls
+
+    """
+
+    def __init__(
+        self, repo: AbilityRepositoryABC, executor: BlockingExecutor | None = None
+    ) -> None:
+        """Initializer for BlockingAbilityRepository
+
+        Args:
+            repo (AbilityRepositoryABC): The sync repository
+            executor (BlockingExecutor | None): The executor running the calls, or None
+                to run them on the event loop
+
+        """
+        self._repo = repo
+        self._executor: BlockingExecutor | InlineExecutor = (
+            InlineExecutor() if executor is None else executor
+        )
+
+    def _convert_to_entity(self, model: AbilityMst) -> PokemonAbility:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the sync repository.
+
+        Args:
+            model (AbilityMst): The SQLAlchemy model instance of Ability to be converted.
+
+        Returns:
+            PokemonAbility: The converted instance of the domain entity of Ability.
+
+        """
+        return self._repo._convert_to_entity(model)
+
+    async def get_by_id(self, id_: int) -> PokemonAbility | None:
+        """Retrieve an ability by its identifier.
+
+        Args:
+            id_ (int): The identifier of the ability to retrieve.
+
+        Returns:
+            PokemonAbility | None: The ability with the specified identifier, or None if not found.
+
+        """
+        return await self._executor.run(self._repo.get_by_id, id_)
+
+    async def get_all(self) -> list[PokemonAbility]:
+        """Retrieve all abilities.
+
+        Returns:
+            list[PokemonAbility]: A list of all abilities.
+
+        """
+        return await self._executor.run(self._repo.get_all)
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        return await self._executor.run(self._repo.get_by_ids, ids)
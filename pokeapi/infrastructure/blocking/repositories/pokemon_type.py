@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.domain.repositories.pokemon_type import TypeRepositoryABC
+from pokeapi.domain.repositories.pokemon_type_async import AsyncTypeRepositoryABC
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor, InlineExecutor
+from pokeapi.infrastructure.database.models.type_mst import TypeMst
+
+
+class BlockingTypeRepository(AsyncTypeRepositoryABC):
+    """Async repository for PokemonType serving a sync repository
+
+    Each call runs the sync repository to completion, on the blocking executor when one
+    is given and on the event loop otherwise.
+
+    Attributes:
+        _repo (TypeRepositoryABC): The sync repository
+        _executor (BlockingExecutor | InlineExecutor): The executor running the calls
+
+    """
+
+    def __init__(
+        self, repo: TypeRepositoryABC, executor: BlockingExecutor | None = None
+    ) -> None:
+        """Initializer for BlockingTypeRepository
+
+        Args:
+            repo (TypeRepositoryABC): The sync repository
+            executor (BlockingExecutor | None): The executor running the calls, or None
+                to run them on the event loop
+
+        """
+        self._repo = repo
+        self._executor: BlockingExecutor | InlineExecutor = (
+            InlineExecutor() if executor is None else executor
+        )
+
+    def _convert_to_entity(self, model: TypeMst) -> PokemonType:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the sync repository.
+
+        Args:
+            model (TypeMst): The SQLAlchemy model instance of Type to be converted.
+
+        Returns:
+            PokemonType: The converted instance of the domain entity of Type.
+
+        """
+        return self._repo._convert_to_entity(model)
+
+    async def get_by_id(self, id_: int) -> PokemonType | None:
+        """Retrieve a type by its identifier.
+
+        Args:
+            id_ (int): The identifier of the type to retrieve.
+
+        Returns:
+            PokemonType | None: The type with the specified identifier, or None if not found.
+
+        """
+        return await self._executor.run(self._repo.get_by_id, id_)
+
+    async def get_all(self) -> list[PokemonType]:
+        """Retrieve all types.
+
+        Returns:
+            list[PokemonType]: A list of all types.
+
+        """
+        return await self._executor.run(self._repo.get_all)
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        return await self._executor.run(self._repo.get_by_ids, ids)
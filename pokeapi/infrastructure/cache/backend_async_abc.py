@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+
+
+class AsyncCacheBackendABC(ABC):
+    """Abstract class for the async clients of the stores shared by the caches.
+
+    This class is an abstract class that defines the methods that the async client of a
+    shared store should implement, so that the async services read, write and
+    invalidate the store without blocking the event loop.
+
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Retrieve a stored value.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            bytes | None: The stored value, or None if missing or expired.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retrieve stored values in a single round trip.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[bytes | None]: The stored values, or None for those missing or
+                expired, in the order of the keys.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def set_many(self, values: Mapping[str, bytes], ttl: float) -> None:
+        """Store values in a single round trip.
+
+        Args:
+            values (Mapping[str, bytes]): The values to be stored, by key.
+            ttl (float): The number of seconds the values are kept, or zero to keep
+                them until evicted.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Increment a counter, starting from zero.
+
+        Args:
+            key (str): The key of the counter.
+
+        Returns:
+            int: The incremented counter.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connections to the store."""
+        pass  # pragma: no cover
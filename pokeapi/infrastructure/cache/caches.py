@@ -0,0 +1,140 @@
+from injector import inject, singleton
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.entities.base import BaseEntity
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.domain.services.cache_abc import CacheABC
+
+from .backend_abc import CacheBackendABC
+from .backend_async_abc import AsyncCacheBackendABC
+from .codec import EntityCodec
+from .memory import MemoryCache
+from .memory_backend import MemoryCacheBackend
+from .memory_backend_async import AsyncMemoryCacheBackend
+from .redis_backend import RedisCacheBackend
+from .redis_backend_async import AsyncRedisCacheBackend
+from .tiered import TieredCache
+
+
+def create_backend(url: str) -> CacheBackendABC:
+    """Create the shared store of a URL.
+
+    Args:
+        url (str): The URL of the store (e.g. 'redis://redis:6379/0', 'memory://').
+
+    Returns:
+        CacheBackendABC: The shared store.
+
+    """
+    if url.startswith("memory://"):
+        return MemoryCacheBackend()
+
+    return RedisCacheBackend.from_url(url)
+
+
+def create_async_backend(url: str, backend: CacheBackendABC) -> AsyncCacheBackendABC:
+    """Create the async client of the shared store of a URL.
+
+    Args:
+        url (str): The URL of the store (e.g. 'redis://redis:6379/0', 'memory://').
+        backend (CacheBackendABC): The sync client of the store, whose entries a store
+            in memory shares.
+
+    Returns:
+        AsyncCacheBackendABC: The async client of the shared store.
+
+    """
+    if isinstance(backend, MemoryCacheBackend):
+        return AsyncMemoryCacheBackend(backend)
+
+    return AsyncRedisCacheBackend.from_url(url)
+
+
+@singleton
+class ServiceCaches:
+    """The caches of the read-through services, one per kind of master data.
+
+    When `CACHE_URL` is set, the caches keep the entries in memory in front of the
+    shared store, and in memory only otherwise.
+
+    Attributes:
+        _backend (CacheBackendABC | None): The shared store, if any.
+        _async_backend (AsyncCacheBackendABC | None): The async client of the shared
+            store, if any.
+        pokemon (CacheABC): The cache of Pokémon.
+        type_ (CacheABC): The cache of Types.
+        ability (CacheABC): The cache of Abilities.
+
+    """
+
+    @inject
+    def __init__(self, config: AppConfig) -> None:
+        """Initialize the ServiceCaches with empty caches.
+
+        Args:
+            config (AppConfig): The application configuration.
+
+        """
+        url = config.cache_url
+        self._backend = None if url is None else create_backend(url)
+        self._async_backend = (
+            None
+            if url is None or self._backend is None
+            else create_async_backend(url, self._backend)
+        )
+        self.pokemon = self._create(config, "pokemon", Pokemon)
+        self.type_ = self._create(config, "type", PokemonType)
+        self.ability = self._create(config, "ability", PokemonAbility)
+
+    def _create(
+        self, config: AppConfig, namespace: str, entity_type: type[BaseEntity]
+    ) -> CacheABC:
+        """Create the cache of a kind of master data.
+
+        Args:
+            config (AppConfig): The application configuration.
+            namespace (str): The namespace of the keys of the kind.
+            entity_type (type[BaseEntity]): The type of the entities of the kind.
+
+        Returns:
+            CacheABC: The cache of the kind.
+
+        """
+        local = MemoryCache(config.cache_max_size, config.cache_ttl)
+
+        if self._backend is None or self._async_backend is None:
+            return local
+
+        return TieredCache(
+            namespace,
+            local,
+            self._backend,
+            self._async_backend,
+            EntityCodec(entity_type),
+            config.cache_ttl,
+            config.cache_version_interval,
+            config.cache_breaker_interval,
+        )
+
+    async def close(self) -> None:
+        """Release the connections to the shared store, if any."""
+        if self._async_backend is not None:
+            await self._async_backend.close()
+
+        if self._backend is not None:
+            self._backend.close()
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the counters of the caches.
+
+        Returns:
+            dict: The counters of each cache, by kind of master data.
+
+        """
+        return {
+            "pokemon": self.pokemon.snapshot(),
+            "type": self.type_.snapshot(),
+            "ability": self.ability.snapshot(),
+        }
@@ -0,0 +1,66 @@
+from collections.abc import Sequence
+
+import msgpack
+
+from pokeapi.domain.entities.base import BaseEntity
+
+
+class EntityCodec:
+    """The encoding of cached entities, and lists of entities, with msgpack.
+
+    Unlike pickle, the encoded values hold plain data only, so that a value written by
+    another version of the application is rejected by validation instead of running
+    its code.
+
+    Attributes:
+        _entity_type (type[BaseEntity]): The type of the entities.
+
+    """
+
+    def __init__(self, entity_type: type[BaseEntity]) -> None:
+        """Initialize the EntityCodec with the type of the entities.
+
+        Args:
+            entity_type (type[BaseEntity]): The type of the entities.
+
+        """
+        self._entity_type = entity_type
+
+    def encode(self, value: BaseEntity | Sequence[BaseEntity]) -> bytes:
+        """Encode an entity or a list of entities.
+
+        Args:
+            value (BaseEntity | Sequence[BaseEntity]): The entity or the entities.
+
+        Returns:
+            bytes: The encoded value.
+
+        """
+        if isinstance(value, BaseEntity):
+            data = msgpack.packb(value.model_dump())
+        else:
+            data = msgpack.packb([entity.model_dump() for entity in value])
+
+        assert isinstance(data, bytes)
+
+        return data
+
+    def decode(self, data: bytes) -> BaseEntity | list[BaseEntity]:
+        """Decode an entity or a list of entities.
+
+        Args:
+            data (bytes): The encoded value.
+
+        Returns:
+            BaseEntity | list[BaseEntity]: The entity or the entities.
+
+        Raises:
+            ValueError: If the value is not an encoded entity or list of entities.
+
+        """
+        value = msgpack.unpackb(data)
+
+        if isinstance(value, list):
+            return [self._entity_type.model_validate(item) for item in value]
+
+        return self._entity_type.model_validate(value)
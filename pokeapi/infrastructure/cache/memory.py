@@ -0,0 +1,191 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from pokeapi.domain.services.cache_abc import CacheABC
+
+
+class MemoryCache(CacheABC):
+    """A bounded in-process cache, evicting the least recently used entries.
+
+    Each entry expires a fixed number of seconds after it was cached. The cache is
+    shared by the threads of the blocking executor and by the event loop, so every
+    access is guarded by a lock.
+
+    Attributes:
+        _max_size (int): The number of entries kept, or zero to cache nothing.
+        _ttl (float): The number of seconds an entry is kept, or zero to keep it until
+            evicted.
+        _lock (threading.Lock): The lock guarding the entries and the counters.
+        _entries (OrderedDict[str, tuple[float, Any]]): The monotonic expiration time
+            and the value of the entries, from the least recently used.
+        _hits (int): The number of values found.
+        _misses (int): The number of values missing or expired.
+        _evictions (int): The number of entries evicted to make room.
+        _expirations (int): The number of entries dropped for having expired.
+
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize the MemoryCache with no entry.
+
+        Args:
+            max_size (int): The number of entries kept, or zero to cache nothing.
+            ttl (float): The number of seconds an entry is kept, or zero to keep it
+                until evicted.
+
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Any | None:
+        """Retrieve a cached value, and mark it as the most recently used.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            Any | None: The cached value, or None if missing or expired.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries beyond the size.
+
+        Args:
+            key (str): The key of the value.
+            value (Any): The value to be cached.
+
+        """
+        if self._max_size <= 0 or value is None:
+            return
+
+        expires_at = time.monotonic() + self._ttl if self._ttl > 0 else math.inf
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve cached values, and mark them as the most recently used.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[Any | None]: The cached values, or None for those missing or expired,
+                in the order of the keys.
+
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        """Cache values, evicting the least recently used entries beyond the size.
+
+        Args:
+            values (Mapping[str, Any]): The values to be cached, by key.
+
+        """
+        for key, value in values.items():
+            self.set(key, value)
+
+    async def get_many_async(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve cached values. The entries are in memory, so nothing blocks.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[Any | None]: The cached values, or None for those missing or expired,
+                in the order of the keys.
+
+        """
+        return self.get_many(keys)
+
+    async def set_many_async(self, values: Mapping[str, Any]) -> None:
+        """Cache values. The entries are in memory, so nothing blocks.
+
+        Args:
+            values (Mapping[str, Any]): The values to be cached, by key.
+
+        """
+        self.set_many(values)
+
+    def delete(self, *keys: str) -> None:
+        """Invalidate cached values.
+
+        Args:
+            *keys (str): The keys of the values to be invalidated.
+
+        """
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Invalidate every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+    async def delete_async(self, *keys: str) -> None:
+        """Invalidate cached values. The entries are in memory, so nothing blocks.
+
+        Args:
+            *keys (str): The keys of the values to be invalidated.
+
+        """
+        self.delete(*keys)
+
+    async def clear_async(self) -> None:
+        """Invalidate every cached value. The entries are in memory, so nothing blocks."""
+        self.clear()
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the counters of the cache.
+
+        Returns:
+            dict: The number of entries, the maximum number of entries, and the numbers
+                of hits, misses, evictions and expirations.
+
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
@@ -0,0 +1,99 @@
+import math
+import threading
+import time
+from collections.abc import Mapping, Sequence
+
+from .backend_abc import CacheBackendABC
+
+
+class MemoryCacheBackend(CacheBackendABC):
+    """A store private to the process, standing in for a shared store.
+
+    It behaves like the shared store for a single worker, which serves the tests and
+    the development without a Redis server.
+
+    Attributes:
+        _lock (threading.Lock): The lock guarding the entries.
+        _entries (dict[str, tuple[float, bytes]]): The monotonic expiration time and
+            the value of the entries.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the MemoryCacheBackend with no entry."""
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, bytes]] = {}
+
+    def get(self, key: str) -> bytes | None:
+        """Retrieve a stored value.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            bytes | None: The stored value, or None if missing or expired.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            return value
+
+    def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retrieve stored values.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[bytes | None]: The stored values, or None for those missing or
+                expired, in the order of the keys.
+
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, values: Mapping[str, bytes], ttl: float) -> None:
+        """Store values.
+
+        Args:
+            values (Mapping[str, bytes]): The values to be stored, by key.
+            ttl (float): The number of seconds the values are kept, or zero to keep
+                them until evicted.
+
+        """
+        expires_at = time.monotonic() + ttl if ttl > 0 else math.inf
+
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expires_at, value)
+
+    def incr(self, key: str) -> int:
+        """Increment a counter, starting from zero.
+
+        Args:
+            key (str): The key of the counter.
+
+        Returns:
+            int: The incremented counter.
+
+        """
+        with self._lock:
+            _, value = self._entries.get(key, (math.inf, b"0"))
+            counter = int(value) + 1
+            self._entries[key] = (math.inf, str(counter).encode())
+
+            return counter
+
+    def close(self) -> None:
+        """Forget every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,76 @@
+from collections.abc import Mapping, Sequence
+
+from .backend_async_abc import AsyncCacheBackendABC
+from .memory_backend import MemoryCacheBackend
+
+
+class AsyncMemoryCacheBackend(AsyncCacheBackendABC):
+    """The async client of a store private to the process.
+
+    The entries are those of the sync store, in memory, so every call runs on the event
+    loop without blocking it.
+
+    Attributes:
+        _backend (MemoryCacheBackend): The store.
+
+    """
+
+    def __init__(self, backend: MemoryCacheBackend) -> None:
+        """Initialize the AsyncMemoryCacheBackend with the store.
+
+        Args:
+            backend (MemoryCacheBackend): The store.
+
+        """
+        self._backend = backend
+
+    async def get(self, key: str) -> bytes | None:
+        """Retrieve a stored value.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            bytes | None: The stored value, or None if missing or expired.
+
+        """
+        return self._backend.get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retrieve stored values.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[bytes | None]: The stored values, or None for those missing or
+                expired, in the order of the keys.
+
+        """
+        return self._backend.get_many(keys)
+
+    async def set_many(self, values: Mapping[str, bytes], ttl: float) -> None:
+        """Store values.
+
+        Args:
+            values (Mapping[str, bytes]): The values to be stored, by key.
+            ttl (float): The number of seconds the values are kept, or zero to keep
+                them until evicted.
+
+        """
+        self._backend.set_many(values, ttl)
+
+    async def incr(self, key: str) -> int:
+        """Increment a counter, starting from zero.
+
+        Args:
+            key (str): The key of the counter.
+
+        Returns:
+            int: The incremented counter.
+
+        """
+        return self._backend.incr(key)
+
+    async def close(self) -> None:
+        """Do nothing, since the sync store forgets the entries when closed."""
@@ -0,0 +1,108 @@
+from collections.abc import Mapping, Sequence
+
+from redis import Redis
+
+from .backend_abc import CacheBackendABC
+
+# NOTE: A lookup falls back to the database when the store is slow, rather than wait.
+SOCKET_TIMEOUT = 0.1
+
+
+class RedisCacheBackend(CacheBackendABC):
+    """A store shared by every worker, on a server speaking the Redis protocol.
+
+    Attributes:
+        _client (Redis): The client of the server.
+
+    """
+
+    def __init__(self, client: Redis) -> None:
+        """Initialize the RedisCacheBackend with a client.
+
+        Args:
+            client (Redis): The client of the server.
+
+        """
+        self._client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        """Connect to the server of a URL.
+
+        Args:
+            url (str): The URL of the server (e.g. 'redis://redis:6379/0').
+
+        Returns:
+            RedisCacheBackend: The store on the server.
+
+        """
+        return cls(
+            Redis.from_url(
+                url,
+                socket_timeout=SOCKET_TIMEOUT,
+                socket_connect_timeout=SOCKET_TIMEOUT,
+            )
+        )
+
+    def get(self, key: str) -> bytes | None:
+        """Retrieve a stored value.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            bytes | None: The stored value, or None if missing or expired.
+
+        """
+        value = self._client.get(key)
+
+        # NOTE: The client returns bytes, since responses are not decoded.
+        assert value is None or isinstance(value, bytes)
+
+        return value
+
+    def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retrieve stored values with a single `MGET`.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[bytes | None]: The stored values, or None for those missing or
+                expired, in the order of the keys.
+
+        """
+        # NOTE: The client returns bytes, since responses are not decoded.
+        return list(self._client.mget(keys))  # type: ignore[arg-type]
+
+    def set_many(self, values: Mapping[str, bytes], ttl: float) -> None:
+        """Store values with a single pipeline of `SET`, since `MSET` takes no TTL.
+
+        Args:
+            values (Mapping[str, bytes]): The values to be stored, by key.
+            ttl (float): The number of seconds the values are kept, or zero to keep
+                them until evicted.
+
+        """
+        pipeline = self._client.pipeline(transaction=False)
+
+        for key, value in values.items():
+            pipeline.set(key, value, px=int(ttl * 1000) if ttl > 0 else None)
+
+        pipeline.execute()
+
+    def incr(self, key: str) -> int:
+        """Increment a counter, starting from zero.
+
+        Args:
+            key (str): The key of the counter.
+
+        Returns:
+            int: The incremented counter.
+
+        """
+        return int(self._client.incr(key))
+
+    def close(self) -> None:
+        """Release the connections to the server."""
+        self._client.close()
@@ -0,0 +1,106 @@
+from collections.abc import Mapping, Sequence
+
+from redis.asyncio import Redis
+
+from .backend_async_abc import AsyncCacheBackendABC
+from .redis_backend import SOCKET_TIMEOUT
+
+
+class AsyncRedisCacheBackend(AsyncCacheBackendABC):
+    """The async client of a store on a server speaking the Redis protocol.
+
+    Attributes:
+        _client (Redis): The async client of the server.
+
+    """
+
+    def __init__(self, client: Redis) -> None:
+        """Initialize the AsyncRedisCacheBackend with a client.
+
+        Args:
+            client (Redis): The async client of the server.
+
+        """
+        self._client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "AsyncRedisCacheBackend":
+        """Connect to the server of a URL.
+
+        Args:
+            url (str): The URL of the server (e.g. 'redis://redis:6379/0').
+
+        Returns:
+            AsyncRedisCacheBackend: The async client of the store on the server.
+
+        """
+        return cls(
+            Redis.from_url(
+                url,
+                socket_timeout=SOCKET_TIMEOUT,
+                socket_connect_timeout=SOCKET_TIMEOUT,
+            )
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        """Retrieve a stored value.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            bytes | None: The stored value, or None if missing or expired.
+
+        """
+        value = await self._client.get(key)
+
+        # NOTE: The client returns bytes, since responses are not decoded.
+        assert value is None or isinstance(value, bytes)
+
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Retrieve stored values with a single `MGET`.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[bytes | None]: The stored values, or None for those missing or
+                expired, in the order of the keys.
+
+        """
+        # NOTE: The client returns bytes, since responses are not decoded.
+        return list(await self._client.mget(keys))  # type: ignore[arg-type]
+
+    async def set_many(self, values: Mapping[str, bytes], ttl: float) -> None:
+        """Store values with a single pipeline of `SET`, since `MSET` takes no TTL.
+
+        Args:
+            values (Mapping[str, bytes]): The values to be stored, by key.
+            ttl (float): The number of seconds the values are kept, or zero to keep
+                them until evicted.
+
+        """
+        pipeline = self._client.pipeline(transaction=False)
+
+        for key, value in values.items():
+            pipeline.set(key, value, px=int(ttl * 1000) if ttl > 0 else None)
+
+        await pipeline.execute()
+
+    async def incr(self, key: str) -> int:
+        """Increment a counter, starting from zero.
+
+        Args:
+            key (str): The key of the counter.
+
+        Returns:
+            int: The incremented counter.
+
+        """
+        return int(await self._client.incr(key))
+
+    async def close(self) -> None:
+        """Release the connections to the server."""
+        await self._client.aclose()
@@ -0,0 +1,551 @@
+import logging
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from pokeapi.domain.services.cache_abc import CacheABC
+
+from .backend_abc import CacheBackendABC
+from .backend_async_abc import AsyncCacheBackendABC
+from .codec import EntityCodec
+from .memory import MemoryCache
+
+# NOTE: Bumped when the cached entities change shape, so that the workers of a new
+# release never read the entries of the previous one.
+SCHEMA_VERSION = 1
+
+
+class TieredCache(CacheABC):
+    """A cache keeping the entries in memory, in front of a store shared by the workers.
+
+    A worker missing entries in memory reads them from the shared store in a single
+    round trip, and caches what it loads in both. The keys carry the version of the
+    cache, a counter in the shared store: an invalidation increments it, which orphans
+    the entries of every worker at once. Each worker reads the version again once per
+    interval, so an invalidation is seen by every worker within the interval.
+
+    A failing shared store is treated as missing the entries, so that the lookups fall
+    back to the database. After a failure, the shared store is left alone for the
+    interval of the breaker, so that the lookups do not each wait for it to time out;
+    the next operation then tries it again. The async methods, invalidations included,
+    go through the async client of the shared store, so that the event loop is never
+    blocked.
+
+    Attributes:
+        _namespace (str): The namespace of the keys.
+        _version_key (str): The key of the version in the shared store.
+        _local (MemoryCache): The entries cached in memory.
+        _backend (CacheBackendABC): The store shared by the workers.
+        _async_backend (AsyncCacheBackendABC): The async client of the shared store.
+        _codec (EntityCodec): The encoding of the entries in the shared store.
+        _ttl (float): The number of seconds an entry is kept by the shared store.
+        _version_interval (float): The number of seconds the version is trusted.
+        _breaker_interval (float): The number of seconds the shared store is left
+            alone after a failure.
+        _logger (logging.Logger): The logger instance.
+        _lock (threading.Lock): The lock guarding the version, the breaker and the
+            counters.
+        _version (int): The version of the cache.
+        _version_read_at (float | None): The monotonic time the version was read at.
+        _broken_until (float | None): The monotonic time until which the shared store
+            is left alone, or None if it is working.
+        _shared_hits (int): The number of values found in the shared store only.
+        _shared_misses (int): The number of values missing from the shared store.
+        _errors (int): The number of failed operations on the shared store.
+        _skipped (int): The number of operations skipped while the shared store is
+            left alone.
+
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        local: MemoryCache,
+        backend: CacheBackendABC,
+        async_backend: AsyncCacheBackendABC,
+        codec: EntityCodec,
+        ttl: float,
+        version_interval: float,
+        breaker_interval: float,
+    ) -> None:
+        """Initialize the TieredCache with its tiers.
+
+        Args:
+            namespace (str): The namespace of the keys (e.g. 'pokemon').
+            local (MemoryCache): The entries cached in memory.
+            backend (CacheBackendABC): The store shared by the workers.
+            async_backend (AsyncCacheBackendABC): The async client of the shared store.
+            codec (EntityCodec): The encoding of the entries in the shared store.
+            ttl (float): The number of seconds an entry is kept by the shared store, or
+                zero to keep it until evicted.
+            version_interval (float): The number of seconds the version is trusted.
+            breaker_interval (float): The number of seconds the shared store is left
+                alone after a failure, or zero to never leave it alone.
+
+        """
+        self._namespace = namespace
+        self._version_key = f"pokeapi:{namespace}:version"
+        self._local = local
+        self._backend = backend
+        self._async_backend = async_backend
+        self._codec = codec
+        self._ttl = ttl
+        self._version_interval = version_interval
+        self._breaker_interval = breaker_interval
+        self._logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._version = 0
+        self._version_read_at: float | None = None
+        self._broken_until: float | None = None
+        self._shared_hits = 0
+        self._shared_misses = 0
+        self._errors = 0
+        self._skipped = 0
+
+    def _available(self) -> bool:
+        """Check whether the shared store may be used.
+
+        Once the interval of the breaker has passed, a single caller is let through to
+        try the shared store again, while the others keep leaving it alone.
+
+        Returns:
+            bool: A boolean indicating whether the shared store may be used.
+
+        """
+        if self._broken_until is None:
+            return True
+
+        now = time.monotonic()
+
+        with self._lock:
+            if self._broken_until is None:
+                return True
+
+            if now < self._broken_until:
+                self._skipped += 1
+                return False
+
+            self._broken_until = now + self._breaker_interval
+
+            return True
+
+    def _succeed(self) -> None:
+        """Use the shared store again, after an operation on it succeeded."""
+        if self._broken_until is None:
+            return
+
+        with self._lock:
+            self._broken_until = None
+
+        self._logger.info(f"The shared cache is back. namespace: {self._namespace}")
+
+    def _fail(self, operation: str, error: Exception) -> None:
+        """Count a failed operation on the shared store, and leave the store alone.
+
+        Only the first failure of an outage is logged.
+
+        Args:
+            operation (str): The failed operation.
+            error (Exception): The error raised.
+
+        """
+        with self._lock:
+            self._errors += 1
+            first = self._broken_until is None
+
+            if self._breaker_interval > 0:
+                self._broken_until = time.monotonic() + self._breaker_interval
+
+        if first:
+            self._logger.warning(
+                f"Failed to {operation} of the shared cache, left alone for"
+                f" {self._breaker_interval}s. namespace: {self._namespace},"
+                f" error: {error}"
+            )
+
+    def _version_due(self) -> bool:
+        """Check whether the version must be read again, and claim the read if so.
+
+        Other callers keep the previous version while the claimed read runs.
+
+        Returns:
+            bool: A boolean indicating whether the caller must read the version.
+
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            if (
+                self._version_read_at is not None
+                and now - self._version_read_at < self._version_interval
+            ):
+                return False
+
+            self._version_read_at = now
+
+        return self._available()
+
+    def _set_version(self, version: bytes | None) -> None:
+        """Keep the version read from the shared store.
+
+        Args:
+            version (bytes | None): The version, or None if never incremented.
+
+        """
+        with self._lock:
+            self._version = int(version or 0)
+
+    def _set_incremented_version(self, version: int) -> None:
+        """Keep the version incremented by this worker, which needs no read.
+
+        Args:
+            version (int): The incremented version.
+
+        """
+        with self._lock:
+            self._version = version
+            self._version_read_at = time.monotonic()
+
+    def _key(self, key: str) -> str:
+        """Build the key of an entry, with the current version of the cache.
+
+        Args:
+            key (str): The key of the lookup.
+
+        Returns:
+            str: The key of the entry in both tiers.
+
+        """
+        return f"pokeapi:{self._namespace}:{SCHEMA_VERSION}:{self._version}:{key}"
+
+    def _refresh_version(self) -> None:
+        """Read the version from the shared store, once per interval."""
+        if not self._version_due():
+            return
+
+        try:
+            version = self._backend.get(self._version_key)
+        except Exception as e:
+            self._fail("read the version", e)
+        else:
+            self._succeed()
+            self._set_version(version)
+
+    async def _refresh_version_async(self) -> None:
+        """Read the version from the shared store, once per interval."""
+        if not self._version_due():
+            return
+
+        try:
+            version = await self._async_backend.get(self._version_key)
+        except Exception as e:
+            self._fail("read the version", e)
+        else:
+            self._succeed()
+            self._set_version(version)
+
+    def _get_local(self, keys: Sequence[str]) -> tuple[list[str], list[Any | None]]:
+        """Retrieve cached values from memory.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            tuple[list[str], list[Any | None]]: The keys of the entries, and the values
+                found in memory, or None for those missing.
+
+        """
+        versioned_keys = [self._key(key) for key in keys]
+
+        return versioned_keys, self._local.get_many(versioned_keys)
+
+    def _missing(self, values: list[Any | None]) -> list[int]:
+        """Take the positions of the values to read from the shared store.
+
+        Args:
+            values (list[Any | None]): The values found in memory.
+
+        Returns:
+            list[int]: The positions of the values missing from memory, or none if the
+                shared store is left alone.
+
+        """
+        missing = [index for index, value in enumerate(values) if value is None]
+
+        if not missing or not self._available():
+            return []
+
+        return missing
+
+    def _fill(
+        self,
+        versioned_keys: list[str],
+        values: list[Any | None],
+        missing: list[int],
+        data: list[bytes | None],
+    ) -> None:
+        """Decode the values read from the shared store, and cache them in memory.
+
+        Args:
+            versioned_keys (list[str]): The keys of the entries.
+            values (list[Any | None]): The values found in memory, filled in place.
+            missing (list[int]): The positions of the values read from the store.
+            data (list[bytes | None]): The encoded values read from the store.
+
+        """
+        found: dict[str, Any] = {}
+
+        for index, encoded in zip(missing, data, strict=True):
+            if encoded is None:
+                continue
+
+            try:
+                value = self._codec.decode(encoded)
+            except ValueError as e:
+                # NOTE: The store is working, so the breaker is left closed.
+                with self._lock:
+                    self._errors += 1
+
+                self._logger.warning(
+                    "Failed to decode an entry of the shared cache."
+                    f" namespace: {self._namespace}, error: {e}"
+                )
+                continue
+
+            values[index] = value
+            found[versioned_keys[index]] = value
+
+        with self._lock:
+            self._shared_hits += len(found)
+            self._shared_misses += len(missing) - len(found)
+
+        self._local.set_many(found)
+
+    def _set_local(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        """Cache values in memory, and take those to write to the shared store.
+
+        Args:
+            values (Mapping[str, Any]): The values to be cached, by key.
+
+        Returns:
+            dict[str, Any]: The values to write to the shared store, by key of entry,
+                or none if the shared store is left alone.
+
+        """
+        versioned = {
+            self._key(key): value for key, value in values.items() if value is not None
+        }
+        self._local.set_many(versioned)
+
+        if not versioned or not self._available():
+            return {}
+
+        return versioned
+
+    def get(self, key: str) -> Any | None:
+        """Retrieve a cached value, from memory or else from the shared store.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            Any | None: The cached value, or None if missing or expired.
+
+        """
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve cached values, from memory or else from the shared store.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[Any | None]: The cached values, or None for those missing or expired,
+                in the order of the keys.
+
+        """
+        self._refresh_version()
+        versioned_keys, values = self._get_local(keys)
+        missing = self._missing(values)
+
+        if not missing:
+            return values
+
+        try:
+            data = self._backend.get_many([versioned_keys[index] for index in missing])
+        except Exception as e:
+            self._fail("read entries", e)
+            return values
+
+        self._succeed()
+        self._fill(versioned_keys, values, missing, data)
+
+        return values
+
+    async def get_many_async(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve cached values, from memory or else from the shared store.
+
+        Args:
+            keys (Sequence[str]): The keys of the values.
+
+        Returns:
+            list[Any | None]: The cached values, or None for those missing or expired,
+                in the order of the keys.
+
+        """
+        await self._refresh_version_async()
+        versioned_keys, values = self._get_local(keys)
+        missing = self._missing(values)
+
+        if not missing:
+            return values
+
+        try:
+            data = await self._async_backend.get_many(
+                [versioned_keys[index] for index in missing]
+            )
+        except Exception as e:
+            self._fail("read entries", e)
+            return values
+
+        self._succeed()
+        self._fill(versioned_keys, values, missing, data)
+
+        return values
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value, in memory and in the shared store.
+
+        Args:
+            key (str): The key of the value.
+            value (Any): The value to be cached.
+
+        """
+        self.set_many({key: value})
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        """Cache values, in memory and in the shared store.
+
+        Args:
+            values (Mapping[str, Any]): The values to be cached, by key.
+
+        """
+        self._refresh_version()
+        versioned = self._set_local(values)
+
+        if not versioned:
+            return
+
+        try:
+            self._backend.set_many(
+                {key: self._codec.encode(value) for key, value in versioned.items()},
+                self._ttl,
+            )
+        except Exception as e:
+            self._fail("write entries", e)
+        else:
+            self._succeed()
+
+    async def set_many_async(self, values: Mapping[str, Any]) -> None:
+        """Cache values, in memory and in the shared store.
+
+        Args:
+            values (Mapping[str, Any]): The values to be cached, by key.
+
+        """
+        await self._refresh_version_async()
+        versioned = self._set_local(values)
+
+        if not versioned:
+            return
+
+        try:
+            await self._async_backend.set_many(
+                {key: self._codec.encode(value) for key, value in versioned.items()},
+                self._ttl,
+            )
+        except Exception as e:
+            self._fail("write entries", e)
+        else:
+            self._succeed()
+
+    def delete(self, *keys: str) -> None:
+        """Invalidate cached values, by invalidating the whole cache.
+
+        The entries of the other workers cannot be reached one by one, so every entry
+        is invalidated.
+
+        Args:
+            *keys (str): The keys of the values to be invalidated.
+
+        """
+        self.clear()
+
+    def clear(self) -> None:
+        """Invalidate every cached value, in every worker.
+
+        The version is incremented even while the shared store is left alone, so that
+        its entries are not read again once it is back.
+
+        """
+        self._local.clear()
+
+        try:
+            version = self._backend.incr(self._version_key)
+        except Exception as e:
+            self._fail("increment the version", e)
+            return
+
+        self._succeed()
+        self._set_incremented_version(version)
+
+    async def delete_async(self, *keys: str) -> None:
+        """Invalidate cached values, by invalidating the whole cache.
+
+        The entries of the other workers cannot be reached one by one, so every entry
+        is invalidated.
+
+        Args:
+            *keys (str): The keys of the values to be invalidated.
+
+        """
+        await self.clear_async()
+
+    async def clear_async(self) -> None:
+        """Invalidate every cached value, in every worker.
+
+        The version is incremented even while the shared store is left alone, so that
+        its entries are not read again once it is back.
+
+        """
+        self._local.clear()
+
+        try:
+            version = await self._async_backend.incr(self._version_key)
+        except Exception as e:
+            self._fail("increment the version", e)
+            return
+
+        self._succeed()
+        self._set_incremented_version(version)
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the counters of the cache.
+
+        Returns:
+            dict: The counters of the entries in memory, the version, the numbers of
+                hits and misses of the shared store, of its failed operations and of
+                the operations skipped while it is left alone.
+
+        """
+        with self._lock:
+            return {
+                **self._local.snapshot(),
+                "version": self._version,
+                "shared_hits": self._shared_hits,
+                "shared_misses": self._shared_misses,
+                "errors": self._errors,
+                "skipped": self._skipped,
+            }
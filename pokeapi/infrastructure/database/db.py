@@ -1,31 +1,226 @@
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
 from injector import inject, provider, singleton
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.database.pool import (
+    AsyncPoolMetrics,
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+)
 from pokeapi.infrastructure.database.utils import adjust_connection_url
 
+_unit_of_work: ContextVar[object | None] = ContextVar("unit_of_work", default=None)
+
+
+def _get_scope() -> object:
+    """Identify the unit of work that owns the current session.
+
+    Outside of a unit of work, sessions are scoped to the current thread.
+
+    Returns:
+        object: The key of the current scope.
+
+    """
+    scope = _unit_of_work.get()
+
+    if scope is None:
+        return threading.get_ident()
+
+    return scope
+
 
 @singleton
 @inject
 @provider
-def session_factory(config: AppConfig) -> Session:
-    """Create a new session factory.
+def engine_factory(config: AppConfig, metrics: PoolMetrics) -> Engine:
+    """Create the database engine.
 
     Args:
         config (AppConfig): The application configuration.
+        metrics (PoolMetrics): The metrics of the connection pool.
 
     Returns:
-        Session: The session factory.
+        Engine: The database engine.
 
     """
     engine = create_engine(
-        adjust_connection_url(config.database_url), echo=config.debug
+        adjust_connection_url(config.database_url),
+        echo=config.debug,
+        poolclass=InstrumentedQueuePool,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout,
+        pool_recycle=config.db_pool_recycle,
+        pool_pre_ping=config.db_pool_pre_ping,
     )
+    metrics.listen(engine)
 
-    session_local = scoped_session(
-        sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    return engine
+
+
+@singleton
+@inject
+@provider
+def async_engine_factory(config: AppConfig, metrics: AsyncPoolMetrics) -> AsyncEngine:
+    """Create the async database engine.
+
+    The engine connects through `aiomysql` and shares the pool settings of the sync
+    engine, but keeps a pool of its own.
+
+    Args:
+        config (AppConfig): The application configuration.
+        metrics (AsyncPoolMetrics): The metrics of the connection pool.
+
+    Returns:
+        AsyncEngine: The async database engine.
+
+    """
+    engine = create_async_engine(
+        adjust_connection_url(config.database_url, driver="aiomysql"),
+        echo=config.debug,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout,
+        pool_recycle=config.db_pool_recycle,
+        pool_pre_ping=config.db_pool_pre_ping,
     )
+    metrics.listen(engine.sync_engine)
+
+    return engine
+
+
+@singleton
+@inject
+@provider
+def scoped_session_factory(engine: Engine) -> scoped_session[Session]:
+    """Create the registry of sessions.
+
+    The registry hands out one session per unit of work. Sessions are created lazily on
+    first use.
+
+    Args:
+        engine (Engine): The database engine.
 
-    with session_local() as session:
-        return session
+    Returns:
+        scoped_session[Session]: The registry of sessions.
+
+    """
+    return scoped_session(
+        sessionmaker(bind=engine, autocommit=False, autoflush=False),
+        scopefunc=_get_scope,
+    )
+
+
+@inject
+@provider
+def session_factory(session_local: scoped_session[Session]) -> Session:
+    """Provide the session of the current unit of work.
+
+    Args:
+        session_local (scoped_session[Session]): The registry of sessions.
+
+    Returns:
+        Session: The session of the current unit of work.
+
+    """
+    return session_local()
+
+
+@singleton
+@inject
+@provider
+def async_scoped_session_factory(
+    engine: AsyncEngine,
+) -> async_scoped_session[AsyncSession]:
+    """Create the registry of async sessions.
+
+    The registry shares the scopes of `scoped_session_factory`, so a unit of work owns at
+    most one sync and one async session.
+
+    Args:
+        engine (AsyncEngine): The async database engine.
+
+    Returns:
+        async_scoped_session[AsyncSession]: The registry of async sessions.
+
+    """
+    return async_scoped_session(
+        async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
+        scopefunc=_get_scope,
+    )
+
+
+@inject
+@provider
+def async_session_factory(
+    session_local: async_scoped_session[AsyncSession],
+) -> AsyncSession:
+    """Provide the async session of the current unit of work.
+
+    Args:
+        session_local (async_scoped_session[AsyncSession]): The registry of async
+            sessions.
+
+    Returns:
+        AsyncSession: The async session of the current unit of work.
+
+    """
+    return session_local()
+
+
+@contextmanager
+def unit_of_work(session_local: scoped_session[Session]) -> Iterator[None]:
+    """Scope a session to a unit of work, such as a request or a task.
+
+    The session is opened lazily on first use and is always closed when the unit of
+    work ends, which rolls back any uncommitted transaction and resets the identity map.
+
+    Args:
+        session_local (scoped_session[Session]): The registry of sessions.
+
+    """
+    token = _unit_of_work.set(object())
+
+    try:
+        yield
+    finally:
+        session_local.remove()
+        _unit_of_work.reset(token)
+
+
+@asynccontextmanager
+async def async_unit_of_work(
+    session_local: scoped_session[Session],
+    async_session_local: async_scoped_session[AsyncSession],
+) -> AsyncIterator[None]:
+    """Scope both a session and an async session to a unit of work.
+
+    Both sessions are opened lazily on first use and are always closed when the unit of
+    work ends.
+
+    Args:
+        session_local (scoped_session[Session]): The registry of sessions.
+        async_session_local (async_scoped_session[AsyncSession]): The registry of async
+            sessions.
+
+    """
+    with unit_of_work(session_local):
+        try:
+            yield
+        finally:
+            await async_session_local.remove()
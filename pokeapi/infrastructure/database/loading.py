@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class LoadingStrategy(Enum):
+    """Strategies for eagerly loading the relationships of a model.
+
+    Attributes:
+        SELECTIN: Load each relationship with an additional `SELECT ... IN` query.
+            The number of queries is fixed regardless of the number of rows, which
+            suits queries returning many rows.
+        JOINED: Load every relationship in the same query with `LEFT OUTER JOIN`.
+            A single round trip is made, which suits queries returning a single row.
+
+    """
+
+    SELECTIN = "selectin"
+    JOINED = "joined"
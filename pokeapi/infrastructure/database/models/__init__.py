@@ -3,6 +3,7 @@ from .base import BaseModel
 from .pokemon_abilities import PokemonAbilities
 from .pokemon_mst import Pokemon
 from .pokemon_types import PokemonTypes
+from .token_revocation import TokenRevocation
 from .token_whitelist import TokenWhitelist
 from .type_mst import TypeMst
 from .users import User
@@ -13,6 +14,7 @@ __all__ = [
     "PokemonAbilities",
     "Pokemon",
     "PokemonTypes",
+    "TokenRevocation",
     "TokenWhitelist",
     "TypeMst",
     "User",
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import SmallInteger, String
+from sqlalchemy import Index, SmallInteger, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -17,6 +17,14 @@ class Pokemon(BaseModel, TimestampMixin):
     """Class that maps to the `pokemon_mst` table."""
 
     __tablename__ = "pokemon_mst"
+    __table_args__ = (
+        Index(
+            "ix_pokemon_mst_national_pokedex_number",
+            "national_pokedex_number",
+            "deleted_at",
+        ),
+        Index("ix_pokemon_mst_name", "name", "deleted_at"),
+    )
 
     id_: Mapped[int] = mapped_column("id", primary_key=True, autoincrement=True)
     national_pokedex_number: Mapped[int] = mapped_column(nullable=False)
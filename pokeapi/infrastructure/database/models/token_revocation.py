@@ -0,0 +1,20 @@
+import datetime
+
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+from .types import BinaryUUID
+
+
+class TokenRevocation(BaseModel):
+    """Class that maps to the token_revocation table."""
+
+    __tablename__ = "token_revocation"
+    __table_args__ = (Index("ix_token_revocation_revoked_at", "revoked_at"),)
+
+    id_: Mapped[int] = mapped_column("id", primary_key=True, autoincrement=True)
+    access_token: Mapped[str] = mapped_column(BinaryUUID, nullable=False)
+    revoked_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, default=datetime.datetime.now, nullable=False
+    )
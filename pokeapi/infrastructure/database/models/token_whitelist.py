@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
 from .mixins import TimestampMixin
+from .types import BinaryUUID
 
 if TYPE_CHECKING:
     from .users import User
@@ -16,11 +17,30 @@ class TokenWhitelist(BaseModel, TimestampMixin):
     """Class that maps to the token_whitelist table."""
 
     __tablename__ = "token_whitelist"
+    __table_args__ = (
+        Index(
+            "ix_token_whitelist_access_token",
+            "access_token",
+            "deleted_at",
+            "updated_at",
+            "user_id",
+        ),
+        Index(
+            "ix_token_whitelist_refresh_token",
+            "refresh_token",
+            "deleted_at",
+            "updated_at",
+            "user_id",
+        ),
+        Index("ix_token_whitelist_user_id", "user_id", "deleted_at", "updated_at"),
+        Index("ix_token_whitelist_updated_at", "updated_at"),
+        Index("ix_token_whitelist_deleted_at", "deleted_at"),
+    )
 
     id_: Mapped[int] = mapped_column("id", primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    access_token: Mapped[str] = mapped_column(String(36), nullable=False)
-    refresh_token: Mapped[str] = mapped_column(String(36), nullable=False)
+    access_token: Mapped[str] = mapped_column(BinaryUUID, nullable=False)
+    refresh_token: Mapped[str] = mapped_column(BinaryUUID, nullable=False)
 
     # Relationships
     user: Mapped[User] = relationship("User", back_populates="token_whitelist")
@@ -0,0 +1,52 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import BINARY, Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class BinaryUUID(TypeDecorator[str]):
+    """A UUID handled as text in Python and stored as 16 bytes.
+
+    A value that is not a UUID is bound as NULL, which equals no row, so that a malformed
+    token is simply not found.
+
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        """Convert a UUID in text form to its bytes.
+
+        Args:
+            value (str | None): The UUID in text form.
+            dialect (Dialect): The dialect in use.
+
+        Returns:
+            bytes | None: The bytes of the UUID, or None if the value is not a UUID.
+
+        """
+        if value is None:
+            return None
+
+        try:
+            return uuid.UUID(value).bytes
+        except ValueError:
+            return None
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        """Convert the bytes of a UUID to its text form.
+
+        Args:
+            value (Any): The bytes of the UUID.
+            dialect (Dialect): The dialect in use.
+
+        Returns:
+            str | None: The UUID in text form.
+
+        """
+        if value is None:
+            return None
+
+        return str(uuid.UUID(bytes=value))
@@ -0,0 +1,174 @@
+import threading
+import time
+from typing import Any
+
+from injector import singleton
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+CHECKOUT_WAIT_KEY = "checkout_wait"
+
+
+class InstrumentedQueuePool(QueuePool):
+    """A queue pool that measures how long each checkout waits for a connection.
+
+    The wait time is stored in the `info` of the connection record, so that it can be
+    read by the `checkout` event listeners.
+
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Retrieve a connection record from the pool, measuring the wait time.
+
+        Returns:
+            ConnectionPoolEntry: The connection record.
+
+        """
+        start = time.perf_counter()
+        record = super()._do_get()
+        record.info[CHECKOUT_WAIT_KEY] = time.perf_counter() - start
+
+        return record
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """The counterpart of `InstrumentedQueuePool` for engines with an async driver."""
+
+
+@singleton
+class PoolMetrics:
+    """Metrics of the database connection pool.
+
+    The metrics are recorded by pool event listeners registered with `listen`.
+
+    Attributes:
+        _lock (threading.Lock): The lock guarding the counters.
+        _engine (Engine | None): The engine whose pool is observed.
+        _checkouts (int): The number of checkouts.
+        _checkout_wait_total (float): The total checkout wait time in seconds.
+        _checkout_wait_max (float): The longest checkout wait time in seconds.
+        _checked_out_max (int): The highest number of checked-out connections.
+        _overflow_max (int): The highest number of overflow connections.
+        _connects (int): The number of new DBAPI connections.
+        _invalidations (int): The number of invalidated connections.
+        _soft_invalidations (int): The number of soft-invalidated connections.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the PoolMetrics with empty counters."""
+        self._lock = threading.Lock()
+        self._engine: Engine | None = None
+        self._checkouts = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+        self._checked_out_max = 0
+        self._overflow_max = 0
+        self._connects = 0
+        self._invalidations = 0
+        self._soft_invalidations = 0
+
+    def listen(self, engine: Engine) -> None:
+        """Register the pool event listeners on an engine.
+
+        Args:
+            engine (Engine): The engine whose pool is observed.
+
+        """
+        self._engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "soft_invalidate", self._on_soft_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        """Count a new DBAPI connection."""
+        with self._lock:
+            self._connects += 1
+
+    def _on_checkout(
+        self,
+        dbapi_connection: Any,
+        record: ConnectionPoolEntry,
+        proxy: PoolProxiedConnection,
+    ) -> None:
+        """Record the wait time and the pool usage of a checkout."""
+        wait = record.info.pop(CHECKOUT_WAIT_KEY, 0.0)
+        checked_out, overflow = self._pool_usage()
+
+        with self._lock:
+            self._checkouts += 1
+            self._checkout_wait_total += wait
+            self._checkout_wait_max = max(self._checkout_wait_max, wait)
+            self._checked_out_max = max(self._checked_out_max, checked_out)
+            self._overflow_max = max(self._overflow_max, overflow)
+
+    def _on_invalidate(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, exception: Any
+    ) -> None:
+        """Count an invalidated connection."""
+        with self._lock:
+            self._invalidations += 1
+
+    def _on_soft_invalidate(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, exception: Any
+    ) -> None:
+        """Count a soft-invalidated connection."""
+        with self._lock:
+            self._soft_invalidations += 1
+
+    def _pool_usage(self) -> tuple[int, int]:
+        """Read the current usage of the pool.
+
+        Returns:
+            tuple[int, int]: The number of checked-out and overflow connections.
+
+        """
+        if self._engine is None or not isinstance(self._engine.pool, QueuePool):
+            return 0, 0
+
+        pool = self._engine.pool
+
+        return pool.checkedout(), max(pool.overflow(), 0)
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the metrics.
+
+        Returns:
+            dict: The current metrics of the connection pool.
+
+        """
+        checked_out, overflow = self._pool_usage()
+
+        with self._lock:
+            return {
+                "checked_out": checked_out,
+                "checked_out_max": self._checked_out_max,
+                "overflow": overflow,
+                "overflow_max": self._overflow_max,
+                "checkouts": self._checkouts,
+                "checkout_wait_avg": (
+                    self._checkout_wait_total / self._checkouts
+                    if self._checkouts
+                    else 0.0
+                ),
+                "checkout_wait_max": self._checkout_wait_max,
+                "connects": self._connects,
+                "invalidations": self._invalidations,
+                "soft_invalidations": self._soft_invalidations,
+            }
+
+
+@singleton
+class AsyncPoolMetrics(PoolMetrics):
+    """Metrics of the connection pool of the async database engine.
+
+    The async engine keeps its own pool, so its metrics are recorded apart from those of
+    the sync engine.
+
+    """
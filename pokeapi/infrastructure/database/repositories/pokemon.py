@@ -1,6 +1,8 @@
+from collections.abc import Sequence
+
 from injector import inject, singleton
-from sqlalchemy import and_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select
+from sqlalchemy.orm import Session, scoped_session
 
 from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
 from pokeapi.domain.entities.pokemon_ability import PokemonAbility
@@ -9,6 +11,8 @@ from pokeapi.domain.entities.pokemon_type import PokemonType
 from pokeapi.domain.entities.pokemons_ability import PokemonsAbility
 from pokeapi.domain.entities.pokemons_type import PokemonsType
 from pokeapi.domain.repositories.pokemon import PokemonRepositoryABC
+from pokeapi.infrastructure.database import statements
+from pokeapi.infrastructure.database.loading import LoadingStrategy
 from pokeapi.infrastructure.database.models.pokemon_mst import Pokemon as PokemonModel
 
 
@@ -20,20 +24,42 @@ class PokemonRepository(PokemonRepositoryABC):
     methods to interact with the database.
 
     Attributes:
-        _db (Session): The database session to be used by the repository.
+        _db (scoped_session[Session]):
+            The session registry of the current unit of work used by the repository.
 
     """
 
     @inject
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: scoped_session[Session]) -> None:
         """Initializer for PokemonRepository.
 
         Args:
-            db (Session): The database session object used by the repository.
+            db (scoped_session[Session]):
+                The session registry of the current unit of work used by the repository.
 
         """
         self._db = db
 
+    def _execute(
+        self, statement: Select[tuple[PokemonModel]], loading: LoadingStrategy
+    ) -> Sequence[PokemonModel]:
+        """Execute a statement, eagerly loading the types and abilities of Pokémon.
+
+        Every row of the result is consumed, since joined eager loading spreads the
+        collections of one Pokémon across several rows.
+
+        Args:
+            statement (Select[tuple[PokemonModel]]): The statement to be executed.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            Sequence[PokemonModel]: The Pokémon retrieved by the statement.
+
+        """
+        statement = statement.options(*statements.pokemon_loader_options(loading))
+
+        return self._db.execute(statement).unique().scalars().all()
+
     def _convert_to_entity(self, model: PokemonModel) -> PokemonEntity:
         """Converts a SQLAlchemy model to a domain entity.
 
@@ -84,80 +110,139 @@ class PokemonRepository(PokemonRepositoryABC):
             pokemons_ability=pokemons_ability,
         )
 
-    def get_by_id(self, id_: int) -> PokemonEntity | None:
+    def get_by_id(
+        self, id_: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
         """Retrieve a Pokémon by its identifier.
 
         Args:
             id_ (int): The identifier of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
 
         Returns:
             PokemonEntity | None:
                 The Pokémon with the specified identifier, or None if no such Pokémon exists.
 
         """
-        statement = select(PokemonModel).where(
-            and_(PokemonModel.id_ == id_, PokemonModel.deleted_at.is_(None))
-        )
-        result = self._db.execute(statement).scalar()
+        statement = statements.select_pokemon_by_id(id_)
+        result = self._execute(statement, loading)
 
-        if result is None:
+        if not result:
             return None
 
-        return self._convert_to_entity(result)
+        return self._convert_to_entity(result[0])
 
-    def get_by_pokedex_number(self, pokedex_number: int) -> PokemonEntity | None:
+    def get_by_pokedex_number(
+        self, pokedex_number: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
         """Retrieve a Pokémon by its pokedex number.
 
         Args:
             pokedex_number (int): The pokedex number of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
 
         Returns:
             PokemonEntity | None:
                 The Pokémon with the specified pokedex number, or None if no such Pokémon exists.
 
         """
-        statement = select(PokemonModel).where(
-            and_(
-                PokemonModel.national_pokedex_number == pokedex_number,
-                PokemonModel.deleted_at.is_(None),
-            )
-        )
-        result = self._db.execute(statement).scalar()
+        statement = statements.select_pokemon_by_pokedex_number(pokedex_number)
+        result = self._execute(statement, loading)
 
-        if result is None:
+        if not result:
             return None
 
-        return self._convert_to_entity(result)
+        return self._convert_to_entity(result[0])
 
-    def get_by_name(self, name: str) -> PokemonEntity | None:
+    def get_by_name(
+        self, name: str, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
         """Retrieve a Pokémon by its name.
 
         Args:
             name (str): The name of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
 
         Returns:
             PokemonEntity | None:
                 The Pokémon with the specified name, or None if no such Pokémon exists.
 
         """
-        statement = select(PokemonModel).where(
-            and_(PokemonModel.name == name, PokemonModel.deleted_at.is_(None))
-        )
-        result = self._db.execute(statement).scalar()
+        statement = statements.select_pokemon_by_name(name)
+        result = self._execute(statement, loading)
 
-        if result is None:
+        if not result:
             return None
 
-        return self._convert_to_entity(result)
+        return self._convert_to_entity(result[0])
 
-    def get_all(self) -> list[PokemonEntity]:
+    def get_all(
+        self, loading: LoadingStrategy = LoadingStrategy.SELECTIN
+    ) -> list[PokemonEntity]:
         """Retrieve all Pokémon.
 
+        Args:
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
         Returns:
             list[PokemonEntity]: A list of all Pokémon.
 
         """
-        statement = select(PokemonModel).where(PokemonModel.deleted_at.is_(None))
-        result = self._db.execute(statement).scalars().all()
+        statement = statements.select_all_pokemon()
+        result = self._execute(statement, loading)
+
+        return [self._convert_to_entity(pokemon) for pokemon in result]
+
+    def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve a page of Pokémon ordered by their identifiers.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        statement = statements.select_pokemon_page(limit, after, before, backward)
+        result = self._execute(statement, loading)
+
+        if backward:
+            result = result[::-1]
+
+        return [self._convert_to_entity(pokemon) for pokemon in result]
+
+    def get_by_ids(
+        self,
+        ids: Sequence[int],
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve Pokémon by their identifiers in a single query.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon with the specified identifiers, in no
+                particular order.
+
+        """
+        if not ids:
+            return []
+
+        statement = statements.select_pokemon_by_ids(ids)
+        result = self._execute(statement, loading)
 
         return [self._convert_to_entity(pokemon) for pokemon in result]
@@ -1,9 +1,11 @@
+from collections.abc import Sequence
+
 from injector import inject, singleton
-from sqlalchemy import and_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, scoped_session
 
 from pokeapi.domain.entities.pokemon_ability import PokemonAbility
 from pokeapi.domain.repositories.pokemon_ability import AbilityRepositoryABC
+from pokeapi.infrastructure.database import statements
 from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
 
 
@@ -15,16 +17,16 @@ class AbilityRepository(AbilityRepositoryABC):
     methods to interact with the database.
 
     Attributes:
-        _db (Session): Database session
+        _db (scoped_session[Session]): Session registry of the current unit of work
 
     """
 
     @inject
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: scoped_session[Session]) -> None:
         """Initializer for TypeRepository
 
         Args:
-            db (Session): Database session
+            db (scoped_session[Session]): Session registry of the current unit of work
 
         """
         self._db = db
@@ -56,9 +58,7 @@ class AbilityRepository(AbilityRepositoryABC):
             PokemonAbility | None: The ability with the specified identifier, or None if not found.
 
         """
-        statement = select(AbilityMst).where(
-            and_(AbilityMst.id_ == id_, AbilityMst.deleted_at.is_(None))
-        )
+        statement = statements.select_ability_by_id(id_)
         result = self._db.execute(statement).scalar()
 
         if result is None:
@@ -73,7 +73,26 @@ class AbilityRepository(AbilityRepositoryABC):
             list[PokemonAbility]: A list of all abilities.
 
         """
-        statement = select(AbilityMst).where(AbilityMst.deleted_at.is_(None))
+        statement = statements.select_all_abilities()
+        results = self._db.execute(statement).scalars().all()
+
+        return [self._convert_to_entity(result) for result in results]
+
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers in a single query.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        if not ids:
+            return []
+
+        statement = statements.select_abilities_by_ids(ids)
         results = self._db.execute(statement).scalars().all()
 
         return [self._convert_to_entity(result) for result in results]
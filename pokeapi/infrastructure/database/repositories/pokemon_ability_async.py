@@ -0,0 +1,105 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.repositories.pokemon_ability_async import AsyncAbilityRepositoryABC
+from pokeapi.infrastructure.database import statements
+from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
+from pokeapi.infrastructure.database.repositories.pokemon_ability import (
+    AbilityRepository,
+)
+
+
+@singleton
+class AsyncAbilityRepository(AsyncAbilityRepositoryABC):
+    """Async repository for PokemonAbility
+
+    This class implements the AsyncAbilityRepositoryABC abstract base class and queries the
+    database without blocking the event loop.
+
+    Attributes:
+        _db (async_scoped_session[AsyncSession]):
+            Async session registry of the current unit of work
+        _sync_repo (AbilityRepository): The sync repository sharing the conversion
+
+    """
+
+    @inject
+    def __init__(
+        self, db: async_scoped_session[AsyncSession], sync_repo: AbilityRepository
+    ) -> None:
+        """Initializer for AsyncAbilityRepository
+
+        Args:
+            db (async_scoped_session[AsyncSession]):
+                Async session registry of the current unit of work
+            sync_repo (AbilityRepository): The sync repository sharing the conversion
+
+        """
+        self._db = db
+        self._sync_repo = sync_repo
+
+    def _convert_to_entity(self, model: AbilityMst) -> PokemonAbility:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the sync repository.
+
+        Args:
+            model (AbilityMst): The SQLAlchemy model instance of Ability to be converted.
+
+        Returns:
+            PokemonAbility: The converted instance of the domain entity of Ability.
+
+        """
+        return self._sync_repo._convert_to_entity(model)
+
+    async def get_by_id(self, id_: int) -> PokemonAbility | None:
+        """Retrieve an ability by its identifier.
+
+        Args:
+            id_ (int): The identifier of the ability to retrieve.
+
+        Returns:
+            PokemonAbility | None: The ability with the specified identifier, or None if not found.
+
+        """
+        statement = statements.select_ability_by_id(id_)
+        result = (await self._db.execute(statement)).scalar()
+
+        if result is None:
+            return None
+
+        return self._convert_to_entity(result)
+
+    async def get_all(self) -> list[PokemonAbility]:
+        """Retrieve all abilities.
+
+        Returns:
+            list[PokemonAbility]: A list of all abilities.
+
+        """
+        statement = statements.select_all_abilities()
+        results = (await self._db.execute(statement)).scalars().all()
+
+        return [self._convert_to_entity(result) for result in results]
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers in a single query.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        if not ids:
+            return []
+
+        statement = statements.select_abilities_by_ids(ids)
+        results = (await self._db.execute(statement)).scalars().all()
+
+        return [self._convert_to_entity(result) for result in results]
@@ -0,0 +1,218 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+
+from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
+from pokeapi.domain.repositories.pokemon_async import AsyncPokemonRepositoryABC
+from pokeapi.infrastructure.database import statements
+from pokeapi.infrastructure.database.loading import LoadingStrategy
+from pokeapi.infrastructure.database.models.pokemon_mst import Pokemon as PokemonModel
+from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
+
+
+@singleton
+class AsyncPokemonRepository(AsyncPokemonRepositoryABC):
+    """An async repository class for handling Pokemon data.
+
+    This class extends the abstract base class AsyncPokemonRepositoryABC and queries the
+    database without blocking the event loop. The statements and the loader options are
+    built by the `statements` module, and the conversion is that of PokemonRepository.
+
+    Attributes:
+        _db (async_scoped_session[AsyncSession]):
+            The async session registry of the current unit of work used by the repository.
+        _sync_repo (PokemonRepository):
+            The sync repository sharing the conversion.
+
+    """
+
+    @inject
+    def __init__(
+        self, db: async_scoped_session[AsyncSession], sync_repo: PokemonRepository
+    ) -> None:
+        """Initializer for AsyncPokemonRepository.
+
+        Args:
+            db (async_scoped_session[AsyncSession]):
+                The async session registry of the current unit of work used by the
+                repository.
+            sync_repo (PokemonRepository):
+                The sync repository sharing the conversion.
+
+        """
+        self._db = db
+        self._sync_repo = sync_repo
+
+    async def _execute(
+        self, statement: Select[tuple[PokemonModel]], loading: LoadingStrategy
+    ) -> Sequence[PokemonModel]:
+        """Execute a statement, eagerly loading the types and abilities of Pokémon.
+
+        Lazy loading is not available to async sessions, so every relationship read by
+        the conversion must be loaded here.
+
+        Args:
+            statement (Select[tuple[PokemonModel]]): The statement to be executed.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            Sequence[PokemonModel]: The Pokémon retrieved by the statement.
+
+        """
+        statement = statement.options(*statements.pokemon_loader_options(loading))
+        result = await self._db.execute(statement)
+
+        return result.unique().scalars().all()
+
+    def _convert_to_entity(self, model: PokemonModel) -> PokemonEntity:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the sync repository.
+
+        Args:
+            model (PokemonModel): The SQLAlchemy model instance of Pokémon to be converted.
+
+        Returns:
+            PokemonEntity: The converted instance of the domain entity of Pokémon.
+
+        """
+        return self._sync_repo._convert_to_entity(model)
+
+    async def get_by_id(
+        self, id_: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its identifier.
+
+        Args:
+            id_ (int): The identifier of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified identifier, or None if no such Pokémon exists.
+
+        """
+        statement = statements.select_pokemon_by_id(id_)
+        result = await self._execute(statement, loading)
+
+        if not result:
+            return None
+
+        return self._convert_to_entity(result[0])
+
+    async def get_by_pokedex_number(
+        self, pokedex_number: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its pokedex number.
+
+        Args:
+            pokedex_number (int): The pokedex number of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified pokedex number, or None if no such Pokémon exists.
+
+        """
+        statement = statements.select_pokemon_by_pokedex_number(pokedex_number)
+        result = await self._execute(statement, loading)
+
+        if not result:
+            return None
+
+        return self._convert_to_entity(result[0])
+
+    async def get_by_name(
+        self, name: str, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its name.
+
+        Args:
+            name (str): The name of the Pokémon to be retrieved.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified name, or None if no such Pokémon exists.
+
+        """
+        statement = statements.select_pokemon_by_name(name)
+        result = await self._execute(statement, loading)
+
+        if not result:
+            return None
+
+        return self._convert_to_entity(result[0])
+
+    async def get_all(
+        self, loading: LoadingStrategy = LoadingStrategy.SELECTIN
+    ) -> list[PokemonEntity]:
+        """Retrieve all Pokémon.
+
+        Args:
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: A list of all Pokémon.
+
+        """
+        statement = statements.select_all_pokemon()
+        result = await self._execute(statement, loading)
+
+        return [self._convert_to_entity(pokemon) for pokemon in result]
+
+    async def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve a page of Pokémon ordered by their identifiers.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        statement = statements.select_pokemon_page(limit, after, before, backward)
+        result = await self._execute(statement, loading)
+
+        if backward:
+            result = result[::-1]
+
+        return [self._convert_to_entity(pokemon) for pokemon in result]
+
+    async def get_by_ids(
+        self,
+        ids: Sequence[int],
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve Pokémon by their identifiers in a single query.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+            loading (LoadingStrategy): The strategy for loading the relationships.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon with the specified identifiers, in no
+                particular order.
+
+        """
+        if not ids:
+            return []
+
+        statement = statements.select_pokemon_by_ids(ids)
+        result = await self._execute(statement, loading)
+
+        return [self._convert_to_entity(pokemon) for pokemon in result]
@@ -1,9 +1,11 @@
+from collections.abc import Sequence
+
 from injector import inject, singleton
-from sqlalchemy import and_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, scoped_session
 
 from pokeapi.domain.entities.pokemon_type import PokemonType
 from pokeapi.domain.repositories.pokemon_type import TypeRepositoryABC
+from pokeapi.infrastructure.database import statements
 from pokeapi.infrastructure.database.models.type_mst import TypeMst
 
 
@@ -15,16 +17,16 @@ class TypeRepository(TypeRepositoryABC):
     methods to interact with the database.
 
     Attributes:
-        _db (Session): Database session
+        _db (scoped_session[Session]): Session registry of the current unit of work
 
     """
 
     @inject
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: scoped_session[Session]) -> None:
         """Initializer for TypeRepository
 
         Args:
-            db (Session): Database session
+            db (scoped_session[Session]): Session registry of the current unit of work
 
         """
         self._db = db
@@ -56,9 +58,7 @@ class TypeRepository(TypeRepositoryABC):
             PokemonType | None: The type with the specified identifier, or None if not found.
 
         """
-        statement = select(TypeMst).where(
-            and_(TypeMst.id_ == id_, TypeMst.deleted_at.is_(None))
-        )
+        statement = statements.select_type_by_id(id_)
         result = self._db.execute(statement).scalar()
 
         if result is None:
@@ -73,7 +73,26 @@ class TypeRepository(TypeRepositoryABC):
             list[PokemonType]: A list of all types.
 
         """
-        statement = select(TypeMst).where(TypeMst.deleted_at.is_(None))
+        statement = statements.select_all_types()
+        results = self._db.execute(statement).scalars().all()
+
+        return [self._convert_to_entity(result) for result in results]
+
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers in a single query.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        if not ids:
+            return []
+
+        statement = statements.select_types_by_ids(ids)
         results = self._db.execute(statement).scalars().all()
 
         return [self._convert_to_entity(result) for result in results]
@@ -0,0 +1,103 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.domain.repositories.pokemon_type_async import AsyncTypeRepositoryABC
+from pokeapi.infrastructure.database import statements
+from pokeapi.infrastructure.database.models.type_mst import TypeMst
+from pokeapi.infrastructure.database.repositories.pokemon_type import TypeRepository
+
+
+@singleton
+class AsyncTypeRepository(AsyncTypeRepositoryABC):
+    """Async repository for PokemonType
+
+    This class implements the AsyncTypeRepositoryABC abstract base class and queries the
+    database without blocking the event loop.
+
+    Attributes:
+        _db (async_scoped_session[AsyncSession]):
+            Async session registry of the current unit of work
+        _sync_repo (TypeRepository): The sync repository sharing the conversion
+
+    """
+
+    @inject
+    def __init__(
+        self, db: async_scoped_session[AsyncSession], sync_repo: TypeRepository
+    ) -> None:
+        """Initializer for AsyncTypeRepository
+
+        Args:
+            db (async_scoped_session[AsyncSession]):
+                Async session registry of the current unit of work
+            sync_repo (TypeRepository): The sync repository sharing the conversion
+
+        """
+        self._db = db
+        self._sync_repo = sync_repo
+
+    def _convert_to_entity(self, model: TypeMst) -> PokemonType:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the sync repository.
+
+        Args:
+            model (TypeMst): The SQLAlchemy model instance of Type to be converted.
+
+        Returns:
+            PokemonType: The converted instance of the domain entity of Type.
+
+        """
+        return self._sync_repo._convert_to_entity(model)
+
+    async def get_by_id(self, id_: int) -> PokemonType | None:
+        """Retrieve a type by its identifier.
+
+        Args:
+            id_ (int): The identifier of the type to retrieve.
+
+        Returns:
+            PokemonType | None: The type with the specified identifier, or None if not found.
+
+        """
+        statement = statements.select_type_by_id(id_)
+        result = (await self._db.execute(statement)).scalar()
+
+        if result is None:
+            return None
+
+        return self._convert_to_entity(result)
+
+    async def get_all(self) -> list[PokemonType]:
+        """Retrieve all types.
+
+        Returns:
+            list[PokemonType]: A list of all types.
+
+        """
+        statement = statements.select_all_types()
+        results = (await self._db.execute(statement)).scalars().all()
+
+        return [self._convert_to_entity(result) for result in results]
+
+    async def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers in a single query.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        if not ids:
+            return []
+
+        statement = statements.select_types_by_ids(ids)
+        results = (await self._db.execute(statement)).scalars().all()
+
+        return [self._convert_to_entity(result) for result in results]
@@ -0,0 +1,107 @@
+import datetime
+import logging
+
+from injector import inject, singleton
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, scoped_session
+
+from pokeapi.domain.entities.token_revocation import (
+    TokenRevocation as TokenRevocationEntity,
+)
+from pokeapi.domain.repositories.token_revocation import TokenRevocationRepositoryABC
+from pokeapi.infrastructure.database.models.token_revocation import (
+    TokenRevocation as TokenRevocationModel,
+)
+
+
+@singleton
+class TokenRevocationRepository(TokenRevocationRepositoryABC):
+    """Concrete implementation of the token revocation repository.
+
+    This class provides an implementation of the token revocation repository interface
+    using SQLAlchemy as the data store.
+
+    Attributes:
+        _db (scoped_session[Session]): The SQLAlchemy session registry.
+
+    """
+
+    @inject
+    def __init__(self, db: scoped_session[Session]) -> None:
+        """Initializes the token revocation repository.
+
+        Args:
+            db (scoped_session[Session]): The SQLAlchemy session registry.
+
+        """
+        self._db = db
+        self._logger = logging.getLogger(__name__)
+
+    def _convert_to_entity(self, model: TokenRevocationModel) -> TokenRevocationEntity:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        Args:
+            model (TokenRevocationModel): The SQLAlchemy model instance to be converted.
+
+        Returns:
+            TokenRevocationEntity: The converted instance of the domain entity.
+
+        """
+        return TokenRevocationEntity(
+            id_=model.id_,
+            access_token=model.access_token,
+            revoked_at=model.revoked_at,
+        )
+
+    def get_since(self, since: datetime.datetime) -> list[TokenRevocationEntity]:
+        """Retrieve the revocations recorded at or after a date.
+
+        Args:
+            since (datetime.datetime): The date of the oldest revocations to retrieve.
+
+        Returns:
+            list[TokenRevocationEntity]: The revocations, from the oldest to the newest.
+
+        """
+        statement = (
+            select(TokenRevocationModel)
+            .where(TokenRevocationModel.revoked_at >= since)
+            .order_by(TokenRevocationModel.revoked_at, TokenRevocationModel.id_)
+        )
+        result = self._db.execute(statement).scalars().all()
+
+        return [self._convert_to_entity(model) for model in result]
+
+    def purge(self, expiration: datetime.datetime, limit: int) -> int:
+        """Permanently delete a batch of expired revocations.
+
+        The batch is selected by primary key first, since MySQL does not accept a limit
+        on a subquery of a `DELETE`, and then deleted and committed in its own short
+        transaction.
+
+        Args:
+            expiration (datetime.datetime): The revocations recorded at or before this
+                date are expired.
+            limit (int): The maximum number of revocations to delete.
+
+        Returns:
+            int: The number of deleted revocations.
+
+        """
+        ids_statement = (
+            select(TokenRevocationModel.id_)
+            .where(TokenRevocationModel.revoked_at <= expiration)
+            .order_by(TokenRevocationModel.id_)
+            .limit(limit)
+        )
+        ids = self._db.execute(ids_statement).scalars().all()
+
+        if not ids:
+            return 0
+
+        result = self._db.execute(
+            delete(TokenRevocationModel).where(TokenRevocationModel.id_.in_(ids))
+        )
+        self._db.commit()
+
+        return result.rowcount
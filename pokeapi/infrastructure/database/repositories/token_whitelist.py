@@ -2,15 +2,18 @@ import datetime
 import logging
 
 from injector import inject, singleton
-from sqlalchemy import and_, insert, select, update
+from sqlalchemy import DateTime, and_, delete, insert, literal, or_, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, scoped_session
 
 from pokeapi.domain.entities.token_whitelist import (
     TokenWhitelist as TokenWhitelistEntity,
 )
 from pokeapi.domain.repositories.token_whitelist import TokenWhitelistRepositoryABC
 from pokeapi.exceptions.token import TokenRegistrationError, TokenUpdateError
+from pokeapi.infrastructure.database.models.token_revocation import (
+    TokenRevocation as TokenRevocationModel,
+)
 from pokeapi.infrastructure.database.models.token_whitelist import (
     TokenWhitelist as TokenWhitelistModel,
 )
@@ -24,16 +27,16 @@ class TokenWhitelistRepository(TokenWhitelistRepositoryABC):
         SQLAlchemy as the data store.
 
     Attributes:
-        _db (Session): The SQLAlchemy session object.
+        _db (scoped_session[Session]): The SQLAlchemy session registry.
 
     """
 
     @inject
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: scoped_session[Session]) -> None:
         """Initializes the token whitelist repository.
 
         Args:
-            db (Session): The SQLAlchemy session object.
+            db (scoped_session[Session]): The SQLAlchemy session registry.
 
         """
         self._db = db
@@ -60,64 +63,6 @@ class TokenWhitelistRepository(TokenWhitelistRepositoryABC):
             updated_at=model.updated_at,
         )
 
-    def get_by_access_token(
-        self, token: str, expiration: datetime.datetime
-    ) -> TokenWhitelistEntity | None:
-        """Retrieve an entity by its access token.
-
-        Args:
-            token (str): The access token to retrieve.
-            expiration (datetime.datetime): The expiration date of the access token.
-
-        Returns:
-            TokenWhitelistEntity: The entity with the specified access token.
-
-        """
-        statement = select(TokenWhitelistModel).where(
-            and_(
-                TokenWhitelistModel.access_token == token,
-                TokenWhitelistModel.updated_at.between(
-                    expiration, datetime.datetime.now()
-                ),
-                TokenWhitelistModel.deleted_at.is_(None),
-            )
-        )
-        result = self._db.execute(statement).scalar()
-
-        if result is None:
-            return None
-
-        return self._convert_to_entity(result)
-
-    def get_by_refresh_token(
-        self, token: str, expiration: datetime.datetime
-    ) -> TokenWhitelistEntity | None:
-        """Retrieve an entity by its refresh token.
-
-        Args:
-            token (str): The refresh token to retrieve.
-            expiration (datetime.datetime): The expiration date of the refresh token.
-
-        Returns:
-            TokenWhitelistEntity: The entity with the specified refresh token.
-
-        """
-        statement = select(TokenWhitelistModel).where(
-            and_(
-                TokenWhitelistModel.refresh_token == token,
-                TokenWhitelistModel.updated_at.between(
-                    expiration, datetime.datetime.now()
-                ),
-                TokenWhitelistModel.deleted_at.is_(None),
-            )
-        )
-        result = self._db.execute(statement).scalar()
-
-        if result is None:
-            return None
-
-        return self._convert_to_entity(result)
-
     def create(self, entity: TokenWhitelistEntity) -> TokenWhitelistEntity:
         """Create a new entity.
 
@@ -152,29 +97,54 @@ class TokenWhitelistRepository(TokenWhitelistRepositoryABC):
         if result.inserted_primary_key is None:
             raise TokenRegistrationError("Failed to register token")
 
-        read_statement = select(TokenWhitelistModel).where(
-            TokenWhitelistModel.id_ == result.inserted_primary_key[0]
-        )
-        created_token_whitelist = self._db.execute(read_statement).scalar_one()
+        return entity.model_copy(update={"id_": result.inserted_primary_key[0]})
 
-        return self._convert_to_entity(created_token_whitelist)
+    def rotate(
+        self,
+        token: str,
+        expiration: datetime.datetime,
+        entity: TokenWhitelistEntity,
+        revoke: bool,
+    ) -> bool:
+        """Replace the tokens of the entity holding a valid refresh token.
 
-    def update(self, entity: TokenWhitelistEntity) -> TokenWhitelistEntity:
-        """Update an existing entity.
+        The refresh token is checked and replaced by a single conditional update, so
+        that of concurrent rotations of the same refresh token only one succeeds. When
+        revoking, the access token replaced is recorded as revoked in the same
+        transaction, after locking the entity, so that a concurrent rotation waits
+        rather than deadlocks. Otherwise the access token replaced is rejected by its
+        lookup in the whitelist alone.
 
         Args:
-            entity (TokenWhitelistEntity): The entity to be updated.
+            token (str): The refresh token to be replaced.
+            expiration (datetime.datetime): The expiration date of the refresh token.
+            entity (TokenWhitelistEntity): The entity holding the new tokens.
+            revoke (bool): Whether to record the access token replaced as revoked.
 
         Returns:
-            TokenWhitelistEntity: The updated entity.
+            bool: True if the tokens were replaced, False if the refresh token is invalid.
 
         Raises:
             TokenUpdateError: If the entity could not be updated.
 
         """
+        condition = and_(
+            TokenWhitelistModel.refresh_token == token,
+            TokenWhitelistModel.updated_at > expiration,
+            TokenWhitelistModel.deleted_at.is_(None),
+        )
+        revocation = insert(TokenRevocationModel).from_select(
+            ["access_token", "revoked_at"],
+            select(
+                TokenWhitelistModel.access_token,
+                literal(entity.updated_at, DateTime),
+            )
+            .where(condition)
+            .with_for_update(),
+        )
         statement = (
             update(TokenWhitelistModel)
-            .where(TokenWhitelistModel.id_ == entity.id_)
+            .where(condition)
             .values(
                 access_token=entity.access_token,
                 refresh_token=entity.refresh_token,
@@ -184,50 +154,58 @@ class TokenWhitelistRepository(TokenWhitelistRepositoryABC):
         )
 
         try:
+            if revoke:
+                self._db.execute(revocation)
+
             result = self._db.execute(statement)
+
+            if result.rowcount != 1:
+                self._db.rollback()
+                return False
+
             self._db.commit()
         except IntegrityError as e:
             self._db.rollback()
             self._logger.error(e)
             raise TokenUpdateError("Failed to update token") from None
 
-        if result.rowcount == 0:
-            self._logger.error(
-                TokenUpdateError(
-                    f"Faild to update token. ID: {entity.id_}, User: {entity.user_id}"
-                )
-            )
-            raise TokenUpdateError("Failed to update token") from None
-
-        read_statement = select(TokenWhitelistModel).where(
-            TokenWhitelistModel.id_ == entity.id_
-        )
-        updated_token_whitelist = self._db.execute(read_statement).scalar_one()
+        return True
 
-        return self._convert_to_entity(updated_token_whitelist)
+    def purge(self, expiration: datetime.datetime, limit: int) -> int:
+        """Permanently delete a batch of expired or revoked tokens.
 
-    def delete(self, user_id: int, expiration: datetime.datetime) -> None:
-        """Delete expired tokens for a user.
+        The batch is selected by primary key first, since MySQL does not accept a limit
+        on a subquery of a `DELETE`, and then deleted and committed in its own short
+        transaction.
 
         Args:
-            user_id (int): The user ID for which to delete expired tokens.
-            expiration (datetime.datetime): The expiration date for the tokens to be deleted.
+            expiration (datetime.datetime): The tokens last updated at or before this
+                date are expired.
+            limit (int): The maximum number of tokens to delete.
+
+        Returns:
+            int: The number of deleted tokens.
 
         """
-        statement = (
-            update(TokenWhitelistModel)
+        ids_statement = (
+            select(TokenWhitelistModel.id_)
             .where(
-                and_(
-                    TokenWhitelistModel.user_id == user_id,
+                or_(
                     TokenWhitelistModel.updated_at <= expiration,
-                    TokenWhitelistModel.deleted_at.is_(None),
+                    TokenWhitelistModel.deleted_at.is_not(None),
                 )
             )
-            .values(deleted_at=datetime.datetime.now())
+            .order_by(TokenWhitelistModel.id_)
+            .limit(limit)
         )
+        ids = self._db.execute(ids_statement).scalars().all()
 
-        result = self._db.execute(statement)
-        self._db.commit()
-        self._logger.info(
-            f"Deleted {result.rowcount} expired tokens for user: {user_id}"
+        if not ids:
+            return 0
+
+        result = self._db.execute(
+            delete(TokenWhitelistModel).where(TokenWhitelistModel.id_.in_(ids))
         )
+        self._db.commit()
+
+        return result.rowcount
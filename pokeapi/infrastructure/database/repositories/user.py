@@ -1,13 +1,15 @@
+import datetime
 import logging
 
 from injector import inject, singleton
 from sqlalchemy import and_, insert, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, scoped_session
 
 from pokeapi.domain.entities.user import User as UserEntity
 from pokeapi.domain.repositories.user import UserRepositoryABC
 from pokeapi.exceptions.user import UserCreationError, UserUpdateError
+from pokeapi.infrastructure.database.models import TokenWhitelist as TokenWhitelistModel
 from pokeapi.infrastructure.database.models import User as UserModel
 
 
@@ -20,16 +22,18 @@ class UserRepository(UserRepositoryABC):
 
     Attributes:
         _logger (Logger): The logger instance used by the repository.
-        _db (Session): The database session to be used by the repository.
+        _db (scoped_session[Session]):
+            The session registry of the current unit of work used by the repository.
 
     """
 
     @inject
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: scoped_session[Session]) -> None:
         """Initializer for UserRepository.
 
         Args:
-            db (Session): The database session object used by the repository.
+            db (scoped_session[Session]):
+                The session registry of the current unit of work used by the repository.
 
         """
         self._logger = logging.getLogger(__name__)
@@ -74,6 +78,76 @@ class UserRepository(UserRepositoryABC):
 
         return self._convert_to_entity(result)
 
+    def get_by_access_token(
+        self, id_: int, token: str, expiration: datetime.datetime
+    ) -> UserEntity | None:
+        """Retrieve an entity by a whitelisted access token issued to it.
+
+        The whitelist lookup and the user are resolved by a single join.
+
+        Args:
+            id_ (int): The identifier of the entity the token was issued to.
+            token (str): The access token.
+            expiration (datetime.datetime): The expiration date of the access token.
+
+        Returns:
+            UserEntity | None: The entity, or None if the token is not whitelisted.
+
+        """
+        statement = (
+            select(UserModel)
+            .join(TokenWhitelistModel, TokenWhitelistModel.user_id == UserModel.id_)
+            .where(
+                and_(
+                    TokenWhitelistModel.access_token == token,
+                    TokenWhitelistModel.updated_at.between(
+                        expiration, datetime.datetime.now()
+                    ),
+                    TokenWhitelistModel.deleted_at.is_(None),
+                    UserModel.id_ == id_,
+                    UserModel.deleted_at.is_(None),
+                )
+            )
+        )
+        result = self._db.execute(statement).scalar()
+
+        if result is None:
+            return None
+
+        return self._convert_to_entity(result)
+
+    def get_by_refresh_token(
+        self, token: str, expiration: datetime.datetime
+    ) -> UserEntity | None:
+        """Retrieve an entity by a whitelisted refresh token issued to it.
+
+        Args:
+            token (str): The refresh token.
+            expiration (datetime.datetime): The expiration date of the refresh token.
+
+        Returns:
+            UserEntity | None: The entity, or None if the token is not whitelisted.
+
+        """
+        statement = (
+            select(UserModel)
+            .join(TokenWhitelistModel, TokenWhitelistModel.user_id == UserModel.id_)
+            .where(
+                and_(
+                    TokenWhitelistModel.refresh_token == token,
+                    TokenWhitelistModel.updated_at > expiration,
+                    TokenWhitelistModel.deleted_at.is_(None),
+                    UserModel.deleted_at.is_(None),
+                )
+            )
+        )
+        result = self._db.execute(statement).scalar()
+
+        if result is None:
+            return None
+
+        return self._convert_to_entity(result)
+
     def get_by_username(self, username: str) -> UserEntity | None:
         """Retrieve an entity by its username.
 
@@ -125,12 +199,7 @@ class UserRepository(UserRepositoryABC):
         if result.inserted_primary_key is None:
             raise UserCreationError("Failed to create user")
 
-        read_statement = select(UserModel).where(
-            UserModel.id_ == result.inserted_primary_key[0]
-        )
-        created_user = self._db.execute(read_statement).scalar_one()
-
-        return self._convert_to_entity(created_user)
+        return entity.model_copy(update={"id_": result.inserted_primary_key[0]})
 
     def update(self, entity: UserEntity) -> UserEntity:
         """Update an entity.
@@ -166,7 +235,4 @@ class UserRepository(UserRepositoryABC):
             )
             raise UserUpdateError("Failed to update user.")
 
-        read_statement = select(UserModel).where(UserModel.id_ == entity.id_)
-        updated_user = self._db.execute(read_statement).scalar_one()
-
-        return self._convert_to_entity(updated_user)
+        return entity
@@ -0,0 +1,192 @@
+import asyncio
+import contextlib
+import datetime
+import logging
+import threading
+import time
+
+from injector import inject, singleton
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.repositories.token_revocation import TokenRevocationRepositoryABC
+from pokeapi.domain.services.revocation_abc import TokenRevocationFilterABC
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+
+# NOTE: Each refresh reads again the revocations of the last seconds, so that none is
+# missed for having been committed late or stamped by a clock running behind.
+OVERLAP = datetime.timedelta(seconds=10)
+
+
+@singleton
+class TokenRevocationFilter(TokenRevocationFilterABC):
+    """The set of the revoked access tokens, refreshed from the database in the background.
+
+    Each worker reads the revocations recorded since its last refresh, on the blocking
+    executor, and forgets those older than the lifetime of access tokens, whose tokens
+    have expired anyway. The filter is trusted for two intervals after a refresh: a
+    revocation is thus seen within two intervals, and a worker whose refreshes fail
+    falls back to the whitelist instead of serving revoked tokens.
+
+    Attributes:
+        _config (AppConfig): The application configuration.
+        _repo (TokenRevocationRepositoryABC): The repository of the revocations.
+        _executor (BlockingExecutor): The executor running the refreshes.
+        _logger (logging.Logger): The logger instance.
+        _task (asyncio.Task | None): The running task, if started.
+        _lock (threading.Lock): The lock guarding the revocations and the counters.
+        _revoked (dict[str, datetime.datetime]): The revocation date of the revoked
+            access tokens, by JWT ID.
+        _watermark (datetime.datetime | None): The date of the newest revocation read.
+        _refreshed_at (float | None): The monotonic time the last refresh started at.
+        _refreshes (int): The number of finished refreshes.
+        _failures (int): The number of failed refreshes.
+
+    """
+
+    @inject
+    def __init__(
+        self,
+        config: AppConfig,
+        repo: TokenRevocationRepositoryABC,
+        executor: BlockingExecutor,
+    ) -> None:
+        """Initialize the TokenRevocationFilter with no revocation.
+
+        Args:
+            config (AppConfig): The application configuration.
+            repo (TokenRevocationRepositoryABC): The repository of the revocations.
+            executor (BlockingExecutor): The executor running the refreshes.
+
+        """
+        self._config = config
+        self._repo = repo
+        self._executor = executor
+        self._logger = logging.getLogger(__name__)
+        self._task: asyncio.Task | None = None
+        self._lock = threading.Lock()
+        self._revoked: dict[str, datetime.datetime] = {}
+        self._watermark: datetime.datetime | None = None
+        self._refreshed_at: float | None = None
+        self._refreshes = 0
+        self._failures = 0
+
+    def is_fresh(self) -> bool:
+        """Check whether the filter was refreshed within the last two intervals.
+
+        Returns:
+            bool: True if the filter was refreshed recently enough to be trusted.
+
+        """
+        with self._lock:
+            refreshed_at = self._refreshed_at
+
+        interval = self._config.token_revocation_interval
+
+        return (
+            refreshed_at is not None
+            and interval > 0
+            and time.monotonic() - refreshed_at <= interval * 2
+        )
+
+    def is_revoked(self, jti: str) -> bool:
+        """Check whether an access token was revoked.
+
+        Args:
+            jti (str): The JWT ID of the access token.
+
+        Returns:
+            bool: True if the access token was revoked.
+
+        """
+        with self._lock:
+            return jti in self._revoked
+
+    async def refresh(self) -> int:
+        """Read the revocations recorded since the last refresh.
+
+        Returns:
+            int: The number of revocations read.
+
+        """
+        start = time.monotonic()
+        now = datetime.datetime.now()
+        horizon = now - datetime.timedelta(hours=self._config.access_token_lifetime)
+        since = max(self._watermark or horizon, horizon) - OVERLAP
+        revocations = await self._executor.run(self._repo.get_since, since)
+
+        with self._lock:
+            for revocation in revocations:
+                self._revoked[revocation.access_token] = revocation.revoked_at
+
+            if revocations:
+                self._watermark = max(
+                    self._watermark or revocations[-1].revoked_at,
+                    revocations[-1].revoked_at,
+                )
+
+            self._revoked = {
+                jti: revoked_at
+                for jti, revoked_at in self._revoked.items()
+                if revoked_at > horizon - OVERLAP
+            }
+            self._refreshed_at = start
+            self._refreshes += 1
+
+        return len(revocations)
+
+    async def _run(self) -> None:
+        """Refresh at every interval until cancelled. A failed refresh is retried later."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                with self._lock:
+                    self._failures += 1
+
+                self._logger.exception("Failed to refresh the revoked access tokens")
+
+            await asyncio.sleep(self._config.token_revocation_interval)
+
+    def start(self) -> None:
+        """Start refreshing on the running event loop, unless disabled or started."""
+        if (
+            not self._config.access_token_stateless
+            or self._config.token_revocation_interval <= 0
+            or self._task is not None
+        ):
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop refreshing. A refresh already running finishes on the blocking executor."""
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the metrics.
+
+        Returns:
+            dict: The current metrics of the filter.
+
+        """
+        fresh = self.is_fresh()
+
+        with self._lock:
+            return {
+                "size": len(self._revoked),
+                "fresh": fresh,
+                "age": (
+                    None
+                    if self._refreshed_at is None
+                    else time.monotonic() - self._refreshed_at
+                ),
+                "refreshes": self._refreshes,
+                "failures": self._failures,
+            }
@@ -0,0 +1,218 @@
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, Select, and_, select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from pokeapi.infrastructure.database.loading import LoadingStrategy
+from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
+from pokeapi.infrastructure.database.models.pokemon_abilities import PokemonAbilities
+from pokeapi.infrastructure.database.models.pokemon_mst import Pokemon
+from pokeapi.infrastructure.database.models.pokemon_types import PokemonTypes
+from pokeapi.infrastructure.database.models.type_mst import TypeMst
+
+
+def pokemon_loader_options(loading: LoadingStrategy) -> tuple[LoaderOption, ...]:
+    """Build the options that eagerly load the types and abilities of Pokémon.
+
+    Args:
+        loading (LoadingStrategy): The strategy for loading the relationships.
+
+    Returns:
+        tuple[LoaderOption, ...]: The loader options of the statement.
+
+    """
+    if loading is LoadingStrategy.JOINED:
+        return (
+            joinedload(Pokemon.pokemon_types).joinedload(PokemonTypes.type_),
+            joinedload(Pokemon.pokemon_abilities).joinedload(PokemonAbilities.ability),
+        )
+
+    return (
+        selectinload(Pokemon.pokemon_types).joinedload(PokemonTypes.type_),
+        selectinload(Pokemon.pokemon_abilities).joinedload(PokemonAbilities.ability),
+    )
+
+
+def select_pokemon_by_id(id_: int) -> Select[tuple[Pokemon]]:
+    """Build the statement selecting a Pokémon by its identifier.
+
+    Args:
+        id_ (int): The identifier of the Pokémon.
+
+    Returns:
+        Select[tuple[Pokemon]]: The statement.
+
+    """
+    return select(Pokemon).where(and_(Pokemon.id_ == id_, Pokemon.deleted_at.is_(None)))
+
+
+def select_pokemon_by_pokedex_number(pokedex_number: int) -> Select[tuple[Pokemon]]:
+    """Build the statement selecting a Pokémon by its pokedex number.
+
+    Args:
+        pokedex_number (int): The pokedex number of the Pokémon.
+
+    Returns:
+        Select[tuple[Pokemon]]: The statement.
+
+    """
+    return select(Pokemon).where(
+        and_(
+            Pokemon.national_pokedex_number == pokedex_number,
+            Pokemon.deleted_at.is_(None),
+        )
+    )
+
+
+def select_pokemon_by_name(name: str) -> Select[tuple[Pokemon]]:
+    """Build the statement selecting a Pokémon by its name.
+
+    Args:
+        name (str): The name of the Pokémon.
+
+    Returns:
+        Select[tuple[Pokemon]]: The statement.
+
+    """
+    return select(Pokemon).where(
+        and_(Pokemon.name == name, Pokemon.deleted_at.is_(None))
+    )
+
+
+def select_all_pokemon() -> Select[tuple[Pokemon]]:
+    """Build the statement selecting all Pokémon.
+
+    Returns:
+        Select[tuple[Pokemon]]: The statement.
+
+    """
+    return select(Pokemon).where(Pokemon.deleted_at.is_(None))
+
+
+def select_pokemon_page(
+    limit: int,
+    after: int | None = None,
+    before: int | None = None,
+    backward: bool = False,
+) -> Select[tuple[Pokemon]]:
+    """Build the statement selecting a page of Pokémon by keyset on their identifiers.
+
+    The rows of a backward page come in descending order of identifier, and must be
+    reversed by the caller.
+
+    Args:
+        limit (int): The maximum number of Pokémon to select.
+        after (int | None): Only select Pokémon with a greater identifier.
+        before (int | None): Only select Pokémon with a smaller identifier.
+        backward (bool): Whether to take the Pokémon closest to `before` rather than
+            the ones closest to `after`.
+
+    Returns:
+        Select[tuple[Pokemon]]: The statement.
+
+    """
+    conditions: list[ColumnElement[bool]] = [Pokemon.deleted_at.is_(None)]
+
+    if after is not None:
+        conditions.append(Pokemon.id_ > after)
+
+    if before is not None:
+        conditions.append(Pokemon.id_ < before)
+
+    order = Pokemon.id_.desc() if backward else Pokemon.id_.asc()
+
+    return select(Pokemon).where(and_(*conditions)).order_by(order).limit(limit)
+
+
+def select_pokemon_by_ids(ids: Sequence[int]) -> Select[tuple[Pokemon]]:
+    """Build the statement selecting Pokémon by their identifiers.
+
+    Args:
+        ids (Sequence[int]): The identifiers of the Pokémon.
+
+    Returns:
+        Select[tuple[Pokemon]]: The statement.
+
+    """
+    return select(Pokemon).where(
+        and_(Pokemon.id_.in_(ids), Pokemon.deleted_at.is_(None))
+    )
+
+
+def select_type_by_id(id_: int) -> Select[tuple[TypeMst]]:
+    """Build the statement selecting a type by its identifier.
+
+    Args:
+        id_ (int): The identifier of the type.
+
+    Returns:
+        Select[tuple[TypeMst]]: The statement.
+
+    """
+    return select(TypeMst).where(and_(TypeMst.id_ == id_, TypeMst.deleted_at.is_(None)))
+
+
+def select_all_types() -> Select[tuple[TypeMst]]:
+    """Build the statement selecting all types.
+
+    Returns:
+        Select[tuple[TypeMst]]: The statement.
+
+    """
+    return select(TypeMst).where(TypeMst.deleted_at.is_(None))
+
+
+def select_types_by_ids(ids: Sequence[int]) -> Select[tuple[TypeMst]]:
+    """Build the statement selecting types by their identifiers.
+
+    Args:
+        ids (Sequence[int]): The identifiers of the types.
+
+    Returns:
+        Select[tuple[TypeMst]]: The statement.
+
+    """
+    return select(TypeMst).where(
+        and_(TypeMst.id_.in_(ids), TypeMst.deleted_at.is_(None))
+    )
+
+
+def select_ability_by_id(id_: int) -> Select[tuple[AbilityMst]]:
+    """Build the statement selecting an ability by its identifier.
+
+    Args:
+        id_ (int): The identifier of the ability.
+
+    Returns:
+        Select[tuple[AbilityMst]]: The statement.
+
+    """
+    return select(AbilityMst).where(
+        and_(AbilityMst.id_ == id_, AbilityMst.deleted_at.is_(None))
+    )
+
+
+def select_all_abilities() -> Select[tuple[AbilityMst]]:
+    """Build the statement selecting all abilities.
+
+    Returns:
+        Select[tuple[AbilityMst]]: The statement.
+
+    """
+    return select(AbilityMst).where(AbilityMst.deleted_at.is_(None))
+
+
+def select_abilities_by_ids(ids: Sequence[int]) -> Select[tuple[AbilityMst]]:
+    """Build the statement selecting abilities by their identifiers.
+
+    Args:
+        ids (Sequence[int]): The identifiers of the abilities.
+
+    Returns:
+        Select[tuple[AbilityMst]]: The statement.
+
+    """
+    return select(AbilityMst).where(
+        and_(AbilityMst.id_.in_(ids), AbilityMst.deleted_at.is_(None))
+    )
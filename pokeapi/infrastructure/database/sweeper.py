@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import datetime
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from injector import inject, singleton
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.repositories.token_revocation import TokenRevocationRepositoryABC
+from pokeapi.domain.repositories.token_whitelist import TokenWhitelistRepositoryABC
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+
+
+@singleton
+class TokenWhitelistSweeper:
+    """A periodic task deleting the expired and revoked tokens of the whitelist.
+
+    Requests only read the whitelist: the tokens outside of their lifetime are ignored
+    by the lookups and deleted here, in the background, batch after batch. Each batch
+    runs on the blocking executor in its own transaction. The revocations of access
+    tokens that have expired since are deleted the same way.
+
+    Attributes:
+        _config (AppConfig): The application configuration.
+        _repo (TokenWhitelistRepositoryABC): The repository of the token whitelist.
+        _revocation_repo (TokenRevocationRepositoryABC): The repository of the
+            revocations of access tokens.
+        _executor (BlockingExecutor): The executor running the batches.
+        _logger (logging.Logger): The logger instance.
+        _task (asyncio.Task | None): The running task, if started.
+        _lock (threading.Lock): The lock guarding the counters.
+        _cycles (int): The number of finished sweeps.
+        _failures (int): The number of failed sweeps.
+        _purged_total (int): The number of deleted rows.
+        _purged_last (int): The number of rows deleted by the last sweep.
+        _duration_last (float): The duration of the last sweep in seconds.
+        _duration_max (float): The longest duration of a sweep in seconds.
+
+    """
+
+    @inject
+    def __init__(
+        self,
+        config: AppConfig,
+        repo: TokenWhitelistRepositoryABC,
+        revocation_repo: TokenRevocationRepositoryABC,
+        executor: BlockingExecutor,
+    ) -> None:
+        """Initialize the TokenWhitelistSweeper with empty counters.
+
+        Args:
+            config (AppConfig): The application configuration.
+            repo (TokenWhitelistRepositoryABC): The repository of the token whitelist.
+            revocation_repo (TokenRevocationRepositoryABC): The repository of the
+                revocations of access tokens.
+            executor (BlockingExecutor): The executor running the batches.
+
+        """
+        self._config = config
+        self._repo = repo
+        self._revocation_repo = revocation_repo
+        self._executor = executor
+        self._logger = logging.getLogger(__name__)
+        self._task: asyncio.Task | None = None
+        self._lock = threading.Lock()
+        self._cycles = 0
+        self._failures = 0
+        self._purged_total = 0
+        self._purged_last = 0
+        self._duration_last = 0.0
+        self._duration_max = 0.0
+
+    async def _purge(
+        self,
+        purge: Callable[[datetime.datetime, int], int],
+        expiration: datetime.datetime,
+    ) -> int:
+        """Delete the rows expired at a date, batch after batch.
+
+        Args:
+            purge (Callable[[datetime.datetime, int], int]): The repository method
+                deleting a batch.
+            expiration (datetime.datetime): The date the rows expired at.
+
+        Returns:
+            int: The number of deleted rows.
+
+        """
+        batch_size = self._config.token_sweep_batch_size
+        purged = 0
+
+        while True:
+            count = await self._executor.run(purge, expiration, batch_size)
+            purged += count
+
+            if count < batch_size:
+                return purged
+
+    async def sweep(self) -> int:
+        """Delete the expired and revoked tokens, and the expired revocations.
+
+        Returns:
+            int: The number of deleted rows.
+
+        """
+        start = time.perf_counter()
+        now = datetime.datetime.now()
+        purged = await self._purge(
+            self._repo.purge,
+            now - datetime.timedelta(hours=self._config.refresh_token_lifetime),
+        )
+        purged += await self._purge(
+            self._revocation_repo.purge,
+            now - datetime.timedelta(hours=self._config.access_token_lifetime),
+        )
+        duration = time.perf_counter() - start
+
+        with self._lock:
+            self._cycles += 1
+            self._purged_total += purged
+            self._purged_last = purged
+            self._duration_last = duration
+            self._duration_max = max(self._duration_max, duration)
+
+        self._logger.info(f"Purged {purged} tokens in {duration:.3f}s")
+
+        return purged
+
+    async def _run(self) -> None:
+        """Sweep at every interval until cancelled. A failed sweep is retried later."""
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                with self._lock:
+                    self._failures += 1
+
+                self._logger.exception("Failed to purge the token whitelist")
+
+            await asyncio.sleep(self._config.token_sweep_interval)
+
+    def start(self) -> None:
+        """Start sweeping on the running event loop, unless disabled or started."""
+        if self._config.token_sweep_interval <= 0 or self._task is not None:
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sweeping. A batch already running finishes on the blocking executor."""
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the metrics.
+
+        Returns:
+            dict: The current metrics of the sweeper.
+
+        """
+        with self._lock:
+            return {
+                "cycles": self._cycles,
+                "failures": self._failures,
+                "purged_total": self._purged_total,
+                "purged_last": self._purged_last,
+                "duration_last": self._duration_last,
+                "duration_max": self._duration_max,
+            }
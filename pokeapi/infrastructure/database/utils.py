@@ -1,11 +1,12 @@
 import re
 
 
-def adjust_connection_url(connection_url: str) -> str:
+def adjust_connection_url(connection_url: str, driver: str = "pymysql") -> str:
     """Adjust connection url to be compatible.
 
     Args:
         connection_url (str): connection url
+        driver (str): The DBAPI driver of MySQL, e.g. `pymysql` or `aiomysql`.
 
     Returns:
         str: adjusted connection url
@@ -13,7 +14,7 @@ def adjust_connection_url(connection_url: str) -> str:
     """
     prog = re.compile("(.*)(://.*)")
     result = prog.match(connection_url)
-    protocol = "mysql+pymysql"
+    protocol = f"mysql+{driver}"
 
     if result:
         return f"{protocol}{result.group(2)}"
@@ -0,0 +1,190 @@
+import datetime
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from injector import inject, singleton
+from sqlalchemy.orm import Session, scoped_session
+
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.infrastructure.database.db import unit_of_work
+from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
+from pokeapi.infrastructure.database.repositories.pokemon_ability import (
+    AbilityRepository,
+)
+from pokeapi.infrastructure.database.repositories.pokemon_type import TypeRepository
+
+
+@dataclass(frozen=True)
+class PokedexSnapshot:
+    """An immutable, indexed copy of the master data.
+
+    The entities are immutable and every index is a read-only mapping, so a snapshot can
+    be shared between threads without locking.
+
+    Attributes:
+        pokemons (tuple[Pokemon, ...]): All Pokémon in ascending order of identifier.
+        pokemon_ids (tuple[int, ...]): The identifiers of `pokemons`, for bisection.
+        pokemon_by_id (Mapping[int, Pokemon]): The Pokémon by identifier.
+        pokemon_by_pokedex_number (Mapping[int, Pokemon]):
+            The Pokémon by national Pokédex number.
+        pokemon_by_name (Mapping[str, Pokemon]): The Pokémon by name.
+        types (tuple[PokemonType, ...]): All Types in ascending order of identifier.
+        type_by_id (Mapping[int, PokemonType]): The Types by identifier.
+        abilities (tuple[PokemonAbility, ...]):
+            All Abilities in ascending order of identifier.
+        ability_by_id (Mapping[int, PokemonAbility]): The Abilities by identifier.
+        loaded_at (datetime.datetime): When the snapshot was loaded.
+
+    """
+
+    pokemons: tuple[Pokemon, ...]
+    pokemon_ids: tuple[int, ...]
+    pokemon_by_id: Mapping[int, Pokemon]
+    pokemon_by_pokedex_number: Mapping[int, Pokemon]
+    pokemon_by_name: Mapping[str, Pokemon]
+    types: tuple[PokemonType, ...]
+    type_by_id: Mapping[int, PokemonType]
+    abilities: tuple[PokemonAbility, ...]
+    ability_by_id: Mapping[int, PokemonAbility]
+    loaded_at: datetime.datetime
+
+    @classmethod
+    def build(
+        cls,
+        pokemons: Iterable[Pokemon],
+        types: Iterable[PokemonType],
+        abilities: Iterable[PokemonAbility],
+    ) -> "PokedexSnapshot":
+        """Build a snapshot and its indexes from entities.
+
+        When several Pokémon share a Pokédex number or a name, the one with the lowest
+        identifier is indexed.
+
+        Args:
+            pokemons (Iterable[Pokemon]): All Pokémon.
+            types (Iterable[PokemonType]): All Types.
+            abilities (Iterable[PokemonAbility]): All Abilities.
+
+        Returns:
+            PokedexSnapshot: The snapshot.
+
+        """
+        sorted_pokemons = tuple(sorted(pokemons, key=lambda pokemon: pokemon.id_))
+        sorted_types = tuple(sorted(types, key=lambda type_: type_.id_))
+        sorted_abilities = tuple(sorted(abilities, key=lambda ability: ability.id_))
+        by_pokedex_number: dict[int, Pokemon] = {}
+        by_name: dict[str, Pokemon] = {}
+
+        for pokemon in sorted_pokemons:
+            by_pokedex_number.setdefault(pokemon.national_pokedex_number, pokemon)
+            by_name.setdefault(pokemon.name, pokemon)
+
+        return cls(
+            pokemons=sorted_pokemons,
+            pokemon_ids=tuple(pokemon.id_ for pokemon in sorted_pokemons),
+            pokemon_by_id=MappingProxyType(
+                {pokemon.id_: pokemon for pokemon in sorted_pokemons}
+            ),
+            pokemon_by_pokedex_number=MappingProxyType(by_pokedex_number),
+            pokemon_by_name=MappingProxyType(by_name),
+            types=sorted_types,
+            type_by_id=MappingProxyType({type_.id_: type_ for type_ in sorted_types}),
+            abilities=sorted_abilities,
+            ability_by_id=MappingProxyType(
+                {ability.id_: ability for ability in sorted_abilities}
+            ),
+            loaded_at=datetime.datetime.now(),
+        )
+
+
+@singleton
+class PokedexSnapshotStore:
+    """The holder of the current snapshot of the master data.
+
+    Readers take the current snapshot without locking. A refresh builds a new snapshot
+    aside and then replaces the reference to the current one in a single assignment, so
+    readers see either the old or the new snapshot, never a mix of both.
+
+    Attributes:
+        _pokemon_repo (PokemonRepository): The database repository of Pokémon.
+        _type_repo (TypeRepository): The database repository of Types.
+        _ability_repo (AbilityRepository): The database repository of Abilities.
+        _session_local (scoped_session[Session]): The registry of sessions.
+        _lock (threading.Lock): The lock serializing refreshes.
+        _snapshot (PokedexSnapshot | None): The current snapshot.
+
+    """
+
+    @inject
+    def __init__(
+        self,
+        pokemon_repo: PokemonRepository,
+        type_repo: TypeRepository,
+        ability_repo: AbilityRepository,
+        session_local: scoped_session[Session],
+    ) -> None:
+        """Initialize the PokedexSnapshotStore with the database repositories.
+
+        Args:
+            pokemon_repo (PokemonRepository): The database repository of Pokémon.
+            type_repo (TypeRepository): The database repository of Types.
+            ability_repo (AbilityRepository): The database repository of Abilities.
+            session_local (scoped_session[Session]): The registry of sessions.
+
+        """
+        self._pokemon_repo = pokemon_repo
+        self._type_repo = type_repo
+        self._ability_repo = ability_repo
+        self._session_local = session_local
+        self._lock = threading.Lock()
+        self._snapshot: PokedexSnapshot | None = None
+
+    @property
+    def snapshot(self) -> PokedexSnapshot:
+        """The current snapshot, loaded on first access if needed.
+
+        Returns:
+            PokedexSnapshot: The current snapshot.
+
+        """
+        snapshot = self._snapshot
+
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._load()
+
+            return self._snapshot
+
+    def refresh(self) -> PokedexSnapshot:
+        """Reload the master data and swap in the new snapshot.
+
+        Returns:
+            PokedexSnapshot: The new snapshot.
+
+        """
+        with self._lock:
+            snapshot = self._load()
+            self._snapshot = snapshot
+
+            return snapshot
+
+    def _load(self) -> PokedexSnapshot:
+        """Load the master data from the database.
+
+        Returns:
+            PokedexSnapshot: The loaded snapshot.
+
+        """
+        with unit_of_work(self._session_local):
+            return PokedexSnapshot.build(
+                pokemons=self._pokemon_repo.get_all(),
+                types=self._type_repo.get_all(),
+                abilities=self._ability_repo.get_all(),
+            )
@@ -0,0 +1,170 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+from injector import inject, singleton
+
+from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
+from pokeapi.domain.repositories.pokemon import PokemonRepositoryABC
+from pokeapi.infrastructure.database.loading import LoadingStrategy
+from pokeapi.infrastructure.database.models.pokemon_mst import Pokemon as PokemonModel
+from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+
+
+@singleton
+class SnapshotPokemonRepository(PokemonRepositoryABC):
+    """A repository class serving Pokémon from the snapshot of the master data.
+
+    Reads never reach the database. Since the types and abilities of every Pokémon are
+    already in memory, the loading strategies have no effect.
+
+    Attributes:
+        _store (PokedexSnapshotStore): The holder of the current snapshot.
+        _source (PokemonRepository): The database repository the snapshot is loaded with.
+
+    """
+
+    @inject
+    def __init__(self, store: PokedexSnapshotStore, source: PokemonRepository) -> None:
+        """Initializer for SnapshotPokemonRepository.
+
+        Args:
+            store (PokedexSnapshotStore): The holder of the current snapshot.
+            source (PokemonRepository):
+                The database repository the snapshot is loaded with.
+
+        """
+        self._store = store
+        self._source = source
+
+    def _convert_to_entity(self, model: PokemonModel) -> PokemonEntity:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the database repository.
+
+        Args:
+            model (PokemonModel): The SQLAlchemy model instance of Pokémon to be converted.
+
+        Returns:
+            PokemonEntity: The converted instance of the domain entity of Pokémon.
+
+        """
+        return self._source._convert_to_entity(model)
+
+    def get_by_id(
+        self, id_: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its identifier.
+
+        Args:
+            id_ (int): The identifier of the Pokémon to be retrieved.
+            loading (LoadingStrategy): Ignored, see the class docstring.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified identifier, or None if no such Pokémon exists.
+
+        """
+        return self._store.snapshot.pokemon_by_id.get(id_)
+
+    def get_by_pokedex_number(
+        self, pokedex_number: int, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its pokedex number.
+
+        Args:
+            pokedex_number (int): The pokedex number of the Pokémon to be retrieved.
+            loading (LoadingStrategy): Ignored, see the class docstring.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified pokedex number, or None if no such Pokémon exists.
+
+        """
+        return self._store.snapshot.pokemon_by_pokedex_number.get(pokedex_number)
+
+    def get_by_name(
+        self, name: str, loading: LoadingStrategy = LoadingStrategy.JOINED
+    ) -> PokemonEntity | None:
+        """Retrieve a Pokémon by its name.
+
+        Args:
+            name (str): The name of the Pokémon to be retrieved.
+            loading (LoadingStrategy): Ignored, see the class docstring.
+
+        Returns:
+            PokemonEntity | None:
+                The Pokémon with the specified name, or None if no such Pokémon exists.
+
+        """
+        return self._store.snapshot.pokemon_by_name.get(name)
+
+    def get_all(
+        self, loading: LoadingStrategy = LoadingStrategy.SELECTIN
+    ) -> list[PokemonEntity]:
+        """Retrieve all Pokémon.
+
+        Args:
+            loading (LoadingStrategy): Ignored, see the class docstring.
+
+        Returns:
+            list[PokemonEntity]: A list of all Pokémon.
+
+        """
+        return list(self._store.snapshot.pokemons)
+
+    def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve a page of Pokémon ordered by their identifiers.
+
+        The bounds of the page are found by bisecting the sorted identifiers.
+
+        Args:
+            limit (int): The maximum number of Pokémon to retrieve.
+            after (int | None): Only retrieve Pokémon with a greater identifier.
+            before (int | None): Only retrieve Pokémon with a smaller identifier.
+            backward (bool): Whether to take the Pokémon closest to `before` rather than
+                the ones closest to `after`.
+            loading (LoadingStrategy): Ignored, see the class docstring.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon of the page in ascending order of identifier.
+
+        """
+        snapshot = self._store.snapshot
+        ids = snapshot.pokemon_ids
+        start = 0 if after is None else bisect_right(ids, after)
+        end = len(ids) if before is None else bisect_left(ids, before)
+
+        if backward:
+            start = max(start, end - limit)
+        else:
+            end = min(end, start + limit)
+
+        return list(snapshot.pokemons[start:end])
+
+    def get_by_ids(
+        self,
+        ids: Sequence[int],
+        loading: LoadingStrategy = LoadingStrategy.SELECTIN,
+    ) -> list[PokemonEntity]:
+        """Retrieve Pokémon by their identifiers.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the Pokémon to retrieve.
+            loading (LoadingStrategy): Ignored, see the class docstring.
+
+        Returns:
+            list[PokemonEntity]: The Pokémon with the specified identifiers, in no
+                particular order.
+
+        """
+        by_id = self._store.snapshot.pokemon_by_id
+
+        return [by_id[id_] for id_ in dict.fromkeys(ids) if id_ in by_id]
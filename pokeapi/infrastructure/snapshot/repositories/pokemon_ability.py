@@ -0,0 +1,86 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.repositories.pokemon_ability import AbilityRepositoryABC
+from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
+from pokeapi.infrastructure.database.repositories.pokemon_ability import (
+    AbilityRepository,
+)
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+
+
+@singleton
+class SnapshotAbilityRepository(AbilityRepositoryABC):
+    """Repository for PokemonAbility serving the snapshot of the master data
+
+    Reads never reach the database.
+
+    Attributes:
+        _store (PokedexSnapshotStore): The holder of the current snapshot
+        _source (AbilityRepository): The database repository the snapshot is loaded with
+
+    """
+
+    @inject
+    def __init__(self, store: PokedexSnapshotStore, source: AbilityRepository) -> None:
+        """Initializer for SnapshotAbilityRepository
+
+        Args:
+            store (PokedexSnapshotStore): The holder of the current snapshot
+            source (AbilityRepository): The database repository the snapshot is loaded with
+
+        """
+        self._store = store
+        self._source = source
+
+    def _convert_to_entity(self, model: AbilityMst) -> PokemonAbility:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the database repository.
+
+        Args:
+            model (AbilityMst): The SQLAlchemy model instance of Ability to be converted.
+
+        Returns:
+            PokemonAbility: The converted instance of the domain entity of Ability.
+
+        """
+        return self._source._convert_to_entity(model)
+
+    def get_by_id(self, id_: int) -> PokemonAbility | None:
+        """Retrieve an ability by its identifier.
+
+        Args:
+            id_ (int): The identifier of the ability to retrieve.
+
+        Returns:
+            PokemonAbility | None: The ability with the specified identifier, or None if not found.
+
+        """
+        return self._store.snapshot.ability_by_id.get(id_)
+
+    def get_all(self) -> list[PokemonAbility]:
+        """Retrieve all abilities.
+
+        Returns:
+            list[PokemonAbility]: A list of all abilities.
+
+        """
+        return list(self._store.snapshot.abilities)
+
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonAbility]:
+        """Retrieve abilities by their identifiers.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the abilities to retrieve.
+
+        Returns:
+            list[PokemonAbility]: The abilities with the specified identifiers, in no particular
+                order.
+
+        """
+        by_id = self._store.snapshot.ability_by_id
+
+        return [by_id[id_] for id_ in dict.fromkeys(ids) if id_ in by_id]
@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+
+from injector import inject, singleton
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.domain.repositories.pokemon_type import TypeRepositoryABC
+from pokeapi.infrastructure.database.models.type_mst import TypeMst
+from pokeapi.infrastructure.database.repositories.pokemon_type import TypeRepository
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+
+
+@singleton
+class SnapshotTypeRepository(TypeRepositoryABC):
+    """Repository for PokemonType serving the snapshot of the master data
+
+    Reads never reach the database.
+
+    Attributes:
+        _store (PokedexSnapshotStore): The holder of the current snapshot
+        _source (TypeRepository): The database repository the snapshot is loaded with
+
+    """
+
+    @inject
+    def __init__(self, store: PokedexSnapshotStore, source: TypeRepository) -> None:
+        """Initializer for SnapshotTypeRepository
+
+        Args:
+            store (PokedexSnapshotStore): The holder of the current snapshot
+            source (TypeRepository): The database repository the snapshot is loaded with
+
+        """
+        self._store = store
+        self._source = source
+
+    def _convert_to_entity(self, model: TypeMst) -> PokemonType:
+        """Converts a SQLAlchemy model to a domain entity.
+
+        The conversion is delegated to the database repository.
+
+        Args:
+            model (TypeMst): The SQLAlchemy model instance of Type to be converted.
+
+        Returns:
+            PokemonType: The converted instance of the domain entity of Type.
+
+        """
+        return self._source._convert_to_entity(model)
+
+    def get_by_id(self, id_: int) -> PokemonType | None:
+        """Retrieve a type by its identifier.
+
+        Args:
+            id_ (int): The identifier of the type to retrieve.
+
+        Returns:
+            PokemonType | None: The type with the specified identifier, or None if not found.
+
+        """
+        return self._store.snapshot.type_by_id.get(id_)
+
+    def get_all(self) -> list[PokemonType]:
+        """Retrieve all types.
+
+        Returns:
+            list[PokemonType]: A list of all types.
+
+        """
+        return list(self._store.snapshot.types)
+
+    def get_by_ids(self, ids: Sequence[int]) -> list[PokemonType]:
+        """Retrieve types by their identifiers.
+
+        Args:
+            ids (Sequence[int]): The identifiers of the types to retrieve.
+
+        Returns:
+            list[PokemonType]: The types with the specified identifiers, in no particular
+                order.
+
+        """
+        by_id = self._store.snapshot.type_by_id
+
+        return [by_id[id_] for id_ in dict.fromkeys(ids) if id_ in by_id]
@@ -1,23 +1,126 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import strawberry
-from fastapi import FastAPI
-from strawberry.fastapi import GraphQLRouter
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from pokeapi.dependencies.context import get_context
+from pokeapi.dependencies.context import (
+    get_context,
+    get_root_container,
+    get_unit_of_work,
+)
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.services.jwt import JWTService
+from pokeapi.domain.services.password_pool import ProcessPoolPasswordService
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.infrastructure.cache.caches import ServiceCaches
+from pokeapi.infrastructure.database.pool import AsyncPoolMetrics, PoolMetrics
+from pokeapi.infrastructure.database.revocation import TokenRevocationFilter
+from pokeapi.infrastructure.database.sweeper import TokenWhitelistSweeper
 from pokeapi.infrastructure.logger import configure_logging
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+from pokeapi.presentation.document_cache import DocumentCache
+from pokeapi.presentation.extensions.document_cache import DocumentCacheExtension
+from pokeapi.presentation.extensions.persisted_queries import PersistedQueryExtension
+from pokeapi.presentation.persisted_queries import PersistedQueryRegistry
+from pokeapi.presentation.response_cache import ResponseCache
+from pokeapi.presentation.router import CachedGraphQLRouter
 from pokeapi.presentation.schemas.mutation import Mutation
 from pokeapi.presentation.schemas.query import Query
 
 configure_logging()
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
-graphql_app: GraphQLRouter = GraphQLRouter(
-    schema, context_getter=get_context, path="/graphql"
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[PersistedQueryExtension, DocumentCacheExtension],
 )
+graphql_app = CachedGraphQLRouter(schema, context_getter=get_context, path="/graphql")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the root container before the application starts serving requests.
+
+    When enabled, the snapshot of the master data is loaded here as well, so that no
+    request pays for it. The sweeper of the token whitelist runs in the background until
+    shutdown, and so does the refresh of the revoked access tokens when
+    `ACCESS_TOKEN_STATELESS` is enabled. On shutdown, the threads of the blocking
+    executor and the processes hashing passwords are stopped, the connections to the
+    shared cache are released, and the connections of the async engine are closed while
+    the event loop is still running.
+
+    Args:
+        app (FastAPI): The application.
+
+    """
+    container = get_root_container()
+    config = container.get(AppConfig)
+
+    if config.pokedex_snapshot:
+        container.get(PokedexSnapshotStore).refresh()
+
+    sweeper = container.get(TokenWhitelistSweeper)
+    sweeper.start()
+    revocation_filter = container.get(TokenRevocationFilter)
+    revocation_filter.start()
+
+    yield
+
+    await revocation_filter.stop()
+    await sweeper.stop()
+    container.get(BlockingExecutor).dispose()
+
+    if config.password_pool_size > 0:
+        container.get(ProcessPoolPasswordService).dispose()
 
-app = FastAPI()
-app.include_router(graphql_app)
+    if config.cache_pokemon or config.cache_type or config.cache_ability:
+        await container.get(ServiceCaches).close()
+
+    if config.db_async:
+        await container.get(AsyncEngine).dispose()
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(graphql_app, dependencies=[Depends(get_unit_of_work)])
 
 
 @app.get("/health")
 def health_check() -> dict:
     return {"status": "OK"}
+
+
+@app.get("/metrics")
+def metrics() -> dict:
+    container = get_root_container()
+    config = container.get(AppConfig)
+    result = {
+        "database_pool": container.get(PoolMetrics).snapshot(),
+        "blocking_executor": container.get(BlockingExecutor).snapshot(),
+        "token_whitelist_sweeper": container.get(TokenWhitelistSweeper).snapshot(),
+        "jwt_cache": container.get(JWTService).snapshot(),
+        "document_cache": container.get(DocumentCache).snapshot(),
+    }
+
+    if config.db_async:
+        result["async_database_pool"] = container.get(AsyncPoolMetrics).snapshot()
+
+    if config.access_token_stateless:
+        result["token_revocation_filter"] = container.get(
+            TokenRevocationFilter
+        ).snapshot()
+
+    if config.cache_pokemon or config.cache_type or config.cache_ability:
+        result["service_cache"] = container.get(ServiceCaches).snapshot()
+
+    if config.response_cache:
+        result["response_cache"] = container.get(ResponseCache).snapshot()
+
+    if config.persisted_queries:
+        result["persisted_queries"] = container.get(PersistedQueryRegistry).snapshot()
+
+    if config.password_pool_size > 0:
+        result["password_pool"] = container.get(ProcessPoolPasswordService).snapshot()
+
+    return result
@@ -0,0 +1,90 @@
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+from injector import Injector
+from strawberry.dataloader import DataLoader
+
+from pokeapi.application.services.pokemon_ability_async_abc import (
+    AsyncAbilityServiceABC,
+)
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
+from pokeapi.application.services.pokemon_type_async_abc import AsyncTypeServiceABC
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.domain.entities.pokemon_ability import PokemonAbility
+from pokeapi.domain.entities.pokemon_type import PokemonType
+
+
+class _Identifiable(Protocol):
+    @property
+    def id_(self) -> int:
+        ...  # pragma: no cover
+
+
+EntityT = TypeVar("EntityT", bound=_Identifiable)
+
+
+def batch_load(
+    get_by_ids: Callable[[Sequence[int]], Awaitable[Sequence[EntityT]]],
+) -> Callable[[list[int]], Coroutine[Any, Any, list[EntityT | None]]]:
+    """Adapt a batch lookup of entities to the load function of a DataLoader.
+
+    Args:
+        get_by_ids (Callable[[Sequence[int]], Awaitable[Sequence[EntityT]]]):
+            The lookup retrieving the entities with the given identifiers.
+
+    Returns:
+        Callable[[list[int]], Coroutine[Any, Any, list[EntityT | None]]]:
+            The load function, which returns the entities in the order of the
+            identifiers and None for the identifiers without an entity.
+
+    """
+
+    async def load(ids: list[int]) -> list[EntityT | None]:
+        entities = {entity.id_: entity for entity in await get_by_ids(ids)}
+
+        return [entities.get(id_) for id_ in ids]
+
+    return load
+
+
+@dataclass(frozen=True)
+class DataLoaders:
+    """DataLoaders shared by the resolvers of one request.
+
+    Each loader collects the identifiers requested within the same tick of the event
+    loop, deduplicates them and retrieves the entities with a single `IN (...)` query.
+
+    Attributes:
+        pokemon (DataLoader[int, Pokemon | None]): The loader of Pokémon.
+        type_ (DataLoader[int, PokemonType | None]): The loader of Pokémon Types.
+        ability (DataLoader[int, PokemonAbility | None]): The loader of Pokémon Abilities.
+
+    """
+
+    pokemon: DataLoader[int, Pokemon | None]
+    type_: DataLoader[int, PokemonType | None]
+    ability: DataLoader[int, PokemonAbility | None]
+
+
+def create_dataloaders(container: Injector) -> DataLoaders:
+    """Create the DataLoaders of a request.
+
+    Loaders cache what they load, so they must not outlive the request.
+
+    Args:
+        container (Injector): The container of the request.
+
+    Returns:
+        DataLoaders: The DataLoaders of the request.
+
+    """
+    pokemon_service = container.get(AsyncPokemonServiceABC)  # type: ignore[type-abstract]
+    type_service = container.get(AsyncTypeServiceABC)  # type: ignore[type-abstract]
+    ability_service = container.get(AsyncAbilityServiceABC)  # type: ignore[type-abstract]
+
+    return DataLoaders(
+        pokemon=DataLoader(load_fn=batch_load(pokemon_service.get_by_ids)),
+        type_=DataLoader(load_fn=batch_load(type_service.get_by_ids)),
+        ability=DataLoader(load_fn=batch_load(ability_service.get_by_ids)),
+    )
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+
+from graphql import GraphQLError
+from graphql.language import DocumentNode
+from injector import inject, singleton
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.cache.memory import MemoryCache
+from pokeapi.presentation.persisted_queries import hash_query
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """A GraphQL document, parsed and validated against the schema.
+
+    Attributes:
+        query (str): The text of the document.
+        document (DocumentNode): The parsed document.
+        errors (tuple[GraphQLError, ...]): The errors of the validation, if any.
+
+    """
+
+    query: str
+    document: DocumentNode
+    errors: tuple[GraphQLError, ...]
+
+
+@singleton
+class DocumentCache:
+    """A bounded cache of the parsed and validated GraphQL documents, by text.
+
+    The schema does not change while the process runs, so neither does the validation
+    of a document: both are kept along with the document, and the least recently used
+    documents are evicted first.
+
+    Attributes:
+        _documents (MemoryCache): The cached documents, by hash of their text.
+
+    """
+
+    @inject
+    def __init__(self, config: AppConfig) -> None:
+        """Initialize the DocumentCache with no document.
+
+        Args:
+            config (AppConfig): The application configuration.
+
+        """
+        self._documents = MemoryCache(config.document_cache_max_size, 0)
+
+    def get(self, query: str) -> CachedDocument | None:
+        """Retrieve a cached document.
+
+        Args:
+            query (str): The text of the document.
+
+        Returns:
+            CachedDocument | None: The cached document, or None if missing.
+
+        """
+        cached: CachedDocument | None = self._documents.get(hash_query(query))
+
+        if cached is None or cached.query != query:
+            return None
+
+        return cached
+
+    def set(
+        self, query: str, document: DocumentNode, errors: list[GraphQLError]
+    ) -> None:
+        """Cache a parsed and validated document.
+
+        Args:
+            query (str): The text of the document.
+            document (DocumentNode): The parsed document.
+            errors (list[GraphQLError]): The errors of the validation, if any.
+
+        """
+        self._documents.set(
+            hash_query(query), CachedDocument(query, document, tuple(errors))
+        )
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the counters of the cache.
+
+        Returns:
+            dict: The counters of the cached documents.
+
+        """
+        return self._documents.snapshot()
@@ -0,0 +1,40 @@
+from collections.abc import Awaitable
+from typing import Any
+
+from strawberry.extensions.field_extension import (
+    FieldExtension,
+    SyncExtensionResolver,
+)
+from strawberry.types import Info
+
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+
+
+class BlockingResolverExtension(FieldExtension):
+    """A field extension running a sync resolver on the blocking executor.
+
+    Sync resolvers that hash passwords or query the database would otherwise run on the
+    event loop and stall every other request in the meantime. The resolver is left
+    unchanged: the extension hands it to `BlockingExecutor` and returns the awaitable
+    result, which the async execution of the schema awaits.
+
+    """
+
+    def resolve(
+        self, next_: SyncExtensionResolver, source: Any, info: Info, **kwargs: Any
+    ) -> Awaitable[Any]:
+        """Resolve the field on the blocking executor.
+
+        Args:
+            next_ (SyncExtensionResolver): The resolver of the field.
+            source (Any): The parent value of the field.
+            info (Info): The query info.
+            **kwargs (Any): The arguments of the field.
+
+        Returns:
+            Awaitable[Any]: The value of the field, once resolved.
+
+        """
+        executor: BlockingExecutor = info.context["container"].get(BlockingExecutor)
+
+        return executor.run(next_, source, info, **kwargs)
@@ -0,0 +1,67 @@
+from collections.abc import Iterator
+
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+
+from pokeapi.presentation.document_cache import DocumentCache
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """A schema extension reusing the parsed and validated documents.
+
+    A document found in `DocumentCache` is handed to the execution along with the
+    errors of its validation, so that both parsing and validation are skipped. A
+    document missing from the cache is cached once strawberry has parsed and
+    validated it. A document already handed to the execution by another extension is
+    left unchanged.
+
+    Attributes:
+        _cache (DocumentCache | None): The cache of documents, or None if the document
+            is left unchanged.
+
+    """
+
+    def __init__(self, *, execution_context: ExecutionContext) -> None:
+        """Initialize the DocumentCacheExtension for an execution.
+
+        Args:
+            execution_context (ExecutionContext): The context of the execution.
+
+        """
+        super().__init__(execution_context=execution_context)
+        self._cache: DocumentCache | None = None
+
+    def on_parse(self) -> Iterator[None]:
+        """Hand the cached document and its validation to the execution, if cached."""
+        execution_context = self.execution_context
+
+        if execution_context.query and execution_context.graphql_document is None:
+            cache = execution_context.context["container"].get(DocumentCache)
+            cached = cache.get(execution_context.query)
+
+            if cached is None:
+                self._cache = cache
+            else:
+                execution_context.graphql_document = cached.document
+                # NOTE: Skips the validation, whose errors are known.
+                execution_context.errors = list(cached.errors)
+
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        """Cache the document and its validation, once validated."""
+        yield
+
+        execution_context = self.execution_context
+
+        if (
+            self._cache is not None
+            and execution_context.query
+            and execution_context.graphql_document is not None
+            and execution_context.errors is not None
+        ):
+            self._cache.set(
+                execution_context.query,
+                execution_context.graphql_document,
+                execution_context.errors,
+            )
@@ -0,0 +1,75 @@
+from collections.abc import Iterator
+
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.presentation.persisted_queries import (
+    PersistedQuery,
+    PersistedQueryRegistry,
+    hash_query,
+)
+
+
+class PersistedQueryExtension(SchemaExtension):
+    """A schema extension reusing the validated documents of the persisted queries.
+
+    When the query is registered in `PersistedQueryRegistry` with its document, the
+    document is handed to the execution, which skips both parsing and validation.
+    When registered without, the document is kept once parsed and validated. Other
+    queries are left unchanged.
+
+    Attributes:
+        _registry (PersistedQueryRegistry | None): The registry of persisted queries,
+            or None if persisted queries are disabled.
+        _persisted_query (PersistedQuery | None): The registered query, if any.
+
+    """
+
+    def __init__(self, *, execution_context: ExecutionContext) -> None:
+        """Initialize the PersistedQueryExtension for an execution.
+
+        Args:
+            execution_context (ExecutionContext): The context of the execution.
+
+        """
+        super().__init__(execution_context=execution_context)
+        self._registry: PersistedQueryRegistry | None = None
+        self._persisted_query: PersistedQuery | None = None
+
+    def on_parse(self) -> Iterator[None]:
+        """Hand the document of a registered query to the execution, if kept."""
+        execution_context = self.execution_context
+        container = execution_context.context["container"]
+
+        if container.get(AppConfig).persisted_queries and execution_context.query:
+            registry = container.get(PersistedQueryRegistry)
+            self._registry = registry
+            self._persisted_query = registry.get(hash_query(execution_context.query))
+
+        persisted_query = self._persisted_query
+
+        if persisted_query is not None and persisted_query.document is not None:
+            execution_context.graphql_document = persisted_query.document
+            # NOTE: Skips the validation, already passed by the document.
+            execution_context.errors = []
+
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        """Keep the document of a registered query, once validated."""
+        yield
+
+        execution_context = self.execution_context
+        persisted_query = self._persisted_query
+
+        if (
+            self._registry is not None
+            and persisted_query is not None
+            and persisted_query.document is None
+            and execution_context.graphql_document is not None
+            and not execution_context.errors
+        ):
+            self._registry.store_document(
+                persisted_query.query, execution_context.graphql_document
+            )
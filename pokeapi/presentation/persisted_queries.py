@@ -0,0 +1,137 @@
+import hashlib
+from dataclasses import dataclass
+
+from graphql.language import DocumentNode
+from injector import inject, singleton
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.exceptions.persisted_query import PersistedQueryNotFoundError
+from pokeapi.infrastructure.cache.memory import MemoryCache
+
+
+@dataclass(frozen=True)
+class PersistedQuery:
+    """A query registered by its hash.
+
+    Attributes:
+        query (str): The text of the query.
+        document (DocumentNode | None): The parsed document, once validated against
+            the schema, or None until then.
+
+    """
+
+    query: str
+    document: DocumentNode | None
+
+
+def hash_query(query: str) -> str:
+    """Hash the text of a query, as the clients do.
+
+    Args:
+        query (str): The text of the query.
+
+    Returns:
+        str: The hexadecimal SHA-256 hash of the query.
+
+    """
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+@singleton
+class PersistedQueryRegistry:
+    """A bounded registry of the queries persisted by the clients, by hash.
+
+    A client sends the hash of a query in place of its text, and registers the text
+    along with the hash when the hash is unknown. The document of a registered query
+    is kept once it has been parsed and validated against the schema, so that the
+    following requests skip both phases. The least recently used queries are evicted
+    first.
+
+    Attributes:
+        _queries (MemoryCache): The registered queries, by hash.
+
+    """
+
+    @inject
+    def __init__(self, config: AppConfig) -> None:
+        """Initialize the PersistedQueryRegistry with no query.
+
+        Args:
+            config (AppConfig): The application configuration.
+
+        """
+        self._queries = MemoryCache(config.persisted_query_max_size, 0)
+
+    def get(self, sha256_hash: str) -> PersistedQuery | None:
+        """Retrieve a registered query.
+
+        Args:
+            sha256_hash (str): The hash of the query.
+
+        Returns:
+            PersistedQuery | None: The registered query, or None if not registered.
+
+        """
+        persisted_query: PersistedQuery | None = self._queries.get(sha256_hash)
+
+        return persisted_query
+
+    def get_query(self, sha256_hash: str) -> str:
+        """Retrieve the text of a registered query.
+
+        Args:
+            sha256_hash (str): The hash of the query.
+
+        Returns:
+            str: The text of the query.
+
+        Raises:
+            PersistedQueryNotFoundError: If the query is not registered.
+
+        """
+        persisted_query = self.get(sha256_hash)
+
+        if persisted_query is None:
+            raise PersistedQueryNotFoundError(
+                f"Persisted query is not registered. sha256Hash: {sha256_hash}"
+            )
+
+        return persisted_query.query
+
+    def register(self, sha256_hash: str, query: str) -> None:
+        """Register a query by its hash, unless already registered.
+
+        Args:
+            sha256_hash (str): The hash of the query sent by the client.
+            query (str): The text of the query.
+
+        Raises:
+            ValueError: If the hash does not match the query.
+
+        """
+        if hash_query(query) != sha256_hash:
+            raise ValueError(
+                f"Hash does not match the query. sha256Hash: {sha256_hash}"
+            )
+
+        if self.get(sha256_hash) is None:
+            self._queries.set(sha256_hash, PersistedQuery(query, None))
+
+    def store_document(self, query: str, document: DocumentNode) -> None:
+        """Keep the validated document of a registered query.
+
+        Args:
+            query (str): The text of the query.
+            document (DocumentNode): The document, validated against the schema.
+
+        """
+        self._queries.set(hash_query(query), PersistedQuery(query, document))
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the counters of the registry.
+
+        Returns:
+            dict: The counters of the registered queries.
+
+        """
+        return self._queries.snapshot()
@@ -5,6 +5,7 @@ from strawberry.types.info import Info
 from pokeapi.application.services.authentication import AuthenticationService
 from pokeapi.exceptions.authentication import AuthenticationError
 from pokeapi.exceptions.authorization import AuthorizationError
+from pokeapi.exceptions.password import PasswordHashingBusyError
 from pokeapi.exceptions.user import UserNotFoundError
 from pokeapi.presentation.helpers.request_utils import extract_bearer_token
 from pokeapi.presentation.schemas.authentication import AuthErrors, AuthResult
@@ -28,7 +29,7 @@ def auth(input: UserInput, info: Info) -> AuthResult | AuthErrors:  # noqa A002
 
     try:
         token = service.auth(validated_input.username, validated_input.password)
-    except AuthenticationError as e:
+    except (AuthenticationError, PasswordHashingBusyError) as e:
         return AuthErrors.from_exception(e)
 
     return AuthResult.from_entity(token)
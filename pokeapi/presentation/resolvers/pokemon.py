@@ -1,10 +1,13 @@
 from strawberry.types.info import Info
 
-from pokeapi.application.services.pokemon import PokemonService
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
 from pokeapi.presentation.schemas.pokemon import Pokemon
+from pokeapi.presentation.schemas.pokemon_connection import PokemonConnection
 
 
-def get_pokemon_by_pokedex_number(pokedex_number: int, info: Info) -> Pokemon | None:
+async def get_pokemon_by_pokedex_number(
+    pokedex_number: int, info: Info
+) -> Pokemon | None:
     """Retrieves a Pokemon by Pokedex number.
 
     Args:
@@ -16,8 +19,8 @@ def get_pokemon_by_pokedex_number(pokedex_number: int, info: Info) -> Pokemon |
 
     """
     container = info.context.get("container")
-    service = container.get(PokemonService)
-    pokemon = service.get_by_pokedex_number(pokedex_number)
+    service = container.get(AsyncPokemonServiceABC)
+    pokemon = await service.get_by_pokedex_number(pokedex_number)
 
     if pokemon is None:
         return None
@@ -25,7 +28,7 @@ def get_pokemon_by_pokedex_number(pokedex_number: int, info: Info) -> Pokemon |
     return Pokemon.from_entity(pokemon)
 
 
-def get_pokemon_by_name(name: str, info: Info) -> Pokemon | None:
+async def get_pokemon_by_name(name: str, info: Info) -> Pokemon | None:
     """Retrieves a Pokemon by name.
 
     Args:
@@ -37,10 +40,38 @@ def get_pokemon_by_name(name: str, info: Info) -> Pokemon | None:
 
     """
     container = info.context.get("container")
-    service = container.get(PokemonService)
-    pokemon = service.get_by_name(name)
+    service = container.get(AsyncPokemonServiceABC)
+    pokemon = await service.get_by_name(name)
 
     if pokemon is None:
         return None
 
     return Pokemon.from_entity(pokemon)
+
+
+async def get_pokemons(
+    info: Info,
+    before: str | None = None,
+    after: str | None = None,
+    first: int | None = None,
+    last: int | None = None,
+) -> PokemonConnection:
+    """Retrieves a page of Pokémon.
+
+    Args:
+        info (Info): The query info.
+        before (str | None): Returns the Pokémon before the specified cursor.
+        after (str | None): Returns the Pokémon after the specified cursor.
+        first (int | None): Returns the first n Pokémon.
+        last (int | None): Returns the last n Pokémon.
+
+    Returns:
+        PokemonConnection: The result of the operation.
+
+    """
+    container = info.context.get("container")
+    service = container.get(AsyncPokemonServiceABC)
+
+    return await PokemonConnection.resolve_page(
+        service, info=info, before=before, after=after, first=first, last=last
+    )
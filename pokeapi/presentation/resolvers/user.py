@@ -4,6 +4,7 @@ from strawberry.types.info import Info
 
 from pokeapi.application.services.user import UserService
 from pokeapi.exceptions.authorization import AuthorizationError
+from pokeapi.exceptions.password import PasswordHashingBusyError
 from pokeapi.exceptions.token import TokenVerificationError
 from pokeapi.exceptions.user import UserCreationError
 from pokeapi.presentation.helpers.request_utils import extract_bearer_token
@@ -36,7 +37,7 @@ def get_user_by_token(info: Info) -> User | UserErrors:
 
     try:
         user = service.get_by_token(token)
-    except TokenVerificationError as e:
+    except (AuthorizationError, TokenVerificationError) as e:
         return UserErrors.from_exception(e)
 
     return User.from_entity(user)
@@ -62,7 +63,7 @@ def create_user(
 
     try:
         token = service.create(validated_input.username, validated_input.password)
-    except UserCreationError as e:
+    except (UserCreationError, PasswordHashingBusyError) as e:
         return UserErrors.from_exception(e)
 
     return UserCreationResult.from_entity(token)
@@ -0,0 +1,242 @@
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from graphql import GraphQLError
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    Lexer,
+    OperationType,
+    SelectionSetNode,
+    Source,
+    TokenKind,
+    parse,
+)
+from graphql.utilities import get_operation_ast
+from injector import inject, singleton
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.cache.memory import MemoryCache
+
+# NOTE: The fields reading users or tokens, whose responses depend on the caller.
+PRIVATE_FIELDS = frozenset({"user", "auth", "refresh", "userCreate", "createUser"})
+
+# NOTE: Smaller responses are not worth compressing, as in starlette's GZipMiddleware.
+GZIP_MIN_SIZE = 500
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached response of a GraphQL query.
+
+    Attributes:
+        body (bytes): The JSON body of the response.
+        gzipped (bytes | None): The body compressed with gzip, or None if not
+            compressed.
+
+    """
+
+    body: bytes
+    gzipped: bytes | None
+
+
+def normalize_document(query: str) -> str:
+    """Hash a GraphQL document, regardless of its whitespace, commas and comments.
+
+    Args:
+        query (str): The text of the document.
+
+    Returns:
+        str: The hash of the tokens of the document.
+
+    Raises:
+        GraphQLError: If the document has a syntax error.
+
+    """
+    lexer = Lexer(Source(query))
+    tokens = []
+    token = lexer.advance()
+
+    while token.kind != TokenKind.EOF:
+        tokens.append((token.kind.value, token.value))
+        token = lexer.advance()
+
+    return hashlib.sha256(json.dumps(tokens).encode("utf-8")).hexdigest()
+
+
+def is_cacheable(document: DocumentNode, operation_name: str | None) -> bool:
+    """Tell whether the response of an operation may be cached.
+
+    Only queries are cached, and only when no field they select, through fragments
+    included, reads users or tokens.
+
+    Args:
+        document (DocumentNode): The parsed document.
+        operation_name (str | None): The name of the operation to execute.
+
+    Returns:
+        bool: A boolean indicating whether the response of the operation may be cached.
+
+    """
+    operation = get_operation_ast(document, operation_name)
+
+    if operation is None or operation.operation != OperationType.QUERY:
+        return False
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    visited: set[str] = set()
+    pending: list[SelectionSetNode] = [operation.selection_set]
+
+    while pending:
+        for selection in pending.pop().selections:
+            if isinstance(selection, FieldNode):
+                if selection.name.value in PRIVATE_FIELDS:
+                    return False
+
+                if selection.selection_set is not None:
+                    pending.append(selection.selection_set)
+            elif isinstance(selection, InlineFragmentNode):
+                pending.append(selection.selection_set)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+
+                if name in fragments and name not in visited:
+                    visited.add(name)
+                    pending.append(fragments[name].selection_set)
+
+    return True
+
+
+@singleton
+class ResponseCache:
+    """A bounded cache of the responses of GraphQL queries on master data.
+
+    A response is keyed on the hash of the normalized document, the operation name,
+    the variables and whether the request is authenticated. Whether an operation may
+    be cached is decided once per document and operation name, by parsing the
+    document. Only the responses without errors are cached, as the final JSON body,
+    and compressed with gzip ahead when `RESPONSE_CACHE_GZIP` is enabled.
+
+    Attributes:
+        _gzip (bool): A boolean indicating whether the responses are compressed ahead.
+        _responses (MemoryCache): The cached responses.
+        _policies (MemoryCache): Whether each operation may be cached.
+        _bypassed (int): The number of requests whose operation may not be cached.
+
+    """
+
+    @inject
+    def __init__(self, config: AppConfig) -> None:
+        """Initialize the ResponseCache with no response.
+
+        Args:
+            config (AppConfig): The application configuration.
+
+        """
+        self._gzip = config.response_cache_gzip
+        self._responses = MemoryCache(
+            config.response_cache_max_size, config.response_cache_ttl
+        )
+        self._policies = MemoryCache(config.response_cache_max_size, 0)
+        self._bypassed = 0
+
+    def key(
+        self,
+        query: str | None,
+        variables: Any,
+        operation_name: str | None,
+        authenticated: bool,
+    ) -> str | None:
+        """Build the key of the response of a request.
+
+        Args:
+            query (str | None): The text of the document.
+            variables (Any): The variables of the operation.
+            operation_name (str | None): The name of the operation to execute.
+            authenticated (bool): A boolean indicating whether the request carries
+                credentials.
+
+        Returns:
+            str | None: The key of the response, or None if it may not be cached.
+
+        """
+        if not isinstance(query, str):
+            return None
+
+        try:
+            document_hash = normalize_document(query)
+        except GraphQLError:
+            return None
+
+        policy_key = f"{document_hash}:{operation_name}"
+        cacheable = self._policies.get(policy_key)
+
+        if cacheable is None:
+            try:
+                cacheable = is_cacheable(parse(query), operation_name)
+            except GraphQLError:
+                cacheable = False
+
+            self._policies.set(policy_key, cacheable)
+
+        if not cacheable:
+            self._bypassed += 1
+            return None
+
+        request_hash = hashlib.sha256(
+            json.dumps(
+                [operation_name, variables], sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+        ).hexdigest()
+        visibility = "authenticated" if authenticated else "anonymous"
+
+        return f"{visibility}:{document_hash}:{request_hash}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Retrieve a cached response.
+
+        Args:
+            key (str): The key of the response.
+
+        Returns:
+            CachedResponse | None: The cached response, or None if missing or expired.
+
+        """
+        return self._responses.get(key)
+
+    def set(self, key: str, body: bytes) -> None:
+        """Cache the body of a response.
+
+        Args:
+            key (str): The key of the response.
+            body (bytes): The JSON body of the response.
+
+        """
+        gzipped = (
+            gzip.compress(body) if self._gzip and len(body) >= GZIP_MIN_SIZE else None
+        )
+        self._responses.set(key, CachedResponse(body, gzipped))
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._responses.clear()
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of the counters of the cache.
+
+        Returns:
+            dict: The counters of the cached responses, and the number of requests
+                whose operation may not be cached.
+
+        """
+        return {**self._responses.snapshot(), "bypassed": self._bypassed}
@@ -0,0 +1,275 @@
+from typing import Any
+
+from fastapi import Request, Response
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLHTTPResponse, GraphQLRequestData
+from strawberry.http.async_base_view import AsyncHTTPRequestAdapter
+from strawberry.http.base import BaseRequestProtocol
+from strawberry.http.exceptions import HTTPException
+from strawberry.http.typevars import Context, RootValue
+from strawberry.types import ExecutionResult
+from strawberry.unset import UNSET
+
+from pokeapi.dependencies.context import get_root_container
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.exceptions.persisted_query import (
+    PersistedQueryNotFoundError,
+    PersistedQueryNotSupportedError,
+)
+from pokeapi.presentation.persisted_queries import PersistedQueryRegistry
+from pokeapi.presentation.response_cache import ResponseCache
+
+
+class CachedGraphQLRouter(GraphQLRouter[Any, Any]):
+    """A GraphQL router serving the responses of queries on master data from a cache.
+
+    When `RESPONSE_CACHE` is enabled, the request is looked up in `ResponseCache`
+    before the schema is run, and a hit returns the cached JSON body without parsing,
+    validating nor executing the document. On a miss, the response is cached once
+    executed, unless the result has errors.
+
+    When `PERSISTED_QUERIES` is enabled, the router accepts the automatic persisted
+    queries of Apollo: a request may carry the SHA-256 hash of a query registered in
+    `PersistedQueryRegistry` in place of its text, and registers the text when sent
+    along with the hash.
+
+    """
+
+    async def run(
+        self,
+        request: Request,
+        context: Context | None = UNSET,
+        root_value: RootValue | None = UNSET,
+    ) -> Response:
+        """Serve a request, from the response cache when possible.
+
+        Args:
+            request (Request): The request.
+            context (Context | None): The context of the execution.
+            root_value (RootValue | None): The root value of the execution.
+
+        Returns:
+            Response: The response, or an error the clients of persisted queries react
+                to.
+
+        """
+        try:
+            return await self._run_cached(request, context, root_value)
+        except PersistedQueryNotFoundError:
+            return self._persisted_query_error(
+                "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+            )
+        except PersistedQueryNotSupportedError:
+            return self._persisted_query_error(
+                "PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED"
+            )
+
+    async def _run_cached(
+        self,
+        request: Request,
+        context: Context | None,
+        root_value: RootValue | None,
+    ) -> Response:
+        """Serve a request, from the response cache when possible.
+
+        Args:
+            request (Request): The request.
+            context (Context | None): The context of the execution.
+            root_value (RootValue | None): The root value of the execution.
+
+        Returns:
+            Response: The response.
+
+        """
+        container = get_root_container()
+
+        if not container.get(AppConfig).response_cache:
+            return await super().run(request, context, root_value)
+
+        cache = container.get(ResponseCache)
+        key = await self._cache_key(request, cache)
+
+        if key is None:
+            return await super().run(request, context, root_value)
+
+        cached = cache.get(key)
+
+        if cached is not None:
+            accepts_gzip = "gzip" in request.headers.get("Accept-Encoding", "")
+
+            if cached.gzipped is not None and accepts_gzip:
+                return Response(
+                    cached.gzipped,
+                    media_type="application/json",
+                    headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+                )
+
+            return Response(cached.body, media_type="application/json")
+
+        response = await super().run(request, context, root_value)
+
+        # NOTE: Responses not built from a result, such as GraphiQL, are not cached.
+        if response.status_code == 200 and not getattr(
+            request.state, "graphql_errors", True
+        ):
+            cache.set(key, bytes(response.body))
+
+        return response
+
+    async def _cache_key(self, request: Request, cache: ResponseCache) -> str | None:
+        """Build the key of the response of a request.
+
+        Args:
+            request (Request): The request.
+            cache (ResponseCache): The response cache.
+
+        Returns:
+            str | None: The key of the response, or None if it may not be cached.
+
+        """
+        request_adapter = self.request_adapter_class(request)
+        is_json = "application/json" in (request_adapter.content_type or "")
+
+        if not (request_adapter.method == "GET" or is_json):
+            return None
+
+        try:
+            request_data = await self.parse_http_body(request_adapter)
+        except (HTTPException, ValueError):
+            return None
+
+        return cache.key(
+            request_data.query,
+            request_data.variables,
+            request_data.operation_name,
+            "Authorization" in request.headers,
+        )
+
+    def should_render_graphql_ide(self, request: BaseRequestProtocol) -> bool:
+        """Whether to render GraphiQL in place of running the request.
+
+        A GET request carrying only the hash of a persisted query has no `query`
+        parameter, and is run rather than answered with GraphiQL.
+
+        Args:
+            request (BaseRequestProtocol): The request.
+
+        Returns:
+            bool: A boolean indicating whether to render GraphiQL.
+
+        """
+        extensions = request.query_params.get("extensions")
+
+        if isinstance(extensions, str) and "persistedQuery" in extensions:
+            return False
+
+        return super().should_render_graphql_ide(request)
+
+    async def parse_http_body(
+        self, request: AsyncHTTPRequestAdapter
+    ) -> GraphQLRequestData:
+        """Parse the body of a request, resolving the text of a persisted query.
+
+        Args:
+            request (AsyncHTTPRequestAdapter): The request.
+
+        Returns:
+            GraphQLRequestData: The query, the variables and the operation name.
+
+        Raises:
+            HTTPException: If the persisted query is invalid or its hash does not
+                match its text.
+            PersistedQueryNotFoundError: If the hash of the query is not registered.
+            PersistedQueryNotSupportedError: If persisted queries are disabled.
+
+        """
+        if "application/json" in (request.content_type or ""):
+            data = self.parse_json(await request.get_body())
+        elif request.method == "GET":
+            data = self.parse_query_params(request.query_params)
+        else:
+            return await super().parse_http_body(request)
+
+        request_data = GraphQLRequestData(
+            query=data.get("query"),
+            variables=data.get("variables"),
+            operation_name=data.get("operationName"),
+        )
+        extensions = data.get("extensions")
+
+        if isinstance(extensions, str):
+            extensions = self.parse_json(extensions)
+
+        if not isinstance(extensions, dict) or "persistedQuery" not in extensions:
+            return request_data
+
+        container = get_root_container()
+
+        if not container.get(AppConfig).persisted_queries:
+            if request_data.query is None:
+                raise PersistedQueryNotSupportedError("Persisted queries are disabled.")
+
+            return request_data
+
+        persisted_query = extensions["persistedQuery"]
+
+        if not isinstance(persisted_query, dict) or persisted_query.get("version") != 1:
+            raise HTTPException(400, "Unsupported persisted query version")
+
+        sha256_hash = persisted_query.get("sha256Hash")
+
+        if not isinstance(sha256_hash, str):
+            raise HTTPException(400, "Persisted query has no sha256Hash")
+
+        registry = container.get(PersistedQueryRegistry)
+
+        if request_data.query is None:
+            request_data.query = registry.get_query(sha256_hash.lower())
+        else:
+            try:
+                registry.register(sha256_hash.lower(), request_data.query)
+            except ValueError as e:
+                raise HTTPException(400, "provided sha does not match query") from e
+
+        return request_data
+
+    def _persisted_query_error(self, message: str, code: str) -> Response:
+        """Build the response of a persisted query the router cannot serve.
+
+        Args:
+            message (str): The message of the error.
+            code (str): The code of the error.
+
+        Returns:
+            Response: The response, with the error in the GraphQL format.
+
+        """
+        return Response(
+            self.encode_json(
+                {
+                    "data": None,
+                    "errors": [{"message": message, "extensions": {"code": code}}],
+                }
+            ),
+            media_type="application/json",
+        )
+
+    async def process_result(
+        self, request: Request, result: ExecutionResult
+    ) -> GraphQLHTTPResponse:
+        """Convert the result of an execution to the body of the response.
+
+        Whether the result has errors is kept in the state of the request, so that the
+        response is not cached.
+
+        Args:
+            request (Request): The request.
+            result (ExecutionResult): The result of the execution.
+
+        Returns:
+            GraphQLHTTPResponse: The body of the response.
+
+        """
+        request.state.graphql_errors = bool(result.errors)
+
+        return await super().process_result(request, result)
@@ -1,5 +1,6 @@
 import strawberry
 
+from pokeapi.presentation.extensions.blocking import BlockingResolverExtension
 from pokeapi.presentation.resolvers.authentication import auth, refresh
 from pokeapi.presentation.resolvers.user import create_user
 
@@ -10,7 +11,8 @@ from . import AUTH_PAYLOAD, USER_CREATION_PAYLOAD
 class Mutation:
     """Root mutation schema.
 
-    This schema defines the root mutation operations.
+    This schema defines the root mutation operations. Their resolvers block, so they run
+    on the blocking executor.
 
     Attributes:
         auth (AUTH_PAYLOAD): Authenticates a user and returns a token.
@@ -22,10 +24,15 @@ class Mutation:
     auth: AUTH_PAYLOAD = strawberry.field(
         resolver=auth,
         description="Authenticates a user and returns a token.",
+        extensions=[BlockingResolverExtension()],
     )
     refresh: AUTH_PAYLOAD = strawberry.field(
-        resolver=refresh, description="Refreshes a token."
+        resolver=refresh,
+        description="Refreshes a token.",
+        extensions=[BlockingResolverExtension()],
     )
     user_create: USER_CREATION_PAYLOAD = strawberry.field(
-        resolver=create_user, description="Creates a new user and returns a token."
+        resolver=create_user,
+        description="Creates a new user and returns a token.",
+        extensions=[BlockingResolverExtension()],
     )
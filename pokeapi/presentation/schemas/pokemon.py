@@ -1,8 +1,9 @@
+from collections.abc import Iterable
+
 import strawberry
 from strawberry import relay
 from strawberry.types import Info
 
-from pokeapi.application.services.pokemon import PokemonService
 from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
 from pokeapi.exceptions.pokemon import PokemonNotFoundError
 from pokeapi.presentation.schemas.pokemon_ability import PokemonAbility
@@ -105,7 +106,7 @@ class Pokemon(relay.Node):
         )
 
     @classmethod
-    def resolve_node(
+    async def resolve_node(
         cls, node_id: str, *, info: Info, required: bool = False
     ) -> "Pokemon":
         """Resolve Pokémon by node_id.
@@ -122,11 +123,39 @@ class Pokemon(relay.Node):
             PokemonNotFoundError: If the Pokémon is not found.
 
         """
-        container = info.context["container"]
-        service = container.get(PokemonService)
-        entity = service.get_by_id(int(node_id))
+        entity = await info.context["dataloaders"].pokemon.load(int(node_id))
 
         if entity is None:
             raise PokemonNotFoundError("Pokemon not found")
 
         return cls.from_entity(entity)
+
+    @classmethod
+    async def resolve_nodes(  # type: ignore[override]
+        cls, *, info: Info, node_ids: Iterable[str], required: bool = False
+    ) -> list["Pokemon | None"]:
+        """Resolve Pokémon by their node_ids with a single query.
+
+        Args:
+            info (Info): Information about the execution of the query.
+            node_ids (Iterable[str]): The unique identifiers for the Pokémon.
+            required (bool, optional): Whether every node is required.
+
+        Returns:
+            list[Pokemon | None]:
+                The Pokémon in the order of the node_ids, with None for the
+                Pokémon not found.
+
+        Raises:
+            PokemonNotFoundError: If a required Pokémon is not found.
+
+        """
+        ids = [int(node_id) for node_id in node_ids]
+        entities = await info.context["dataloaders"].pokemon.load_many(ids)
+
+        if required and any(entity is None for entity in entities):
+            raise PokemonNotFoundError("Pokemon not found")
+
+        return [
+            None if entity is None else cls.from_entity(entity) for entity in entities
+        ]
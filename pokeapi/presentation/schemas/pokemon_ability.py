@@ -1,8 +1,9 @@
+from collections.abc import Iterable
+
 import strawberry
 from strawberry import relay
 from strawberry.types import Info
 
-from pokeapi.application.services.pokemon_ability import AbilityService
 from pokeapi.domain.entities.pokemon_ability import (
     PokemonAbility as PokemonAbilityEntity,
 )
@@ -36,7 +37,7 @@ class PokemonAbility(relay.Node):
         return PokemonAbility(id=entity.id_, ability_name=entity.name)
 
     @classmethod
-    def resolve_node(
+    async def resolve_node(
         cls, node_id: str, *, info: Info, required: bool = False
     ) -> "PokemonAbility":
         """Resolve Pokémon Ability.
@@ -53,11 +54,39 @@ class PokemonAbility(relay.Node):
             AbilityNotFoundError: If the Pokémon Ability is not found.
 
         """
-        container = info.context["container"]
-        service = container.get(AbilityService)
-        entity = service.get_by_id(int(node_id))
+        entity = await info.context["dataloaders"].ability.load(int(node_id))
 
         if entity is None:
             raise AbilityNotFoundError("Ability not found")
 
         return cls.from_entity(entity)
+
+    @classmethod
+    async def resolve_nodes(  # type: ignore[override]
+        cls, *, info: Info, node_ids: Iterable[str], required: bool = False
+    ) -> list["PokemonAbility | None"]:
+        """Resolve Pokémon Abilities by their node_ids with a single query.
+
+        Args:
+            info (Info): Information about the execution of the query.
+            node_ids (Iterable[str]): The unique identifiers for the Pokémon Abilities.
+            required (bool, optional): Whether every node is required.
+
+        Returns:
+            list[PokemonAbility | None]:
+                The Pokémon Abilities in the order of the node_ids, with None for the
+                Pokémon Abilities not found.
+
+        Raises:
+            AbilityNotFoundError: If a required Pokémon Ability is not found.
+
+        """
+        ids = [int(node_id) for node_id in node_ids]
+        entities = await info.context["dataloaders"].ability.load_many(ids)
+
+        if required and any(entity is None for entity in entities):
+            raise AbilityNotFoundError("Ability not found")
+
+        return [
+            None if entity is None else cls.from_entity(entity) for entity in entities
+        ]
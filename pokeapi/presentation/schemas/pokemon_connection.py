@@ -0,0 +1,138 @@
+import strawberry
+from strawberry import relay
+from strawberry.types import Info
+
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
+from pokeapi.presentation.schemas.pokemon import Pokemon
+
+CURSOR_PREFIX = "pokemon-cursor"
+
+
+@strawberry.type(description="A connection to a list of Pokémon.")
+class PokemonConnection(relay.Connection[Pokemon]):
+    """GraphQL schema for a page of Pokémon.
+
+    Pages are located by the identifiers of the Pokémon at their edges, so fetching a
+    page costs the same regardless of its position. Cursors are opaque to clients.
+
+    """
+
+    @staticmethod
+    def encode_cursor(id_: int) -> str:
+        """Encode the identifier of a Pokémon into a cursor.
+
+        Args:
+            id_ (int): The identifier of the Pokémon.
+
+        Returns:
+            str: The opaque cursor.
+
+        """
+        return relay.to_base64(CURSOR_PREFIX, id_)
+
+    @staticmethod
+    def decode_cursor(cursor: str, argument: str) -> int:
+        """Decode a cursor into the identifier of a Pokémon.
+
+        Args:
+            cursor (str): The opaque cursor.
+            argument (str): The name of the argument holding the cursor.
+
+        Returns:
+            int: The identifier of the Pokémon.
+
+        Raises:
+            ValueError: If the cursor was not issued by this connection.
+
+        """
+        try:
+            prefix, id_ = relay.from_base64(cursor)
+
+            if prefix != CURSOR_PREFIX:
+                raise ValueError(prefix)
+
+            return int(id_)
+        except ValueError as e:
+            raise ValueError(f"Argument '{argument}' is not a valid cursor.") from e
+
+    @classmethod
+    async def resolve_page(
+        cls,
+        service: AsyncPokemonServiceABC,
+        *,
+        info: Info,
+        before: str | None = None,
+        after: str | None = None,
+        first: int | None = None,
+        last: int | None = None,
+    ) -> "PokemonConnection":
+        """Resolve a page of Pokémon from the pagination arguments.
+
+        One extra Pokémon is fetched to know whether more Pokémon follow the page.
+
+        Args:
+            service (AsyncPokemonServiceABC): The service retrieving the Pokémon.
+            info (Info): Information about the execution of the query.
+            before (str | None): Returns the Pokémon before the specified cursor.
+            after (str | None): Returns the Pokémon after the specified cursor.
+            first (int | None): Returns the first n Pokémon.
+            last (int | None): Returns the last n Pokémon.
+
+        Returns:
+            PokemonConnection: The page of Pokémon.
+
+        Raises:
+            ValueError: If the pagination arguments are invalid.
+
+        """
+        max_results = info.schema.config.relay_max_results
+
+        if first is not None and last is not None:
+            raise ValueError("Arguments 'first' and 'last' cannot be used together.")
+
+        for argument, value in (("first", first), ("last", last)):
+            if value is not None and value < 0:
+                raise ValueError(
+                    f"Argument '{argument}' must be a non-negative integer."
+                )
+
+            if value is not None and value > max_results:
+                raise ValueError(
+                    f"Argument '{argument}' cannot be higher than {max_results}."
+                )
+
+        after_id = cls.decode_cursor(after, "after") if after else None
+        before_id = cls.decode_cursor(before, "before") if before else None
+        backward = last is not None
+
+        if last is not None:
+            limit = last
+        elif first is not None:
+            limit = first
+        else:
+            limit = max_results
+
+        entities = await service.get_page(
+            limit + 1, after=after_id, before=before_id, backward=backward
+        )
+        has_more = len(entities) > limit
+
+        if has_more:
+            entities = entities[1:] if backward else entities[:-1]
+
+        edges = [
+            relay.Edge(
+                cursor=cls.encode_cursor(entity.id_), node=Pokemon.from_entity(entity)
+            )
+            for entity in entities
+        ]
+
+        return cls(
+            edges=edges,
+            page_info=relay.PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=has_more if backward else after_id is not None,
+                has_next_page=before_id is not None if backward else has_more,
+            ),
+        )
@@ -1,8 +1,9 @@
+from collections.abc import Iterable
+
 import strawberry
 from strawberry import relay
 from strawberry.types import Info
 
-from pokeapi.application.services.pokemon_type import TypeService
 from pokeapi.domain.entities.pokemon_type import PokemonType as PokemonTypeEntity
 from pokeapi.exceptions.pokemon_type import TypeNotFoundError
 
@@ -34,7 +35,7 @@ class PokemonType(relay.Node):
         return PokemonType(id=entity.id_, type_name=entity.name)
 
     @classmethod
-    def resolve_node(
+    async def resolve_node(
         cls, node_id: str, *, info: Info, required: bool = False
     ) -> "PokemonType":
         """Resolve Pokémon Type.
@@ -51,11 +52,39 @@ class PokemonType(relay.Node):
             TypeNotFoundError: If the Pokémon Type is not found.
 
         """
-        container = info.context["container"]
-        service = container.get(TypeService)
-        entity = service.get_by_id(int(node_id))
+        entity = await info.context["dataloaders"].type_.load(int(node_id))
 
         if entity is None:
             raise TypeNotFoundError("Type not found")
 
         return cls.from_entity(entity)
+
+    @classmethod
+    async def resolve_nodes(  # type: ignore[override]
+        cls, *, info: Info, node_ids: Iterable[str], required: bool = False
+    ) -> list["PokemonType | None"]:
+        """Resolve Pokémon Types by their node_ids with a single query.
+
+        Args:
+            info (Info): Information about the execution of the query.
+            node_ids (Iterable[str]): The unique identifiers for the Pokémon Types.
+            required (bool, optional): Whether every node is required.
+
+        Returns:
+            list[PokemonType | None]:
+                The Pokémon Types in the order of the node_ids, with None for the
+                Pokémon Types not found.
+
+        Raises:
+            TypeNotFoundError: If a required Pokémon Type is not found.
+
+        """
+        ids = [int(node_id) for node_id in node_ids]
+        entities = await info.context["dataloaders"].type_.load_many(ids)
+
+        if required and any(entity is None for entity in entities):
+            raise TypeNotFoundError("Type not found")
+
+        return [
+            None if entity is None else cls.from_entity(entity) for entity in entities
+        ]
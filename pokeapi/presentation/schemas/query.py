@@ -1,18 +1,17 @@
-from collections.abc import Iterable
-
 import strawberry
 from strawberry import relay
-from strawberry.types.info import Info
 
-from pokeapi.application.services.pokemon_abc import PokemonServiceABC
+from pokeapi.presentation.extensions.blocking import BlockingResolverExtension
 from pokeapi.presentation.resolvers.pokemon import (
     get_pokemon_by_name,
     get_pokemon_by_pokedex_number,
+    get_pokemons,
 )
 from pokeapi.presentation.resolvers.user import get_user_by_token
 from pokeapi.presentation.schemas import USER_PAYLOAD
 from pokeapi.presentation.schemas.pokemon import Pokemon
 from pokeapi.presentation.schemas.pokemon_ability import PokemonAbility
+from pokeapi.presentation.schemas.pokemon_connection import PokemonConnection
 from pokeapi.presentation.schemas.pokemon_type import PokemonType
 
 
@@ -28,6 +27,7 @@ class Query:
         pokemon_by_name (Pokemon): Returns a Pokémon resource by name.
         pokemon_type (PokemonType): Returns a Pokémon Type resource by ID.
         pokemon_ability (PokemonAbility): Returns a Pokémon Ability resource by ID.
+        pokemons (PokemonConnection): Returns a page of Pokémon resources.
         user(USER_PAYLOAD): Returns a User resource by access token.
 
     """
@@ -50,18 +50,8 @@ class Query:
     user: USER_PAYLOAD = strawberry.field(
         resolver=get_user_by_token,
         description="Returns a User resource by access token.",
+        extensions=[BlockingResolverExtension()],
+    )
+    pokemons: PokemonConnection = strawberry.field(
+        description="List of Pokémon.", resolver=get_pokemons
     )
-
-    @relay.connection(relay.ListConnection[Pokemon], description="List of Pokémon.")
-    def pokemons(self, info: Info) -> Iterable[Pokemon]:  # pragma: no cover
-        """Returns a list of Pokémon resources.
-
-        Returns:
-            Iterable[Pokemon]: A list of Pokémon resources.
-
-        """
-        container = info.context["container"]
-        service = container.get(PokemonServiceABC)
-        entities = service.get_all()
-
-        return [Pokemon.from_entity(entity) for entity in entities]
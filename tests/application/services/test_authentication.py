@@ -1,15 +1,28 @@
+from collections.abc import Generator
 from unittest.mock import MagicMock
 
 import pytest
+from freezegun import freeze_time
 from injector import Injector
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
 
 from pokeapi.application.services.authentication import AuthenticationService
+from pokeapi.dependencies.settings.config import AppConfigABC
+from pokeapi.domain.services.password import PasswordService
+from pokeapi.domain.services.token import TokenService
 from pokeapi.exceptions.authentication import AuthenticationError
-from pokeapi.exceptions.user import UserNotFoundError
+from pokeapi.exceptions.password import PasswordHashingBusyError
+from pokeapi.exceptions.user import UserUpdateError
+from pokeapi.infrastructure.database.models import TokenWhitelist as TokenWhitelistModel
+from pokeapi.infrastructure.database.models import User as UserModel
+from pokeapi.infrastructure.database.repositories.user import UserRepository
 from tests.conftest import (
+    EXECUTION_DATETIME,
     TEST_TOKEN_ENTITY,
-    TEST_TOKEN_WHITELIST_ENTITY,
     TEST_USER_ENTITY,
+    TEST_UUID,
+    QueryCounter,
 )
 
 
@@ -18,8 +31,50 @@ def service(container: Injector) -> AuthenticationService:
     return container.get(AuthenticationService)
 
 
+@pytest.fixture()
+def db_service(
+    container: Injector, db_token_service: TokenService
+) -> AuthenticationService:
+    return AuthenticationService(
+        container.get(AppConfigABC),  # type: ignore
+        PasswordService(container.get(AppConfigABC)),  # type: ignore
+        db_token_service,
+        container.get(UserRepository),
+    )
+
+
+@pytest.fixture()
+def _setup_user(container: Injector) -> Generator:
+    session = container.get(Session)
+    record = session.execute(
+        insert(UserModel).values(
+            username="test_service",
+            password=PasswordService(container.get(AppConfigABC)).hash(  # type: ignore
+                "password"
+            ),
+            created_by="test_service",
+            updated_by="test_service",
+        )
+    )
+    assert record.inserted_primary_key is not None
+    session.commit()
+
+    yield
+
+    user_id = record.inserted_primary_key[0]
+    session.execute(
+        delete(TokenWhitelistModel).where(TokenWhitelistModel.user_id == user_id)
+    )
+    session.execute(delete(UserModel).where(UserModel.id_ == user_id))
+    session.commit()
+
+
 class TestAuthenticationService:
     def test_auth(self, service: AuthenticationService) -> None:
+        service._user_repo.get_by_username = MagicMock(return_value=TEST_USER_ENTITY)  # type: ignore
+        service._password_service.verify = MagicMock(return_value=True)  # type: ignore
+        service._password_service.needs_rehash = MagicMock(return_value=False)  # type: ignore
+        service._user_repo.update = MagicMock()  # type: ignore
         service._token_service.create = MagicMock(return_value=TEST_TOKEN_ENTITY)  # type: ignore
         actual = service.auth("mock_user", "password")
 
@@ -27,6 +82,39 @@ class TestAuthenticationService:
         assert actual.refresh_token == "refresh_token"
         assert actual.token_type == "Bearer"
 
+    def test_auth_rehash(self, service: AuthenticationService) -> None:
+        service._user_repo.get_by_username = MagicMock(return_value=TEST_USER_ENTITY)  # type: ignore
+        service._password_service.verify = MagicMock(return_value=True)  # type: ignore
+        service._password_service.needs_rehash = MagicMock(return_value=True)  # type: ignore
+        service._password_service.hash = MagicMock(return_value="rehashed")  # type: ignore
+        service._user_repo.update = MagicMock(side_effect=lambda user: user)  # type: ignore
+        service._token_service.create = MagicMock(return_value=TEST_TOKEN_ENTITY)  # type: ignore
+        actual = service.auth("mock_user", "password")
+
+        assert actual.access_token == "access_token"
+        service._password_service.hash.assert_called_once_with("password")
+        updated = service._user_repo.update.call_args.args[0]
+        assert updated.id_ == TEST_USER_ENTITY.id_
+        assert updated.password == "rehashed"
+        assert service._token_service.create.call_args.args[0] == updated
+
+    @pytest.mark.parametrize(
+        "error", [UserUpdateError("error"), PasswordHashingBusyError("error")]
+    )
+    def test_auth_rehash_failed(
+        self, service: AuthenticationService, error: Exception
+    ) -> None:
+        service._user_repo.get_by_username = MagicMock(return_value=TEST_USER_ENTITY)  # type: ignore
+        service._password_service.verify = MagicMock(return_value=True)  # type: ignore
+        service._password_service.needs_rehash = MagicMock(return_value=True)  # type: ignore
+        service._password_service.hash = MagicMock(return_value="rehashed")  # type: ignore
+        service._user_repo.update = MagicMock(side_effect=error)  # type: ignore
+        service._token_service.create = MagicMock(return_value=TEST_TOKEN_ENTITY)  # type: ignore
+        actual = service.auth("mock_user", "password")
+
+        assert actual.access_token == "access_token"
+        assert service._token_service.create.call_args.args[0] == TEST_USER_ENTITY
+
     def test_auth_user_not_found(self, service: AuthenticationService) -> None:
         service._user_repo.get_by_username = MagicMock(return_value=None)  # type: ignore
         with pytest.raises(AuthenticationError):
@@ -39,24 +127,46 @@ class TestAuthenticationService:
             service.auth("mock_user", "invalid_password")
 
     def test_refresh(self, service: AuthenticationService) -> None:
-        service._token_service.update = MagicMock(return_value=TEST_TOKEN_ENTITY)  # type: ignore
+        service._user_repo.get_by_refresh_token = MagicMock(  # type: ignore
+            return_value=TEST_USER_ENTITY
+        )
+        service._token_service.rotate = MagicMock(return_value=TEST_TOKEN_ENTITY)  # type: ignore
         actual = service.refresh("token")
 
         assert actual.access_token == "access_token"
         assert actual.refresh_token == "refresh_token"
         assert actual.token_type == "Bearer"
+        args = service._token_service.rotate.call_args.args
+        assert args[:2] == (TEST_USER_ENTITY, "token")
 
     def test_refresh_token_not_found(self, service: AuthenticationService) -> None:
-        service._token_whitelist_repo.get_by_refresh_token = MagicMock(  # type: ignore
-            return_value=None
-        )
+        service._user_repo.get_by_refresh_token = MagicMock(return_value=None)  # type: ignore
         with pytest.raises(AuthenticationError):
             service.refresh("invalid_refresh_token")
 
-    def test_refresh_user_not_found(self, service: AuthenticationService) -> None:
-        service._token_whitelist_repo.get_by_refresh_token = MagicMock(  # type: ignore
-            return_value=TEST_TOKEN_WHITELIST_ENTITY
+    def test_refresh_rotated_concurrently(self, service: AuthenticationService) -> None:
+        service._user_repo.get_by_refresh_token = MagicMock(  # type: ignore
+            return_value=TEST_USER_ENTITY
         )
-        service._user_repo.get_by_id = MagicMock(return_value=None)  # type: ignore
-        with pytest.raises(UserNotFoundError):
-            service.refresh("no_user_refresh_token")
+        service._token_service.rotate = MagicMock(return_value=None)  # type: ignore
+        with pytest.raises(AuthenticationError):
+            service.refresh("rotated_refresh_token")
+
+    @pytest.mark.usefixtures("_setup_user")
+    def test_auth_queries(
+        self, db_service: AuthenticationService, query_counter: QueryCounter
+    ) -> None:
+        actual = db_service.auth("test_service", "password")
+
+        assert actual.token_type == "Bearer"
+        assert query_counter.count == 2
+
+    @pytest.mark.usefixtures("_setup_token_whitelist_for_user")
+    @freeze_time(EXECUTION_DATETIME)
+    def test_refresh_queries(
+        self, db_service: AuthenticationService, query_counter: QueryCounter
+    ) -> None:
+        actual = db_service.refresh(TEST_UUID)
+
+        assert actual.refresh_token != TEST_UUID
+        assert query_counter.count == 3
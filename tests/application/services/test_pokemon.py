@@ -1,12 +1,23 @@
+from collections.abc import Callable
+from typing import Any, cast
+
 import pytest
 from injector import Injector
 
 from pokeapi.application.services.pokemon import PokemonService
+from pokeapi.application.services.pokemon_async import AsyncPokemonService
 from tests.conftest import TEST_POKEMON_ENTITY
 
 
-@pytest.fixture()
-def service(container: Injector) -> PokemonService:
+@pytest.fixture(params=["sync", "async"])
+def service(
+    request: pytest.FixtureRequest,
+    container: Injector,
+    async_runner: Callable[[Any], Any],
+) -> PokemonService:
+    if request.param == "async":
+        return cast(PokemonService, async_runner(container.get(AsyncPokemonService)))
+
     return container.get(PokemonService)
 
 
@@ -48,3 +59,17 @@ class TestPokemonService:
         service._repo.get_all.return_value = []  # type: ignore
 
         assert service.get_all() == []
+
+    def test_get_page(self, service: PokemonService) -> None:
+        service._repo.get_page.return_value = [TEST_POKEMON_ENTITY]  # type: ignore
+        actual = service.get_page(2, after=0)
+
+        assert actual == [TEST_POKEMON_ENTITY]
+        service._repo.get_page.assert_called_with(  # type: ignore
+            2, after=0, before=None, backward=False
+        )
+
+    def test_get_by_ids(self, service: PokemonService) -> None:
+        service._repo.get_by_ids.return_value = [TEST_POKEMON_ENTITY]  # type: ignore
+
+        assert service.get_by_ids([1]) == [TEST_POKEMON_ENTITY]
@@ -1,12 +1,23 @@
+from collections.abc import Callable
+from typing import Any, cast
+
 import pytest
 from injector import Injector
 
 from pokeapi.application.services.pokemon_ability import AbilityService
+from pokeapi.application.services.pokemon_ability_async import AsyncAbilityService
 from tests.conftest import TEST_POKEMON_ABILITY_ENTITY
 
 
-@pytest.fixture()
-def service(container: Injector) -> AbilityService:
+@pytest.fixture(params=["sync", "async"])
+def service(
+    request: pytest.FixtureRequest,
+    container: Injector,
+    async_runner: Callable[[Any], Any],
+) -> AbilityService:
+    if request.param == "async":
+        return cast(AbilityService, async_runner(container.get(AsyncAbilityService)))
+
     return container.get(AbilityService)
 
 
@@ -33,3 +44,8 @@ class TestAbilityService:
         service._repo.get_all.return_value = []  # type: ignore
 
         assert service.get_all() == []
+
+    def test_get_by_ids(self, service: AbilityService) -> None:
+        service._repo.get_by_ids.return_value = [TEST_POKEMON_ABILITY_ENTITY]  # type: ignore
+
+        assert service.get_by_ids([1]) == [TEST_POKEMON_ABILITY_ENTITY]
@@ -0,0 +1,103 @@
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pokeapi.application.services.pokemon_async import AsyncPokemonService
+from pokeapi.application.services.pokemon_async_cached import (
+    AsyncCachedPokemonService,
+)
+from pokeapi.infrastructure.cache.memory import MemoryCache
+from tests.conftest import TEST_POKEMON_ENTITY
+
+OTHER_POKEMON_ENTITY = TEST_POKEMON_ENTITY.model_copy(
+    update={"id_": 2, "national_pokedex_number": 2, "name": "フシギソウ"}
+)
+
+
+@pytest.fixture()
+def inner() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture()
+def service(inner: MagicMock, async_runner: Callable[[Any], Any]) -> Any:
+    inner.mock_add_spec(AsyncPokemonService)
+
+    return async_runner(
+        AsyncCachedPokemonService(inner, MemoryCache(max_size=100, ttl=60))
+    )
+
+
+class TestAsyncCachedPokemonService:
+    @pytest.mark.parametrize(
+        ("name", "arg"),
+        [
+            ("get_by_id", 1),
+            ("get_by_pokedex_number", 1),
+            ("get_by_name", "フシギダネ"),
+        ],
+    )
+    def test_lookup_cached(
+        self, service: Any, inner: MagicMock, name: str, arg: Any
+    ) -> None:
+        getattr(inner, name).return_value = TEST_POKEMON_ENTITY
+
+        assert getattr(service, name)(arg) == TEST_POKEMON_ENTITY
+        assert getattr(service, name)(arg) == TEST_POKEMON_ENTITY
+        getattr(inner, name).assert_called_once_with(arg)
+
+    def test_lookup_not_found_not_cached(self, service: Any, inner: MagicMock) -> None:
+        inner.get_by_id.return_value = None
+
+        assert service.get_by_id(0) is None
+        assert service.get_by_id(0) is None
+        assert inner.get_by_id.call_count == 2
+
+    def test_get_all(self, service: Any, inner: MagicMock) -> None:
+        inner.get_all.return_value = [TEST_POKEMON_ENTITY]
+
+        service.get_all().append(OTHER_POKEMON_ENTITY)
+
+        assert service.get_all() == [TEST_POKEMON_ENTITY]
+        inner.get_all.assert_called_once_with()
+
+    def test_get_by_ids(self, service: Any, inner: MagicMock) -> None:
+        inner.get_by_id.return_value = TEST_POKEMON_ENTITY
+        inner.get_by_ids.return_value = [OTHER_POKEMON_ENTITY]
+        service.get_by_id(1)
+
+        actual = service.get_by_ids([1, 2, 3])
+
+        assert actual == [TEST_POKEMON_ENTITY, OTHER_POKEMON_ENTITY]
+        inner.get_by_ids.assert_called_once_with([2, 3])
+        assert service.get_by_id(2) == OTHER_POKEMON_ENTITY
+        inner.get_by_id.assert_called_once_with(1)
+
+    def test_get_page_not_cached(self, service: Any, inner: MagicMock) -> None:
+        inner.get_page.return_value = [TEST_POKEMON_ENTITY]
+
+        service.get_page(10, after=0)
+        actual = service.get_page(10, after=0)
+
+        assert actual == [TEST_POKEMON_ENTITY]
+        assert inner.get_page.call_count == 2
+
+    def test_invalidate(self, service: Any, inner: MagicMock) -> None:
+        inner.get_by_name.return_value = TEST_POKEMON_ENTITY
+        inner.get_by_id.return_value = OTHER_POKEMON_ENTITY
+        service.get_by_name(TEST_POKEMON_ENTITY.name)
+        service.get_by_id(OTHER_POKEMON_ENTITY.id_)
+
+        service.invalidate(TEST_POKEMON_ENTITY)
+        service.get_by_name(TEST_POKEMON_ENTITY.name)
+        service.get_by_id(OTHER_POKEMON_ENTITY.id_)
+
+        assert inner.get_by_name.call_count == 2
+        assert inner.get_by_id.call_count == 1
+
+        service.invalidate()
+        service.get_by_id(OTHER_POKEMON_ENTITY.id_)
+
+        assert inner.get_by_id.call_count == 2
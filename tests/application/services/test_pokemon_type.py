@@ -1,12 +1,23 @@
+from collections.abc import Callable
+from typing import Any, cast
+
 import pytest
 from injector import Injector
 
 from pokeapi.application.services.pokemon_type import TypeService
+from pokeapi.application.services.pokemon_type_async import AsyncTypeService
 from tests.conftest import TEST_POKEMON_TYPE_ENTITY
 
 
-@pytest.fixture()
-def service(container: Injector) -> TypeService:
+@pytest.fixture(params=["sync", "async"])
+def service(
+    request: pytest.FixtureRequest,
+    container: Injector,
+    async_runner: Callable[[Any], Any],
+) -> TypeService:
+    if request.param == "async":
+        return cast(TypeService, async_runner(container.get(AsyncTypeService)))
+
     return container.get(TypeService)
 
 
@@ -33,3 +44,8 @@ class TestTypeService:
         service._repo.get_all.return_value = []  # type: ignore
 
         assert service.get_all() == []
+
+    def test_get_by_ids(self, service: TypeService) -> None:
+        service._repo.get_by_ids.return_value = [TEST_POKEMON_TYPE_ENTITY]  # type: ignore
+
+        assert service.get_by_ids([1]) == [TEST_POKEMON_TYPE_ENTITY]
@@ -0,0 +1,81 @@
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pokeapi.application.services.pokemon_type_async import AsyncTypeService
+from pokeapi.application.services.pokemon_type_async_cached import (
+    AsyncCachedTypeService,
+)
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.infrastructure.cache.memory import MemoryCache
+from tests.conftest import TEST_POKEMON_TYPE_ENTITY
+
+OTHER_ENTITY = PokemonType(id_=2, name="ほのお")
+
+
+@pytest.fixture()
+def inner() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture()
+def service(inner: MagicMock, async_runner: Callable[[Any], Any]) -> Any:
+    inner.mock_add_spec(AsyncTypeService)
+
+    return async_runner(
+        AsyncCachedTypeService(inner, MemoryCache(max_size=100, ttl=60))
+    )
+
+
+class TestAsyncCachedTypeService:
+    def test_get_by_id(self, service: Any, inner: MagicMock) -> None:
+        inner.get_by_id.return_value = TEST_POKEMON_TYPE_ENTITY
+
+        assert service.get_by_id(1) == TEST_POKEMON_TYPE_ENTITY
+        assert service.get_by_id(1) == TEST_POKEMON_TYPE_ENTITY
+        inner.get_by_id.assert_called_once_with(1)
+
+    def test_get_by_id_not_found(self, service: Any, inner: MagicMock) -> None:
+        inner.get_by_id.return_value = None
+
+        assert service.get_by_id(0) is None
+        assert service.get_by_id(0) is None
+        assert inner.get_by_id.call_count == 2
+
+    def test_get_all(self, service: Any, inner: MagicMock) -> None:
+        inner.get_all.return_value = [TEST_POKEMON_TYPE_ENTITY]
+
+        service.get_all().append(OTHER_ENTITY)
+
+        assert service.get_all() == [TEST_POKEMON_TYPE_ENTITY]
+        inner.get_all.assert_called_once_with()
+
+    def test_get_by_ids(self, service: Any, inner: MagicMock) -> None:
+        inner.get_by_id.return_value = TEST_POKEMON_TYPE_ENTITY
+        inner.get_by_ids.return_value = [OTHER_ENTITY]
+        service.get_by_id(1)
+
+        actual = service.get_by_ids([1, 2])
+
+        assert actual == [TEST_POKEMON_TYPE_ENTITY, OTHER_ENTITY]
+        inner.get_by_ids.assert_called_once_with([2])
+
+    def test_invalidate(self, service: Any, inner: MagicMock) -> None:
+        inner.get_by_id.return_value = TEST_POKEMON_TYPE_ENTITY
+        inner.get_all.return_value = [TEST_POKEMON_TYPE_ENTITY]
+        service.get_by_id(1)
+        service.get_all()
+
+        service.invalidate(TEST_POKEMON_TYPE_ENTITY)
+        service.get_by_id(1)
+        service.get_all()
+
+        assert inner.get_by_id.call_count == 2
+        assert inner.get_all.call_count == 2
+
+        service.invalidate()
+        service.get_by_id(1)
+
+        assert inner.get_by_id.call_count == 3
@@ -1,15 +1,28 @@
+from collections.abc import Generator
 from unittest.mock import MagicMock
 
 import pytest
+from freezegun import freeze_time
 from injector import Injector
+from pytest_mock import MockerFixture
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
 
 from pokeapi.application.services.user import UserService
+from pokeapi.dependencies.settings.config import AppConfig, AppConfigABC
+from pokeapi.domain.entities.user import User
+from pokeapi.domain.services.password import PasswordService
+from pokeapi.domain.services.token import TokenService
 from pokeapi.exceptions.authorization import AuthorizationError
-from pokeapi.exceptions.user import UserNotFoundError
+from pokeapi.infrastructure.database.models import TokenWhitelist as TokenWhitelistModel
+from pokeapi.infrastructure.database.models import User as UserModel
+from pokeapi.infrastructure.database.repositories.user import UserRepository
+from pokeapi.infrastructure.database.revocation import TokenRevocationFilter
 from tests.conftest import (
+    EXECUTION_DATETIME,
     TEST_TOKEN_ENTITY,
-    TEST_TOKEN_WHITELIST_ENTITY,
     TEST_USER_ENTITY,
+    QueryCounter,
 )
 
 
@@ -18,31 +31,130 @@ def service(container: Injector) -> UserService:
     return container.get(UserService)
 
 
+@pytest.fixture()
+def db_service(container: Injector, db_token_service: TokenService) -> UserService:
+    return UserService(
+        container.get(AppConfigABC),  # type: ignore
+        PasswordService(container.get(AppConfigABC)),  # type: ignore
+        db_token_service,
+        container.get(UserRepository),
+        MagicMock(spec=TokenRevocationFilter),
+    )
+
+
+@pytest.fixture()
+def _teardown_for_create(container: Injector) -> Generator:
+    yield
+
+    session = container.get(Session)
+    user_ids = select(UserModel.id_).where(UserModel.username == "test_service")
+    session.execute(
+        delete(TokenWhitelistModel).where(TokenWhitelistModel.user_id.in_(user_ids))
+    )
+    session.execute(delete(UserModel).where(UserModel.username == "test_service"))
+    session.commit()
+
+
 class TestUserService:
     def test_get_by_token(self, service: UserService) -> None:
         service._token_service.extract_payload = MagicMock(  # type: ignore
             return_value={"sub": 1, "jti": "test_jti", "username": "Red"}
         )
-        service._user_repo.get_by_id = MagicMock(return_value=TEST_USER_ENTITY)  # type: ignore
+        service._user_repo.get_by_access_token = MagicMock(  # type: ignore
+            return_value=TEST_USER_ENTITY
+        )
+
+        actual = service.get_by_token("token")
 
-        service.get_by_token("token")
+        assert actual == TEST_USER_ENTITY
+        args = service._user_repo.get_by_access_token.call_args.args
+        assert args[:2] == (1, "test_jti")
 
-    def test_get_by_token_not_found_whitelist(self, service: UserService) -> None:
+    def test_get_by_token_not_found(self, service: UserService) -> None:
         service._token_service.extract_payload = MagicMock(  # type: ignore
             return_value={"sub": 1, "jti": "test_jti", "username": "Red"}
         )
-        service._token_whitelist_repo.get_by_access_token = MagicMock(return_value=None)  # type: ignore
+        service._user_repo.get_by_access_token = MagicMock(return_value=None)  # type: ignore
 
         with pytest.raises(AuthorizationError):
             service.get_by_token("not_found_token")
 
-    def test_get_by_token_not_found_user(self, service: UserService) -> None:
-        service._token_whitelist_repo.get_by_access_token = MagicMock(  # type: ignore
-            return_value=TEST_TOKEN_WHITELIST_ENTITY
+    @pytest.mark.usefixtures("_setup_token_whitelist_for_user")
+    @freeze_time(EXECUTION_DATETIME)
+    def test_get_by_token_single_query(
+        self, db_service: UserService, access_token: str, query_counter: QueryCounter
+    ) -> None:
+        actual = db_service.get_by_token(access_token)
+
+        assert actual.username == "Red"
+        assert query_counter.count == 1
+
+    @pytest.mark.parametrize(
+        ("stateless", "fresh"), [(False, True), (True, False), (False, False)]
+    )
+    def test_get_by_token_whitelist(
+        self,
+        service: UserService,
+        mocker: MockerFixture,
+        stateless: bool,
+        fresh: bool,
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "access_token_stateless",
+            new_callable=mocker.PropertyMock,
+            return_value=stateless,
         )
-        service._user_repo.get_by_id = MagicMock(return_value=None)  # type: ignore
-        with pytest.raises(UserNotFoundError):
-            service.get_by_token("not_found_token")
+        service._revocation_filter.is_fresh = MagicMock(return_value=fresh)  # type: ignore
+        service._token_service.extract_payload = MagicMock(  # type: ignore
+            return_value={"sub": "1", "jti": "test_jti", "username": "Red"}
+        )
+        service._user_repo.get_by_access_token = MagicMock(  # type: ignore
+            return_value=TEST_USER_ENTITY
+        )
+        service._user_repo.get_by_id = MagicMock()  # type: ignore
+
+        assert service.get_by_token("token") == TEST_USER_ENTITY
+        service._user_repo.get_by_id.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("revoked", "user", "expected"),
+        [
+            (False, TEST_USER_ENTITY, None),
+            (True, TEST_USER_ENTITY, AuthorizationError),
+            (False, None, AuthorizationError),
+        ],
+    )
+    def test_get_by_token_stateless(
+        self,
+        service: UserService,
+        mocker: MockerFixture,
+        revoked: bool,
+        user: User | None,
+        expected: type[Exception] | None,
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "access_token_stateless",
+            new_callable=mocker.PropertyMock,
+            return_value=True,
+        )
+        service._revocation_filter.is_fresh = MagicMock(return_value=True)  # type: ignore
+        service._revocation_filter.is_revoked = MagicMock(return_value=revoked)  # type: ignore
+        service._token_service.extract_payload = MagicMock(  # type: ignore
+            return_value={"sub": "1", "jti": "test_jti", "username": "Red"}
+        )
+        service._user_repo.get_by_access_token = MagicMock()  # type: ignore
+        service._user_repo.get_by_id = MagicMock(return_value=user)  # type: ignore
+
+        if expected is None:
+            assert service.get_by_token("token") == TEST_USER_ENTITY
+        else:
+            with pytest.raises(expected):
+                service.get_by_token("token")
+
+        service._revocation_filter.is_revoked.assert_called_once_with("test_jti")
+        service._user_repo.get_by_access_token.assert_not_called()
 
     def test_create(self, service: UserService) -> None:
         service._password_service.hash = MagicMock(return_value="hashed_password")  # type: ignore
@@ -52,3 +164,12 @@ class TestUserService:
         assert actual.access_token == "access_token"
         assert actual.refresh_token == "refresh_token"
         assert actual.token_type == "Bearer"
+
+    @pytest.mark.usefixtures("_teardown_for_create")
+    def test_create_queries(
+        self, db_service: UserService, query_counter: QueryCounter
+    ) -> None:
+        actual = db_service.create("test_service", "password")
+
+        assert actual.token_type == "Bearer"
+        assert query_counter.count == 2
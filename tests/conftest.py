@@ -1,14 +1,18 @@
+import asyncio
 import datetime
-from collections.abc import Generator
+import inspect
+from collections.abc import Callable, Generator
 from dataclasses import dataclass, field
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 from freezegun import freeze_time
 from injector import Binder, Injector, singleton
 from jose import jwt
-from sqlalchemy import delete, insert
-from sqlalchemy.orm import Session
+from sqlalchemy import Engine, create_engine, delete, event, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_scoped_session
+from sqlalchemy.orm import Session, scoped_session
 from starlette.responses import Response
 
 from pokeapi.application.services.authentication import AuthenticationService
@@ -17,8 +21,16 @@ from pokeapi.application.services.pokemon import PokemonService
 from pokeapi.application.services.pokemon_abc import PokemonServiceABC
 from pokeapi.application.services.pokemon_ability import AbilityService
 from pokeapi.application.services.pokemon_ability_abc import AbilityServiceABC
+from pokeapi.application.services.pokemon_ability_async import AsyncAbilityService
+from pokeapi.application.services.pokemon_ability_async_abc import (
+    AsyncAbilityServiceABC,
+)
+from pokeapi.application.services.pokemon_async import AsyncPokemonService
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
 from pokeapi.application.services.pokemon_type import TypeService
 from pokeapi.application.services.pokemon_type_abc import TypeServiceABC
+from pokeapi.application.services.pokemon_type_async import AsyncTypeService
+from pokeapi.application.services.pokemon_type_async_abc import AsyncTypeServiceABC
 from pokeapi.application.services.user import UserService
 from pokeapi.application.services.user_abc import UserServiceABC
 from pokeapi.dependencies.settings.config import AppConfig
@@ -36,16 +48,33 @@ from pokeapi.domain.entities.token_whitelist import (
 from pokeapi.domain.entities.user import User
 from pokeapi.domain.repositories.pokemon import PokemonRepositoryABC
 from pokeapi.domain.repositories.pokemon_ability import AbilityRepositoryABC
+from pokeapi.domain.repositories.pokemon_ability_async import (
+    AsyncAbilityRepositoryABC,
+)
+from pokeapi.domain.repositories.pokemon_async import AsyncPokemonRepositoryABC
 from pokeapi.domain.repositories.pokemon_type import TypeRepositoryABC
+from pokeapi.domain.repositories.pokemon_type_async import AsyncTypeRepositoryABC
+from pokeapi.domain.repositories.token_revocation import TokenRevocationRepositoryABC
 from pokeapi.domain.repositories.token_whitelist import TokenWhitelistRepositoryABC
 from pokeapi.domain.repositories.user import UserRepositoryABC
 from pokeapi.domain.services.jwt import JWTService
 from pokeapi.domain.services.jwt_abc import JWTServiceABC
 from pokeapi.domain.services.password import PasswordService
 from pokeapi.domain.services.password_abc import PasswordServiceABC
+from pokeapi.domain.services.revocation_abc import TokenRevocationFilterABC
 from pokeapi.domain.services.token import TokenService
 from pokeapi.domain.services.token_abc import TokenServiceABC
-from pokeapi.infrastructure.database.db import session_factory
+from pokeapi.infrastructure.database.db import (
+    async_engine_factory,
+    async_scoped_session_factory,
+    async_session_factory,
+    engine_factory,
+    scoped_session_factory,
+    session_factory,
+)
+from pokeapi.infrastructure.database.models.token_revocation import (
+    TokenRevocation as TokenRevocationModel,
+)
 from pokeapi.infrastructure.database.models.token_whitelist import (
     TokenWhitelist as TokenWhitelistModel,
 )
@@ -53,11 +82,26 @@ from pokeapi.infrastructure.database.repositories.pokemon import PokemonReposito
 from pokeapi.infrastructure.database.repositories.pokemon_ability import (
     AbilityRepository,
 )
+from pokeapi.infrastructure.database.repositories.pokemon_ability_async import (
+    AsyncAbilityRepository,
+)
+from pokeapi.infrastructure.database.repositories.pokemon_async import (
+    AsyncPokemonRepository,
+)
 from pokeapi.infrastructure.database.repositories.pokemon_type import TypeRepository
+from pokeapi.infrastructure.database.repositories.pokemon_type_async import (
+    AsyncTypeRepository,
+)
+from pokeapi.infrastructure.database.repositories.token_revocation import (
+    TokenRevocationRepository,
+)
 from pokeapi.infrastructure.database.repositories.token_whitelist import (
     TokenWhitelistRepository,
 )
 from pokeapi.infrastructure.database.repositories.user import UserRepository
+from pokeapi.infrastructure.database.revocation import TokenRevocationFilter
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+from pokeapi.presentation.dataloaders import create_dataloaders
 from pokeapi.presentation.schemas.user import UserInput
 
 EXECUTION_DATETIME = datetime.datetime(2000, 1, 1, 0, 10, 0)
@@ -130,6 +174,12 @@ TEST_TOKEN_WHITELIST_ENTITY = TokenWhitelistEntity(
     updated_at=ISSUE_DATETIME,
 )
 TEST_USER_INPUT = UserInput(username="Red", password="password")
+TEST_SNAPSHOT_POKEMON_ENTITIES = [
+    TEST_POKEMON_ENTITY.model_copy(
+        update={"id_": id_, "national_pokedex_number": id_, "name": f"Pokémon {id_}"}
+    )
+    for id_ in (5, 4, 3, 2)
+] + [TEST_POKEMON_ENTITY]
 
 
 @dataclass
@@ -142,10 +192,54 @@ class MockInfo:
     context: dict
 
 
+@dataclass
+class QueryCounter:
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@dataclass
+class AsyncRunner:
+    """Expose the sync interface of an async object, so that tests run against both."""
+
+    target: Any
+    loop: asyncio.AbstractEventLoop
+    session_local: async_scoped_session[AsyncSession]
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.target, name)
+
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await attr(*args, **kwargs)
+            finally:
+                await self.session_local.remove()
+
+        def run(*args: Any, **kwargs: Any) -> Any:
+            return self.loop.run_until_complete(call(*args, **kwargs))
+
+        return run
+
+
 @pytest.fixture(scope="session")
 def container() -> Injector:
     def configure(binder: Binder) -> None:
-        binder.bind(Session, to=session_factory, scope=singleton)
+        binder.bind(Engine, to=engine_factory, scope=singleton)
+        binder.bind(scoped_session[Session], to=scoped_session_factory, scope=singleton)
+        binder.bind(Session, to=session_factory)
+        binder.bind(AsyncEngine, to=async_engine_factory, scope=singleton)
+        binder.bind(
+            async_scoped_session[AsyncSession],
+            to=async_scoped_session_factory,
+            scope=singleton,
+        )
+        binder.bind(AsyncSession, to=async_session_factory)
         binder.bind(AppConfigABC, to=AppConfig, scope=singleton)  # type: ignore
 
         # Application Services
@@ -174,6 +268,21 @@ def container() -> Injector:
             to=MagicMock(spec=UserService, autospec=True),
             scope=singleton,
         )
+        binder.bind(
+            AsyncPokemonServiceABC,  # type: ignore
+            to=MagicMock(spec=AsyncPokemonService, autospec=True),
+            scope=singleton,
+        )
+        binder.bind(
+            AsyncAbilityServiceABC,  # type: ignore
+            to=MagicMock(spec=AsyncAbilityService, autospec=True),
+            scope=singleton,
+        )
+        binder.bind(
+            AsyncTypeServiceABC,  # type: ignore
+            to=MagicMock(spec=AsyncTypeService, autospec=True),
+            scope=singleton,
+        )
 
         # Domain Services
         binder.bind(
@@ -191,6 +300,11 @@ def container() -> Injector:
             to=MagicMock(spec=TokenService, autospec=True),
             scope=singleton,
         )
+        binder.bind(
+            TokenRevocationFilterABC,  # type: ignore
+            to=MagicMock(spec=TokenRevocationFilter, autospec=True),
+            scope=singleton,
+        )
 
         # Repositories
         binder.bind(
@@ -213,15 +327,77 @@ def container() -> Injector:
             to=MagicMock(spec=TokenWhitelistRepository, autospec=True),
             scope=singleton,
         )
+        binder.bind(
+            TokenRevocationRepositoryABC,  # type: ignore
+            to=MagicMock(spec=TokenRevocationRepository, autospec=True),
+            scope=singleton,
+        )
         binder.bind(
             UserRepositoryABC,  # type: ignore
             to=MagicMock(spec=UserRepository, autospec=True),
             scope=singleton,
         )
+        binder.bind(
+            AsyncPokemonRepositoryABC,  # type: ignore
+            to=MagicMock(spec=AsyncPokemonRepository, autospec=True),
+            scope=singleton,
+        )
+        binder.bind(
+            AsyncAbilityRepositoryABC,  # type: ignore
+            to=MagicMock(spec=AsyncAbilityRepository, autospec=True),
+            scope=singleton,
+        )
+        binder.bind(
+            AsyncTypeRepositoryABC,  # type: ignore
+            to=MagicMock(spec=AsyncTypeRepository, autospec=True),
+            scope=singleton,
+        )
 
     return Injector(configure)
 
 
+@pytest.fixture(scope="session")
+def async_loop(container: Injector) -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+
+    yield loop
+
+    loop.run_until_complete(container.get(AsyncEngine).dispose())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def async_runner(
+    container: Injector, async_loop: asyncio.AbstractEventLoop
+) -> Callable[[Any], Any]:
+    session_local = container.get(async_scoped_session[AsyncSession])
+
+    return lambda target: AsyncRunner(target, async_loop, session_local)
+
+
+@pytest.fixture()
+def snapshot_store() -> PokedexSnapshotStore:
+    pokemon_repo = MagicMock(spec=PokemonRepository)
+    pokemon_repo.get_all.return_value = TEST_SNAPSHOT_POKEMON_ENTITIES
+    type_repo = MagicMock(spec=TypeRepository)
+    type_repo.get_all.return_value = [
+        PokemonType(id_=2, name="ほのお"),
+        TEST_POKEMON_TYPE_ENTITY,
+    ]
+    ability_repo = MagicMock(spec=AbilityRepository)
+    ability_repo.get_all.return_value = [
+        PokemonAbility(id_=2, name="かそく"),
+        TEST_POKEMON_ABILITY_ENTITY,
+    ]
+
+    return PokedexSnapshotStore(
+        pokemon_repo=pokemon_repo,
+        type_repo=type_repo,
+        ability_repo=ability_repo,
+        session_local=scoped_session_factory(create_engine("sqlite://")),
+    )
+
+
 @pytest.fixture(scope="session")
 @freeze_time(ISSUE_DATETIME)
 def access_token(container: Injector) -> str:
@@ -287,6 +463,18 @@ def mock_info(container: Injector) -> MockInfo:
     )
 
 
+@pytest.fixture()
+def mock_loader_info(container: Injector) -> MockInfo:
+    return MockInfo(
+        context={
+            "container": container,
+            "dataloaders": create_dataloaders(container),
+            "request": MockRequest(),
+            "response": Response(),
+        }
+    )
+
+
 @pytest.fixture(scope="session")
 def mock_access_info(container: Injector, mock_access_request: MockRequest) -> MockInfo:
     return MockInfo(
@@ -311,6 +499,35 @@ def mock_refresh_info(
     )
 
 
+@pytest.fixture()
+def query_counter(container: Injector) -> Generator[QueryCounter, None, None]:
+    engines = [container.get(Engine), container.get(AsyncEngine).sync_engine]
+    counter = QueryCounter()
+
+    def before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        counter.statements.append(statement)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    yield counter
+
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+def db_token_service(container: Injector) -> TokenService:
+    """A token service signing real tokens into the database whitelist."""
+    config = container.get(AppConfigABC)  # type: ignore
+
+    return TokenService(
+        config, JWTService(config), container.get(TokenWhitelistRepository)
+    )
+
+
 @pytest.fixture()
 def _setup_token_whitelist_for_user(
     container: Injector,
@@ -337,4 +554,9 @@ def _setup_token_whitelist_for_user(
             TokenWhitelistModel.id_ == record.inserted_primary_key[0]
         )
     )
+    session.execute(
+        delete(TokenRevocationModel).where(
+            TokenRevocationModel.access_token == TEST_UUID
+        )
+    )
     session.commit()
@@ -1,9 +1,16 @@
 import pytest
 from injector import Injector
+from pytest_mock import MockerFixture
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from pokeapi.application.services.pokemon import PokemonService
+from pokeapi.application.services.pokemon_abc import PokemonServiceABC
+from pokeapi.application.services.pokemon_async import AsyncPokemonService
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
+from pokeapi.application.services.pokemon_async_cached import (
+    AsyncCachedPokemonService,
+)
 from pokeapi.dependencies.di.application import ApplicationServiceModule
 from pokeapi.dependencies.di.config import ConfigModule
 from pokeapi.dependencies.di.database import DatabaseModule
@@ -11,9 +18,24 @@ from pokeapi.dependencies.di.domain import DomainServiceModule
 from pokeapi.dependencies.di.repository import RepositoryModule
 from pokeapi.dependencies.settings import AppConfig
 from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
+from pokeapi.domain.repositories.pokemon import PokemonRepositoryABC
+from pokeapi.domain.repositories.pokemon_async import AsyncPokemonRepositoryABC
 from pokeapi.domain.services.password import PasswordService
+from pokeapi.domain.services.password_abc import PasswordServiceABC
+from pokeapi.domain.services.password_pool import ProcessPoolPasswordService
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.infrastructure.blocking.repositories.pokemon import (
+    BlockingPokemonRepository,
+)
+from pokeapi.infrastructure.cache.caches import ServiceCaches
 from pokeapi.infrastructure.database.models import Pokemon as PokemonModel
 from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
+from pokeapi.infrastructure.database.repositories.pokemon_async import (
+    AsyncPokemonRepository,
+)
+from pokeapi.infrastructure.snapshot.repositories.pokemon import (
+    SnapshotPokemonRepository,
+)
 
 
 class TestDIContainer:
@@ -94,3 +116,105 @@ class TestDIContainer:
         actual = service.hash("password")
 
         assert isinstance(actual, str)
+
+    @pytest.mark.parametrize(
+        ("password_pool_size", "expected"),
+        [(2, ProcessPoolPasswordService), (0, PasswordService)],
+    )
+    def test_di_password_service_pool(
+        self, mocker: MockerFixture, password_pool_size: int, expected: type
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "password_pool_size",
+            new_callable=mocker.PropertyMock,
+            return_value=password_pool_size,
+        )
+        container = Injector([ConfigModule(), DomainServiceModule()])
+
+        assert isinstance(container.get(PasswordServiceABC), expected)  # type: ignore[type-abstract]
+
+    @pytest.mark.parametrize(
+        ("pokedex_snapshot", "expected"),
+        [(True, SnapshotPokemonRepository), (False, PokemonRepository)],
+    )
+    def test_di_master_data_repo(
+        self, mocker: MockerFixture, pokedex_snapshot: bool, expected: type
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "pokedex_snapshot",
+            new_callable=mocker.PropertyMock,
+            return_value=pokedex_snapshot,
+        )
+        container = Injector([ConfigModule(), DatabaseModule(), RepositoryModule()])
+
+        assert isinstance(container.get(PokemonRepositoryABC), expected)  # type: ignore[type-abstract]
+
+    @pytest.mark.parametrize(
+        ("db_async", "pokedex_snapshot", "expected", "offloaded"),
+        [
+            (True, False, AsyncPokemonRepository, False),
+            (True, True, BlockingPokemonRepository, False),
+            (False, False, BlockingPokemonRepository, True),
+        ],
+    )
+    def test_di_async_master_data_repo(
+        self,
+        mocker: MockerFixture,
+        db_async: bool,
+        pokedex_snapshot: bool,
+        expected: type,
+        offloaded: bool,
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "db_async",
+            new_callable=mocker.PropertyMock,
+            return_value=db_async,
+        )
+        mocker.patch.object(
+            AppConfig,
+            "pokedex_snapshot",
+            new_callable=mocker.PropertyMock,
+            return_value=pokedex_snapshot,
+        )
+        container = Injector([ConfigModule(), DatabaseModule(), RepositoryModule()])
+        repo = container.get(AsyncPokemonRepositoryABC)  # type: ignore[type-abstract]
+
+        assert isinstance(repo, expected)
+
+        if isinstance(repo, BlockingPokemonRepository):
+            assert (repo._executor is container.get(BlockingExecutor)) is offloaded
+
+    @pytest.mark.parametrize(
+        ("cache_pokemon", "expected"),
+        [
+            (True, AsyncCachedPokemonService),
+            (False, AsyncPokemonService),
+        ],
+    )
+    def test_di_cached_service(
+        self, mocker: MockerFixture, cache_pokemon: bool, expected: type
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "cache_pokemon",
+            new_callable=mocker.PropertyMock,
+            return_value=cache_pokemon,
+        )
+        container = Injector(
+            [
+                ConfigModule(),
+                DatabaseModule(),
+                RepositoryModule(),
+                ApplicationServiceModule(),
+            ]
+        )
+        service = container.get(AsyncPokemonServiceABC)  # type: ignore[type-abstract]
+
+        assert isinstance(service, expected)
+        assert isinstance(container.get(PokemonServiceABC), PokemonService)  # type: ignore[type-abstract]
+
+        if isinstance(service, AsyncCachedPokemonService):
+            assert service._cache is container.get(ServiceCaches).pokemon
@@ -75,9 +75,336 @@ class TestAppConfig:
         with pytest.raises(UnsetEnvironmentVariableError):
             _ = config.database_url
 
+    @pytest.mark.parametrize(
+        ("name", "value", "expected"),
+        [
+            ("db_pool_size", "20", 20),
+            ("db_max_overflow", "0", 0),
+            ("db_pool_timeout", "2.5", 2.5),
+            ("db_pool_recycle", "3600", 3600),
+            ("db_pool_pre_ping", "True", True),
+            ("db_pool_pre_ping", "false", False),
+        ],
+    )
+    def test_db_pool(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        name: str,
+        value: str,
+        expected: int | float | bool,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert getattr(config, name) == expected
+
+    def test_db_pool_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.db_pool_size == 5
+        assert config.db_max_overflow == 10
+        assert config.db_pool_timeout == 30
+        assert config.db_pool_recycle == -1
+        assert config.db_pool_pre_ping is False
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("True", True), ("false", False), (None, False)]
+    )
+    def test_db_async(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        value: str | None,
+        expected: bool,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert config.db_async is expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("True", True), ("false", False), (None, False)]
+    )
+    def test_pokedex_snapshot(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        value: str | None,
+        expected: bool,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert config.pokedex_snapshot is expected
+
+    @pytest.mark.parametrize("name", ["cache_pokemon", "cache_type", "cache_ability"])
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("True", True), ("false", False), (None, False)]
+    )
+    def test_cache_services(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        name: str,
+        value: str | None,
+        expected: bool,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert getattr(config, name) is expected
+
+    @pytest.mark.parametrize(
+        ("name", "value", "expected"),
+        [
+            ("cache_max_size", "100", 100),
+            ("cache_ttl", "0.5", 0.5),
+            ("cache_version_interval", "0.5", 0.5),
+            ("cache_breaker_interval", "0.5", 0.5),
+        ],
+    )
+    def test_cache_bounds(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        name: str,
+        value: str,
+        expected: int | float,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert getattr(config, name) == expected
+
+    def test_cache_bounds_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.cache_max_size == 10000
+        assert config.cache_ttl == 300
+        assert config.cache_url is None
+        assert config.cache_version_interval == 1
+        assert config.cache_breaker_interval == 5
+
+    @pytest.mark.parametrize(
+        "value", ["redis://redis:6379/0", "unix:///run/redis.sock", "memory://"]
+    )
+    def test_cache_url(
+        self, config: AppConfig, mocker: MockerFixture, value: str
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert config.cache_url == value
+
+    def test_cache_url_empty(self, config: AppConfig, mocker: MockerFixture) -> None:
+        mocker.patch("os.getenv", return_value="")
+
+        assert config.cache_url is None
+
+    def test_cache_url_with_invalid_value(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("os.getenv", return_value="memcached://cache:11211")
+
+        with pytest.raises(InvalidEnvironmentValueError):
+            _ = config.cache_url
+
+    @pytest.mark.parametrize("name", ["response_cache", "response_cache_gzip"])
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("True", True), ("false", False), (None, False)]
+    )
+    def test_response_cache_flags(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        name: str,
+        value: str | None,
+        expected: bool,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert getattr(config, name) is expected
+
+    @pytest.mark.parametrize(
+        ("name", "value", "expected"),
+        [("response_cache_max_size", "100", 100), ("response_cache_ttl", "0.5", 0.5)],
+    )
+    def test_response_cache_bounds(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        name: str,
+        value: str,
+        expected: int | float,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert getattr(config, name) == expected
+
+    def test_response_cache_bounds_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.response_cache_max_size == 1000
+        assert config.response_cache_ttl == 60
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("True", True), ("false", False), (None, False)]
+    )
+    def test_persisted_queries(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        value: str | None,
+        expected: bool,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert config.persisted_queries is expected
+
+    def test_persisted_query_max_size(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("os.getenv", return_value="100")
+
+        assert config.persisted_query_max_size == 100
+
+    def test_persisted_query_max_size_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.persisted_query_max_size == 1000
+
+    def test_document_cache_max_size(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("os.getenv", return_value="100")
+
+        assert config.document_cache_max_size == 100
+
+    def test_document_cache_max_size_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.document_cache_max_size == 1000
+
+    def test_blocking_pool_size(self, config: AppConfig, mocker: MockerFixture) -> None:
+        mocker.patch("os.getenv", return_value="4")
+
+        assert config.blocking_pool_size == 4
+
+    def test_blocking_pool_size_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.blocking_pool_size == 10
+
+    @pytest.mark.parametrize(
+        ("name", "value", "expected"),
+        [
+            ("password_pool_size", "4", 4),
+            ("password_pool_max_pending", "8", 8),
+            ("password_pool_timeout", "0.1", 0.1),
+            ("password_time_cost", "2", 2),
+            ("password_memory_cost", "19456", 19456),
+            ("password_parallelism", "1", 1),
+        ],
+    )
+    def test_password_pool(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        name: str,
+        value: str,
+        expected: int | float,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert getattr(config, name) == expected
+
+    def test_password_pool_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.password_pool_size == 0
+        assert config.password_pool_max_pending == 16
+        assert config.password_pool_timeout == 0.5
+        assert config.password_time_cost == 3
+        assert config.password_memory_cost == 65536
+        assert config.password_parallelism == 4
+
+    @pytest.mark.parametrize(
+        ("name", "value", "expected"),
+        [("token_sweep_interval", "0.5", 0.5), ("token_sweep_batch_size", "10", 10)],
+    )
+    def test_token_sweep(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        name: str,
+        value: str,
+        expected: int | float,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert getattr(config, name) == expected
+
+    def test_token_sweep_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.token_sweep_interval == 300
+        assert config.token_sweep_batch_size == 1000
+
+    def test_jwt_cache_size(self, config: AppConfig, mocker: MockerFixture) -> None:
+        mocker.patch("os.getenv", return_value="10")
+
+        assert config.jwt_cache_size == 10
+
+    def test_jwt_cache_size_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.jwt_cache_size == 10000
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("True", True), ("false", False), (None, False)]
+    )
+    def test_access_token_stateless(
+        self,
+        config: AppConfig,
+        mocker: MockerFixture,
+        value: str | None,
+        expected: bool,
+    ) -> None:
+        mocker.patch("os.getenv", return_value=value)
+
+        assert config.access_token_stateless is expected
+
+    def test_token_revocation_interval(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("os.getenv", return_value="0.5")
+
+        assert config.token_revocation_interval == 0.5
+
+    def test_token_revocation_interval_with_default(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(os.environ, clear=True)
+
+        assert config.token_revocation_interval == 5
+
     def test_load_private_key_with_error(
         self, config: AppConfig, mocker: MockerFixture
     ) -> None:
+        config._load_private_key.cache_clear()
         mocker.patch("os.getenv", return_value=None)
 
         with pytest.raises(UnsetEnvironmentVariableError):
@@ -97,6 +424,7 @@ class TestAppConfig:
     def test_load_public_key_with_error(
         self, config: AppConfig, mocker: MockerFixture
     ) -> None:
+        config._load_public_key.cache_clear()
         mocker.patch("os.getenv", return_value=None)
 
         with pytest.raises(UnsetEnvironmentVariableError):
@@ -113,10 +441,21 @@ class TestAppConfig:
     def test_public_key(self, config: AppConfig) -> None:
         assert isinstance(config.public_key, str)
 
-    def test_jwt_algorithm(self, config: AppConfig, mocker: MockerFixture) -> None:
-        mocker.patch("os.getenv", return_value="test_algorithm")
+    @pytest.mark.parametrize("algorithm", ["RS256", "ES256", "EdDSA"])
+    def test_jwt_algorithm(
+        self, config: AppConfig, mocker: MockerFixture, algorithm: str
+    ) -> None:
+        mocker.patch("os.getenv", return_value=algorithm)
+
+        assert config.jwt_algorithm == algorithm
+
+    def test_jwt_algorithm_with_invalid_value(
+        self, config: AppConfig, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("os.getenv", return_value="HS256")
 
-        assert config.jwt_algorithm == "test_algorithm"
+        with pytest.raises(InvalidEnvironmentValueError):
+            _ = config.jwt_algorithm
 
     def test_jwt_algorithm_with_error(
         self, config: AppConfig, mocker: MockerFixture
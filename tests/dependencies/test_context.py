@@ -1,6 +1,19 @@
+import asyncio
+
+import pytest
 from injector import Injector
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.orm import Session, scoped_session
 
-from pokeapi.dependencies.context import get_context
+from pokeapi.application.services.pokemon import PokemonService
+from pokeapi.dependencies.context import (
+    get_context,
+    get_root_container,
+    get_unit_of_work,
+)
+from pokeapi.dependencies.settings import AppConfig, AppConfigABC
+from pokeapi.presentation.dataloaders import DataLoaders
 
 
 def test_get_context() -> None:
@@ -10,3 +23,47 @@ def test_get_context() -> None:
 
     assert container is not None
     assert isinstance(container, Injector)
+
+
+def test_get_root_container() -> None:
+    assert get_root_container() is get_root_container()
+
+
+def test_get_context_shares_root_singletons() -> None:
+    container_1 = get_context()["container"]
+    container_2 = get_context()["container"]
+
+    assert container_1 is not container_2
+    assert container_1.parent is get_root_container()
+    assert container_1.get(AppConfigABC) is container_2.get(AppConfigABC)
+    assert container_1.get(PokemonService) is container_2.get(PokemonService)
+
+
+def test_get_context_creates_dataloaders_per_request() -> None:
+    dataloaders_1 = get_context()["dataloaders"]
+    dataloaders_2 = get_context()["dataloaders"]
+
+    assert isinstance(dataloaders_1, DataLoaders)
+    assert dataloaders_1 is not dataloaders_2
+
+
+@pytest.mark.parametrize("db_async", [True, False])
+def test_get_unit_of_work(mocker: MockerFixture, db_async: bool) -> None:
+    mocker.patch.object(
+        AppConfig, "db_async", new_callable=mocker.PropertyMock, return_value=db_async
+    )
+    container = get_root_container()
+    session_local = container.get(scoped_session[Session])
+    async_session_local = container.get(async_scoped_session[AsyncSession])
+
+    async def run() -> None:
+        async for _ in get_unit_of_work():
+            session_local()
+
+            if db_async:
+                async_session_local()
+
+    asyncio.run(run())
+
+    assert not session_local.registry.has()
+    assert async_session_local.registry.registry == {}
@@ -16,9 +16,9 @@ from pokeapi.exceptions.token import TokenVerificationError
 from tests.conftest import EXECUTION_DATETIME, ISSUE_DATETIME, TEST_UUID
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture()
 def service(container: Injector) -> JWTService:
-    return container.get(JWTService)
+    return JWTService(container.get(AppConfig))
 
 
 @pytest.fixture(scope="module")
@@ -195,3 +195,93 @@ class TestJWTServices:
         mocker.patch("jose.jwt.decode", return_value=1)
         with pytest.raises(TypeError):
             service.decode_token(access_token)
+
+    @freeze_time(EXECUTION_DATETIME)
+    def test_decode_token_cached(
+        self, service: JWTService, access_token: str, mocker: MockerFixture
+    ) -> None:
+        decode = mocker.spy(jwt, "decode")
+        expected = service.decode_token(access_token)
+        actual = service.decode_token(access_token)
+        actual["sub"] = "2"
+
+        assert actual["jti"] == TEST_UUID
+        assert service.decode_token(access_token) == expected
+        assert decode.call_count == 1
+        assert service.snapshot() == {
+            "size": 1,
+            "max_size": 10000,
+            "hits": 2,
+            "misses": 1,
+        }
+
+    def test_decode_token_cached_expired(
+        self, service: JWTService, exp: datetime.datetime, access_token: str
+    ) -> None:
+        with freeze_time(EXECUTION_DATETIME):
+            service.decode_token(access_token)
+
+        with freeze_time(exp + datetime.timedelta(seconds=1)), pytest.raises(
+            TokenVerificationError
+        ):
+            service.decode_token(access_token)
+
+        assert service.snapshot()["size"] == 0
+        assert service.snapshot()["misses"] == 2
+
+    @freeze_time(EXECUTION_DATETIME)
+    def test_decode_token_cache_eviction(
+        self,
+        service: JWTService,
+        exp: datetime.datetime,
+        access_token: str,
+        mocker: MockerFixture,
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "jwt_cache_size",
+            new_callable=mocker.PropertyMock,
+            return_value=2,
+        )
+        tokens = [
+            service.create_token(
+                User(id_=i, username="Red", password="password"), exp, TEST_UUID
+            )
+            for i in range(3)
+        ]
+
+        for token in [tokens[0], tokens[1], tokens[0], tokens[2]]:
+            service.decode_token(token)
+
+        service.decode_token(tokens[0])
+
+        assert service.snapshot()["size"] == 2
+        assert service.snapshot()["hits"] == 2
+        assert service.snapshot()["misses"] == 3
+
+    @freeze_time(EXECUTION_DATETIME)
+    def test_decode_token_cache_disabled(
+        self, service: JWTService, access_token: str, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "jwt_cache_size",
+            new_callable=mocker.PropertyMock,
+            return_value=0,
+        )
+        service.decode_token(access_token)
+        service.decode_token(access_token)
+
+        assert service.snapshot()["size"] == 0
+        assert service.snapshot()["misses"] == 2
+
+    @freeze_time(EXECUTION_DATETIME)
+    def test_decode_invalid_not_cached(
+        self, service: JWTService, access_token_invalid_signature: str
+    ) -> None:
+        for _ in range(2):
+            with pytest.raises(TokenVerificationError):
+                service.decode_token(access_token_invalid_signature)
+
+        assert service.snapshot()["size"] == 0
+        assert service.snapshot()["misses"] == 2
@@ -0,0 +1,123 @@
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+from freezegun import freeze_time
+from jose import jwt
+from jose.exceptions import JWKError
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.entities.user import User
+from pokeapi.domain.services.jwt import JWTService
+from pokeapi.domain.services.jwt_keys import EDDSA, Ed25519Key, construct_key
+from pokeapi.exceptions.token import TokenVerificationError
+from tests.conftest import EXECUTION_DATETIME, TEST_UUID
+
+KEYS: dict[str, PrivateKeyTypes] = {
+    "RS256": rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate(),
+}
+
+
+def private_pem(key: PrivateKeyTypes) -> str:
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+
+
+def public_pem(key: PrivateKeyTypes) -> str:
+    return (
+        key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode("utf-8")
+    )
+
+
+def config_for(algorithm: str) -> MagicMock:
+    return MagicMock(
+        spec=AppConfig,
+        app_domain="http://localhost",
+        jwt_algorithm=algorithm,
+        jwt_cache_size=0,
+        private_key=private_pem(KEYS[algorithm]),
+        public_key=public_pem(KEYS[algorithm]),
+    )
+
+
+class TestJWTAlgorithms:
+    @freeze_time(EXECUTION_DATETIME)
+    @pytest.mark.parametrize("algorithm", list(KEYS))
+    def test_round_trip(self, algorithm: str) -> None:
+        service = JWTService(config_for(algorithm))
+        exp = datetime.datetime.now() + datetime.timedelta(hours=1)
+        user = User(id_=1, username="Red", password="password")
+
+        token = service.create_token(user, exp, TEST_UUID)
+        actual = service.decode_token(token)
+
+        assert jwt.get_unverified_header(token)["alg"] == algorithm
+        assert actual["sub"] == "1"
+        assert actual["jti"] == TEST_UUID
+
+    @freeze_time(EXECUTION_DATETIME)
+    @pytest.mark.parametrize("algorithm", list(KEYS))
+    def test_decode_invalid_signature(self, algorithm: str) -> None:
+        service = JWTService(config_for(algorithm))
+        exp = datetime.datetime.now() + datetime.timedelta(hours=1)
+        user = User(id_=1, username="Red", password="password")
+        header, claims, signature = service.create_token(user, exp, TEST_UUID).split(
+            "."
+        )
+        forged = "A" if signature[0] != "A" else "B"
+
+        with pytest.raises(TokenVerificationError):
+            service.decode_token(f"{header}.{claims}.{forged}{signature[1:]}")
+
+    @freeze_time(EXECUTION_DATETIME)
+    def test_decode_other_algorithm(self) -> None:
+        exp = datetime.datetime.now() + datetime.timedelta(hours=1)
+        user = User(id_=1, username="Red", password="password")
+        token = JWTService(config_for("EdDSA")).create_token(user, exp, TEST_UUID)
+
+        with pytest.raises(TokenVerificationError):
+            JWTService(config_for("ES256")).decode_token(token)
+
+
+class TestEd25519Key:
+    def test_sign_verify(self) -> None:
+        private_key = construct_key(private_pem(KEYS[EDDSA]), EDDSA)
+        public_key = construct_key(public_pem(KEYS[EDDSA]), EDDSA)
+        signature = private_key.sign(b"message")
+
+        assert isinstance(private_key, Ed25519Key)
+        assert public_key.verify(b"message", signature)
+        assert private_key.verify(b"message", signature)
+        assert not public_key.verify(b"other", signature)
+        assert public_key.public_key() is public_key
+
+    def test_sign_with_public_key(self) -> None:
+        public_key = Ed25519Key(public_pem(KEYS[EDDSA]), EDDSA)
+
+        with pytest.raises(JWKError):
+            public_key.sign(b"message")
+
+    @pytest.mark.parametrize(
+        ("key", "algorithm"),
+        [
+            (private_pem(KEYS[EDDSA]), "ES256"),
+            (private_pem(KEYS["ES256"]), EDDSA),
+            ("not a key", EDDSA),
+        ],
+    )
+    def test_invalid_key(self, key: str, algorithm: str) -> None:
+        with pytest.raises(JWKError):
+            Ed25519Key(key, algorithm)
@@ -1,12 +1,24 @@
+from unittest.mock import MagicMock
+
 import pytest
 from passlib.hash import argon2
 
+from pokeapi.dependencies.settings.config import AppConfig
 from pokeapi.domain.services.password import PasswordService
 
 
+def config_for(time_cost: int, memory_cost: int, parallelism: int) -> MagicMock:
+    return MagicMock(
+        spec=AppConfig,
+        password_time_cost=time_cost,
+        password_memory_cost=memory_cost,
+        password_parallelism=parallelism,
+    )
+
+
 @pytest.fixture(scope="module")
 def service() -> PasswordService:
-    return PasswordService()
+    return PasswordService(config_for(3, 65536, 4))
 
 
 @pytest.fixture(scope="module")
@@ -36,3 +48,32 @@ class TestPasswordService:
         actual = service.verify(password, hashed_password)
 
         assert actual is expected
+
+    def test_hash_parameters(self) -> None:
+        service = PasswordService(config_for(2, 1024, 1))
+
+        actual = service.hash("password")
+
+        assert actual.startswith("$argon2id$v=19$m=1024,t=2,p=1$")
+        assert service.verify("password", actual)
+
+    @pytest.mark.parametrize(
+        ("time_cost", "memory_cost", "parallelism", "expected"),
+        [
+            (3, 65536, 4, False),
+            (4, 65536, 4, True),
+            (3, 131072, 4, True),
+            (3, 65536, 2, True),
+        ],
+    )
+    def test_needs_rehash(
+        self,
+        hashed_password: str,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int,
+        expected: bool,
+    ) -> None:
+        service = PasswordService(config_for(time_cost, memory_cost, parallelism))
+
+        assert service.needs_rehash(hashed_password) is expected
@@ -0,0 +1,85 @@
+from collections.abc import Generator
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+from passlib.hash import argon2
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.services.password_pool import ProcessPoolPasswordService
+from pokeapi.exceptions.password import PasswordHashingBusyError
+
+
+@pytest.fixture()
+def config() -> MagicMock:
+    return MagicMock(
+        spec=AppConfig,
+        password_pool_size=1,
+        password_pool_max_pending=1,
+        password_pool_timeout=0.01,
+        password_time_cost=3,
+        password_memory_cost=65536,
+        password_parallelism=4,
+    )
+
+
+@pytest.fixture()
+def service(config: MagicMock) -> Generator[ProcessPoolPasswordService, None, None]:
+    service = ProcessPoolPasswordService(config)
+
+    yield service
+
+    service.dispose()
+
+
+def done(result: object) -> Future:
+    future: Future = Future()
+    future.set_result(result)
+
+    return future
+
+
+class TestProcessPoolPasswordService:
+    def test_hash_and_verify(self, service: ProcessPoolPasswordService) -> None:
+        hashed_password = service.hash("password")
+
+        assert argon2.verify("password", hashed_password)
+        assert service.verify("password", hashed_password) is True
+        assert service.verify("hoge", hashed_password) is False
+        assert service.snapshot() == {
+            "max_workers": 1,
+            "pending": 0,
+            "accepted": 3,
+            "rejected": 0,
+        }
+
+    def test_busy(self, service: ProcessPoolPasswordService) -> None:
+        service._pool = MagicMock()
+        service._pool.submit.return_value = done(True)
+        service._slots.acquire()
+
+        with pytest.raises(PasswordHashingBusyError):
+            service.verify("password", "hashed_password")
+
+        service._slots.release()
+        assert service.verify("password", "hashed_password") is True
+        assert service.snapshot()["rejected"] == 1
+
+    def test_release_on_error(self, service: ProcessPoolPasswordService) -> None:
+        failed: Future = Future()
+        failed.set_exception(ValueError("error"))
+        service._pool = MagicMock()
+        service._pool.submit.side_effect = [failed, done("hashed_password")]
+
+        with pytest.raises(ValueError, match="error"):
+            service.hash("password")
+
+        assert service.hash("password") == "hashed_password"
+        assert service.snapshot()["pending"] == 0
+
+    def test_needs_rehash(self, service: ProcessPoolPasswordService) -> None:
+        outdated = argon2.using(rounds=2).hash("password")
+
+        assert service.needs_rehash(argon2.hash("password")) is False
+        assert service.needs_rehash(outdated) is True
+        assert service.snapshot()["accepted"] == 0
@@ -1,9 +1,11 @@
+import datetime
 from unittest.mock import MagicMock
 
 import pytest
 from injector import Injector
 from pytest_mock import MockerFixture
 
+from pokeapi.dependencies.settings.config import AppConfig
 from pokeapi.domain.services.token import TokenService
 from pokeapi.exceptions.token import TokenVerificationError
 from tests.conftest import TEST_USER_ENTITY
@@ -24,18 +26,42 @@ class TestTokenService:
         assert actual.refresh_token == "test_uuid"
         assert actual.token_type == "Bearer"
 
-    def test_update(self, service: TokenService, mocker: MockerFixture) -> None:
+    @pytest.mark.parametrize("stateless", [True, False])
+    def test_rotate(
+        self, service: TokenService, mocker: MockerFixture, stateless: bool
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "access_token_stateless",
+            new_callable=mocker.PropertyMock,
+            return_value=stateless,
+        )
         mocker.patch("uuid.uuid4", return_value="test_uuid")
         service._jwt_service.create_token = MagicMock(return_value="test_token")  # type: ignore
+        service._whitelist_repo.rotate = MagicMock(return_value=True)  # type: ignore
+        expiration = datetime.datetime.now()
 
-        actual = service.update(TEST_USER_ENTITY, 1)
+        actual = service.rotate(TEST_USER_ENTITY, "refresh_token", expiration)
 
+        assert actual is not None
         assert actual.access_token == "test_token"
         assert actual.refresh_token == "test_uuid"
         assert actual.token_type == "Bearer"
 
-    def test_delete(self, service: TokenService) -> None:
-        service.delete(TEST_USER_ENTITY)
+        token, exp, entity, revoke = service._whitelist_repo.rotate.call_args.args
+        assert (token, exp) == ("refresh_token", expiration)
+        assert revoke is stateless
+        assert entity.access_token == "test_uuid"
+        assert entity.refresh_token == "test_uuid"
+
+    def test_rotate_invalid(self, service: TokenService) -> None:
+        service._whitelist_repo.rotate = MagicMock(return_value=False)  # type: ignore
+
+        actual = service.rotate(
+            TEST_USER_ENTITY, "refresh_token", datetime.datetime.now()
+        )
+
+        assert actual is None
 
     def test_extract_payload(self, service: TokenService) -> None:
         service._jwt_service.decode_token = MagicMock(  # type: ignore
@@ -0,0 +1,100 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.infrastructure.blocking.repositories.pokemon import (
+    BlockingPokemonRepository,
+)
+from pokeapi.infrastructure.database.loading import LoadingStrategy
+from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+from pokeapi.infrastructure.snapshot.repositories.pokemon import (
+    SnapshotPokemonRepository,
+)
+from tests.conftest import TEST_POKEMON_ENTITY
+
+
+@pytest.fixture()
+def source() -> MagicMock:
+    return MagicMock(spec=PokemonRepository)
+
+
+@pytest.fixture()
+def repo(source: MagicMock) -> BlockingPokemonRepository:
+    return BlockingPokemonRepository(source)
+
+
+class TestBlockingPokemonRepository:
+    def test_convert_to_entity(
+        self, repo: BlockingPokemonRepository, source: MagicMock
+    ) -> None:
+        source._convert_to_entity.return_value = TEST_POKEMON_ENTITY
+
+        assert repo._convert_to_entity(MagicMock()) == TEST_POKEMON_ENTITY
+
+    @pytest.mark.parametrize(
+        ("method", "args", "expected_args", "expected_kwargs"),
+        [
+            ("get_by_id", (1,), (1, LoadingStrategy.JOINED), {}),
+            ("get_by_pokedex_number", (1,), (1, LoadingStrategy.JOINED), {}),
+            (
+                "get_by_name",
+                ("フシギダネ",),
+                ("フシギダネ", LoadingStrategy.JOINED),
+                {},
+            ),
+            ("get_all", (), (LoadingStrategy.SELECTIN,), {}),
+            (
+                "get_page",
+                (2,),
+                (2,),
+                {
+                    "after": None,
+                    "before": None,
+                    "backward": False,
+                    "loading": LoadingStrategy.SELECTIN,
+                },
+            ),
+            ("get_by_ids", ([1],), ([1], LoadingStrategy.SELECTIN), {}),
+        ],
+    )
+    def test_delegates(
+        self,
+        repo: BlockingPokemonRepository,
+        source: MagicMock,
+        method: str,
+        args: tuple,
+        expected_args: tuple,
+        expected_kwargs: dict,
+    ) -> None:
+        getattr(source, method).return_value = TEST_POKEMON_ENTITY
+
+        actual = asyncio.run(getattr(repo, method)(*args))
+
+        assert actual == TEST_POKEMON_ENTITY
+        getattr(source, method).assert_called_once_with(
+            *expected_args, **expected_kwargs
+        )
+
+    def test_runs_on_executor(self, source: MagicMock) -> None:
+        executor = MagicMock(spec=BlockingExecutor)
+        executor.run = AsyncMock(return_value=TEST_POKEMON_ENTITY)
+        repo = BlockingPokemonRepository(source, executor)
+
+        assert asyncio.run(repo.get_by_id(1)) == TEST_POKEMON_ENTITY
+        executor.run.assert_awaited_once_with(
+            source.get_by_id, 1, LoadingStrategy.JOINED
+        )
+
+    def test_serves_snapshot(self, snapshot_store: PokedexSnapshotStore) -> None:
+        repo = BlockingPokemonRepository(
+            SnapshotPokemonRepository(snapshot_store, MagicMock())
+        )
+
+        assert asyncio.run(repo.get_by_id(1)) == TEST_POKEMON_ENTITY
+        assert [pokemon.id_ for pokemon in asyncio.run(repo.get_page(2, after=2))] == [
+            3,
+            4,
+        ]
@@ -0,0 +1,70 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.infrastructure.blocking.repositories.pokemon_ability import (
+    BlockingAbilityRepository,
+)
+from pokeapi.infrastructure.database.repositories.pokemon_ability import (
+    AbilityRepository,
+)
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+from pokeapi.infrastructure.snapshot.repositories.pokemon_ability import (
+    SnapshotAbilityRepository,
+)
+from tests.conftest import TEST_POKEMON_ABILITY_ENTITY
+
+
+@pytest.fixture()
+def source() -> MagicMock:
+    return MagicMock(spec=AbilityRepository)
+
+
+@pytest.fixture()
+def repo(source: MagicMock) -> BlockingAbilityRepository:
+    return BlockingAbilityRepository(source)
+
+
+class TestBlockingAbilityRepository:
+    def test_convert_to_entity(
+        self, repo: BlockingAbilityRepository, source: MagicMock
+    ) -> None:
+        source._convert_to_entity.return_value = TEST_POKEMON_ABILITY_ENTITY
+
+        assert repo._convert_to_entity(MagicMock()) == TEST_POKEMON_ABILITY_ENTITY
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [("get_by_id", (1,)), ("get_all", ()), ("get_by_ids", ([1],))],
+    )
+    def test_delegates(
+        self,
+        repo: BlockingAbilityRepository,
+        source: MagicMock,
+        method: str,
+        args: tuple,
+    ) -> None:
+        getattr(source, method).return_value = TEST_POKEMON_ABILITY_ENTITY
+
+        actual = asyncio.run(getattr(repo, method)(*args))
+
+        assert actual == TEST_POKEMON_ABILITY_ENTITY
+        getattr(source, method).assert_called_once_with(*args)
+
+    def test_runs_on_executor(self, source: MagicMock) -> None:
+        executor = MagicMock(spec=BlockingExecutor)
+        executor.run = AsyncMock(return_value=TEST_POKEMON_ABILITY_ENTITY)
+        repo = BlockingAbilityRepository(source, executor)
+
+        assert asyncio.run(repo.get_by_id(1)) == TEST_POKEMON_ABILITY_ENTITY
+        executor.run.assert_awaited_once_with(source.get_by_id, 1)
+
+    def test_serves_snapshot(self, snapshot_store: PokedexSnapshotStore) -> None:
+        repo = BlockingAbilityRepository(
+            SnapshotAbilityRepository(snapshot_store, MagicMock())
+        )
+
+        assert asyncio.run(repo.get_by_id(1)) == TEST_POKEMON_ABILITY_ENTITY
+        assert asyncio.run(repo.get_by_id(0)) is None
@@ -0,0 +1,139 @@
+import asyncio
+import contextvars
+import threading
+from collections.abc import Generator
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import scoped_session
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor, InlineExecutor
+from pokeapi.infrastructure.database.db import _unit_of_work
+
+request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "request_id", default=None
+)
+
+
+@pytest.fixture()
+def session_local() -> MagicMock:
+    return MagicMock(spec=scoped_session)
+
+
+@pytest.fixture()
+def executor(session_local: MagicMock) -> Generator[BlockingExecutor, None, None]:
+    config = MagicMock(spec=AppConfig, blocking_pool_size=2)
+    executor = BlockingExecutor(config, session_local)
+
+    yield executor
+
+    executor.dispose()
+
+
+class TestBlockingExecutor:
+    def test_run(self, executor: BlockingExecutor) -> None:
+        actual = asyncio.run(executor.run(lambda: threading.current_thread().name))
+
+        assert actual.startswith("blocking")
+        assert executor.snapshot()["completed"] == 1
+
+    def test_run_with_error(self, executor: BlockingExecutor) -> None:
+        def fail() -> None:
+            raise ValueError("error")
+
+        with pytest.raises(ValueError, match="error"):
+            asyncio.run(executor.run(fail))
+
+        assert executor.snapshot()["running"] == 0
+        assert executor.snapshot()["completed"] == 1
+
+    def test_run_in_own_unit_of_work(
+        self, executor: BlockingExecutor, session_local: MagicMock
+    ) -> None:
+        async def main() -> tuple[object, object, str | None]:
+            request_id.set("request")
+            token = _unit_of_work.set(object())
+
+            try:
+                scope = await executor.run(_unit_of_work.get)
+                return _unit_of_work.get(), scope, await executor.run(request_id.get)
+            finally:
+                _unit_of_work.reset(token)
+
+        caller_scope, worker_scope, worker_request_id = asyncio.run(main())
+
+        assert worker_scope is not None
+        assert worker_scope is not caller_scope
+        assert worker_request_id == "request"
+        assert session_local.remove.call_count == 2
+
+    def test_bounded(self, executor: BlockingExecutor) -> None:
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def block() -> None:
+            started.release()
+            release.wait()
+
+        async def main() -> dict:
+            tasks = [asyncio.ensure_future(executor.run(block)) for _ in range(5)]
+
+            for _ in range(2):
+                await asyncio.to_thread(started.acquire)
+
+            snapshot = executor.snapshot()
+            release.set()
+            await asyncio.gather(*tasks)
+
+            return snapshot
+
+        saturated = asyncio.run(main())
+        snapshot = executor.snapshot()
+
+        assert saturated["running"] == 2
+        assert saturated["queued"] == 3
+
+        assert snapshot["max_workers"] == 2
+        assert snapshot["queued"] == 0
+        assert snapshot["queued_max"] >= 3
+        assert snapshot["running"] == 0
+        assert snapshot["completed"] == 5
+        assert 0 < snapshot["wait_avg"] <= snapshot["wait_max"]
+
+    def test_cancel_queued(self, executor: BlockingExecutor) -> None:
+        release = threading.Event()
+        calls: list[int] = []
+
+        async def main() -> None:
+            running = [
+                asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)
+            ]
+            queued = asyncio.ensure_future(executor.run(calls.append, 1))
+            await asyncio.sleep(0)
+            queued.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+            release.set()
+            await asyncio.gather(*running)
+
+        asyncio.run(main())
+
+        assert calls == []
+        assert executor.snapshot()["queued"] == 0
+        assert executor.snapshot()["completed"] == 2
+
+    def test_dispose(self, executor: BlockingExecutor) -> None:
+        asyncio.run(executor.run(lambda: None))
+        executor.dispose()
+
+        assert asyncio.run(executor.run(lambda: 1)) == 1
+
+
+class TestInlineExecutor:
+    def test_run(self) -> None:
+        actual = asyncio.run(InlineExecutor().run(threading.current_thread))
+
+        assert actual is threading.current_thread()
@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.cache.caches import (
+    ServiceCaches,
+    create_async_backend,
+    create_backend,
+)
+from pokeapi.infrastructure.cache.memory import MemoryCache
+from pokeapi.infrastructure.cache.memory_backend import MemoryCacheBackend
+from pokeapi.infrastructure.cache.memory_backend_async import AsyncMemoryCacheBackend
+from pokeapi.infrastructure.cache.redis_backend import RedisCacheBackend
+from pokeapi.infrastructure.cache.redis_backend_async import AsyncRedisCacheBackend
+from pokeapi.infrastructure.cache.tiered import TieredCache
+
+
+def config_for(cache_url: str | None) -> MagicMock:
+    return MagicMock(
+        spec=AppConfig,
+        cache_url=cache_url,
+        cache_max_size=10,
+        cache_ttl=60,
+        cache_version_interval=1,
+        cache_breaker_interval=5,
+    )
+
+
+class TestServiceCaches:
+    @pytest.mark.parametrize(
+        ("cache_url", "expected"),
+        [(None, MemoryCache), ("memory://", TieredCache)],
+    )
+    def test_caches(self, cache_url: str | None, expected: type) -> None:
+        caches = ServiceCaches(config_for(cache_url))
+
+        assert isinstance(caches.pokemon, expected)
+        assert isinstance(caches.type_, expected)
+        assert isinstance(caches.ability, expected)
+        assert caches.snapshot()["type"]["size"] == 0
+        asyncio.run(caches.close())
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("memory://", MemoryCacheBackend),
+            ("redis://redis:6379/0", RedisCacheBackend),
+            ("unix:///run/redis.sock", RedisCacheBackend),
+        ],
+    )
+    def test_create_backend(self, url: str, expected: type) -> None:
+        assert isinstance(create_backend(url), expected)
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("memory://", AsyncMemoryCacheBackend),
+            ("redis://redis:6379/0", AsyncRedisCacheBackend),
+        ],
+    )
+    def test_create_async_backend(self, url: str, expected: type) -> None:
+        assert isinstance(create_async_backend(url, create_backend(url)), expected)
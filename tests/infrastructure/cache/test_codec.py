@@ -0,0 +1,27 @@
+import msgpack
+import pytest
+
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.infrastructure.cache.codec import EntityCodec
+from tests.conftest import TEST_POKEMON_ENTITY, TEST_SNAPSHOT_POKEMON_ENTITIES
+
+
+class TestEntityCodec:
+    def test_entity(self) -> None:
+        codec = EntityCodec(Pokemon)
+
+        assert codec.decode(codec.encode(TEST_POKEMON_ENTITY)) == TEST_POKEMON_ENTITY
+
+    def test_entities(self) -> None:
+        codec = EntityCodec(Pokemon)
+
+        actual = codec.decode(codec.encode(TEST_SNAPSHOT_POKEMON_ENTITIES))
+
+        assert actual == TEST_SNAPSHOT_POKEMON_ENTITIES
+
+    @pytest.mark.parametrize(
+        "data", [b"\xc1", msgpack.packb({"id_": 1}), msgpack.packb(1)]
+    )
+    def test_decode_invalid(self, data: bytes) -> None:
+        with pytest.raises(ValueError):  # noqa: PT011
+            EntityCodec(Pokemon).decode(data)
@@ -0,0 +1,105 @@
+import asyncio
+import datetime
+
+from freezegun import freeze_time
+
+from pokeapi.infrastructure.cache.memory import MemoryCache
+from tests.conftest import EXECUTION_DATETIME
+
+
+class TestMemoryCache:
+    def test_get_set(self) -> None:
+        cache = MemoryCache(max_size=10, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("other") is None
+        assert cache.snapshot() == {
+            "size": 1,
+            "max_size": 10,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def test_none_not_cached(self) -> None:
+        cache = MemoryCache(max_size=10, ttl=60)
+        cache.set("key", None)
+
+        assert cache.snapshot()["size"] == 0
+
+    def test_evict_least_recently_used(self) -> None:
+        cache = MemoryCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.snapshot()["evictions"] == 1
+
+    def test_expire(self) -> None:
+        with freeze_time(EXECUTION_DATETIME) as frozen:
+            cache = MemoryCache(max_size=10, ttl=60)
+            cache.set("key", "value")
+            frozen.tick(datetime.timedelta(seconds=59))
+
+            assert cache.get("key") == "value"
+
+            frozen.tick(datetime.timedelta(seconds=1))
+
+            assert cache.get("key") is None
+            assert cache.snapshot()["expirations"] == 1
+
+    def test_no_ttl(self) -> None:
+        with freeze_time(EXECUTION_DATETIME) as frozen:
+            cache = MemoryCache(max_size=10, ttl=0)
+            cache.set("key", "value")
+            frozen.tick(datetime.timedelta(days=365))
+
+            assert cache.get("key") == "value"
+
+    def test_disabled(self) -> None:
+        cache = MemoryCache(max_size=0, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+    def test_delete_clear(self) -> None:
+        cache = MemoryCache(max_size=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        cache.delete("a", "b", "unknown")
+
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+
+        cache.clear()
+
+        assert cache.get("c") is None
+
+    def test_get_many_set_many(self) -> None:
+        cache = MemoryCache(max_size=10, ttl=60)
+        cache.set_many({"a": 1, "b": None})
+
+        assert cache.get_many(["a", "b"]) == [1, None]
+        assert cache.snapshot()["size"] == 1
+
+    def test_async(self) -> None:
+        cache = MemoryCache(max_size=10, ttl=60)
+
+        async def run() -> list:
+            await cache.set_many_async({"a": 1, "b": 2, "c": 3})
+            await cache.delete_async("a")
+            actual = await cache.get_many_async(["a", "b"])
+            await cache.clear_async()
+
+            return actual
+
+        assert asyncio.run(run()) == [None, 2]
+        assert cache.snapshot()["size"] == 0
@@ -0,0 +1,40 @@
+import datetime
+
+from freezegun import freeze_time
+
+from pokeapi.infrastructure.cache.memory_backend import MemoryCacheBackend
+from tests.conftest import EXECUTION_DATETIME
+
+
+class TestMemoryCacheBackend:
+    def test_get_set(self) -> None:
+        backend = MemoryCacheBackend()
+        backend.set_many({"key": b"value"}, 60)
+
+        assert backend.get("key") == b"value"
+        assert backend.get("other") is None
+        assert backend.get_many(["key", "other"]) == [b"value", None]
+
+    def test_expire(self) -> None:
+        with freeze_time(EXECUTION_DATETIME) as frozen:
+            backend = MemoryCacheBackend()
+            backend.set_many({"key": b"value"}, 60)
+            backend.set_many({"forever": b"value"}, 0)
+            frozen.tick(datetime.timedelta(seconds=60))
+
+            assert backend.get("key") is None
+            assert backend.get("forever") == b"value"
+
+    def test_incr(self) -> None:
+        backend = MemoryCacheBackend()
+
+        assert backend.incr("version") == 1
+        assert backend.incr("version") == 2
+        assert backend.get("version") == b"2"
+
+    def test_close(self) -> None:
+        backend = MemoryCacheBackend()
+        backend.set_many({"key": b"value"}, 60)
+        backend.close()
+
+        assert backend.get("key") is None
@@ -0,0 +1,26 @@
+import asyncio
+
+from pokeapi.infrastructure.cache.memory_backend import MemoryCacheBackend
+from pokeapi.infrastructure.cache.memory_backend_async import AsyncMemoryCacheBackend
+
+
+class TestAsyncMemoryCacheBackend:
+    def test_shared_with_sync(self) -> None:
+        backend = MemoryCacheBackend()
+        async_backend = AsyncMemoryCacheBackend(backend)
+
+        async def run() -> list:
+            await async_backend.set_many({"key": b"value"}, 60)
+
+            return [
+                await async_backend.get("key"),
+                await async_backend.get_many(["key", "other"]),
+                await async_backend.incr("version"),
+            ]
+
+        assert asyncio.run(run()) == [b"value", [b"value", None], 1]
+        assert backend.get("version") == b"1"
+
+        asyncio.run(async_backend.close())
+
+        assert backend.get("key") == b"value"
@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+from redis import Redis
+
+from pokeapi.infrastructure.cache.redis_backend import RedisCacheBackend
+
+
+@pytest.fixture()
+def client() -> MagicMock:
+    return MagicMock(spec=Redis)
+
+
+class TestRedisCacheBackend:
+    def test_from_url(self) -> None:
+        backend = RedisCacheBackend.from_url("redis://redis:6379/1")
+        kwargs = backend._client.connection_pool.connection_kwargs
+
+        assert kwargs["host"] == "redis"
+        assert kwargs["db"] == 1
+        assert kwargs["socket_timeout"] == 0.1
+
+    def test_get(self, client: MagicMock) -> None:
+        client.get.return_value = b"value"
+
+        assert RedisCacheBackend(client).get("key") == b"value"
+        client.get.assert_called_once_with("key")
+
+    def test_get_many(self, client: MagicMock) -> None:
+        client.mget.return_value = [b"value", None]
+
+        assert RedisCacheBackend(client).get_many(["key", "other"]) == [b"value", None]
+        client.mget.assert_called_once_with(["key", "other"])
+
+    @pytest.mark.parametrize(("ttl", "px"), [(1.5, 1500), (0, None)])
+    def test_set_many(self, client: MagicMock, ttl: float, px: int | None) -> None:
+        RedisCacheBackend(client).set_many({"key": b"value", "other": b"other"}, ttl)
+
+        pipeline = client.pipeline.return_value
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipeline.set.assert_has_calls(
+            [call("key", b"value", px=px), call("other", b"other", px=px)]
+        )
+        pipeline.execute.assert_called_once_with()
+
+    def test_incr(self, client: MagicMock) -> None:
+        client.incr.return_value = 2
+
+        assert RedisCacheBackend(client).incr("version") == 2
+        client.incr.assert_called_once_with("version")
+
+    def test_close(self, client: MagicMock) -> None:
+        RedisCacheBackend(client).close()
+
+        client.close.assert_called_once_with()
@@ -0,0 +1,70 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+from redis.asyncio import Redis
+
+from pokeapi.infrastructure.cache.redis_backend_async import AsyncRedisCacheBackend
+
+
+@pytest.fixture()
+def client() -> AsyncMock:
+    client = AsyncMock(spec=Redis)
+    # NOTE: The commands return awaitables, without being coroutine functions.
+    client.get = AsyncMock()
+    client.mget = AsyncMock()
+    client.incr = AsyncMock()
+    client.pipeline = MagicMock()
+    client.pipeline.return_value.execute = AsyncMock()
+
+    return client
+
+
+class TestAsyncRedisCacheBackend:
+    def test_from_url(self) -> None:
+        backend = AsyncRedisCacheBackend.from_url("redis://redis:6379/1")
+        kwargs = backend._client.connection_pool.connection_kwargs
+
+        assert kwargs["host"] == "redis"
+        assert kwargs["db"] == 1
+        assert kwargs["socket_timeout"] == 0.1
+
+    def test_get(self, client: AsyncMock) -> None:
+        client.get.return_value = b"value"
+
+        assert asyncio.run(AsyncRedisCacheBackend(client).get("key")) == b"value"
+        client.get.assert_awaited_once_with("key")
+
+    def test_get_many(self, client: AsyncMock) -> None:
+        client.mget.return_value = [b"value", None]
+
+        assert asyncio.run(
+            AsyncRedisCacheBackend(client).get_many(["key", "other"])
+        ) == [b"value", None]
+        client.mget.assert_awaited_once_with(["key", "other"])
+
+    @pytest.mark.parametrize(("ttl", "px"), [(1.5, 1500), (0, None)])
+    def test_set_many(self, client: AsyncMock, ttl: float, px: int | None) -> None:
+        asyncio.run(
+            AsyncRedisCacheBackend(client).set_many(
+                {"key": b"value", "other": b"other"}, ttl
+            )
+        )
+
+        pipeline = client.pipeline.return_value
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipeline.set.assert_has_calls(
+            [call("key", b"value", px=px), call("other", b"other", px=px)]
+        )
+        pipeline.execute.assert_awaited_once_with()
+
+    def test_incr(self, client: AsyncMock) -> None:
+        client.incr.return_value = 2
+
+        assert asyncio.run(AsyncRedisCacheBackend(client).incr("version")) == 2
+        client.incr.assert_awaited_once_with("version")
+
+    def test_close(self, client: AsyncMock) -> None:
+        asyncio.run(AsyncRedisCacheBackend(client).close())
+
+        client.aclose.assert_awaited_once_with()
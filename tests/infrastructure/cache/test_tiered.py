@@ -0,0 +1,232 @@
+import asyncio
+import datetime
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from freezegun import freeze_time
+
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.infrastructure.cache.backend_abc import CacheBackendABC
+from pokeapi.infrastructure.cache.backend_async_abc import AsyncCacheBackendABC
+from pokeapi.infrastructure.cache.codec import EntityCodec
+from pokeapi.infrastructure.cache.memory import MemoryCache
+from pokeapi.infrastructure.cache.memory_backend import MemoryCacheBackend
+from pokeapi.infrastructure.cache.memory_backend_async import AsyncMemoryCacheBackend
+from pokeapi.infrastructure.cache.tiered import TieredCache
+from tests.conftest import (
+    EXECUTION_DATETIME,
+    TEST_POKEMON_ENTITY,
+    TEST_SNAPSHOT_POKEMON_ENTITIES,
+)
+
+
+def worker(
+    backend: CacheBackendABC, async_backend: AsyncCacheBackendABC | None = None
+) -> TieredCache:
+    """Build the cache of a worker sharing the backend."""
+    if async_backend is None:
+        assert isinstance(backend, MemoryCacheBackend)
+        async_backend = AsyncMemoryCacheBackend(backend)
+
+    return TieredCache(
+        "pokemon",
+        MemoryCache(max_size=100, ttl=60),
+        backend,
+        async_backend,
+        EntityCodec(Pokemon),
+        ttl=60,
+        version_interval=1,
+        breaker_interval=5,
+    )
+
+
+def failing_backends() -> tuple[MagicMock, AsyncMock]:
+    """Build the clients of a shared store failing every operation."""
+    backend = MagicMock(spec=CacheBackendABC)
+    backend.get.side_effect = ConnectionError("error")
+    backend.get_many.side_effect = ConnectionError("error")
+    backend.set_many.side_effect = ConnectionError("error")
+    backend.incr.side_effect = ConnectionError("error")
+    async_backend = AsyncMock(spec=AsyncCacheBackendABC)
+    async_backend.get.side_effect = ConnectionError("error")
+    async_backend.get_many.side_effect = ConnectionError("error")
+    async_backend.set_many.side_effect = ConnectionError("error")
+    async_backend.incr.side_effect = ConnectionError("error")
+
+    return backend, async_backend
+
+
+@pytest.fixture()
+def backend() -> MemoryCacheBackend:
+    return MemoryCacheBackend()
+
+
+class TestTieredCache:
+    def test_shared_between_workers(self, backend: MemoryCacheBackend) -> None:
+        worker_1 = worker(backend)
+        worker_2 = worker(backend)
+        worker_1.set("pokemon:id:1", TEST_POKEMON_ENTITY)
+        worker_1.set("pokemon:all:None", TEST_SNAPSHOT_POKEMON_ENTITIES)
+
+        assert worker_2.get("pokemon:id:1") == TEST_POKEMON_ENTITY
+        assert worker_2.get("pokemon:id:1") == TEST_POKEMON_ENTITY
+        assert worker_2.get("pokemon:all:None") == TEST_SNAPSHOT_POKEMON_ENTITIES
+        assert worker_2.get("pokemon:id:2") is None
+        snapshot = worker_2.snapshot()
+        assert snapshot["hits"] == 1
+        assert snapshot["shared_hits"] == 2
+        assert snapshot["shared_misses"] == 1
+        assert snapshot["version"] == 0
+
+    def test_keys_versioned(self, backend: MemoryCacheBackend) -> None:
+        cache = worker(backend)
+        cache.set("pokemon:id:1", TEST_POKEMON_ENTITY)
+
+        assert backend.get("pokeapi:pokemon:1:0:pokemon:id:1") is not None
+
+    def test_invalidation_reaches_workers(self, backend: MemoryCacheBackend) -> None:
+        with freeze_time(EXECUTION_DATETIME) as frozen:
+            worker_1 = worker(backend)
+            worker_2 = worker(backend)
+            worker_1.set("pokemon:id:1", TEST_POKEMON_ENTITY)
+            worker_2.get("pokemon:id:1")
+
+            worker_1.delete("pokemon:id:1")
+
+            assert worker_1.get("pokemon:id:1") is None
+            assert worker_2.get("pokemon:id:1") == TEST_POKEMON_ENTITY
+
+            frozen.tick(datetime.timedelta(seconds=1))
+
+            assert worker_2.get("pokemon:id:1") is None
+            assert worker_2.snapshot()["version"] == 1
+
+    def test_get_many_single_round_trip(self, backend: MemoryCacheBackend) -> None:
+        worker(backend).set_many(
+            {"pokemon:id:1": TEST_POKEMON_ENTITY, "pokemon:id:2": None}
+        )
+        shared = MagicMock(spec=CacheBackendABC, wraps=backend)
+        cache = worker(shared, AsyncMemoryCacheBackend(backend))
+
+        assert cache.get_many(["pokemon:id:1", "pokemon:id:2"]) == [
+            TEST_POKEMON_ENTITY,
+            None,
+        ]
+        assert cache.get_many(["pokemon:id:1"]) == [TEST_POKEMON_ENTITY]
+        shared.get_many.assert_called_once_with(
+            ["pokeapi:pokemon:1:0:pokemon:id:1", "pokeapi:pokemon:1:0:pokemon:id:2"]
+        )
+
+    def test_async(self, backend: MemoryCacheBackend) -> None:
+        worker_1 = worker(backend)
+        worker_2 = worker(backend)
+
+        async def run() -> list:
+            await worker_1.set_many_async({"pokemon:id:1": TEST_POKEMON_ENTITY})
+
+            return await worker_2.get_many_async(["pokemon:id:1", "pokemon:id:2"])
+
+        assert asyncio.run(run()) == [TEST_POKEMON_ENTITY, None]
+        assert worker_2.snapshot()["shared_hits"] == 1
+
+    def test_invalidation_async(self, backend: MemoryCacheBackend) -> None:
+        with freeze_time(EXECUTION_DATETIME) as frozen:
+            worker_1 = worker(backend)
+            worker_2 = worker(backend)
+            worker_1.set("pokemon:id:1", TEST_POKEMON_ENTITY)
+            worker_2.get("pokemon:id:1")
+
+            asyncio.run(worker_1.delete_async("pokemon:id:1"))
+
+            assert worker_1.get("pokemon:id:1") is None
+            assert worker_1.snapshot()["version"] == 1
+
+            frozen.tick(datetime.timedelta(seconds=1))
+
+            assert worker_2.get("pokemon:id:1") is None
+
+    def test_invalidation_async_failure(self, backend: MemoryCacheBackend) -> None:
+        backend_mock = MagicMock(spec=CacheBackendABC, wraps=backend)
+        _, async_backend = failing_backends()
+        cache = worker(backend_mock, async_backend)
+        cache.set("pokemon:id:1", TEST_POKEMON_ENTITY)
+
+        asyncio.run(cache.clear_async())
+
+        backend_mock.incr.assert_not_called()
+        async_backend.incr.assert_awaited_once_with("pokeapi:pokemon:version")
+        assert cache.snapshot()["errors"] == 1
+        assert cache.snapshot()["size"] == 0
+
+    def test_backend_failure(self) -> None:
+        cache = worker(*failing_backends())
+
+        cache.set("pokemon:id:1", TEST_POKEMON_ENTITY)
+
+        assert cache.get("pokemon:id:1") == TEST_POKEMON_ENTITY
+        assert cache.get("pokemon:id:2") is None
+
+        cache.clear()
+
+        assert cache.get("pokemon:id:1") is None
+        snapshot = cache.snapshot()
+        assert snapshot["errors"] == 2
+        assert snapshot["skipped"] == 3
+
+    def test_breaker(self, caplog: pytest.LogCaptureFixture) -> None:
+        backend, async_backend = failing_backends()
+
+        with freeze_time(EXECUTION_DATETIME) as frozen:
+            cache = worker(backend, async_backend)
+
+            with caplog.at_level(logging.WARNING):
+                assert cache.get("pokemon:id:1") is None
+                assert cache.get("pokemon:id:1") is None
+                assert asyncio.run(cache.get_many_async(["pokemon:id:1"])) == [None]
+
+            backend.get.assert_called_once()
+            backend.get_many.assert_not_called()
+            async_backend.get_many.assert_not_called()
+            assert len(caplog.records) == 1
+            assert cache.snapshot()["skipped"] == 3
+
+            frozen.tick(datetime.timedelta(seconds=5))
+
+            with caplog.at_level(logging.WARNING):
+                assert cache.get("pokemon:id:1") is None
+
+            assert backend.get.call_count == 2
+            backend.get_many.assert_not_called()
+            assert len(caplog.records) == 1
+
+            frozen.tick(datetime.timedelta(seconds=5))
+            backend.get.side_effect = None
+            backend.get.return_value = None
+            backend.get_many.side_effect = None
+            backend.get_many.return_value = [None]
+
+            with caplog.at_level(logging.INFO):
+                assert cache.get("pokemon:id:1") is None
+
+            assert "The shared cache is back" in caplog.text
+            backend.get_many.assert_called_once()
+            assert cache.snapshot()["errors"] == 2
+
+    def test_async_backend_failure(self, backend: MemoryCacheBackend) -> None:
+        _, async_backend = failing_backends()
+        cache = worker(backend, async_backend)
+
+        assert asyncio.run(cache.get_many_async(["pokemon:id:1"])) == [None]
+        asyncio.run(cache.set_many_async({"pokemon:id:1": TEST_POKEMON_ENTITY}))
+
+        assert cache.get("pokemon:id:1") == TEST_POKEMON_ENTITY
+        async_backend.set_many.assert_not_called()
+        assert cache.snapshot()["errors"] == 1
+
+    def test_decode_failure(self, backend: MemoryCacheBackend) -> None:
+        cache = worker(backend)
+        backend.set_many({"pokeapi:pokemon:1:0:pokemon:id:1": b"\xc1"}, 60)
+
+        assert cache.get("pokemon:id:1") is None
+        assert cache.snapshot()["errors"] == 1
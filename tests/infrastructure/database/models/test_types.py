@@ -0,0 +1,48 @@
+import uuid
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, create_engine, insert, select
+from sqlalchemy.dialects import mysql
+
+from pokeapi.infrastructure.database.models.types import BinaryUUID
+
+TEST_TOKEN = "8c4b6e2a-1f3d-4a5b-9c7e-0d2f4a6b8c1e"
+
+
+class TestBinaryUUID:
+    def test_bind(self) -> None:
+        actual = BinaryUUID().process_bind_param(TEST_TOKEN, mysql.dialect())
+
+        assert actual == uuid.UUID(TEST_TOKEN).bytes
+        assert len(actual) == 16
+
+    @pytest.mark.parametrize("value", [None, "hoge"])
+    def test_bind_not_uuid(self, value: str | None) -> None:
+        assert BinaryUUID().process_bind_param(value, mysql.dialect()) is None
+
+    def test_result(self) -> None:
+        actual = BinaryUUID().process_result_value(
+            uuid.UUID(TEST_TOKEN).bytes, mysql.dialect()
+        )
+
+        assert actual == TEST_TOKEN
+        assert BinaryUUID().process_result_value(None, mysql.dialect()) is None
+
+    def test_round_trip(self) -> None:
+        table = Table("tokens", MetaData(), Column("token", BinaryUUID))
+        engine = create_engine("sqlite://")
+        table.metadata.create_all(engine)
+
+        with engine.connect() as connection:
+            connection.execute(insert(table).values(token=TEST_TOKEN))
+            stored = connection.exec_driver_sql("SELECT token FROM tokens").scalar()
+            found = connection.execute(
+                select(table.c.token).where(table.c.token == TEST_TOKEN)
+            ).scalar()
+            not_found = connection.execute(
+                select(table.c.token).where(table.c.token == "hoge")
+            ).scalar()
+
+        assert stored == uuid.UUID(TEST_TOKEN).bytes
+        assert found == TEST_TOKEN
+        assert not_found is None
@@ -1,15 +1,24 @@
+from collections.abc import Callable
+from typing import Any, cast
+
 import pytest
 from injector import Injector
 from pytest_mock import MockerFixture
 from sqlalchemy import ScalarResult
+from sqlalchemy.orm import Session, scoped_session
 
+from pokeapi.infrastructure.database.db import unit_of_work
+from pokeapi.infrastructure.database.loading import LoadingStrategy
 from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
 from pokeapi.infrastructure.database.models.pokemon_abilities import PokemonAbilities
 from pokeapi.infrastructure.database.models.pokemon_mst import Pokemon
 from pokeapi.infrastructure.database.models.pokemon_types import PokemonTypes
 from pokeapi.infrastructure.database.models.type_mst import TypeMst
 from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
-from tests.conftest import TEST_POKEMON_ENTITY
+from pokeapi.infrastructure.database.repositories.pokemon_async import (
+    AsyncPokemonRepository,
+)
+from tests.conftest import TEST_POKEMON_ENTITY, QueryCounter
 
 TEST_MODEL = Pokemon(
     id_=1,
@@ -59,8 +68,17 @@ TEST_MODEL = Pokemon(
 )
 
 
-@pytest.fixture(scope="module")
-def repo(container: Injector) -> PokemonRepository:
+@pytest.fixture(scope="module", params=["sync", "async"])
+def repo(
+    request: pytest.FixtureRequest,
+    container: Injector,
+    async_runner: Callable[[Any], Any],
+) -> PokemonRepository:
+    if request.param == "async":
+        return cast(
+            PokemonRepository, async_runner(container.get(AsyncPokemonRepository))
+        )
+
     return container.get(PokemonRepository)
 
 
@@ -68,8 +86,9 @@ class TestPokemonRepository:
     def test_convert_to_entity(self, repo: PokemonRepository) -> None:
         assert repo._convert_to_entity(TEST_MODEL) == TEST_POKEMON_ENTITY
 
-    def test_get_by_id(self, repo: PokemonRepository) -> None:
-        assert repo.get_by_id(1) == TEST_POKEMON_ENTITY
+    @pytest.mark.parametrize("loading", list(LoadingStrategy))
+    def test_get_by_id(self, repo: PokemonRepository, loading: LoadingStrategy) -> None:
+        assert repo.get_by_id(1, loading) == TEST_POKEMON_ENTITY
 
     def test_get_by_id_not_found(self, repo: PokemonRepository) -> None:
         assert repo.get_by_id(0) is None
@@ -86,8 +105,9 @@ class TestPokemonRepository:
     def test_get_by_name_not_found(self, repo: PokemonRepository) -> None:
         assert repo.get_by_name("けつばん") is None
 
-    def test_get_all(self, repo: PokemonRepository) -> None:
-        actual = repo.get_all()
+    @pytest.mark.parametrize("loading", list(LoadingStrategy))
+    def test_get_all(self, repo: PokemonRepository, loading: LoadingStrategy) -> None:
+        actual = repo.get_all(loading)
 
         assert actual
         assert len(actual) == 151
@@ -99,3 +119,63 @@ class TestPokemonRepository:
         mocker.patch.object(ScalarResult, "all", return_value=[])
 
         assert repo.get_all() == []
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"limit": 3}, [1, 2, 3]),
+            ({"limit": 3, "after": 149}, [150, 151]),
+            ({"limit": 3, "backward": True}, [149, 150, 151]),
+            ({"limit": 3, "before": 3, "backward": True}, [1, 2]),
+            ({"limit": 5, "after": 1, "before": 4}, [2, 3]),
+        ],
+    )
+    def test_get_page(
+        self, repo: PokemonRepository, kwargs: dict, expected: list[int]
+    ) -> None:
+        actual = repo.get_page(**kwargs)
+
+        assert [pokemon.id_ for pokemon in actual] == expected
+
+    def test_get_page_converts_entities(self, repo: PokemonRepository) -> None:
+        assert repo.get_page(1) == [TEST_POKEMON_ENTITY]
+
+    @pytest.mark.parametrize(
+        ("loading", "expected"),
+        [(LoadingStrategy.SELECTIN, 3), (LoadingStrategy.JOINED, 1)],
+    )
+    def test_query_count(
+        self,
+        repo: PokemonRepository,
+        container: Injector,
+        query_counter: QueryCounter,
+        loading: LoadingStrategy,
+        expected: int,
+    ) -> None:
+        session_local = container.get(scoped_session[Session])
+        counts = []
+
+        for get in (
+            lambda: repo.get_by_id(1, loading),
+            lambda: repo.get_by_pokedex_number(1, loading),
+            lambda: repo.get_by_name("フシギダネ", loading),
+            lambda: repo.get_all(loading),
+        ):
+            with unit_of_work(session_local):
+                start = query_counter.count
+                get()
+                counts.append(query_counter.count - start)
+
+        assert counts == [expected] * 4
+
+    def test_get_by_ids(self, repo: PokemonRepository) -> None:
+        actual = repo.get_by_ids([2, 1, 0])
+
+        assert sorted(entity.id_ for entity in actual) == [1, 2]
+        assert TEST_POKEMON_ENTITY in actual
+
+    def test_get_by_ids_empty(
+        self, repo: PokemonRepository, query_counter: QueryCounter
+    ) -> None:
+        assert repo.get_by_ids([]) == []
+        assert query_counter.count == 0
@@ -1,3 +1,6 @@
+from collections.abc import Callable
+from typing import Any, cast
+
 import pytest
 from injector import Injector
 from pytest_mock import MockerFixture
@@ -7,13 +10,25 @@ from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
 from pokeapi.infrastructure.database.repositories.pokemon_ability import (
     AbilityRepository,
 )
-from tests.conftest import TEST_POKEMON_ABILITY_ENTITY
+from pokeapi.infrastructure.database.repositories.pokemon_ability_async import (
+    AsyncAbilityRepository,
+)
+from tests.conftest import TEST_POKEMON_ABILITY_ENTITY, QueryCounter
 
 TEST_MODEL = AbilityMst(id_=1, ability="あくしゅう")
 
 
-@pytest.fixture(scope="module")
-def repo(container: Injector) -> AbilityRepository:
+@pytest.fixture(scope="module", params=["sync", "async"])
+def repo(
+    request: pytest.FixtureRequest,
+    container: Injector,
+    async_runner: Callable[[Any], Any],
+) -> AbilityRepository:
+    if request.param == "async":
+        return cast(
+            AbilityRepository, async_runner(container.get(AsyncAbilityRepository))
+        )
+
     return container.get(AbilityRepository)
 
 
@@ -40,3 +55,15 @@ class TestAbilityRepository:
         mocker.patch.object(ScalarResult, "all", return_value=[])
 
         assert repo.get_all() == []
+
+    def test_get_by_ids(self, repo: AbilityRepository) -> None:
+        actual = repo.get_by_ids([2, 1, 0])
+
+        assert sorted(entity.id_ for entity in actual) == [1, 2]
+        assert TEST_POKEMON_ABILITY_ENTITY in actual
+
+    def test_get_by_ids_empty(
+        self, repo: AbilityRepository, query_counter: QueryCounter
+    ) -> None:
+        assert repo.get_by_ids([]) == []
+        assert query_counter.count == 0
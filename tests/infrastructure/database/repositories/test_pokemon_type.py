@@ -1,3 +1,6 @@
+from collections.abc import Callable
+from typing import Any, cast
+
 import pytest
 from injector import Injector
 from pytest_mock import MockerFixture
@@ -5,13 +8,23 @@ from sqlalchemy import ScalarResult
 
 from pokeapi.infrastructure.database.models.type_mst import TypeMst
 from pokeapi.infrastructure.database.repositories.pokemon_type import TypeRepository
-from tests.conftest import TEST_POKEMON_TYPE_ENTITY
+from pokeapi.infrastructure.database.repositories.pokemon_type_async import (
+    AsyncTypeRepository,
+)
+from tests.conftest import TEST_POKEMON_TYPE_ENTITY, QueryCounter
 
 TEST_MODEL = TypeMst(id_=1, type_="ノーマル")
 
 
-@pytest.fixture(scope="module")
-def repo(container: Injector) -> TypeRepository:
+@pytest.fixture(scope="module", params=["sync", "async"])
+def repo(
+    request: pytest.FixtureRequest,
+    container: Injector,
+    async_runner: Callable[[Any], Any],
+) -> TypeRepository:
+    if request.param == "async":
+        return cast(TypeRepository, async_runner(container.get(AsyncTypeRepository)))
+
     return container.get(TypeRepository)
 
 
@@ -36,3 +49,15 @@ class TestTypeRepository:
         mocker.patch.object(ScalarResult, "all", return_value=[])
 
         assert repo.get_all() == []
+
+    def test_get_by_ids(self, repo: TypeRepository) -> None:
+        actual = repo.get_by_ids([2, 1, 0])
+
+        assert sorted(entity.id_ for entity in actual) == [1, 2]
+        assert TEST_POKEMON_TYPE_ENTITY in actual
+
+    def test_get_by_ids_empty(
+        self, repo: TypeRepository, query_counter: QueryCounter
+    ) -> None:
+        assert repo.get_by_ids([]) == []
+        assert query_counter.count == 0
@@ -0,0 +1,86 @@
+import datetime
+from collections.abc import Generator
+
+import pytest
+from injector import Injector
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from pokeapi.infrastructure.database.models.token_revocation import (
+    TokenRevocation as TokenRevocationModel,
+)
+from pokeapi.infrastructure.database.repositories.token_revocation import (
+    TokenRevocationRepository,
+)
+from tests.conftest import EXECUTION_DATETIME, ISSUE_DATETIME
+
+FOO = "00000000-0000-0000-0000-00000000f001"
+BAR = "00000000-0000-0000-0000-00000000f002"
+
+
+@pytest.fixture(scope="module")
+def repo(container: Injector) -> TokenRevocationRepository:
+    return container.get(TokenRevocationRepository)
+
+
+@pytest.fixture()
+def _setup_token_revocation(container: Injector) -> Generator:
+    session = container.get(Session)
+    session.execute(
+        insert(TokenRevocationModel),
+        [
+            {"access_token": FOO, "revoked_at": ISSUE_DATETIME},
+            {"access_token": BAR, "revoked_at": EXECUTION_DATETIME},
+        ],
+    )
+    session.commit()
+
+    yield
+
+    session.execute(
+        delete(TokenRevocationModel).where(
+            TokenRevocationModel.access_token.in_([FOO, BAR])
+        )
+    )
+    session.commit()
+
+
+@pytest.mark.usefixtures("_setup_token_revocation")
+class TestTokenRevocationRepository:
+    def test_get_since(self, repo: TokenRevocationRepository) -> None:
+        actual = [
+            revocation
+            for revocation in repo.get_since(ISSUE_DATETIME)
+            if revocation.access_token in (FOO, BAR)
+        ]
+
+        assert [revocation.access_token for revocation in actual] == [FOO, BAR]
+        assert actual[0].revoked_at == ISSUE_DATETIME
+        assert actual[0].id_ > 0
+
+    def test_get_since_newer(self, repo: TokenRevocationRepository) -> None:
+        actual = repo.get_since(EXECUTION_DATETIME)
+
+        assert FOO not in [revocation.access_token for revocation in actual]
+        assert BAR in [revocation.access_token for revocation in actual]
+
+    def test_purge(self, container: Injector, repo: TokenRevocationRepository) -> None:
+        expiration = EXECUTION_DATETIME - datetime.timedelta(seconds=1)
+
+        assert repo.purge(expiration, 1) == 1
+
+        while repo.purge(expiration, 1000):
+            pass
+
+        session = container.get(Session)
+        remaining = (
+            session.execute(
+                select(TokenRevocationModel.access_token).where(
+                    TokenRevocationModel.access_token.in_([FOO, BAR])
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        assert remaining == [BAR]
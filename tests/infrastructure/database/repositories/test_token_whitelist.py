@@ -6,7 +6,7 @@ import pytest
 from freezegun import freeze_time
 from injector import Injector
 from pytest_mock import MockerFixture
-from sqlalchemy import and_, delete, insert, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -14,6 +14,9 @@ from pokeapi.domain.entities.token_whitelist import (
     TokenWhitelist as TokenWhitelistEntity,
 )
 from pokeapi.exceptions.token import TokenRegistrationError, TokenUpdateError
+from pokeapi.infrastructure.database.models.token_revocation import (
+    TokenRevocation as TokenRevocationModel,
+)
 from pokeapi.infrastructure.database.models.token_whitelist import (
     TokenWhitelist as TokenWhitelistModel,
 )
@@ -21,7 +24,12 @@ from pokeapi.infrastructure.database.models.users import User
 from pokeapi.infrastructure.database.repositories.token_whitelist import (
     TokenWhitelistRepository,
 )
-from tests.conftest import EXECUTION_DATETIME, ISSUE_DATETIME
+from tests.conftest import EXECUTION_DATETIME, ISSUE_DATETIME, QueryCounter
+
+FOO = "00000000-0000-0000-0000-000000000001"
+BAR = "00000000-0000-0000-0000-000000000002"
+BAZ = "00000000-0000-0000-0000-000000000003"
+QUX = "00000000-0000-0000-0000-000000000004"
 
 
 @pytest.fixture(scope="module")
@@ -63,8 +71,8 @@ def setup_token_whitelist(
     record = session.execute(
         insert(TokenWhitelistModel).values(
             user_id=setup_user,
-            access_token="foo",
-            refresh_token="bar",
+            access_token=FOO,
+            refresh_token=BAR,
             created_by="test_repository",
             created_at=ISSUE_DATETIME,
             updated_by="test_repository",
@@ -81,6 +89,9 @@ def setup_token_whitelist(
             TokenWhitelistModel.id_ == record.inserted_primary_key[0]
         )
     )
+    session.execute(
+        delete(TokenRevocationModel).where(TokenRevocationModel.access_token == FOO)
+    )
     session.commit()
 
 
@@ -101,8 +112,8 @@ class TestTokenWhitelistRepository:
             TokenWhitelistModel(
                 id_=1,
                 user_id=1,
-                access_token="foo",
-                refresh_token="bar",
+                access_token=FOO,
+                refresh_token=BAR,
                 created_by="test_repository",
                 created_at=ISSUE_DATETIME,
                 updated_by="test_repository",
@@ -112,48 +123,8 @@ class TestTokenWhitelistRepository:
         assert isinstance(actual, TokenWhitelistEntity)
         assert actual.id_ == 1
         assert actual.user_id == 1
-        assert actual.access_token == "foo"
-        assert actual.refresh_token == "bar"
-
-    @pytest.mark.usefixtures("setup_token_whitelist")
-    @freeze_time(EXECUTION_DATETIME)
-    def test_get_by_access_token(
-        self, repo: TokenWhitelistRepository, setup_user: int
-    ) -> None:
-        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
-        actual = repo.get_by_access_token("foo", expiration)
-
-        assert isinstance(actual, TokenWhitelistEntity)
-        assert actual.user_id == setup_user
-        assert actual.access_token == "foo"
-
-    def test_get_by_access_token_not_found(
-        self, repo: TokenWhitelistRepository
-    ) -> None:
-        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
-        actual = repo.get_by_access_token("hoge", expiration)
-
-        assert actual is None
-
-    @pytest.mark.usefixtures("setup_token_whitelist")
-    @freeze_time(EXECUTION_DATETIME)
-    def test_get_by_refresh_token(
-        self, repo: TokenWhitelistRepository, setup_user: int
-    ) -> None:
-        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
-        actual = repo.get_by_refresh_token("bar", expiration)
-
-        assert isinstance(actual, TokenWhitelistEntity)
-        assert actual.user_id == setup_user
-        assert actual.refresh_token == "bar"
-
-    def test_get_by_refresh_token_not_found(
-        self, repo: TokenWhitelistRepository
-    ) -> None:
-        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
-        actual = repo.get_by_refresh_token("bar", expiration)
-
-        assert actual is None
+        assert actual.access_token == FOO
+        assert actual.refresh_token == BAR
 
     @pytest.mark.usefixtures("_teardown_for_create")
     @freeze_time(ISSUE_DATETIME)
@@ -161,11 +132,12 @@ class TestTokenWhitelistRepository:
         self,
         repo: TokenWhitelistRepository,
         setup_user: int,
+        query_counter: QueryCounter,
     ) -> None:
         entity = TokenWhitelistEntity(
             user_id=setup_user,
-            access_token="foo",
-            refresh_token="bar",
+            access_token=FOO,
+            refresh_token=BAR,
             created_by="test_repository",
             created_at=datetime.datetime.now(),
             updated_by="test_repository",
@@ -174,9 +146,11 @@ class TestTokenWhitelistRepository:
 
         actual = repo.create(entity)
 
+        assert actual.id_ > 0
         assert actual.user_id == setup_user
-        assert actual.access_token == "foo"
-        assert actual.refresh_token == "bar"
+        assert actual.access_token == FOO
+        assert actual.refresh_token == BAR
+        assert query_counter.count == 1
 
     def test_create_with_integrity_error(
         self,
@@ -184,8 +158,8 @@ class TestTokenWhitelistRepository:
     ) -> None:
         entity = TokenWhitelistEntity(
             user_id=0,
-            access_token="foo",
-            refresh_token="bar",
+            access_token=FOO,
+            refresh_token=BAR,
             created_by="test_repository",
             created_at=datetime.datetime.now(),
             updated_by="test_repository",
@@ -202,8 +176,8 @@ class TestTokenWhitelistRepository:
         repo = TokenWhitelistRepository(mock_session)
         entity = TokenWhitelistEntity(
             user_id=0,
-            access_token="foo",
-            refresh_token="bar",
+            access_token=FOO,
+            refresh_token=BAR,
             created_by="test_repository",
             created_at=datetime.datetime.now(),
             updated_by="test_repository",
@@ -213,24 +187,29 @@ class TestTokenWhitelistRepository:
         with pytest.raises(TokenRegistrationError):
             repo.create(entity)
 
-    def test_update(
+    @freeze_time(EXECUTION_DATETIME)
+    def test_rotate(
         self,
         container: Injector,
         repo: TokenWhitelistRepository,
         setup_user: int,
         setup_token_whitelist: int,
+        query_counter: QueryCounter,
     ) -> None:
+        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
         entity = TokenWhitelistEntity(
-            id_=setup_token_whitelist,
             user_id=setup_user,
-            access_token="baz",
-            refresh_token="qux",
+            access_token=BAZ,
+            refresh_token=QUX,
             created_by="test_repository",
             created_at=datetime.datetime.now(),
             updated_by="test_repository",
             updated_at=datetime.datetime.now(),
         )
-        repo.update(entity)
+
+        assert repo.rotate(BAR, expiration, entity, True) is True
+        assert query_counter.count == 2
+        assert repo.rotate(BAR, expiration, entity, True) is False
 
         session = container.get(Session)
         actual = session.execute(
@@ -240,67 +219,120 @@ class TestTokenWhitelistRepository:
         ).scalar()
 
         assert actual is not None
-        assert actual.user_id == setup_user
-        assert actual.access_token == "baz"
-        assert actual.refresh_token == "qux"
+        assert actual.access_token == BAZ
+        assert actual.refresh_token == QUX
 
-    def test_update_integrity_error(
-        self, repo: TokenWhitelistRepository, mocker: MockerFixture
+        revoked = session.execute(
+            select(TokenRevocationModel.revoked_at).where(
+                TokenRevocationModel.access_token == FOO
+            )
+        ).all()
+
+        assert revoked == [(EXECUTION_DATETIME,)]
+
+    @freeze_time(EXECUTION_DATETIME)
+    def test_rotate_without_revocation(
+        self,
+        container: Injector,
+        repo: TokenWhitelistRepository,
+        setup_user: int,
+        setup_token_whitelist: int,
+        query_counter: QueryCounter,
     ) -> None:
+        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
         entity = TokenWhitelistEntity(
-            id_=0,
-            user_id=0,
-            access_token="baz",
-            refresh_token="qux",
+            user_id=setup_user,
+            access_token=BAZ,
+            refresh_token=QUX,
             created_by="test_repository",
             created_at=datetime.datetime.now(),
             updated_by="test_repository",
             updated_at=datetime.datetime.now(),
         )
-        mocker.patch.object(
-            Session, "execute", side_effect=IntegrityError(None, None, Exception())
+
+        assert repo.rotate(BAR, expiration, entity, False) is True
+        assert query_counter.count == 1
+
+        session = container.get(Session)
+        actual = session.execute(
+            select(TokenWhitelistModel).where(
+                TokenWhitelistModel.id_ == setup_token_whitelist
+            )
+        ).scalar()
+
+        assert actual is not None
+        assert actual.access_token == BAZ
+
+        revoked = session.execute(
+            select(TokenRevocationModel).where(TokenRevocationModel.access_token == FOO)
+        ).all()
+
+        assert revoked == []
+
+    @pytest.mark.usefixtures("setup_token_whitelist")
+    @freeze_time("2999-01-01 01:00:00")
+    def test_rotate_expired(
+        self, container: Injector, repo: TokenWhitelistRepository, setup_user: int
+    ) -> None:
+        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
+        entity = TokenWhitelistEntity(
+            user_id=setup_user,
+            access_token=BAZ,
+            refresh_token=QUX,
+            created_by="test_repository",
+            created_at=datetime.datetime.now(),
+            updated_by="test_repository",
+            updated_at=datetime.datetime.now(),
         )
 
-        with pytest.raises(TokenUpdateError):
-            repo.update(entity)
+        assert repo.rotate(BAR, expiration, entity, True) is False
 
-    def test_update_with_result_zero_error(self, mock_session: MagicMock) -> None:
-        mock_session.execute.return_value = MagicMock()
-        mock_session.execute.return_value.rowcount = 0
-        repo = TokenWhitelistRepository(mock_session)
+        session = container.get(Session)
+        revoked = session.execute(
+            select(TokenRevocationModel).where(TokenRevocationModel.access_token == FOO)
+        ).all()
+
+        assert revoked == []
+
+    def test_rotate_integrity_error(
+        self, repo: TokenWhitelistRepository, mocker: MockerFixture
+    ) -> None:
         entity = TokenWhitelistEntity(
-            id_=0,
             user_id=0,
-            access_token="baz",
-            refresh_token="qux",
+            access_token=BAZ,
+            refresh_token=QUX,
             created_by="test_repository",
             created_at=datetime.datetime.now(),
             updated_by="test_repository",
             updated_at=datetime.datetime.now(),
         )
+        mocker.patch.object(
+            Session, "execute", side_effect=IntegrityError(None, None, Exception())
+        )
 
         with pytest.raises(TokenUpdateError):
-            repo.update(entity)
+            repo.rotate(BAR, datetime.datetime.now(), entity, True)
 
-    @pytest.mark.usefixtures("setup_token_whitelist")
     @freeze_time("2999-01-01 01:00:00")
-    def test_delete(
+    def test_purge(
         self,
         container: Injector,
         repo: TokenWhitelistRepository,
-        setup_user: int,
+        setup_token_whitelist: int,
     ) -> None:
         expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
-        repo.delete(setup_user, expiration)
+        actual = repo.purge(expiration, 1)
+
+        assert actual == 1
+
+        while repo.purge(expiration, 1000):
+            pass
 
         session = container.get(Session)
-        actual = session.execute(
+        remaining = session.execute(
             select(TokenWhitelistModel).where(
-                and_(
-                    TokenWhitelistModel.user_id == setup_user,
-                    TokenWhitelistModel.deleted_at.isnot(None),
-                )
+                TokenWhitelistModel.id_ == setup_token_whitelist
             )
         ).all()
 
-        assert len(actual) == 1
+        assert remaining == []
@@ -1,7 +1,9 @@
+import datetime
 from collections.abc import Generator
 from unittest.mock import MagicMock
 
 import pytest
+from freezegun import freeze_time
 from injector import Injector
 from sqlalchemy import delete, insert
 from sqlalchemy.orm import Session
@@ -10,6 +12,7 @@ from pokeapi.domain.entities.user import User as UserEntity
 from pokeapi.exceptions.user import UserCreationError, UserUpdateError
 from pokeapi.infrastructure.database.models import User as UserModel
 from pokeapi.infrastructure.database.repositories.user import UserRepository
+from tests.conftest import EXECUTION_DATETIME, TEST_UUID, QueryCounter
 
 
 @pytest.fixture(scope="module")
@@ -73,6 +76,50 @@ class TestUserRepository:
     def test_get_by_id_not_found(self, repo: UserRepository) -> None:
         assert repo.get_by_id(0) is None
 
+    @pytest.mark.usefixtures("_setup_token_whitelist_for_user")
+    @freeze_time(EXECUTION_DATETIME)
+    def test_get_by_access_token(
+        self, repo: UserRepository, query_counter: QueryCounter
+    ) -> None:
+        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
+        actual = repo.get_by_access_token(1, TEST_UUID, expiration)
+
+        assert isinstance(actual, UserEntity)
+        assert actual.username == "Red"
+        assert query_counter.count == 1
+
+    @pytest.mark.usefixtures("_setup_token_whitelist_for_user")
+    @freeze_time(EXECUTION_DATETIME)
+    @pytest.mark.parametrize(
+        ("id_", "token", "lifetime"),
+        [(1, "hoge", 1), (0, TEST_UUID, 1), (1, TEST_UUID, 0)],
+    )
+    def test_get_by_access_token_not_found(
+        self, repo: UserRepository, id_: int, token: str, lifetime: int
+    ) -> None:
+        expiration = datetime.datetime.now() - datetime.timedelta(hours=lifetime)
+
+        assert repo.get_by_access_token(id_, token, expiration) is None
+
+    @pytest.mark.usefixtures("_setup_token_whitelist_for_user")
+    @freeze_time(EXECUTION_DATETIME)
+    def test_get_by_refresh_token(self, repo: UserRepository) -> None:
+        expiration = datetime.datetime.now() - datetime.timedelta(hours=1)
+        actual = repo.get_by_refresh_token(TEST_UUID, expiration)
+
+        assert isinstance(actual, UserEntity)
+        assert actual.username == "Red"
+
+    @pytest.mark.usefixtures("_setup_token_whitelist_for_user")
+    @freeze_time(EXECUTION_DATETIME)
+    @pytest.mark.parametrize(("token", "lifetime"), [("hoge", 1), (TEST_UUID, 0)])
+    def test_get_by_refresh_token_not_found(
+        self, repo: UserRepository, token: str, lifetime: int
+    ) -> None:
+        expiration = datetime.datetime.now() - datetime.timedelta(hours=lifetime)
+
+        assert repo.get_by_refresh_token(token, expiration) is None
+
     def test_get_by_username(self, repo: UserRepository) -> None:
         actual = repo.get_by_username("Red")
 
@@ -83,13 +130,15 @@ class TestUserRepository:
         assert repo.get_by_username("hoge") is None
 
     @pytest.mark.usefixtures("_teardown_for_create")
-    def test_create(self, repo: UserRepository) -> None:
+    def test_create(self, repo: UserRepository, query_counter: QueryCounter) -> None:
         actual = repo.create(
             UserEntity(username="test_repository", password="password")
         )
 
+        assert actual.id_ > 0
         assert actual.username == "test_repository"
         assert actual.password == "password"
+        assert query_counter.count == 1
 
     def test_create_with_integrity_error(self, repo: UserRepository) -> None:
         with pytest.raises(UserCreationError):
@@ -104,11 +153,16 @@ class TestUserRepository:
         with pytest.raises(UserCreationError):
             repo.create(UserEntity(username="hoge", password="password"))
 
-    def test_update(self, repo: UserRepository, setup_for_user: int) -> None:
-        repo.update(
+    def test_update(
+        self, repo: UserRepository, setup_for_user: int, query_counter: QueryCounter
+    ) -> None:
+        updated = repo.update(
             UserEntity(id_=setup_for_user, username="Blue", password="password")
         )
 
+        assert updated.username == "Blue"
+        assert query_counter.count == 1
+
         actual = repo.get_by_id(setup_for_user)
 
         assert isinstance(actual, UserEntity)
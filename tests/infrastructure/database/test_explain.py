@@ -0,0 +1,199 @@
+import datetime
+import uuid
+from collections.abc import Callable, Generator
+from typing import Any
+
+import pytest
+from injector import Injector
+from sqlalchemy import Engine, delete, event, insert
+from sqlalchemy.orm import Session
+
+from pokeapi.domain.entities.token_whitelist import (
+    TokenWhitelist as TokenWhitelistEntity,
+)
+from pokeapi.infrastructure.database.loading import LoadingStrategy
+from pokeapi.infrastructure.database.models import TokenWhitelist as TokenWhitelistModel
+from pokeapi.infrastructure.database.repositories.pokemon import PokemonRepository
+from pokeapi.infrastructure.database.repositories.pokemon_ability import (
+    AbilityRepository,
+)
+from pokeapi.infrastructure.database.repositories.pokemon_type import TypeRepository
+from pokeapi.infrastructure.database.repositories.token_whitelist import (
+    TokenWhitelistRepository,
+)
+from pokeapi.infrastructure.database.repositories.user import UserRepository
+
+# Reading a whole master table scans it, and its relations, by design.
+FULL_READ = {
+    "pokemon_mst",
+    "pokemon_types",
+    "pokemon_abilities",
+    "type_mst",
+    "ability_mst",
+}
+EXPIRATION = datetime.datetime(2000, 1, 1)
+UNKNOWN_TOKEN = "00000000-0000-0000-0000-00000000ffff"
+TOKEN = TokenWhitelistEntity(
+    user_id=1,
+    access_token=UNKNOWN_TOKEN,
+    refresh_token=UNKNOWN_TOKEN,
+    created_by="test_explain",
+    created_at=EXPIRATION,
+    updated_by="test_explain",
+    updated_at=EXPIRATION,
+)
+
+POKEMON_CASES: list[tuple[str, tuple[Any, ...], set[str]]] = [
+    ("get_by_id", (1,), set()),
+    ("get_by_pokedex_number", (1,), set()),
+    ("get_by_name", ("フシギダネ",), set()),
+    ("get_page", (10, 10), set()),
+    ("get_by_ids", ([1, 2, 3],), set()),
+    ("get_all", (), FULL_READ),
+]
+CASES: list[tuple[str, Callable[[Injector], Any], set[str]]] = [
+    ("type.get_by_id", lambda c: c.get(TypeRepository).get_by_id(1), set()),
+    ("type.get_by_ids", lambda c: c.get(TypeRepository).get_by_ids([1, 2]), set()),
+    ("type.get_all", lambda c: c.get(TypeRepository).get_all(), FULL_READ),
+    ("ability.get_by_id", lambda c: c.get(AbilityRepository).get_by_id(1), set()),
+    (
+        "ability.get_by_ids",
+        lambda c: c.get(AbilityRepository).get_by_ids([1, 2]),
+        set(),
+    ),
+    ("ability.get_all", lambda c: c.get(AbilityRepository).get_all(), FULL_READ),
+    ("user.get_by_id", lambda c: c.get(UserRepository).get_by_id(1), set()),
+    (
+        "user.get_by_username",
+        lambda c: c.get(UserRepository).get_by_username("Red"),
+        set(),
+    ),
+    (
+        "user.get_by_access_token",
+        lambda c: c.get(UserRepository).get_by_access_token(
+            1, UNKNOWN_TOKEN, EXPIRATION
+        ),
+        set(),
+    ),
+    (
+        "user.get_by_refresh_token",
+        lambda c: c.get(UserRepository).get_by_refresh_token(UNKNOWN_TOKEN, EXPIRATION),
+        set(),
+    ),
+    (
+        "token_whitelist.rotate",
+        lambda c: c.get(TokenWhitelistRepository).rotate(
+            UNKNOWN_TOKEN, EXPIRATION, TOKEN, True
+        ),
+        set(),
+    ),
+    (
+        "token_whitelist.purge",
+        lambda c: c.get(TokenWhitelistRepository).purge(EXPIRATION, 10),
+        set(),
+    ),
+]
+
+
+@pytest.fixture()
+def statements(container: Injector) -> Generator[list[tuple[str, Any]], None, None]:
+    """Record the statements reading or writing existing rows, with their parameters."""
+    engine = container.get(Engine)
+    recorded: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, *args: Any
+    ) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            recorded.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    yield recorded
+
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="module")
+def _setup_token_whitelist(container: Injector) -> Generator:
+    """Fill the whitelist, since the optimizer may scan a table of a few rows."""
+    session = container.get(Session)
+    session.execute(
+        insert(TokenWhitelistModel),
+        [
+            {
+                "user_id": 1,
+                "access_token": str(uuid.uuid4()),
+                "refresh_token": str(uuid.uuid4()),
+                "created_by": "test_explain",
+                "updated_by": "test_explain",
+            }
+            for _ in range(100)
+        ],
+    )
+    session.commit()
+
+    yield
+
+    session.execute(
+        delete(TokenWhitelistModel).where(
+            TokenWhitelistModel.created_by == "test_explain"
+        )
+    )
+    session.commit()
+
+
+def full_scans(
+    engine: Engine, statements: list[tuple[str, Any]], allowed: set[str]
+) -> list[tuple[str, dict]]:
+    """EXPLAIN the statements and collect the full scans of tables not allowed."""
+    scans: list[tuple[str, dict]] = []
+
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            result = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            scans.extend(
+                (statement, dict(row))
+                for row in result.mappings()
+                if row["type"] == "ALL" and row["table"] not in allowed
+            )
+
+    return scans
+
+
+@pytest.mark.usefixtures("_setup_token_whitelist")
+class TestExplain:
+    @pytest.mark.parametrize("loading", list(LoadingStrategy))
+    @pytest.mark.parametrize(
+        ("name", "args", "allowed"),
+        [pytest.param(*case, id=case[0]) for case in POKEMON_CASES],
+    )
+    def test_pokemon_no_full_scan(
+        self,
+        container: Injector,
+        statements: list[tuple[str, Any]],
+        name: str,
+        args: tuple[Any, ...],
+        allowed: set[str],
+        loading: LoadingStrategy,
+    ) -> None:
+        getattr(container.get(PokemonRepository), name)(*args, loading=loading)
+
+        assert statements
+        assert full_scans(container.get(Engine), statements, allowed) == []
+
+    @pytest.mark.parametrize(
+        ("call", "allowed"),
+        [pytest.param(call, allowed, id=name) for name, call, allowed in CASES],
+    )
+    def test_no_full_scan(
+        self,
+        container: Injector,
+        statements: list[tuple[str, Any]],
+        call: Callable[[Injector], Any],
+        allowed: set[str],
+    ) -> None:
+        call(container)
+
+        assert statements
+        assert full_scans(container.get(Engine), statements, allowed) == []
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import Engine, create_engine, text
+
+from pokeapi.infrastructure.database.pool import InstrumentedQueuePool, PoolMetrics
+
+
+@pytest.fixture()
+def metrics() -> PoolMetrics:
+    return PoolMetrics()
+
+
+@pytest.fixture()
+def engine(metrics: PoolMetrics) -> Engine:
+    engine = create_engine(
+        "sqlite://", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=1
+    )
+    metrics.listen(engine)
+
+    return engine
+
+
+class TestPoolMetrics:
+    def test_snapshot_without_engine(self, metrics: PoolMetrics) -> None:
+        actual = metrics.snapshot()
+
+        assert actual["checkouts"] == 0
+        assert actual["checked_out"] == 0
+        assert actual["checkout_wait_avg"] == 0.0
+
+    def test_checkout(self, metrics: PoolMetrics, engine: Engine) -> None:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+            assert metrics.snapshot()["checked_out"] == 1
+
+        actual = metrics.snapshot()
+
+        assert actual["checkouts"] == 1
+        assert actual["checked_out"] == 0
+        assert actual["checked_out_max"] == 1
+        assert actual["connects"] == 1
+        assert actual["checkout_wait_max"] > 0
+        assert actual["checkout_wait_avg"] == actual["checkout_wait_max"]
+
+    def test_overflow(self, metrics: PoolMetrics, engine: Engine) -> None:
+        with engine.connect(), engine.connect():
+            assert metrics.snapshot()["overflow"] == 1
+
+        actual = metrics.snapshot()
+
+        assert actual["checkouts"] == 2
+        assert actual["checked_out_max"] == 2
+        assert actual["overflow_max"] == 1
+
+    def test_invalidate(self, metrics: PoolMetrics, engine: Engine) -> None:
+        with engine.connect() as connection:
+            connection.invalidate()
+
+        assert metrics.snapshot()["invalidations"] == 1
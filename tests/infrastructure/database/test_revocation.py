@@ -0,0 +1,152 @@
+import asyncio
+import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from freezegun import freeze_time
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.domain.entities.token_revocation import TokenRevocation
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.infrastructure.database.repositories.token_revocation import (
+    TokenRevocationRepository,
+)
+from pokeapi.infrastructure.database.revocation import OVERLAP, TokenRevocationFilter
+from tests.conftest import EXECUTION_DATETIME
+
+FOO = "00000000-0000-0000-0000-000000000001"
+BAR = "00000000-0000-0000-0000-000000000002"
+
+
+@pytest.fixture()
+def config() -> MagicMock:
+    return MagicMock(
+        spec=AppConfig,
+        access_token_lifetime=1,
+        access_token_stateless=True,
+        token_revocation_interval=0.01,
+    )
+
+
+@pytest.fixture()
+def repo() -> MagicMock:
+    repo = MagicMock(spec=TokenRevocationRepository)
+    repo.get_since.return_value = []
+
+    return repo
+
+
+@pytest.fixture()
+def revocation_filter(config: MagicMock, repo: MagicMock) -> TokenRevocationFilter:
+    executor = MagicMock(spec=BlockingExecutor)
+
+    async def run(func: Any, *args: Any) -> Any:
+        return func(*args)
+
+    executor.run = AsyncMock(side_effect=run)
+
+    return TokenRevocationFilter(config, repo, executor)
+
+
+def revocation(jti: str, minutes: int) -> TokenRevocation:
+    return TokenRevocation(
+        access_token=jti,
+        revoked_at=EXECUTION_DATETIME - datetime.timedelta(minutes=minutes),
+    )
+
+
+class TestTokenRevocationFilter:
+    @freeze_time(EXECUTION_DATETIME)
+    def test_refresh(
+        self, revocation_filter: TokenRevocationFilter, repo: MagicMock
+    ) -> None:
+        repo.get_since.return_value = [revocation(FOO, 30), revocation(BAR, 5)]
+
+        assert not revocation_filter.is_fresh()
+        assert asyncio.run(revocation_filter.refresh()) == 2
+        assert revocation_filter.is_fresh()
+        assert revocation_filter.is_revoked(FOO)
+        assert revocation_filter.is_revoked(BAR)
+        assert not revocation_filter.is_revoked("unknown")
+
+        since = repo.get_since.call_args.args[0]
+        assert since == EXECUTION_DATETIME - datetime.timedelta(hours=1) - OVERLAP
+
+        repo.get_since.return_value = []
+        asyncio.run(revocation_filter.refresh())
+
+        since = repo.get_since.call_args.args[0]
+        assert since == EXECUTION_DATETIME - datetime.timedelta(minutes=5) - OVERLAP
+
+        snapshot = revocation_filter.snapshot()
+
+        assert snapshot["size"] == 2
+        assert snapshot["fresh"] is True
+        assert snapshot["refreshes"] == 2
+        assert snapshot["failures"] == 0
+
+    def test_refresh_forgets_expired(
+        self, revocation_filter: TokenRevocationFilter, repo: MagicMock
+    ) -> None:
+        repo.get_since.return_value = [revocation(FOO, 30), revocation(BAR, 5)]
+
+        with freeze_time(EXECUTION_DATETIME):
+            asyncio.run(revocation_filter.refresh())
+
+        repo.get_since.return_value = []
+
+        with freeze_time(EXECUTION_DATETIME + datetime.timedelta(minutes=45)):
+            asyncio.run(revocation_filter.refresh())
+
+        assert not revocation_filter.is_revoked(FOO)
+        assert revocation_filter.is_revoked(BAR)
+
+    def test_is_fresh_expired(
+        self, revocation_filter: TokenRevocationFilter, config: MagicMock
+    ) -> None:
+        asyncio.run(revocation_filter.refresh())
+        config.token_revocation_interval = 0
+
+        assert not revocation_filter.is_fresh()
+        assert revocation_filter.snapshot()["age"] >= 0
+
+    def test_run(
+        self, revocation_filter: TokenRevocationFilter, repo: MagicMock
+    ) -> None:
+        repo.get_since.side_effect = [RuntimeError("error"), [], [], [], [], []]
+
+        async def main() -> None:
+            revocation_filter.start()
+            revocation_filter.start()
+            await asyncio.sleep(0.05)
+            await revocation_filter.stop()
+
+        asyncio.run(main())
+
+        assert revocation_filter.snapshot()["failures"] == 1
+        assert revocation_filter.snapshot()["refreshes"] >= 1
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [("access_token_stateless", False), ("token_revocation_interval", 0)],
+    )
+    def test_start_disabled(
+        self,
+        revocation_filter: TokenRevocationFilter,
+        config: MagicMock,
+        repo: MagicMock,
+        name: str,
+        value: Any,
+    ) -> None:
+        setattr(config, name, value)
+
+        async def main() -> None:
+            revocation_filter.start()
+            await asyncio.sleep(0.01)
+            await revocation_filter.stop()
+
+        asyncio.run(main())
+
+        repo.get_since.assert_not_called()
+        assert revocation_filter.snapshot()["age"] is None
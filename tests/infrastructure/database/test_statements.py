@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import Select
+from sqlalchemy.dialects import mysql
+
+from pokeapi.infrastructure.database import statements
+from pokeapi.infrastructure.database.loading import LoadingStrategy
+
+
+def compile_sql(statement: Select) -> str:
+    return str(
+        statement.compile(
+            dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        (statements.select_pokemon_by_id(1), "pokemon_mst.id = 1"),
+        (
+            statements.select_pokemon_by_pokedex_number(25),
+            "pokemon_mst.national_pokedex_number = 25",
+        ),
+        (statements.select_pokemon_by_ids([1, 2]), "pokemon_mst.id IN (1, 2)"),
+        (statements.select_type_by_id(1), "type_mst.id = 1"),
+        (statements.select_types_by_ids([1, 2]), "type_mst.id IN (1, 2)"),
+        (statements.select_ability_by_id(1), "ability_mst.id = 1"),
+        (statements.select_abilities_by_ids([1, 2]), "ability_mst.id IN (1, 2)"),
+    ],
+)
+def test_select_excludes_deleted(statement: Select, expected: str) -> None:
+    sql = compile_sql(statement)
+
+    assert expected in sql
+    assert "deleted_at IS NULL" in sql
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        statements.select_all_pokemon(),
+        statements.select_all_types(),
+        statements.select_all_abilities(),
+    ],
+)
+def test_select_all(statement: Select) -> None:
+    assert compile_sql(statement).endswith("deleted_at IS NULL")
+
+
+def test_select_pokemon_page() -> None:
+    sql = compile_sql(statements.select_pokemon_page(10, after=3, before=20))
+
+    assert "pokemon_mst.id > 3 AND pokemon_mst.id < 20" in sql
+    assert sql.endswith("ORDER BY pokemon_mst.id ASC \n LIMIT 10")
+
+
+def test_select_pokemon_page_backward() -> None:
+    sql = compile_sql(statements.select_pokemon_page(10, before=20, backward=True))
+
+    assert "pokemon_mst.id > " not in sql
+    assert sql.endswith("ORDER BY pokemon_mst.id DESC \n LIMIT 10")
+
+
+@pytest.mark.parametrize(
+    ("loading", "joined"),
+    [(LoadingStrategy.JOINED, True), (LoadingStrategy.SELECTIN, False)],
+)
+def test_pokemon_loader_options(loading: LoadingStrategy, joined: bool) -> None:
+    statement = statements.select_pokemon_by_id(1).options(
+        *statements.pokemon_loader_options(loading)
+    )
+
+    assert ("LEFT OUTER JOIN" in compile_sql(statement)) is joined
@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.infrastructure.database.repositories.token_revocation import (
+    TokenRevocationRepository,
+)
+from pokeapi.infrastructure.database.repositories.token_whitelist import (
+    TokenWhitelistRepository,
+)
+from pokeapi.infrastructure.database.sweeper import TokenWhitelistSweeper
+
+
+@pytest.fixture()
+def config() -> MagicMock:
+    return MagicMock(
+        spec=AppConfig,
+        access_token_lifetime=1,
+        refresh_token_lifetime=1,
+        token_sweep_interval=0.01,
+        token_sweep_batch_size=2,
+    )
+
+
+@pytest.fixture()
+def repo() -> MagicMock:
+    return MagicMock(spec=TokenWhitelistRepository)
+
+
+@pytest.fixture()
+def revocation_repo() -> MagicMock:
+    repo = MagicMock(spec=TokenRevocationRepository)
+    repo.purge.return_value = 0
+
+    return repo
+
+
+@pytest.fixture()
+def sweeper(
+    config: MagicMock, repo: MagicMock, revocation_repo: MagicMock
+) -> TokenWhitelistSweeper:
+    executor = MagicMock(spec=BlockingExecutor)
+
+    async def run(func: Any, *args: Any) -> Any:
+        return func(*args)
+
+    executor.run = AsyncMock(side_effect=run)
+
+    return TokenWhitelistSweeper(config, repo, revocation_repo, executor)
+
+
+class TestTokenWhitelistSweeper:
+    def test_sweep(
+        self,
+        sweeper: TokenWhitelistSweeper,
+        repo: MagicMock,
+        revocation_repo: MagicMock,
+    ) -> None:
+        repo.purge.side_effect = [2, 2, 1]
+        revocation_repo.purge.side_effect = [2, 0]
+
+        actual = asyncio.run(sweeper.sweep())
+
+        assert actual == 7
+        assert repo.purge.call_count == 3
+        assert {call.args[1] for call in repo.purge.call_args_list} == {2}
+        assert revocation_repo.purge.call_count == 2
+
+        snapshot = sweeper.snapshot()
+
+        assert snapshot["cycles"] == 1
+        assert snapshot["purged_total"] == 7
+        assert snapshot["purged_last"] == 7
+        assert snapshot["duration_last"] > 0
+        assert snapshot["duration_max"] == snapshot["duration_last"]
+
+    def test_run(self, sweeper: TokenWhitelistSweeper, repo: MagicMock) -> None:
+        repo.purge.side_effect = [RuntimeError("error"), 0, 0, 0, 0, 0]
+
+        async def main() -> None:
+            sweeper.start()
+            sweeper.start()
+            await asyncio.sleep(0.05)
+            await sweeper.stop()
+
+        asyncio.run(main())
+
+        assert sweeper.snapshot()["failures"] == 1
+        assert sweeper.snapshot()["cycles"] >= 1
+
+    def test_start_disabled(
+        self, sweeper: TokenWhitelistSweeper, config: MagicMock, repo: MagicMock
+    ) -> None:
+        config.token_sweep_interval = 0
+
+        async def main() -> None:
+            sweeper.start()
+            await asyncio.sleep(0.01)
+            await sweeper.stop()
+
+        asyncio.run(main())
+
+        repo.purge.assert_not_called()
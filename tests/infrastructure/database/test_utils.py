@@ -22,3 +22,11 @@ from pokeapi.infrastructure.database.utils import adjust_connection_url
 )
 def test_adjust_connection_url(connection_url: str, expected: str) -> None:
     assert adjust_connection_url(connection_url) == expected
+
+
+def test_adjust_connection_url_with_driver() -> None:
+    actual = adjust_connection_url(
+        "mysql://root:root@db:3306/main_db?charset=utf8", driver="aiomysql"
+    )
+
+    assert actual == "mysql+aiomysql://root:root@db:3306/main_db?charset=utf8"
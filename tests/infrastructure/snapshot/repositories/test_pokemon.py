@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+from pokeapi.infrastructure.snapshot.repositories.pokemon import (
+    SnapshotPokemonRepository,
+)
+from tests.conftest import TEST_POKEMON_ENTITY
+from tests.infrastructure.database.repositories.test_pokemon import TEST_MODEL
+
+
+@pytest.fixture()
+def repo(snapshot_store: PokedexSnapshotStore) -> SnapshotPokemonRepository:
+    source = MagicMock()
+    source._convert_to_entity.return_value = TEST_POKEMON_ENTITY
+
+    return SnapshotPokemonRepository(snapshot_store, source)
+
+
+class TestSnapshotPokemonRepository:
+    def test_convert_to_entity(self, repo: SnapshotPokemonRepository) -> None:
+        assert repo._convert_to_entity(TEST_MODEL) == TEST_POKEMON_ENTITY
+
+    def test_get_by_id(self, repo: SnapshotPokemonRepository) -> None:
+        assert repo.get_by_id(1) == TEST_POKEMON_ENTITY
+
+    def test_get_by_id_not_found(self, repo: SnapshotPokemonRepository) -> None:
+        assert repo.get_by_id(0) is None
+
+    def test_get_by_pokedex_number(self, repo: SnapshotPokemonRepository) -> None:
+        assert repo.get_by_pokedex_number(1) == TEST_POKEMON_ENTITY
+
+    def test_get_by_pokedex_number_not_found(
+        self, repo: SnapshotPokemonRepository
+    ) -> None:
+        assert repo.get_by_pokedex_number(0) is None
+
+    def test_get_by_name(self, repo: SnapshotPokemonRepository) -> None:
+        assert repo.get_by_name("フシギダネ") == TEST_POKEMON_ENTITY
+
+    def test_get_by_name_not_found(self, repo: SnapshotPokemonRepository) -> None:
+        assert repo.get_by_name("けつばん") is None
+
+    def test_get_all(self, repo: SnapshotPokemonRepository) -> None:
+        actual = repo.get_all()
+
+        assert [pokemon.id_ for pokemon in actual] == [1, 2, 3, 4, 5]
+        assert actual[0] == TEST_POKEMON_ENTITY
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"limit": 3}, [1, 2, 3]),
+            ({"limit": 3, "after": 3}, [4, 5]),
+            ({"limit": 3, "backward": True}, [3, 4, 5]),
+            ({"limit": 3, "before": 3, "backward": True}, [1, 2]),
+            ({"limit": 5, "after": 1, "before": 4}, [2, 3]),
+            ({"limit": 0}, []),
+        ],
+    )
+    def test_get_page(
+        self, repo: SnapshotPokemonRepository, kwargs: dict, expected: list[int]
+    ) -> None:
+        actual = repo.get_page(**kwargs)
+
+        assert [pokemon.id_ for pokemon in actual] == expected
+
+    def test_get_by_ids(self, repo: SnapshotPokemonRepository) -> None:
+        actual = repo.get_by_ids([2, 1, 0, 2])
+
+        assert [pokemon.id_ for pokemon in actual] == [2, 1]
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pokeapi.infrastructure.database.models.ability_mst import AbilityMst
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+from pokeapi.infrastructure.snapshot.repositories.pokemon_ability import (
+    SnapshotAbilityRepository,
+)
+from tests.conftest import TEST_POKEMON_ABILITY_ENTITY
+
+
+@pytest.fixture()
+def repo(snapshot_store: PokedexSnapshotStore) -> SnapshotAbilityRepository:
+    source = MagicMock()
+    source._convert_to_entity.return_value = TEST_POKEMON_ABILITY_ENTITY
+
+    return SnapshotAbilityRepository(snapshot_store, source)
+
+
+class TestSnapshotAbilityRepository:
+    def test_convert_to_entity(self, repo: SnapshotAbilityRepository) -> None:
+        assert (
+            repo._convert_to_entity(AbilityMst(id_=1, ability="あくしゅう"))
+            == TEST_POKEMON_ABILITY_ENTITY
+        )
+
+    def test_get_by_id(self, repo: SnapshotAbilityRepository) -> None:
+        assert repo.get_by_id(1) == TEST_POKEMON_ABILITY_ENTITY
+
+    def test_get_by_id_not_found(self, repo: SnapshotAbilityRepository) -> None:
+        assert repo.get_by_id(0) is None
+
+    def test_get_all(self, repo: SnapshotAbilityRepository) -> None:
+        actual = repo.get_all()
+
+        assert [entity.id_ for entity in actual] == [1, 2]
+        assert actual[0] == TEST_POKEMON_ABILITY_ENTITY
+
+    def test_get_by_ids(self, repo: SnapshotAbilityRepository) -> None:
+        actual = repo.get_by_ids([2, 0, 1])
+
+        assert [entity.id_ for entity in actual] == [2, 1]
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pokeapi.infrastructure.database.models.type_mst import TypeMst
+from pokeapi.infrastructure.snapshot.pokedex import PokedexSnapshotStore
+from pokeapi.infrastructure.snapshot.repositories.pokemon_type import (
+    SnapshotTypeRepository,
+)
+from tests.conftest import TEST_POKEMON_TYPE_ENTITY
+
+
+@pytest.fixture()
+def repo(snapshot_store: PokedexSnapshotStore) -> SnapshotTypeRepository:
+    source = MagicMock()
+    source._convert_to_entity.return_value = TEST_POKEMON_TYPE_ENTITY
+
+    return SnapshotTypeRepository(snapshot_store, source)
+
+
+class TestSnapshotTypeRepository:
+    def test_convert_to_entity(self, repo: SnapshotTypeRepository) -> None:
+        assert (
+            repo._convert_to_entity(TypeMst(id_=1, type_="ノーマル"))
+            == TEST_POKEMON_TYPE_ENTITY
+        )
+
+    def test_get_by_id(self, repo: SnapshotTypeRepository) -> None:
+        assert repo.get_by_id(1) == TEST_POKEMON_TYPE_ENTITY
+
+    def test_get_by_id_not_found(self, repo: SnapshotTypeRepository) -> None:
+        assert repo.get_by_id(0) is None
+
+    def test_get_all(self, repo: SnapshotTypeRepository) -> None:
+        actual = repo.get_all()
+
+        assert [entity.id_ for entity in actual] == [1, 2]
+        assert actual[0] == TEST_POKEMON_TYPE_ENTITY
+
+    def test_get_by_ids(self, repo: SnapshotTypeRepository) -> None:
+        actual = repo.get_by_ids([2, 0, 1])
+
+        assert [entity.id_ for entity in actual] == [2, 1]
@@ -0,0 +1,106 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.infrastructure.snapshot.pokedex import (
+    PokedexSnapshot,
+    PokedexSnapshotStore,
+)
+from tests.conftest import TEST_POKEMON_ENTITY, TEST_SNAPSHOT_POKEMON_ENTITIES
+
+
+class TestPokedexSnapshot:
+    def test_build(self) -> None:
+        actual = PokedexSnapshot.build(
+            TEST_SNAPSHOT_POKEMON_ENTITIES,
+            [PokemonType(id_=2, name="ほのお"), PokemonType(id_=1, name="ノーマル")],
+            [],
+        )
+
+        assert actual.pokemon_ids == (1, 2, 3, 4, 5)
+        assert [pokemon.id_ for pokemon in actual.pokemons] == [1, 2, 3, 4, 5]
+        assert actual.pokemon_by_id[1] == TEST_POKEMON_ENTITY
+        assert actual.pokemon_by_pokedex_number[1] == TEST_POKEMON_ENTITY
+        assert actual.pokemon_by_name["フシギダネ"] == TEST_POKEMON_ENTITY
+        assert [type_.id_ for type_ in actual.types] == [1, 2]
+        assert actual.type_by_id[2].name == "ほのお"
+        assert actual.abilities == ()
+
+    def test_build_indexes_lowest_id_of_duplicates(self) -> None:
+        duplicate = TEST_POKEMON_ENTITY.model_copy(update={"id_": 2})
+        actual = PokedexSnapshot.build([duplicate, TEST_POKEMON_ENTITY], [], [])
+
+        assert actual.pokemon_by_name["フシギダネ"].id_ == 1
+        assert actual.pokemon_by_pokedex_number[1].id_ == 1
+
+    def test_is_immutable(self) -> None:
+        actual = PokedexSnapshot.build([TEST_POKEMON_ENTITY], [], [])
+
+        with pytest.raises(TypeError):
+            actual.pokemon_by_id[2] = TEST_POKEMON_ENTITY  # type: ignore
+
+        with pytest.raises(AttributeError):
+            actual.pokemons = ()  # type: ignore
+
+
+class TestPokedexSnapshotStore:
+    def test_snapshot_is_loaded_once(
+        self, snapshot_store: PokedexSnapshotStore
+    ) -> None:
+        assert snapshot_store.snapshot is snapshot_store.snapshot
+        snapshot_store._pokemon_repo.get_all.assert_called_once()  # type: ignore
+
+    def test_refresh_swaps_snapshot(self, snapshot_store: PokedexSnapshotStore) -> None:
+        old = snapshot_store.snapshot
+        snapshot_store._pokemon_repo.get_all.return_value = [TEST_POKEMON_ENTITY]  # type: ignore
+
+        new = snapshot_store.refresh()
+
+        assert snapshot_store.snapshot is new
+        assert new.pokemon_ids == (1,)
+        assert old.pokemon_ids == (1, 2, 3, 4, 5)
+
+    def test_refresh_failure_keeps_snapshot(
+        self, snapshot_store: PokedexSnapshotStore
+    ) -> None:
+        old = snapshot_store.snapshot
+        snapshot_store._type_repo.get_all = MagicMock(side_effect=RuntimeError)  # type: ignore
+
+        with pytest.raises(RuntimeError):
+            snapshot_store.refresh()
+
+        assert snapshot_store.snapshot is old
+
+    def test_readers_see_whole_snapshots_during_refresh(
+        self, snapshot_store: PokedexSnapshotStore
+    ) -> None:
+        snapshot_store.refresh()
+        stop = threading.Event()
+        torn = []
+
+        def read() -> None:
+            while not stop.is_set():
+                snapshot = snapshot_store.snapshot
+
+                if len(snapshot.pokemons) != len(snapshot.pokemon_by_id):
+                    torn.append(snapshot)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+
+        for reader in readers:
+            reader.start()
+
+        for count in range(1, 50):
+            snapshot_store._pokemon_repo.get_all.return_value = (  # type: ignore
+                TEST_SNAPSHOT_POKEMON_ENTITIES[: count % 5 + 1]
+            )
+            snapshot_store.refresh()
+
+        stop.set()
+
+        for reader in readers:
+            reader.join()
+
+        assert torn == []
@@ -0,0 +1,35 @@
+import asyncio
+import threading
+
+import strawberry
+from injector import Injector
+
+from pokeapi.infrastructure.blocking.executor import BlockingExecutor
+from pokeapi.presentation.extensions.blocking import BlockingResolverExtension
+
+
+def get_thread_name(name: str) -> str:
+    return f"{name}: {threading.current_thread().name}"
+
+
+@strawberry.type
+class Query:
+    thread_name: str = strawberry.field(
+        resolver=get_thread_name, extensions=[BlockingResolverExtension()]
+    )
+
+
+def test_blocking_resolver_extension(container: Injector) -> None:
+    schema = strawberry.Schema(query=Query)
+    completed = container.get(BlockingExecutor).snapshot()["completed"]
+
+    result = asyncio.run(
+        schema.execute(
+            '{ threadName(name: "Red") }', context_value={"container": container}
+        )
+    )
+
+    assert result.errors is None
+    assert result.data is not None
+    assert result.data["threadName"].startswith("Red: blocking")
+    assert container.get(BlockingExecutor).snapshot()["completed"] == completed + 1
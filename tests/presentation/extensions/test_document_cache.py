@@ -0,0 +1,84 @@
+import asyncio
+
+import strawberry
+from injector import Injector
+from pytest_mock import MockerFixture
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.presentation.document_cache import DocumentCache
+from pokeapi.presentation.extensions.document_cache import DocumentCacheExtension
+from pokeapi.presentation.extensions.persisted_queries import PersistedQueryExtension
+from pokeapi.presentation.persisted_queries import PersistedQueryRegistry, hash_query
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def pokemon_name(self, name: str) -> str:
+        return name
+
+
+schema = strawberry.Schema(
+    query=Query, extensions=[PersistedQueryExtension, DocumentCacheExtension]
+)
+
+
+def execute(container: Injector, query: str) -> strawberry.types.ExecutionResult:
+    return asyncio.run(schema.execute(query, context_value={"container": container}))
+
+
+class TestDocumentCacheExtension:
+    def test_cached(self, container: Injector, mocker: MockerFixture) -> None:
+        query = '{ pokemonName(name: "Pikachu") }'
+        parse = mocker.spy(strawberry.schema.execute, "parse_document")
+        validate = mocker.spy(strawberry.schema.execute, "validate_document")
+
+        first = execute(container, query)
+        second = execute(container, query)
+
+        assert first.data == second.data == {"pokemonName": "Pikachu"}
+        assert container.get(DocumentCache).get(query) is not None
+        assert parse.call_count == 1
+        assert validate.call_count == 1
+
+    def test_validation_errors_cached(
+        self, container: Injector, mocker: MockerFixture
+    ) -> None:
+        query = "{ unknown }"
+        validate = mocker.spy(strawberry.schema.execute, "validate_document")
+
+        first = execute(container, query)
+        second = execute(container, query)
+
+        assert first.errors is not None
+        assert second.errors is not None
+        assert [e.message for e in first.errors] == [e.message for e in second.errors]
+        assert validate.call_count == 1
+
+    def test_syntax_error_not_cached(
+        self, container: Injector, mocker: MockerFixture
+    ) -> None:
+        query = "{ pokemonName("
+        parse = mocker.spy(strawberry.schema.execute, "parse_document")
+
+        assert execute(container, query).errors is not None
+        assert execute(container, query).errors is not None
+        assert container.get(DocumentCache).get(query) is None
+        assert parse.call_count == 2
+
+    def test_persisted_query_left_unchanged(
+        self, container: Injector, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "persisted_queries",
+            new_callable=mocker.PropertyMock,
+            return_value=True,
+        )
+        query = '{ pokemonName(name: "Eevee") }'
+        container.get(PersistedQueryRegistry).register(hash_query(query), query)
+        execute(container, query)
+        cache = mocker.spy(container.get(DocumentCache), "get")
+
+        assert execute(container, query).data == {"pokemonName": "Eevee"}
+        cache.assert_not_called()
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+import strawberry
+from injector import Injector
+from pytest_mock import MockerFixture
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.presentation.extensions.persisted_queries import PersistedQueryExtension
+from pokeapi.presentation.persisted_queries import PersistedQueryRegistry, hash_query
+
+QUERY = '{ name(name: "Red") }'
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def name(self, name: str) -> str:
+        return name
+
+
+schema = strawberry.Schema(query=Query, extensions=[PersistedQueryExtension])
+
+
+@pytest.fixture()
+def registry(container: Injector, mocker: MockerFixture) -> PersistedQueryRegistry:
+    mocker.patch.object(
+        AppConfig,
+        "persisted_queries",
+        new_callable=mocker.PropertyMock,
+        return_value=True,
+    )
+
+    return container.get(PersistedQueryRegistry)
+
+
+def execute(container: Injector, query: str) -> strawberry.types.ExecutionResult:
+    return asyncio.run(schema.execute(query, context_value={"container": container}))
+
+
+class TestPersistedQueryExtension:
+    def test_registered(
+        self,
+        container: Injector,
+        registry: PersistedQueryRegistry,
+        mocker: MockerFixture,
+    ) -> None:
+        parse = mocker.spy(strawberry.schema.execute, "parse_document")
+        validate = mocker.spy(strawberry.schema.execute, "validate_document")
+        registry.register(hash_query(QUERY), QUERY)
+
+        first = execute(container, QUERY)
+        second = execute(container, QUERY)
+
+        assert first.data == second.data == {"name": "Red"}
+        persisted_query = registry.get(hash_query(QUERY))
+        assert persisted_query is not None
+        assert persisted_query.document is not None
+        assert parse.call_count == 1
+        assert validate.call_count == 1
+
+    def test_invalid_not_stored(
+        self, container: Injector, registry: PersistedQueryRegistry
+    ) -> None:
+        query = "{ unknown }"
+        registry.register(hash_query(query), query)
+
+        assert execute(container, query).errors is not None
+        assert execute(container, query).errors is not None
+        persisted_query = registry.get(hash_query(query))
+        assert persisted_query is not None
+        assert persisted_query.document is None
+
+    def test_not_registered(
+        self,
+        container: Injector,
+        registry: PersistedQueryRegistry,
+        mocker: MockerFixture,
+    ) -> None:
+        query = '{ name(name: "Blue") }'
+        parse = mocker.spy(strawberry.schema.execute, "parse_document")
+
+        execute(container, query)
+        execute(container, query)
+
+        assert registry.get(hash_query(query)) is None
+        assert parse.call_count == 2
+
+    def test_disabled(self, container: Injector, mocker: MockerFixture) -> None:
+        parse = mocker.spy(strawberry.schema.execute, "parse_document")
+        container.get(PersistedQueryRegistry).register(hash_query(QUERY), QUERY)
+
+        execute(container, QUERY)
+        execute(container, QUERY)
+
+        assert parse.call_count == 2
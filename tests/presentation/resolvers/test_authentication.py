@@ -1,7 +1,10 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 from pokeapi.application.services.authentication import AuthenticationService
 from pokeapi.exceptions.authentication import AuthenticationError
+from pokeapi.exceptions.password import PasswordHashingBusyError
 from pokeapi.presentation.resolvers.authentication import auth, refresh
 from pokeapi.presentation.schemas.authentication import AuthErrors, AuthResult
 from tests.conftest import TEST_TOKEN_ENTITY, TEST_USER_INPUT, MockInfo
@@ -19,10 +22,11 @@ class TestAuthResolver:
         assert actual.refresh_token == "refresh_token"
         assert actual.token_type == "Bearer"
 
-    def test_auth_error(self, mock_info: MockInfo) -> None:
+    @pytest.mark.parametrize("error", [AuthenticationError, PasswordHashingBusyError])
+    def test_auth_error(self, mock_info: MockInfo, error: type[Exception]) -> None:
         container = mock_info.context["container"]
         service = container.get(AuthenticationService)
-        service.auth = MagicMock(side_effect=AuthenticationError("error"))
+        service.auth = MagicMock(side_effect=error("error"))
         actual = auth(TEST_USER_INPUT, mock_info)  # type: ignore
 
         assert isinstance(actual, AuthErrors)
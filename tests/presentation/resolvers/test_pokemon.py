@@ -1,20 +1,23 @@
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
-from pokeapi.application.services.pokemon import PokemonService
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
 from pokeapi.presentation.resolvers.pokemon import (
     get_pokemon_by_name,
     get_pokemon_by_pokedex_number,
+    get_pokemons,
 )
 from pokeapi.presentation.schemas.pokemon import Pokemon
+from pokeapi.presentation.schemas.pokemon_connection import PokemonConnection
 from tests.conftest import TEST_POKEMON_ENTITY, MockInfo
 
 
 class TestPokemonResolver:
     def test_pokemon(self, mock_info: MockInfo) -> None:
         container = mock_info.context["container"]
-        service = container.get(PokemonService)
-        service.get_by_pokedex_number = MagicMock(return_value=TEST_POKEMON_ENTITY)
-        actual = get_pokemon_by_pokedex_number(1, mock_info)  # type: ignore
+        service = container.get(AsyncPokemonServiceABC)
+        service.get_by_pokedex_number = AsyncMock(return_value=TEST_POKEMON_ENTITY)
+        actual = asyncio.run(get_pokemon_by_pokedex_number(1, mock_info))  # type: ignore
 
         assert isinstance(actual, Pokemon)
         assert actual.name == TEST_POKEMON_ENTITY.name
@@ -25,17 +28,17 @@ class TestPokemonResolver:
 
     def test_pokemon_not_found(self, mock_info: MockInfo) -> None:
         container = mock_info.context["container"]
-        service = container.get(PokemonService)
-        service.get_by_pokedex_number = MagicMock(return_value=None)
-        actual = get_pokemon_by_pokedex_number(0, mock_info)  # type: ignore
+        service = container.get(AsyncPokemonServiceABC)
+        service.get_by_pokedex_number = AsyncMock(return_value=None)
+        actual = asyncio.run(get_pokemon_by_pokedex_number(0, mock_info))  # type: ignore
 
         assert actual is None
 
     def test_pokemon_by_name(self, mock_info: MockInfo) -> None:
         container = mock_info.context["container"]
-        service = container.get(PokemonService)
-        service.get_by_name = MagicMock(return_value=TEST_POKEMON_ENTITY)
-        actual = get_pokemon_by_name(1, mock_info)  # type: ignore
+        service = container.get(AsyncPokemonServiceABC)
+        service.get_by_name = AsyncMock(return_value=TEST_POKEMON_ENTITY)
+        actual = asyncio.run(get_pokemon_by_name(1, mock_info))  # type: ignore
 
         assert isinstance(actual, Pokemon)
         assert actual.name == TEST_POKEMON_ENTITY.name
@@ -46,8 +49,23 @@ class TestPokemonResolver:
 
     def test_pokemon_by_name_not_found(self, mock_info: MockInfo) -> None:
         container = mock_info.context["container"]
-        service = container.get(PokemonService)
-        service.get_by_name = MagicMock(return_value=None)
-        actual = get_pokemon_by_name(0, mock_info)  # type: ignore
+        service = container.get(AsyncPokemonServiceABC)
+        service.get_by_name = AsyncMock(return_value=None)
+        actual = asyncio.run(get_pokemon_by_name(0, mock_info))  # type: ignore
 
         assert actual is None
+
+    def test_pokemons(self, mock_info: MockInfo) -> None:
+        container = mock_info.context["container"]
+        service = container.get(AsyncPokemonServiceABC)
+        service.get_page = AsyncMock(return_value=[TEST_POKEMON_ENTITY])
+        info = MagicMock(context=mock_info.context)
+        info.schema.config.relay_max_results = 100
+        actual = asyncio.run(get_pokemons(info, first=10))
+
+        assert isinstance(actual, PokemonConnection)
+        assert [edge.node.name for edge in actual.edges] == [TEST_POKEMON_ENTITY.name]
+        assert not actual.page_info.has_next_page
+        service.get_page.assert_awaited_once_with(
+            11, after=None, before=None, backward=False
+        )
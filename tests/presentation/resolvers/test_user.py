@@ -1,6 +1,10 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 from pokeapi.application.services.user import UserService
+from pokeapi.exceptions.authorization import AuthorizationError
+from pokeapi.exceptions.password import PasswordHashingBusyError
 from pokeapi.exceptions.token import TokenVerificationError
 from pokeapi.exceptions.user import UserCreationError
 from pokeapi.presentation.resolvers.user import create_user, get_user_by_token
@@ -29,10 +33,13 @@ class TestUserGetResolver:
         assert isinstance(actual, UserErrors)
         assert actual.message == "User is unauthorized."
 
-    def test_get_user_by_token_error(self, mock_access_info: MockInfo) -> None:
+    @pytest.mark.parametrize("error", [AuthorizationError, TokenVerificationError])
+    def test_get_user_by_token_error(
+        self, mock_access_info: MockInfo, error: type[Exception]
+    ) -> None:
         container = mock_access_info.context["container"]
         service = container.get(UserService)
-        service.get_by_token = MagicMock(side_effect=TokenVerificationError("error"))
+        service.get_by_token = MagicMock(side_effect=error("error"))
         actual = get_user_by_token(mock_access_info)  # type: ignore
 
         assert isinstance(actual, UserErrors)
@@ -55,10 +62,13 @@ class TestUserCreationResolver:
         assert actual.refresh_token == "refresh_token"
         assert actual.token_type == "Bearer"
 
-    def test_create_user_error(self, mock_info: MockInfo) -> None:
+    @pytest.mark.parametrize("error", [UserCreationError, PasswordHashingBusyError])
+    def test_create_user_error(
+        self, mock_info: MockInfo, error: type[Exception]
+    ) -> None:
         container = mock_info.context["container"]
         service = container.get(UserService)
-        service.create = MagicMock(side_effect=UserCreationError("error"))
+        service.create = MagicMock(side_effect=error("error"))
         actual = create_user(
             UserInput(username="mock", password="password"),
             mock_info,  # type: ignore
@@ -1,8 +1,8 @@
-from unittest.mock import MagicMock
+import asyncio
 
 import pytest
 
-from pokeapi.application.services.pokemon import PokemonService
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
 from pokeapi.exceptions.pokemon import PokemonNotFoundError
 from pokeapi.presentation.schemas.pokemon import Pokemon
 from pokeapi.presentation.schemas.pokemon_ability import PokemonAbility
@@ -45,11 +45,13 @@ class TestPokemonSchema:
     def test_from_entity(self) -> None:
         assert Pokemon.from_entity(TEST_POKEMON_ENTITY) == TEST_SCHEMA
 
-    def test_resolve_node(self, mock_info: MockInfo) -> None:
-        mock_info.context["container"].get(PokemonService).get_by_id = MagicMock(
-            return_value=TEST_POKEMON_ENTITY
+    def test_resolve_node(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncPokemonServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = [TEST_POKEMON_ENTITY]
+        actual = asyncio.run(
+            Pokemon.resolve_node("1", info=mock_loader_info)  # type: ignore
         )
-        actual = Pokemon.resolve_node("1", info=mock_info)  # type: ignore
 
         assert isinstance(actual, Pokemon)
         assert actual.id == 1
@@ -70,9 +72,39 @@ class TestPokemonSchema:
             ),
         ]
 
-    def test_resolve_node_not_found(self, mock_info: MockInfo) -> None:
-        mock_info.context["container"].get(PokemonService).get_by_id = MagicMock(
-            return_value=None
+    def test_resolve_node_not_found(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncPokemonServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = []
+        with pytest.raises(PokemonNotFoundError):
+            asyncio.run(
+                Pokemon.resolve_node("0", info=mock_loader_info)  # type: ignore
+            )
+
+    def test_resolve_nodes(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncPokemonServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = [TEST_POKEMON_ENTITY]
+        node_id = str(TEST_POKEMON_ENTITY.id_)
+        actual = asyncio.run(
+            Pokemon.resolve_nodes(
+                info=mock_loader_info,  # type: ignore
+                node_ids=[node_id, "0", node_id],
+            )
         )
+
+        assert actual == [Pokemon.from_entity(TEST_POKEMON_ENTITY), None, actual[0]]
+        service.get_by_ids.assert_called_once_with([TEST_POKEMON_ENTITY.id_, 0])
+
+    def test_resolve_nodes_required(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncPokemonServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = []
         with pytest.raises(PokemonNotFoundError):
-            Pokemon.resolve_node("0", info=mock_info)  # type: ignore
+            asyncio.run(
+                Pokemon.resolve_nodes(
+                    info=mock_loader_info,  # type: ignore
+                    node_ids=["0"],
+                    required=True,
+                )
+            )
@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock
+import asyncio
 
 import pytest
 
-from pokeapi.application.services.pokemon_ability import AbilityService
+from pokeapi.application.services.pokemon_ability_async_abc import (
+    AsyncAbilityServiceABC,
+)
 from pokeapi.exceptions.pokemon_ability import AbilityNotFoundError
 from pokeapi.presentation.schemas.pokemon_ability import PokemonAbility
 from tests.conftest import TEST_POKEMON_ABILITY_ENTITY, MockInfo
@@ -14,19 +16,55 @@ class TestPokemonType:
     def test_from_entity(self) -> None:
         assert PokemonAbility.from_entity(TEST_POKEMON_ABILITY_ENTITY) == TEST_SCHEMA
 
-    def test_resolve_node(self, mock_info: MockInfo) -> None:
-        mock_info.context["container"].get(AbilityService).get_by_id = MagicMock(
-            return_value=TEST_POKEMON_ABILITY_ENTITY
+    def test_resolve_node(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncAbilityServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = [TEST_POKEMON_ABILITY_ENTITY]
+        actual = asyncio.run(
+            PokemonAbility.resolve_node("1", info=mock_loader_info)  # type: ignore
         )
-        actual = PokemonAbility.resolve_node("1", info=mock_info)  # type: ignore
 
         assert isinstance(actual, PokemonAbility)
         assert actual.id == 1
         assert actual.ability_name == "あくしゅう"
 
-    def test_resolve_node_type_not_found(self, mock_info: MockInfo) -> None:
-        mock_info.context["container"].get(AbilityService).get_by_id = MagicMock(
-            return_value=None
+    def test_resolve_node_type_not_found(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncAbilityServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = []
+        with pytest.raises(AbilityNotFoundError):
+            asyncio.run(
+                PokemonAbility.resolve_node("0", info=mock_loader_info)  # type: ignore
+            )
+
+    def test_resolve_nodes(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncAbilityServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = [TEST_POKEMON_ABILITY_ENTITY]
+        node_id = str(TEST_POKEMON_ABILITY_ENTITY.id_)
+        actual = asyncio.run(
+            PokemonAbility.resolve_nodes(
+                info=mock_loader_info,  # type: ignore
+                node_ids=[node_id, "0", node_id],
+            )
         )
+
+        assert actual == [
+            PokemonAbility.from_entity(TEST_POKEMON_ABILITY_ENTITY),
+            None,
+            actual[0],
+        ]
+        service.get_by_ids.assert_called_once_with([TEST_POKEMON_ABILITY_ENTITY.id_, 0])
+
+    def test_resolve_nodes_required(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncAbilityServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = []
         with pytest.raises(AbilityNotFoundError):
-            PokemonAbility.resolve_node("0", info=mock_info)  # type: ignore
+            asyncio.run(
+                PokemonAbility.resolve_nodes(
+                    info=mock_loader_info,  # type: ignore
+                    node_ids=["0"],
+                    required=True,
+                )
+            )
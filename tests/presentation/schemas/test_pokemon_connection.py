@@ -0,0 +1,135 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from strawberry import relay
+
+from pokeapi.domain.entities.pokemon import Pokemon as PokemonEntity
+from pokeapi.presentation.schemas.pokemon_connection import PokemonConnection
+from tests.conftest import TEST_POKEMON_ENTITY
+
+TEST_ENTITIES = [
+    TEST_POKEMON_ENTITY.model_copy(update={"id_": id_}) for id_ in range(1, 11)
+]
+
+
+class MockPokemonService:
+    async def get_page(
+        self,
+        limit: int,
+        after: int | None = None,
+        before: int | None = None,
+        backward: bool = False,
+    ) -> list[PokemonEntity]:
+        entities = [
+            entity
+            for entity in TEST_ENTITIES
+            if (after is None or entity.id_ > after)
+            and (before is None or entity.id_ < before)
+        ]
+
+        if backward:
+            return entities[-limit:]
+
+        return entities[:limit]
+
+
+@pytest.fixture()
+def info() -> MagicMock:
+    info = MagicMock()
+    info.schema.config.relay_max_results = 5
+
+    return info
+
+
+def resolve(info: MagicMock, **kwargs: str | int | None) -> PokemonConnection:
+    return asyncio.run(
+        PokemonConnection.resolve_page(
+            MockPokemonService(),  # type: ignore
+            info=info,
+            **kwargs,  # type: ignore
+        )
+    )
+
+
+def node_ids(connection: PokemonConnection) -> list[int]:
+    return [edge.node.id for edge in connection.edges]
+
+
+class TestPokemonConnection:
+    def test_cursor(self) -> None:
+        cursor = PokemonConnection.encode_cursor(1)
+
+        assert cursor != "1"
+        assert PokemonConnection.decode_cursor(cursor, "after") == 1
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "invalid",
+            relay.to_base64("Pokemon", 1),
+            relay.to_base64("pokemon-cursor", "a"),
+        ],
+    )
+    def test_decode_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(ValueError, match="Argument 'after' is not a valid cursor."):
+            PokemonConnection.decode_cursor(cursor, "after")
+
+    def test_first(self, info: MagicMock) -> None:
+        actual = resolve(info, first=3)
+
+        assert node_ids(actual) == [1, 2, 3]
+        assert actual.page_info.has_next_page
+        assert not actual.page_info.has_previous_page
+        assert actual.page_info.end_cursor == PokemonConnection.encode_cursor(3)
+
+    def test_first_after(self, info: MagicMock) -> None:
+        actual = resolve(info, first=3, after=PokemonConnection.encode_cursor(8))
+
+        assert node_ids(actual) == [9, 10]
+        assert not actual.page_info.has_next_page
+        assert actual.page_info.has_previous_page
+
+    def test_last(self, info: MagicMock) -> None:
+        actual = resolve(info, last=3)
+
+        assert node_ids(actual) == [8, 9, 10]
+        assert not actual.page_info.has_next_page
+        assert actual.page_info.has_previous_page
+
+    def test_last_before(self, info: MagicMock) -> None:
+        actual = resolve(info, last=3, before=PokemonConnection.encode_cursor(3))
+
+        assert node_ids(actual) == [1, 2]
+        assert actual.page_info.has_next_page
+        assert not actual.page_info.has_previous_page
+        assert actual.page_info.start_cursor == PokemonConnection.encode_cursor(1)
+
+    def test_default_page_size(self, info: MagicMock) -> None:
+        actual = resolve(info)
+
+        assert node_ids(actual) == [1, 2, 3, 4, 5]
+        assert actual.page_info.has_next_page
+
+    def test_empty(self, info: MagicMock) -> None:
+        actual = resolve(info, first=3, after=PokemonConnection.encode_cursor(10))
+
+        assert actual.edges == []
+        assert actual.page_info.start_cursor is None
+        assert actual.page_info.end_cursor is None
+        assert not actual.page_info.has_next_page
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"first": 1, "last": 1}, "cannot be used together"),
+            ({"first": -1}, "'first' must be a non-negative integer"),
+            ({"last": 6}, "'last' cannot be higher than 5"),
+            ({"before": "invalid"}, "'before' is not a valid cursor"),
+        ],
+    )
+    def test_invalid_arguments(
+        self, info: MagicMock, kwargs: dict, message: str
+    ) -> None:
+        with pytest.raises(ValueError, match=message):
+            resolve(info, **kwargs)
@@ -1,8 +1,8 @@
-from unittest.mock import MagicMock
+import asyncio
 
 import pytest
 
-from pokeapi.application.services.pokemon_type import TypeService
+from pokeapi.application.services.pokemon_type_async_abc import AsyncTypeServiceABC
 from pokeapi.exceptions.pokemon_type import TypeNotFoundError
 from pokeapi.presentation.schemas.pokemon_type import PokemonType
 from tests.conftest import TEST_POKEMON_TYPE_ENTITY, MockInfo
@@ -14,19 +14,55 @@ class TestPokemonType:
     def test_from_entity(self) -> None:
         assert PokemonType.from_entity(TEST_POKEMON_TYPE_ENTITY) == TEST_SCHEMA
 
-    def test_resolve_node(self, mock_info: MockInfo) -> None:
-        mock_info.context["container"].get(TypeService).get_by_id = MagicMock(
-            return_value=TEST_POKEMON_TYPE_ENTITY
+    def test_resolve_node(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncTypeServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = [TEST_POKEMON_TYPE_ENTITY]
+        actual = asyncio.run(
+            PokemonType.resolve_node("1", info=mock_loader_info)  # type: ignore
         )
-        actual = PokemonType.resolve_node("1", info=mock_info)  # type: ignore
 
         assert isinstance(actual, PokemonType)
         assert actual.id == 1
         assert actual.type_name == "ノーマル"
 
-    def test_resolve_node_type_not_found(self, mock_info: MockInfo) -> None:
-        mock_info.context["container"].get(TypeService).get_by_id = MagicMock(
-            return_value=None
+    def test_resolve_node_type_not_found(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncTypeServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = []
+        with pytest.raises(TypeNotFoundError):
+            asyncio.run(
+                PokemonType.resolve_node("0", info=mock_loader_info)  # type: ignore
+            )
+
+    def test_resolve_nodes(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncTypeServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = [TEST_POKEMON_TYPE_ENTITY]
+        node_id = str(TEST_POKEMON_TYPE_ENTITY.id_)
+        actual = asyncio.run(
+            PokemonType.resolve_nodes(
+                info=mock_loader_info,  # type: ignore
+                node_ids=[node_id, "0", node_id],
+            )
         )
+
+        assert actual == [
+            PokemonType.from_entity(TEST_POKEMON_TYPE_ENTITY),
+            None,
+            actual[0],
+        ]
+        service.get_by_ids.assert_called_once_with([TEST_POKEMON_TYPE_ENTITY.id_, 0])
+
+    def test_resolve_nodes_required(self, mock_loader_info: MockInfo) -> None:
+        service = mock_loader_info.context["container"].get(AsyncTypeServiceABC)
+        service.get_by_ids.reset_mock()
+        service.get_by_ids.return_value = []
         with pytest.raises(TypeNotFoundError):
-            PokemonType.resolve_node("0", info=mock_info)  # type: ignore
+            asyncio.run(
+                PokemonType.resolve_nodes(
+                    info=mock_loader_info,  # type: ignore
+                    node_ids=["0"],
+                    required=True,
+                )
+            )
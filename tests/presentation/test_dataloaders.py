@@ -0,0 +1,53 @@
+import asyncio
+from collections.abc import Sequence
+from unittest.mock import AsyncMock
+
+from injector import Injector
+
+from pokeapi.application.services.pokemon_async_abc import AsyncPokemonServiceABC
+from pokeapi.domain.entities.pokemon import Pokemon
+from pokeapi.domain.entities.pokemon_type import PokemonType
+from pokeapi.presentation.dataloaders import batch_load, create_dataloaders
+from tests.conftest import TEST_POKEMON_ENTITY
+
+
+def test_batch_load() -> None:
+    async def get_by_ids(ids: Sequence[int]) -> list[PokemonType]:
+        return [PokemonType(id_=id_, name=str(id_)) for id_ in reversed(ids) if id_]
+
+    actual = asyncio.run(batch_load(get_by_ids)([1, 0, 2]))
+
+    assert actual == [
+        PokemonType(id_=1, name="1"),
+        None,
+        PokemonType(id_=2, name="2"),
+    ]
+
+
+def test_create_dataloaders(container: Injector) -> None:
+    loaders_1 = create_dataloaders(container)
+    loaders_2 = create_dataloaders(container)
+
+    assert loaders_1.pokemon is not loaders_2.pokemon
+    assert loaders_1.type_ is not loaders_2.type_
+    assert loaders_1.ability is not loaders_2.ability
+
+
+def test_lookups_are_batched(container: Injector) -> None:
+    service = container.get(AsyncPokemonServiceABC)  # type: ignore[type-abstract]
+    service.get_by_ids = AsyncMock(return_value=[TEST_POKEMON_ENTITY])  # type: ignore[method-assign]
+    loaders = create_dataloaders(container)
+
+    async def run() -> list[Pokemon | None]:
+        return list(
+            await asyncio.gather(
+                loaders.pokemon.load(1),
+                loaders.pokemon.load(2),
+                loaders.pokemon.load(1),
+            )
+        )
+
+    actual = asyncio.run(run())
+
+    assert actual == [TEST_POKEMON_ENTITY, None, TEST_POKEMON_ENTITY]
+    service.get_by_ids.assert_called_once_with([1, 2])
@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+from graphql import GraphQLError, parse
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.presentation.document_cache import CachedDocument, DocumentCache
+
+QUERY = "{ pokemons { __typename } }"
+
+
+def document_cache(max_size: int) -> DocumentCache:
+    return DocumentCache(MagicMock(spec=AppConfig, document_cache_max_size=max_size))
+
+
+class TestDocumentCache:
+    def test_get_set(self) -> None:
+        cache = document_cache(10)
+        document = parse(QUERY)
+        error = GraphQLError("error")
+        cache.set(QUERY, document, [error])
+
+        assert cache.get(QUERY) == CachedDocument(QUERY, document, (error,))
+        assert cache.get("{ user { __typename } }") is None
+        assert cache.snapshot()["hits"] == 1
+
+    def test_bounded(self) -> None:
+        cache = document_cache(1)
+        other = "{ user { __typename } }"
+        cache.set(QUERY, parse(QUERY), [])
+        cache.set(other, parse(other), [])
+
+        assert cache.get(QUERY) is None
+        assert cache.get(other) is not None
+
+    def test_disabled(self) -> None:
+        cache = document_cache(0)
+        cache.set(QUERY, parse(QUERY), [])
+
+        assert cache.get(QUERY) is None
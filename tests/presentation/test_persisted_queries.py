@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+import pytest
+from graphql import parse
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.exceptions.persisted_query import PersistedQueryNotFoundError
+from pokeapi.presentation.persisted_queries import (
+    PersistedQuery,
+    PersistedQueryRegistry,
+    hash_query,
+)
+
+QUERY = "{ pokemons { __typename } }"
+
+
+@pytest.fixture()
+def registry() -> PersistedQueryRegistry:
+    return PersistedQueryRegistry(MagicMock(spec=AppConfig, persisted_query_max_size=1))
+
+
+def test_hash_query() -> None:
+    assert (
+        hash_query("{ __typename }")
+        == "7f56e67dd21ab3f30d1ff8b7bed08893f0a0db86449836189b361dd1e56ddb4b"
+    )
+
+
+class TestPersistedQueryRegistry:
+    def test_register(self, registry: PersistedQueryRegistry) -> None:
+        registry.register(hash_query(QUERY), QUERY)
+
+        assert registry.get(hash_query(QUERY)) == PersistedQuery(QUERY, None)
+        assert registry.get_query(hash_query(QUERY)) == QUERY
+
+    def test_register_hash_mismatch(self, registry: PersistedQueryRegistry) -> None:
+        with pytest.raises(ValueError, match="does not match"):
+            registry.register("0" * 64, QUERY)
+
+        assert registry.snapshot()["size"] == 0
+
+    def test_get_query_not_found(self, registry: PersistedQueryRegistry) -> None:
+        with pytest.raises(PersistedQueryNotFoundError):
+            registry.get_query(hash_query(QUERY))
+
+    def test_store_document(self, registry: PersistedQueryRegistry) -> None:
+        document = parse(QUERY)
+        registry.register(hash_query(QUERY), QUERY)
+        registry.store_document(QUERY, document)
+        registry.register(hash_query(QUERY), QUERY)
+
+        assert registry.get(hash_query(QUERY)) == PersistedQuery(QUERY, document)
+
+    def test_bounded(self, registry: PersistedQueryRegistry) -> None:
+        other = "{ user { __typename } }"
+        registry.register(hash_query(QUERY), QUERY)
+        registry.register(hash_query(other), other)
+
+        assert registry.get(hash_query(QUERY)) is None
+        assert registry.get(hash_query(other)) is not None
+        assert registry.snapshot()["evictions"] == 1
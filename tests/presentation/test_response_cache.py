@@ -0,0 +1,127 @@
+import gzip
+from unittest.mock import MagicMock
+
+import pytest
+from graphql import parse
+
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.presentation.response_cache import (
+    ResponseCache,
+    is_cacheable,
+    normalize_document,
+)
+
+POKEMON_QUERY = 'query { pokemonByName(name: "フシギダネ") { id name } }'
+
+
+def response_cache(gzip_enabled: bool = False) -> ResponseCache:
+    return ResponseCache(
+        MagicMock(
+            spec=AppConfig,
+            response_cache_max_size=10,
+            response_cache_ttl=60,
+            response_cache_gzip=gzip_enabled,
+        )
+    )
+
+
+def test_normalize_document() -> None:
+    assert normalize_document(POKEMON_QUERY) == normalize_document(
+        'query{\n  # by name\n  pokemonByName(name: "フシギダネ") { id, name }\n}'
+    )
+    assert normalize_document(POKEMON_QUERY) != normalize_document(
+        'query { pokemonByName(name: "フシギソウ") { id name } }'
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "operation_name", "expected"),
+    [
+        (POKEMON_QUERY, None, True),
+        ("query { pokemons(first: 10) { edges { node { id } } } }", None, True),
+        ("query { user { ... on User { id } } }", None, False),
+        (
+            "query { ...Private } fragment Private on Query { user { __typename } }",
+            None,
+            False,
+        ),
+        ("query { ... on Query { user { __typename } } }", None, False),
+        (
+            'mutation { auth(username: "Red", password: "p") { __typename } }',
+            None,
+            False,
+        ),
+        (
+            "query A { pokemons { __typename } } query B { user { __typename } }",
+            "A",
+            True,
+        ),
+        (
+            "query A { pokemons { __typename } } query B { user { __typename } }",
+            "B",
+            False,
+        ),
+        ("query A { pokemons { __typename } }", "C", False),
+    ],
+)
+def test_is_cacheable(query: str, operation_name: str | None, expected: bool) -> None:
+    assert is_cacheable(parse(query), operation_name) is expected
+
+
+class TestResponseCache:
+    def test_key(self) -> None:
+        cache = response_cache()
+        key = cache.key(POKEMON_QUERY, {"a": 1, "b": 2}, None, authenticated=False)
+
+        assert key is not None
+        assert cache.key(POKEMON_QUERY, {"b": 2, "a": 1}, None, False) == key
+        assert cache.key(POKEMON_QUERY, {"a": 2, "b": 2}, None, False) != key
+        assert cache.key(POKEMON_QUERY, {"a": 1, "b": 2}, None, True) != key
+
+    @pytest.mark.parametrize(
+        "query", [None, "query { user { __typename } }", "query {", "query { a } }"]
+    )
+    def test_key_not_cacheable(self, query: str | None) -> None:
+        cache = response_cache()
+
+        assert cache.key(query, None, None, authenticated=False) is None
+        assert cache.key(query, None, None, authenticated=False) is None
+
+    def test_get_set(self) -> None:
+        cache = response_cache()
+        cache.set("key", b'{"data": {}}')
+
+        actual = cache.get("key")
+
+        assert actual is not None
+        assert actual.body == b'{"data": {}}'
+        assert actual.gzipped is None
+        assert cache.get("other") is None
+
+    def test_set_gzip(self) -> None:
+        cache = response_cache(gzip_enabled=True)
+        body = b'{"data": {"pokemons": [%s]}}' % b",".join([b'{"id": 1}'] * 100)
+        cache.set("small", b'{"data": {}}')
+        cache.set("large", body)
+
+        small = cache.get("small")
+        large = cache.get("large")
+
+        assert small is not None
+        assert small.gzipped is None
+        assert large is not None
+        assert large.gzipped is not None
+        assert gzip.decompress(large.gzipped) == body
+
+    def test_snapshot(self) -> None:
+        cache = response_cache()
+        cache.key("query { user { __typename } }", None, None, authenticated=False)
+        cache.set("key", b"{}")
+        cache.get("key")
+        cache.clear()
+
+        snapshot = cache.snapshot()
+
+        assert snapshot["size"] == 0
+        assert snapshot["hits"] == 1
+        assert snapshot["bypassed"] == 1
@@ -0,0 +1,245 @@
+import gzip
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+import strawberry
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+
+from pokeapi.dependencies.context import get_context, get_root_container
+from pokeapi.dependencies.settings.config import AppConfig
+from pokeapi.presentation.extensions.persisted_queries import PersistedQueryExtension
+from pokeapi.presentation.persisted_queries import hash_query
+from pokeapi.presentation.response_cache import CachedResponse, ResponseCache
+from pokeapi.presentation.router import CachedGraphQLRouter
+
+CALLS: list[str] = []
+
+
+def get_name(name: str) -> str:
+    CALLS.append(name)
+
+    if name == "MissingNo.":
+        raise ValueError("Pokémon not found.")
+
+    return name * 100
+
+
+def get_user() -> str:
+    CALLS.append("user")
+    return "Red"
+
+
+@strawberry.type
+class Query:
+    name: str = strawberry.field(resolver=get_name)
+    user: str = strawberry.field(resolver=get_user)
+
+
+app = FastAPI()
+schema = strawberry.Schema(query=Query, extensions=[PersistedQueryExtension])
+app.include_router(
+    CachedGraphQLRouter(schema, context_getter=get_context, path="/graphql")
+)
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def _enable_response_cache(mocker: MockerFixture) -> Iterator[None]:
+    mocker.patch.object(
+        AppConfig, "response_cache", new_callable=mocker.PropertyMock, return_value=True
+    )
+    CALLS.clear()
+    yield
+    get_root_container().get(ResponseCache).clear()
+
+
+def post(query: str, variables: dict | None = None, **headers: str) -> Any:
+    response = client.post(
+        "/graphql", json={"query": query, "variables": variables}, headers=headers
+    )
+
+    assert response.status_code == 200
+
+    return response.json()["data"]
+
+
+class TestCachedGraphQLRouter:
+    def test_cached(self) -> None:
+        query = "query ($name: String!) { name(name: $name) }"
+
+        assert post(query, {"name": "Red"}) == {"name": "Red" * 100}
+        assert post(query, {"name": "Red"}) == {"name": "Red" * 100}
+        assert post(f"# again\n{query}", {"name": "Red"}) == {"name": "Red" * 100}
+        assert post(query, {"name": "Red"}, Authorization="Bearer token") == {
+            "name": "Red" * 100
+        }
+        assert post(query, {"name": "Blue"}) == {"name": "Blue" * 100}
+        assert ["Red", "Red", "Blue"] == CALLS
+
+    def test_cached_via_get(self) -> None:
+        params = {"query": '{ name(name: "Red") }'}
+
+        assert client.get("/graphql", params=params).json()["data"] is not None
+        assert client.get("/graphql", params=params).json()["data"] is not None
+        assert ["Red"] == CALLS
+
+    def test_private_not_cached(self) -> None:
+        post("{ user }")
+        post("{ user }")
+
+        assert ["user", "user"] == CALLS
+
+    def test_errors_not_cached(self) -> None:
+        query = '{ name(name: "MissingNo.") }'
+        client.post("/graphql", json={"query": query})
+        client.post("/graphql", json={"query": query})
+
+        assert ["MissingNo.", "MissingNo."] == CALLS
+
+    def test_graphql_ide_not_cached(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            CachedGraphQLRouter, "should_render_graphql_ide", return_value=True
+        )
+        params = {"query": '{ name(name: "Red") }'}
+
+        response = client.get("/graphql", params=params, headers={"Accept": "*/*"})
+
+        assert response.status_code == 200
+        assert "text/html" in response.headers["Content-Type"]
+        assert get_root_container().get(ResponseCache).snapshot()["size"] == 0
+
+    def test_disabled(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "response_cache",
+            new_callable=mocker.PropertyMock,
+            return_value=False,
+        )
+        post('{ name(name: "Red") }')
+        post('{ name(name: "Red") }')
+
+        assert ["Red", "Red"] == CALLS
+
+    def test_gzip(self, mocker: MockerFixture) -> None:
+        body = b'{"data": {"name": "Red"}}'
+        mocker.patch.object(
+            ResponseCache, "get", return_value=CachedResponse(body, gzip.compress(body))
+        )
+        query = '{ name(name: "Red") }'
+
+        compressed = client.post(
+            "/graphql", json={"query": query}, headers={"Accept-Encoding": "gzip"}
+        )
+        uncompressed = client.post(
+            "/graphql", json={"query": query}, headers={"Accept-Encoding": "identity"}
+        )
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert compressed.json() == {"data": {"name": "Red"}}
+        assert "Content-Encoding" not in uncompressed.headers
+        assert uncompressed.json() == {"data": {"name": "Red"}}
+        assert [] == CALLS
+
+
+def persisted_query(query: str | None, sha256_hash: str) -> dict:
+    return {
+        "query": query,
+        "extensions": {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}},
+    }
+
+
+class TestPersistedQueries:
+    @pytest.fixture(autouse=True)
+    def _enable_persisted_queries(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "persisted_queries",
+            new_callable=mocker.PropertyMock,
+            return_value=True,
+        )
+
+    def test_registered(self) -> None:
+        query = '{ name(name: "Green") }'
+        sha256_hash = hash_query(query)
+
+        not_found = client.post("/graphql", json=persisted_query(None, sha256_hash))
+        registered = client.post("/graphql", json=persisted_query(query, sha256_hash))
+        found = client.post("/graphql", json=persisted_query(None, sha256_hash))
+        found_via_get = client.get(
+            "/graphql",
+            params={
+                "extensions": json.dumps(
+                    persisted_query(None, sha256_hash)["extensions"]
+                )
+            },
+        )
+
+        assert not_found.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+        assert registered.json()["data"] == {"name": "Green" * 100}
+        assert found.json()["data"] == {"name": "Green" * 100}
+        assert found_via_get.json()["data"] == {"name": "Green" * 100}
+
+    def test_registered_via_get_accepting_any(self) -> None:
+        query = '{ name(name: "Yellow") }'
+        extensions = persisted_query(None, hash_query(query))["extensions"]
+        client.post("/graphql", json=persisted_query(query, hash_query(query)))
+        get_root_container().get(ResponseCache).clear()
+        CALLS.clear()
+
+        responses = [
+            client.get(
+                "/graphql",
+                params={"extensions": json.dumps(extensions)},
+                headers={"Accept": "*/*"},
+            )
+            for _ in range(2)
+        ]
+
+        assert [response.status_code for response in responses] == [200, 200]
+        assert [response.json()["data"] for response in responses] == [
+            {"name": "Yellow" * 100}
+        ] * 2
+        assert ["Yellow"] == CALLS
+
+    def test_hash_mismatch(self) -> None:
+        response = client.post(
+            "/graphql", json=persisted_query('{ name(name: "Red") }', "0" * 64)
+        )
+
+        assert response.status_code == 400
+        assert response.text == "provided sha does not match query"
+
+    @pytest.mark.parametrize("extension", [{"version": 2}, {"version": 1}])
+    def test_invalid(self, extension: dict) -> None:
+        response = client.post(
+            "/graphql",
+            json={"query": None, "extensions": {"persistedQuery": extension}},
+        )
+
+        assert response.status_code == 400
+
+    def test_disabled(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            AppConfig,
+            "persisted_queries",
+            new_callable=mocker.PropertyMock,
+            return_value=False,
+        )
+        query = '{ name(name: "Red") }'
+
+        not_supported = client.post(
+            "/graphql", json=persisted_query(None, hash_query(query))
+        )
+        with_query = client.post(
+            "/graphql", json=persisted_query(query, hash_query(query))
+        )
+
+        assert (
+            not_supported.json()["errors"][0]["extensions"]["code"]
+            == "PERSISTED_QUERY_NOT_SUPPORTED"
+        )
+        assert with_query.json()["data"] == {"name": "Red" * 100}
@@ -1,5 +1,7 @@
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 
+from pokeapi.dependencies.settings import AppConfig
 from pokeapi.main import app
 
 client = TestClient(app)
@@ -10,3 +12,83 @@ def test_health_check() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "OK"}
+
+
+def test_metrics() -> None:
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["database_pool"]["checkouts"] >= 0
+    assert response.json()["blocking_executor"]["queued"] == 0
+    assert response.json()["token_whitelist_sweeper"]["failures"] == 0
+    assert response.json()["jwt_cache"]["hits"] >= 0
+    assert response.json()["document_cache"]["hits"] >= 0
+
+
+def test_metrics_with_async_driver(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        AppConfig, "db_async", new_callable=mocker.PropertyMock, return_value=True
+    )
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["async_database_pool"]["checkouts"] >= 0
+
+
+def test_metrics_with_password_pool(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        AppConfig,
+        "password_pool_size",
+        new_callable=mocker.PropertyMock,
+        return_value=2,
+    )
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["password_pool"]["rejected"] == 0
+
+
+def test_metrics_with_stateless_access_tokens(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        AppConfig,
+        "access_token_stateless",
+        new_callable=mocker.PropertyMock,
+        return_value=True,
+    )
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["token_revocation_filter"]["failures"] == 0
+
+
+def test_metrics_with_service_cache(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        AppConfig, "cache_type", new_callable=mocker.PropertyMock, return_value=True
+    )
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["service_cache"]["type"]["hits"] >= 0
+
+
+def test_metrics_with_response_cache(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        AppConfig, "response_cache", new_callable=mocker.PropertyMock, return_value=True
+    )
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["response_cache"]["bypassed"] >= 0
+
+
+def test_metrics_with_persisted_queries(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        AppConfig,
+        "persisted_queries",
+        new_callable=mocker.PropertyMock,
+        return_value=True,
+    )
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["persisted_queries"]["hits"] >= 0